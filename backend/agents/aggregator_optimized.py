@@ -30,6 +30,7 @@ from backend.models.agent import AgentStep
 from backend.services.llm_manager import LLMManager
 from backend.memory.manager import MemoryManager
 from backend.agents.prompts.unified_react import UnifiedReActPrompt
+from backend.services.rank_fusion import FusionMethod, RankFusion
 
 logger = logging.getLogger(__name__)
 
@@ -311,6 +312,10 @@ class AggregatorAgentOptimized:
         """
         Merge and deduplicate results from parallel operations.
 
+        Scores are min-max normalized per source before fusion, so sources
+        with different score scales rank fairly; a result found by several
+        sources accumulates their normalized scores.
+
         Args:
             results: List of search results from different sources
             max_results: Maximum number of results to return
@@ -321,29 +326,20 @@ class AggregatorAgentOptimized:
         if not results:
             return []
 
-        # Flatten results
-        all_results = []
-        seen_content = set()
+        fusion = RankFusion(method=FusionMethod.MINMAX)
 
         for result_set in results:
             if not result_set:
                 continue
 
-            for result in result_set:
-                # Simple deduplication by content hash
-                content_hash = hash(getattr(result, "text", str(result))[:200])
-
-                if content_hash not in seen_content:
-                    seen_content.add(content_hash)
-                    all_results.append(result)
-
-        # Sort by score if available
-        try:
-            all_results.sort(key=lambda x: getattr(x, "score", 0), reverse=True)
-        except Exception:
-            pass
+            # Simple deduplication by content hash
+            fusion.add(
+                [hash(getattr(result, "text", str(result))[:200]) for result in result_set],
+                [float(getattr(result, "score", 0) or 0) for result in result_set],
+                payloads=result_set,
+            )
 
-        return all_results[:max_results]
+        return [result for result, _, _ in fusion.top_k_payloads(max_results)]
 
     async def _fast_path_query(
         self, query: str, session_id: str, top_k: int = 10
@@ -8,6 +8,7 @@ This agent specializes in vector similarity search operations with advanced feat
 - Caching
 """
 
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any
 
@@ -45,6 +46,7 @@ class VectorSearchAgent:
         enable_colpali_search: bool = True,
         structured_data_service=None,
         enable_table_search: bool = True,
+        two_phase_retrieval: Optional[bool] = None,
     ):
         """
         Initialize the Vector Search Agent.
@@ -64,6 +66,8 @@ class VectorSearchAgent:
             enable_colpali_search: Enable ColPali image search
             structured_data_service: StructuredDataService for table search (optional)
             enable_table_search: Enable table search
+            two_phase_retrieval: Search Milvus for ids/scores only and fetch
+                text for the final results (default: MILVUS_TWO_PHASE_RETRIEVAL)
         """
         self.mcp = mcp_manager
         self.hybrid_search = hybrid_search_manager
@@ -76,6 +80,11 @@ class VectorSearchAgent:
         self.milvus_manager = milvus_manager
         self.embedding_service = embedding_service
         self.use_direct_milvus = milvus_manager is not None and embedding_service is not None
+        if two_phase_retrieval is None:
+            from backend.config import settings
+
+            two_phase_retrieval = settings.MILVUS_TWO_PHASE_RETRIEVAL
+        self.two_phase_retrieval = two_phase_retrieval and self.use_direct_milvus
         
         # ColPali image search
         self.colpali_processor = colpali_processor
@@ -213,6 +222,9 @@ class VectorSearchAgent:
                 text_results, image_results, top_k, table_results
             )
 
+            # 3e. Fetch text for the merged top-k only (rerankers need it)
+            results = await self.hydrate(results)
+
             # 4. Reranking (optional)
             if use_reranking and results:
                 # Try cross-encoder first (best quality)
@@ -278,14 +290,207 @@ class VectorSearchAgent:
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    async def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        search_mode: str = "hybrid",
+        hydrate: bool = True,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search several independent queries (perspectives, sub-queries).
+
+        With direct Milvus access the queries are embedded in one batch and
+        searched in a single Milvus request; keyword fusion then runs per
+        query. Through MCP the queries are searched in parallel.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results per query
+            filters: Optional filters
+            search_mode: "hybrid", "vector_only", or "keyword_only"
+            hydrate: Fetch text of the results; pass False when the caller
+                fuses the lists first and hydrates the survivors itself
+
+        Returns:
+            One result list per query, in input order (empty if it failed)
+        """
+        if not queries:
+            return []
+        if top_k < 1 or top_k > 100:
+            raise ValueError("top_k must be between 1 and 100")
+
+        use_mcp = self.mcp is not None and self.mcp.is_connected(self.server_name)
+        if use_mcp or not self.use_direct_milvus:
+            found = await asyncio.gather(
+                *(
+                    self.search(query=q, top_k=top_k, filters=filters, search_mode=search_mode)
+                    for q in queries
+                ),
+                return_exceptions=True,
+            )
+            results = []
+            for query, result in zip(queries, found):
+                if isinstance(result, Exception):
+                    logger.warning(f"Search failed for query '{query[:50]}': {result}")
+                    result = []
+                results.append(result)
+            return results
+
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(queries)
+        if self.use_caching:
+            for i, query in enumerate(queries):
+                results[i] = await self.cache.get_cached_results(
+                    query, top_k, filters, search_mode
+                ) or None
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        pending_queries = [queries[i] for i in pending]
+        use_hybrid = self.use_hybrid and search_mode != "vector_only"
+        try:
+            # HybridSearchService asks the vector retriever for 2x its top_k
+            vector_hits = await self._milvus_search_many(
+                pending_queries, top_k * 4 if use_hybrid else top_k * 2, filters
+            )
+        except Exception as e:
+            logger.warning(f"Batched Milvus search failed: {e}")
+            vector_hits = [[] for _ in pending_queries]
+
+        for i, query, hits in zip(pending, pending_queries, vector_hits):
+            if use_hybrid:
+                found = await self._hybrid_search(
+                    [query], top_k, filters, search_mode, vector_hits={query: hits}
+                )
+            else:
+                found = self._merge_results(hits, top_k)
+            results[i] = found[:top_k]
+
+        if hydrate:
+            # One chunk fetch for the results of all queries
+            await self.hydrate([r for i in pending for r in results[i]])
+            if self.use_caching:
+                for i in pending:
+                    await self.cache.cache_results(
+                        queries[i], top_k, filters, search_mode, results[i]
+                    )
+
+        logger.info(f"Batched search completed for {len(queries)} queries ({len(pending)} searched)")
+        return results
+
+    async def _milvus_search_many(
+        self, queries: List[str], top_k: int, filters: Optional[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Embed queries in one batch and search them in one Milvus request."""
+        embeddings = await self.embedding_service.embed_batch(queries)
+        hits = await self.milvus_manager.search_many(
+            embeddings,
+            top_k=top_k,
+            filters=self._filter_expression(filters),
+            ids_only=self.two_phase_retrieval,
+        )
+        return [[self._milvus_result_to_dict(r) for r in result] for result in hits]
+
+    async def hydrate(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fill in text and document fields of ids-only results (in place).
+
+        Results of two-phase retrieval (and hybrid fusion) carry only ids
+        and scores; this fetches the survivors in one batched Milvus query
+        through the chunk cache. Results that already have text, or whose
+        chunk is not in Milvus, are left unchanged.
+
+        Args:
+            results: Search result dicts
+
+        Returns:
+            The same list
+        """
+        pending = [r for r in results if not r.get("text")]
+        if not pending or not self.use_direct_milvus:
+            return results
+
+        try:
+            chunks = await self.milvus_manager.fetch_chunks(
+                [r.get("id") or r.get("chunk_id") for r in pending]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to hydrate {len(pending)} results: {e}")
+            return results
+
+        for result in pending:
+            chunk = chunks.get(result.get("id") or result.get("chunk_id"))
+            if chunk is None:
+                continue
+            result["text"] = chunk.get("text", "")
+            result["document_id"] = chunk.get("document_id", "")
+            result["document_name"] = chunk.get("document_name") or "Unknown"
+            result["metadata"] = {
+                **(result.get("metadata") or {}),
+                "document_name": chunk.get("document_name"),
+                "chunk_index": chunk.get("chunk_index"),
+                "file_type": chunk.get("file_type"),
+                "upload_date": chunk.get("upload_date"),
+            }
+        return results
+
+    @staticmethod
+    def _filter_expression(filters: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Convert a filters dict to a Milvus expression string."""
+        if not filters:
+            return None
+
+        filter_conditions = []
+        for key, value in filters.items():
+            if isinstance(value, str):
+                filter_conditions.append(f'{key} == "{value}"')
+            elif isinstance(value, bool):
+                filter_conditions.append(f'{key} == {str(value).lower()}')
+            elif isinstance(value, (int, float)):
+                filter_conditions.append(f'{key} == {value}')
+
+        if not filter_conditions:
+            return None
+
+        filter_expr = " && ".join(filter_conditions)
+        logger.debug(f"Converted filters to expression: {filter_expr}")
+        return filter_expr
+
+    @staticmethod
+    def _milvus_result_to_dict(result: Any) -> Dict[str, Any]:
+        """Convert a Milvus search result (dict or SearchResult) to standard format."""
+        if isinstance(result, dict):
+            return {
+                "id": result.get("chunk_id", result.get("id", "")),
+                "chunk_id": result.get("chunk_id", ""),
+                "document_id": result.get("document_id", ""),
+                "document_name": result.get("document_name", "Unknown"),
+                "text": result.get("text", ""),
+                "score": result.get("score", 0.0),
+                "metadata": result.get("metadata", {})
+            }
+        return {
+            "id": getattr(result, "chunk_id", getattr(result, "id", "")),
+            "chunk_id": getattr(result, "chunk_id", ""),
+            "document_id": getattr(result, "document_id", ""),
+            "document_name": getattr(result, "document_name", "Unknown"),
+            "text": getattr(result, "text", ""),
+            "score": getattr(result, "score", getattr(result, "distance", 0.0)),
+            "metadata": getattr(result, "metadata", {})
+        }
+
     async def _hybrid_search(
         self,
         queries: List[str],
         top_k: int,
         filters: Optional[Dict[str, Any]],
         search_mode: str,
+        vector_hits: Optional[Dict[str, List[Dict[str, Any]]]] = None,
     ) -> List[Dict[str, Any]]:
-        """하이브리드 검색 수행"""
+        """하이브리드 검색 수행 (vector_hits: 쿼리별로 미리 조회한 Milvus 결과)"""
         # Check if MCP is available, otherwise use direct Milvus
         use_mcp = self.mcp is not None and self.mcp.is_connected(self.server_name)
         
@@ -296,6 +501,14 @@ class VectorSearchAgent:
         
         all_results = []
 
+        if vector_hits is None and not use_mcp and len(queries) > 1:
+            # All query variations in one Milvus request
+            try:
+                hits = await self._milvus_search_many(queries, top_k * 4, filters)
+                vector_hits = dict(zip(queries, hits))
+            except Exception as e:
+                logger.debug(f"Batched vector search failed, searching per query: {e}")
+
         for query in queries:
             # Define vector search function for HybridSearchService
             async def vector_search_fn(q: str, k: int) -> List[tuple]:
@@ -319,36 +532,21 @@ class VectorSearchAgent:
                     ]
                 else:
                     # Use direct Milvus for vector search
-                    query_embedding = await self.embedding_service.embed_text(q)
-                    search_results = await self.milvus_manager.search(
-                        query_embedding=query_embedding,
-                        top_k=k,
-                        filters=filters
-                    )
+                    if vector_hits is not None and q in vector_hits:
+                        search_results = vector_hits[q][:k]
+                    else:
+                        search_results = (await self._milvus_search_many([q], k, filters))[0]
                     return [
                         (r.get("chunk_id") or r.get("id"), r.get("score", 0.0))
                         for r in search_results
                     ]
 
-            # Define BM25 search function for HybridSearchService
-            async def bm25_search_fn(q: str, k: int) -> List[tuple]:
-                # BM25 search requires indexed documents
-                # For now, return empty list as BM25 index may not be ready
-                try:
-                    from backend.services.bm25_search import get_bm25_service
-
-                    bm25_service = get_bm25_service()
-                    return await bm25_service.search(q, k)
-                except Exception as e:
-                    logger.debug(f"BM25 search not available: {e}")
-                    return []
-
             # Perform hybrid search
             try:
                 hybrid_results = await self.hybrid_search.search(
                     query=query,
                     vector_search_fn=vector_search_fn,
-                    bm25_search_fn=bm25_search_fn,
+                    # BM25 side: the service's own index, fed by ingestion
                     top_k=top_k * 2,
                     fusion_method="rrf",
                 )
@@ -423,66 +621,15 @@ class VectorSearchAgent:
     async def _direct_milvus_search(
         self, queries: List[str], top_k: int, filters: Optional[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """직접 Milvus를 사용한 벡터 검색"""
-        all_results = []
-        
-        # Convert filters dict to Milvus expression string
-        filter_expr = None
-        if filters:
-            filter_conditions = []
-            for key, value in filters.items():
-                if isinstance(value, str):
-                    filter_conditions.append(f'{key} == "{value}"')
-                elif isinstance(value, (int, float)):
-                    filter_conditions.append(f'{key} == {value}')
-                elif isinstance(value, bool):
-                    filter_conditions.append(f'{key} == {str(value).lower()}')
-            
-            if filter_conditions:
-                filter_expr = " && ".join(filter_conditions)
-                logger.debug(f"Converted filters to expression: {filter_expr}")
-        
-        for query in queries:
-            try:
-                # Generate query embedding
-                query_embedding = await self.embedding_service.embed_text(query)
-                
-                # Search in Milvus with string expression
-                search_results = await self.milvus_manager.search(
-                    query_embedding=query_embedding,
-                    top_k=top_k * 2,
-                    filters=filter_expr  # Pass string expression, not dict
-                )
-                
-                # Convert to standard format
-                for result in search_results:
-                    # Handle both dict and SearchResult object
-                    if isinstance(result, dict):
-                        all_results.append({
-                            "id": result.get("chunk_id", result.get("id", "")),
-                            "chunk_id": result.get("chunk_id", ""),
-                            "document_id": result.get("document_id", ""),
-                            "document_name": result.get("document_name", "Unknown"),
-                            "text": result.get("text", ""),
-                            "score": result.get("score", 0.0),
-                            "metadata": result.get("metadata", {})
-                        })
-                    else:
-                        # Handle Milvus SearchResult object
-                        all_results.append({
-                            "id": getattr(result, "chunk_id", getattr(result, "id", "")),
-                            "chunk_id": getattr(result, "chunk_id", ""),
-                            "document_id": getattr(result, "document_id", ""),
-                            "document_name": getattr(result, "document_name", "Unknown"),
-                            "text": getattr(result, "text", ""),
-                            "score": getattr(result, "score", getattr(result, "distance", 0.0)),
-                            "metadata": getattr(result, "metadata", {})
-                        })
-                    
-            except Exception as e:
-                logger.error(f"Direct Milvus search failed for query '{query}': {e}")
-                continue
-        
+        """직접 Milvus를 사용한 벡터 검색 (모든 쿼리를 한 번의 요청으로)"""
+        try:
+            hits = await self._milvus_search_many(queries, top_k * 2, filters)
+        except Exception as e:
+            logger.error(f"Direct Milvus search failed for {len(queries)} queries: {e}")
+            return []
+
+        all_results = [result for query_hits in hits for result in query_hits]
+
         # Merge and deduplicate
         return self._merge_results(all_results, top_k)
 
@@ -181,30 +181,19 @@ class VectorSearchAgentDirect:
         if document_id and not filters:
             filters = f'document_id == "{document_id}"'
 
-        # Search with all query variations in parallel
-        tasks = []
-        for query_text in queries:
-            # Generate embedding (now async)
-            embedding = await self.embedding.embed_text(query_text)
-
-            # Create search task
-            task = self.milvus.search(
-                query_embedding=embedding,
-                top_k=top_k * 2,
-                filters=filters,  # Get more for merging
+        # Search all query variations in one Milvus request
+        try:
+            embeddings = await self.embedding.embed_batch(queries)
+            all_results = await self.milvus.search_many(
+                embeddings,
+                top_k=top_k * 2,  # Get more for merging
+                filters=filters,
             )
-            tasks.append(task)
-
-        # Execute all searches in parallel
-        all_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Flatten and filter out errors
-        flattened_results = []
-        for result in all_results:
-            if isinstance(result, Exception):
-                logger.warning(f"Search task failed: {result}")
-                continue
-            flattened_results.extend(result)
+        except Exception as e:
+            logger.warning(f"Search failed for {len(queries)} query variations: {e}")
+            all_results = []
+
+        flattened_results = [result for results in all_results for result in results]
 
         # Merge and deduplicate
         return self._merge_results(flattened_results, top_k)
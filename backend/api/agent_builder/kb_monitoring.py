@@ -157,6 +157,7 @@ async def get_kb_profiles(
     
     **Returns**:
     - List of KB profiles with performance metrics
+    - Per-KB search latency percentiles (seconds)
     
     **Requires**: Authentication
     """
@@ -177,7 +178,8 @@ async def get_kb_profiles(
         
         return {
             'total_profiles': len(profiles),
-            'profiles': profiles
+            'profiles': profiles,
+            'latency': optimizer.get_latency_stats()
         }
         
     except Exception as e:
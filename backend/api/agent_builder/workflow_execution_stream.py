@@ -103,12 +103,15 @@ async def execution_event_generator(
                             'end_time': status.get('end_time'),
                             'error': status.get('error'),
                             'output': status.get('output'),
+                            'progress': status.get('progress'),
+                            'partial_results': status.get('partial_results'),
                             'timestamp': datetime.now().timestamp(),
                         }
                         
                         logger.info(f"📨 Sending node status: {node_id} -> {status.get('status')}")
                         yield f"data: {json.dumps(event_data)}\n\n"
-                        last_status[node_id] = status
+                        # Copy: the executor updates node statuses in place
+                        last_status[node_id] = dict(status)
                 
                 # Check if execution task is done
                 if execution_task.done():
@@ -139,6 +139,33 @@ async def get_cache_warmer_stats():
         )
 
 
+@router.get("/workflow")
+async def get_workflow_cache_metrics():
+    """
+    Get workflow execution cache metrics.
+    
+    Returns statistics of the compiled workflow graph cache and the
+    node result cache shared by workflow executions.
+    """
+    try:
+        from backend.services.agent_builder.node_result_cache import get_node_result_cache
+        from backend.services.agent_builder.workflow_graph import get_compiled_cache_stats
+        
+        return {
+            "service": "workflow_cache",
+            "timestamp": datetime.utcnow().isoformat(),
+            "compiled_graphs": get_compiled_cache_stats(),
+            "node_results": get_node_result_cache().get_stats(),
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to get workflow cache metrics: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get workflow cache metrics: {str(e)}"
+        )
+
+
 @router.get("/all")
 async def get_all_cache_metrics():
     """
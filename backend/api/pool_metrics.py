@@ -127,6 +127,36 @@ async def get_milvus_pool_metrics():
         )
 
 
+@router.get("/extraction")
+async def get_extraction_pool_metrics():
+    """
+    Get document extraction process pool metrics.
+    
+    Returns:
+    - Back-pressure (queue depth, max queue depth, average queue wait)
+    - Worker lifecycle (started, recycled, killed on timeout)
+    - Per-format latency (avg, p95, max), errors and timeouts
+    """
+    try:
+        from backend.services.extraction_pool import get_extraction_pool
+        
+        pool = get_extraction_pool()
+        
+        return {
+            "service": "extraction",
+            "timestamp": datetime.utcnow().isoformat(),
+            "enabled": pool is not None,
+            "metrics": pool.get_stats() if pool else None,
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to get extraction pool metrics: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get extraction pool metrics: {str(e)}"
+        )
+
+
 @router.get("/all")
 async def get_all_pool_metrics():
     """
@@ -15,7 +15,7 @@ def add_rate_limit_middleware(app):
     
     @app.middleware("http")
     async def rate_limit_middleware(request: Request, call_next):
-        from backend.core.rate_limiter import RateLimiter
+        from backend.core.rate_limiter import get_rate_limiter
         from backend.core.dependencies import get_redis_client
         
         # Skip rate limiting for health checks and static files
@@ -36,8 +36,8 @@ def add_rate_limit_middleware(app):
             except:
                 pass
             
-            # Create rate limiter with default limits
-            rate_limiter = RateLimiter(
+            # Shared rate limiter with default limits
+            rate_limiter = get_rate_limiter(
                 redis_client=redis_client,
                 requests_per_minute=60,
                 requests_per_hour=1000,
@@ -81,6 +81,24 @@ class EmbeddingSettings(BaseSettings):
     EMBEDDING_BATCH_SIZE_SMALL: int = Field(default=10, description="Batch size for small docs")
     EMBEDDING_BATCH_SIZE_MEDIUM: int = Field(default=32, description="Batch size for medium docs")
     EMBEDDING_BATCH_SIZE_LARGE: int = Field(default=64, description="Batch size for large docs")
+    
+    # Cross-request micro-batching for embed_text
+    EMBEDDING_MICROBATCH_MAX_SIZE: int = Field(
+        default=32, description="Max concurrent embed_text calls coalesced per model call (1 = off)"
+    )
+    EMBEDDING_MICROBATCH_MAX_WAIT_MS: float = Field(
+        default=5.0, description="Max time an embed_text call waits for its micro-batch"
+    )
+
+    # Persistent content-addressed embedding cache
+    ENABLE_EMBEDDING_CACHE: bool = Field(default=True, description="Enable embedding cache")
+    EMBEDDING_CACHE_PATH: str = Field(
+        default="./data/embedding_cache/embeddings.sqlite3",
+        description="SQLite file for the on-disk embedding cache tier"
+    )
+    EMBEDDING_CACHE_MEMORY_ENTRIES: int = Field(
+        default=50000, description="Vectors kept in the in-process LRU tier"
+    )
 
 
 # Embedding Model Dimension Mapping
@@ -159,6 +159,8 @@ class ServiceContainer:
                 db=settings.REDIS_DB,
                 password=settings.REDIS_PASSWORD,
                 ttl=3600,
+                max_messages=settings.STM_MAX_MESSAGES or None,
+                serializer=settings.STM_SERIALIZER,
             )
 
             # Initialize LTM with separate Milvus collection
@@ -380,6 +382,7 @@ class ServiceContainer:
 
         if self._milvus_manager:
             try:
+                await self._milvus_manager.close_writer()
                 self._milvus_manager.disconnect()
                 logger.info("Milvus connection closed")
             except Exception as e:
@@ -128,6 +128,8 @@ def get_short_term_memory() -> ShortTermMemory:
         db=settings.REDIS_DB,
         password=settings.REDIS_PASSWORD,
         ttl=settings.STM_TTL,
+        max_messages=settings.STM_MAX_MESSAGES or None,
+        serializer=settings.STM_SERIALIZER,
     )
 
 
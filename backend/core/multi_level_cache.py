@@ -4,7 +4,7 @@ Multi-Level Cache System - Phase 3.1 + Mode-Aware Caching
 3-tier caching for maximum performance:
 - L1: In-memory LRU (fastest, 100% hit = 0ms)
 - L2: Redis (fast, 100% hit = 10ms)
-- L3: Semantic (Milvus-based, similar queries)
+- L3: Semantic (local vector index persisted to Milvus, similar queries)
 
 Mode-aware caching strategy:
 - FAST: L1 only (fastest access, TTL=3600s)
@@ -17,16 +17,25 @@ Expected impact:
 - Additional 40% LLM cost reduction
 """
 
+import asyncio
 import hashlib
 import logging
-from typing import Optional, Any, Dict
+import time
+import weakref
+from collections import OrderedDict
+from typing import Optional, Any, Dict, List
 from datetime import datetime, timedelta
 from functools import lru_cache
 from enum import Enum
 import json
 
+from backend.core.vector_index import FlatVectorIndex
+
 logger = logging.getLogger(__name__)
 
+# Live L3 caches, so shutdown can flush their buffered Milvus writes
+_l3_caches: "weakref.WeakSet[L3Cache]" = weakref.WeakSet()
+
 
 class CacheStrategy(str, Enum):
     """Cache strategy for different query modes."""
@@ -272,14 +281,33 @@ class L2Cache:
 
 class L3Cache:
     """
-    L3: Semantic cache (Milvus-based).
+    L3: Semantic cache (local vector index, persisted to Milvus).
 
     Finds similar queries using embeddings.
     Useful for paraphrased or similar questions.
+
+    Lookups search an in-process FlatVectorIndex (sub-millisecond after the
+    query is embedded). New entries are indexed locally at once and buffered
+    for Milvus, which receives them as batched inserts when the buffer fills
+    or every ``flush_interval`` seconds. While Milvus is unavailable the
+    buffer keeps at most ``max_pending`` entries (oldest dropped first).
+
+    ``milvus_manager`` is bound to the ``query_cache`` collection. The index
+    is loaded from it (``iter_chunks``) on first use, so entries survive
+    restarts, and re-synced in the background every ``sync_interval``
+    seconds to pick up entries flushed by other workers.
     """
 
     def __init__(
-        self, milvus_manager, embedding_service, similarity_threshold: float = 0.95
+        self,
+        milvus_manager,
+        embedding_service,
+        similarity_threshold: float = 0.95,
+        max_entries: int = 10000,
+        flush_batch_size: int = 100,
+        flush_interval: float = 30.0,
+        max_pending: int = 1000,
+        sync_interval: float = 60.0,
     ):
         """
         Initialize L3 cache.
@@ -288,14 +316,107 @@ class L3Cache:
             milvus_manager: Milvus manager
             embedding_service: Embedding service
             similarity_threshold: Minimum similarity for cache hit
+            max_entries: Maximum entries kept in the local index
+            flush_batch_size: Buffered writes that trigger a Milvus insert
+            flush_interval: Maximum seconds a write waits in the buffer
+            max_pending: Maximum buffered writes kept across failed flushes
+            sync_interval: Seconds between re-syncs of the index from Milvus
         """
         self.milvus = milvus_manager
         self.embedding = embedding_service
         self.threshold = similarity_threshold
         self.collection_name = "query_cache"
+        self.max_entries = max_entries
+        self.flush_batch_size = flush_batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max(max_pending, flush_batch_size)
+        self.sync_interval = sync_interval
         self._mode_hits = {"fast": 0, "balanced": 0, "deep": 0}
 
-        logger.info(f"L3Cache initialized: " f"threshold={similarity_threshold}")
+        # Local index: query hash -> vector, plus the cached results (oldest first)
+        self._index = FlatVectorIndex()
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+
+        # Write-behind buffer for Milvus
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Loading from Milvus: inline on first use, then in the background
+        self._warmed = False
+        self._last_sync = 0.0
+        self._sync_task: Optional[asyncio.Task] = None
+
+        self.stats_flushes = 0
+        self.stats_flushed_rows = 0
+        self.stats_dropped_writes = 0
+        self.stats_synced_rows = 0
+
+        _l3_caches.add(self)
+
+        logger.info(
+            f"L3Cache initialized: threshold={similarity_threshold}, "
+            f"max_entries={max_entries}, flush_batch_size={flush_batch_size}"
+        )
+
+    @staticmethod
+    def _make_key(query: str) -> str:
+        """Create index key from query."""
+        return hashlib.md5(query.encode()).hexdigest()
+
+    def _index_result(self, result: CachedResult, embedding) -> None:
+        """Add a result to the local index, evicting the oldest entries."""
+        key = self._make_key(result.query)
+        if not self._index.add(key, embedding):
+            return
+
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest_key, _ = self._entries.popitem(last=False)
+            self._index.remove(oldest_key)
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._index.remove(key)
+
+    async def _sync(self) -> None:
+        """Load entries persisted to Milvus (by any worker) into the local index."""
+        self._last_sync = time.monotonic()
+        loaded = 0
+        try:
+            async for rows in self.milvus.iter_chunks(
+                output_fields=["query", "response", "metadata", "timestamp", "embedding"],
+            ):
+                for row in rows:
+                    try:
+                        if self._make_key(row["query"]) in self._entries:
+                            continue
+                        result = CachedResult(
+                            query=row["query"],
+                            response=row["response"],
+                            metadata=row.get("metadata") or {},
+                            timestamp=datetime.fromisoformat(row["timestamp"]),
+                        )
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    if not result.is_expired():
+                        self._index_result(result, row["embedding"])
+                        loaded += 1
+        except Exception as e:
+            logger.warning(f"L3 cache sync from Milvus failed: {e}")
+            return
+
+        self.stats_synced_rows += loaded
+        logger.debug(f"L3 cache synced {loaded} new entries from Milvus")
+
+    def _ensure_sync_task(self) -> None:
+        """Start a background re-sync once ``sync_interval`` has elapsed."""
+        if time.monotonic() - self._last_sync < self.sync_interval:
+            return
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(self._sync())
 
     async def find_similar(
         self, query: str, threshold: Optional[float] = None, mode: Optional[str] = None
@@ -304,42 +425,41 @@ class L3Cache:
         threshold = threshold or self.threshold
 
         try:
+            if not self._warmed:
+                self._warmed = True
+                await self._sync()
+            else:
+                self._ensure_sync_task()
+
+            if not self._entries:
+                return None
+
             # Generate query embedding
             query_embedding = await self.embedding.embed_text(query)
 
-            # Search for similar queries
-            results = await self.milvus.search(
-                collection_name=self.collection_name,
-                query_vectors=[query_embedding],
-                limit=1,
-                output_fields=["query", "response", "metadata", "timestamp"],
-            )
+            # Search the local index
+            matches = self._index.search(query_embedding, top_k=1)
 
-            if results and results[0]:
-                result = results[0][0]
-                similarity = result.score
+            if matches:
+                key, similarity = matches[0]
 
                 if similarity >= threshold:
-                    cached_result = CachedResult(
-                        query=result.entity.get("query"),
-                        response=result.entity.get("response"),
-                        metadata=result.entity.get("metadata", {}),
-                        timestamp=datetime.fromisoformat(
-                            result.entity.get("timestamp")
-                        ),
-                    )
+                    cached_result = self._entries[key]
 
                     # Check expiration
-                    if not cached_result.is_expired():
-                        # Track mode-specific hits
-                        if mode:
-                            self._mode_hits[mode] = self._mode_hits.get(mode, 0) + 1
-
-                        logger.debug(
-                            f"L3 cache hit: {query[:50]} "
-                            f"(similarity={similarity:.3f}, mode={mode})"
-                        )
-                        return cached_result
+                    if cached_result.is_expired():
+                        self._remove(key)
+                        return None
+
+                    # Track mode-specific hits
+                    if mode:
+                        self._mode_hits[mode] = self._mode_hits.get(mode, 0) + 1
+
+                    logger.debug(
+                        f"L3 cache hit: {query[:50]} "
+                        f"(similarity={similarity:.3f}, mode={mode})"
+                    )
+                    return cached_result
 
         except Exception as e:
             logger.error(f"L3 cache find error: {e}")
@@ -347,30 +467,106 @@ class L3Cache:
         return None
 
     async def add(self, query: str, result: CachedResult):
-        """Add to L3 cache."""
+        """Add to L3 cache (indexed locally, persisted to Milvus in batches)."""
         try:
             # Generate embedding
             query_embedding = await self.embedding.embed_text(query)
 
-            # Insert into Milvus
-            await self.milvus.insert(
-                collection_name=self.collection_name,
-                data=[
-                    {
-                        "query": query,
-                        "response": result.response,
-                        "metadata": result.metadata,
-                        "timestamp": result.timestamp.isoformat(),
-                        "embedding": query_embedding,
-                    }
-                ],
+            self._index_result(result, query_embedding)
+
+            # Buffer for Milvus
+            self._pending.append(
+                {
+                    "query": query,
+                    "response": result.response,
+                    "metadata": result.metadata,
+                    "timestamp": result.timestamp.isoformat(),
+                    "embedding": query_embedding,
+                }
             )
 
+            self._trim_pending()
+
+            if len(self._pending) >= self.flush_batch_size:
+                await self.flush()
+            else:
+                self._ensure_flush_task()
+
             logger.debug(f"L3 cache add: {query[:50]}")
 
         except Exception as e:
             logger.error(f"L3 cache add error: {e}")
 
+    def _trim_pending(self) -> None:
+        """Drop the oldest buffered writes beyond max_pending."""
+        overflow = len(self._pending) - self.max_pending
+        if overflow > 0:
+            del self._pending[:overflow]
+            self.stats_dropped_writes += overflow
+            logger.warning(f"L3 cache write buffer full: dropped {overflow} oldest entries")
+
+    def _ensure_flush_task(self) -> None:
+        """Start the periodic flush task if it is not running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Bulk-insert buffered entries into Milvus.
+
+        Returns:
+            Number of rows written
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = self._pending, []
+            try:
+                await self.milvus.insert(collection_name=self.collection_name, data=batch)
+            except Exception as e:
+                # Keep the rows for the next flush (bounded)
+                self._pending = batch + self._pending
+                self._trim_pending()
+                logger.error(f"L3 cache flush error ({len(batch)} rows): {e}")
+                return 0
+
+            self.stats_flushes += 1
+            self.stats_flushed_rows += len(batch)
+            logger.debug(f"L3 cache flushed {len(batch)} rows to Milvus")
+            return len(batch)
+
+    async def close(self) -> None:
+        """Stop the periodic flush and sync, and write any buffered entries."""
+        for task in (self._flush_task, self._sync_task):
+            if task is not None and not task.done():
+                task.cancel()
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "pending_writes": len(self._pending),
+            "flushes": self.stats_flushes,
+            "flushed_rows": self.stats_flushed_rows,
+            "dropped_writes": self.stats_dropped_writes,
+            "synced_rows": self.stats_synced_rows,
+            "mode_hits": self._mode_hits,
+        }
+
+
+async def close_l3_caches() -> None:
+    """Flush buffered Milvus writes of every live L3 cache (call at shutdown)."""
+    for cache in list(_l3_caches):
+        await cache.close()
+
 
 class MultiLevelCache:
     """
@@ -381,7 +577,7 @@ class MultiLevelCache:
     Cache hierarchy:
     1. L1: Check in-memory (0ms)
     2. L2: Check Redis (10ms)
-    3. L3: Check semantic similarity (50ms)
+    3. L3: Check semantic similarity (embedding + local index search)
     4. Miss: Execute query (300ms+)
 
     On hit, populate upper levels for faster future access.
@@ -674,6 +870,11 @@ class MultiLevelCache:
 
         logger.info("All cache levels cleared")
 
+    async def close(self):
+        """Flush buffered L3 writes to Milvus."""
+        if self.enabled and self.l3:
+            await self.l3.close()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics including mode-specific metrics."""
         total_requests = sum(self.stats_hits.values()) + self.stats_misses
@@ -707,6 +908,7 @@ class MultiLevelCache:
             "l1_stats": self.l1.stats() if self.enabled else {},
             "l2_stats": {} if not self.l2 else {},  # Async, skip for now
             "l3_enabled": self.l3 is not None,
+            "l3_stats": self.l3.stats() if self.enabled and self.l3 else {},
         }
 
     def get_hit_rate(self) -> float:
@@ -64,6 +64,11 @@ class LRUCache:
         self.cache[key] = value
         self.timestamps[key] = datetime.utcnow()
 
+    def delete(self, key: str) -> bool:
+        """Remove a cache entry. Returns True if it was present."""
+        self.timestamps.pop(key, None)
+        return self.cache.pop(key, None) is not None
+
     def clear(self):
         """Clear all cache entries."""
         self.cache.clear()
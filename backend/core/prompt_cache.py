@@ -7,13 +7,16 @@ Reduces LLM costs by 30-50% through intelligent prompt caching.
 import logging
 import json
 import hashlib
-from typing import Optional, List, Tuple
+import time
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timedelta
 
 import numpy as np
 import redis.asyncio as redis
 from sentence_transformers import SentenceTransformer
 
+from backend.core.vector_index import FlatVectorIndex
+
 
 logger = logging.getLogger(__name__)
 
@@ -27,15 +30,24 @@ class SemanticPromptCache:
     - Embedding-based matching
     - Response reuse for similar prompts
     - Cost reduction (30-50%)
+    
+    Prompt embeddings are mirrored in a local vector index per model, loaded
+    from Redis with pipelined batch GETs and re-synced periodically to pick up
+    entries written by other workers. A lookup searches the local index and
+    only goes to Redis for the matching response. Per-model sorted sets
+    (score = insert time) back LRU eviction.
     """
     
+    SYNC_BATCH_SIZE = 500
+    
     def __init__(
         self,
         redis_client: redis.Redis,
         similarity_threshold: float = 0.95,
         model_name: str = 'all-MiniLM-L6-v2',
         ttl: int = 3600,
-        max_cache_size: int = 10000
+        max_cache_size: int = 10000,
+        sync_interval: float = 60.0
     ):
         """
         Initialize Semantic Prompt Cache.
@@ -46,11 +58,17 @@ class SemanticPromptCache:
             model_name: Sentence transformer model
             ttl: Cache TTL in seconds
             max_cache_size: Maximum cached prompts
+            sync_interval: Seconds between re-syncs of the local index from Redis
         """
         self.redis = redis_client
         self.threshold = similarity_threshold
         self.ttl = ttl
         self.max_cache_size = max_cache_size
+        self.sync_interval = sync_interval
+        
+        # Local vector index per LLM model, keyed by prompt hash
+        self._indexes: Dict[str, FlatVectorIndex] = {}
+        self._last_sync: Dict[str, float] = {}
         
         # Load embedding model
         try:
@@ -98,14 +116,14 @@ class SemanticPromptCache:
             )
             
             if similar_prompt:
-                self.stats["hits"] += 1
-                
                 # Get cached response
-                cache_key = self._get_cache_key(similar_prompt["prompt"], model)
+                cache_key = self._key("data", model, similar_prompt["prompt_hash"])
                 cached_data = await self.redis.get(cache_key)
                 
                 if cached_data:
+                    self.stats["hits"] += 1
                     data = json.loads(cached_data)
+                    similar_prompt["prompt"] = data["prompt"]
                     
                     logger.info(
                         f"Cache hit with similarity: {similar_prompt['similarity']:.3f}",
@@ -123,6 +141,9 @@ class SemanticPromptCache:
                         "original_prompt": similar_prompt["prompt"],
                         "timestamp": data["timestamp"]
                     }
+                
+                # Expired in Redis since the last sync
+                await self._remove_from_cache(similar_prompt["prompt_hash"], model)
             
             self.stats["misses"] += 1
             return None
@@ -154,9 +175,9 @@ class SemanticPromptCache:
             # Generate embedding
             embedding = self.encoder.encode(prompt)
             
-            # Store prompt with embedding
-            cache_key = self._get_cache_key(prompt, model)
-            embedding_key = self._get_embedding_key(prompt, model)
+            embedding = np.asarray(embedding, dtype=np.float32)
+            prompt_hash = self._hash_prompt(prompt)
+            now = time.time()
             
             # Cache data
             cache_data = {
@@ -167,25 +188,28 @@ class SemanticPromptCache:
                 "metadata": metadata or {}
             }
             
-            # Store response
-            await self.redis.setex(
-                cache_key,
-                self.ttl,
-                json.dumps(cache_data)
-            )
+            # Store response, embedding and index entry in one round trip
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(
+                    self._key("data", model, prompt_hash),
+                    self.ttl,
+                    json.dumps(cache_data)
+                )
+                pipe.setex(
+                    self._key("embedding", model, prompt_hash),
+                    self.ttl,
+                    embedding.tobytes()
+                )
+                pipe.zadd(self._index_key(model), {prompt_hash: now})
+                pipe.zcard(self._index_key(model))
+                results = await pipe.execute()
             
-            # Store embedding
-            await self.redis.setex(
-                embedding_key,
-                self.ttl,
-                embedding.tobytes()
-            )
-            
-            # Add to index
-            await self._add_to_index(prompt, model)
+            # Add to the local index (load it first so the sync sees this entry)
+            index = await self._get_index(model)
+            index.add(prompt_hash, embedding)
             
             # Enforce max cache size
-            await self._enforce_cache_limit(model)
+            await self._enforce_cache_limit(model, cache_size=results[-1])
             
             logger.debug(f"Cached prompt-response pair for model: {model}")
             
@@ -198,57 +222,110 @@ class SemanticPromptCache:
         model: str
     ) -> Optional[dict]:
         """
-        Find most similar cached prompt.
+        Find most similar cached prompt in the local index.
         
         Args:
             query_embedding: Query embedding
             model: LLM model name
             
         Returns:
-            Dict with prompt and similarity or None
+            Dict with prompt_hash and similarity or None
         """
-        # Get all cached prompts for this model
-        index_key = f"prompt_cache:index:{model}"
-        cached_prompts = await self.redis.smembers(index_key)
+        index = await self._get_index(model)
+        matches = index.search(query_embedding, top_k=1)
         
-        if not cached_prompts:
+        if not matches:
             return None
         
-        best_match = None
-        best_similarity = 0.0
+        prompt_hash, similarity = matches[0]
+        if similarity < self.threshold:
+            return None
         
-        # Compare with each cached prompt
-        for prompt_hash in cached_prompts:
-            prompt_hash = prompt_hash.decode() if isinstance(prompt_hash, bytes) else prompt_hash
-            
-            # Get embedding
-            embedding_key = f"prompt_cache:embedding:{model}:{prompt_hash}"
-            embedding_bytes = await self.redis.get(embedding_key)
-            
-            if not embedding_bytes:
-                continue
-            
-            # Convert bytes to numpy array
-            cached_embedding = np.frombuffer(embedding_bytes, dtype=np.float32)
-            
-            # Calculate cosine similarity
-            similarity = self._cosine_similarity(query_embedding, cached_embedding)
+        return {
+            "prompt_hash": prompt_hash,
+            "similarity": similarity
+        }
+    
+    async def _get_index(self, model: str) -> FlatVectorIndex:
+        """Return the local index for a model, syncing it from Redis when stale."""
+        index = self._indexes.get(model)
+        last_sync = self._last_sync.get(model, 0.0)
+        
+        if index is None or time.monotonic() - last_sync >= self.sync_interval:
+            index = await self._sync_index(model, index)
+        
+        return index
+    
+    async def _sync_index(
+        self,
+        model: str,
+        index: Optional[FlatVectorIndex] = None
+    ) -> FlatVectorIndex:
+        """
+        Load a model's prompt embeddings from Redis into the local index.
+        
+        Expired index entries are trimmed, then embeddings are fetched with
+        pipelined GETs in batches of SYNC_BATCH_SIZE. Only prompts not already
+        indexed locally are fetched; local entries gone from Redis are dropped.
+        """
+        if index is None:
+            index = FlatVectorIndex()
+            self._indexes[model] = index
+        self._last_sync[model] = time.monotonic()
+        
+        index_key = self._index_key(model)
+        await self._migrate_legacy_index(model)
+        
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(index_key, 0, time.time() - self.ttl)
+            pipe.zrange(index_key, 0, -1)
+            _, members = await pipe.execute()
+        
+        prompt_hashes = [
+            member.decode() if isinstance(member, bytes) else member
+            for member in members
+        ]
+        
+        remote = set(prompt_hashes)
+        for prompt_hash in index.keys():
+            if prompt_hash not in remote:
+                index.remove(prompt_hash)
+        
+        missing = [h for h in prompt_hashes if h not in index]
+        for start in range(0, len(missing), self.SYNC_BATCH_SIZE):
+            batch = missing[start:start + self.SYNC_BATCH_SIZE]
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for prompt_hash in batch:
+                    pipe.get(self._key("embedding", model, prompt_hash))
+                embeddings = await pipe.execute()
             
-            if similarity > best_similarity and similarity >= self.threshold:
-                best_similarity = similarity
-                
-                # Get original prompt
-                cache_key = f"prompt_cache:data:{model}:{prompt_hash}"
-                cached_data = await self.redis.get(cache_key)
-                
-                if cached_data:
-                    data = json.loads(cached_data)
-                    best_match = {
-                        "prompt": data["prompt"],
-                        "similarity": similarity
-                    }
+            for prompt_hash, embedding_bytes in zip(batch, embeddings):
+                if embedding_bytes:
+                    index.add(
+                        prompt_hash,
+                        np.frombuffer(embedding_bytes, dtype=np.float32)
+                    )
+        
+        logger.debug(
+            f"Synced prompt cache index for model {model}: "
+            f"{len(index)} prompts ({len(missing)} fetched)"
+        )
         
-        return best_match
+        return index
+    
+    async def _migrate_legacy_index(self, model: str):
+        """Move prompts from the pre-sorted-set SET index into the sorted set."""
+        legacy_key = f"prompt_cache:index:{model}"
+        if not await self.redis.exists(legacy_key):
+            return
+        
+        members = await self.redis.smembers(legacy_key)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if members:
+                # Unknown insert time: treat as oldest so they are evicted first
+                pipe.zadd(self._index_key(model), {m: time.time() - self.ttl + 1 for m in members})
+            pipe.delete(legacy_key)
+            await pipe.execute()
     
     def _cosine_similarity(
         self,
@@ -265,63 +342,60 @@ class SemanticPromptCache:
         
         return float(dot_product / (norm1 * norm2))
     
+    def _hash_prompt(self, prompt: str) -> str:
+        return hashlib.md5(prompt.encode()).hexdigest()
+    
+    def _key(self, kind: str, model: str, prompt_hash: str) -> str:
+        return f"prompt_cache:{kind}:{model}:{prompt_hash}"
+    
+    def _index_key(self, model: str) -> str:
+        """Sorted set of prompt hashes scored by insert time."""
+        return f"prompt_cache:zindex:{model}"
+    
     def _get_cache_key(self, prompt: str, model: str) -> str:
         """Generate cache key for prompt."""
-        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()
-        return f"prompt_cache:data:{model}:{prompt_hash}"
+        return self._key("data", model, self._hash_prompt(prompt))
     
     def _get_embedding_key(self, prompt: str, model: str) -> str:
         """Generate embedding key for prompt."""
-        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()
-        return f"prompt_cache:embedding:{model}:{prompt_hash}"
-    
-    async def _add_to_index(self, prompt: str, model: str):
-        """Add prompt to index."""
-        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()
-        index_key = f"prompt_cache:index:{model}"
-        await self.redis.sadd(index_key, prompt_hash)
+        return self._key("embedding", model, self._hash_prompt(prompt))
     
-    async def _enforce_cache_limit(self, model: str):
-        """Enforce maximum cache size (LRU eviction)."""
-        index_key = f"prompt_cache:index:{model}"
-        cache_size = await self.redis.scard(index_key)
+    async def _enforce_cache_limit(self, model: str, cache_size: Optional[int] = None):
+        """Enforce maximum cache size (evict oldest by sorted-set score)."""
+        index_key = self._index_key(model)
+        if cache_size is None:
+            cache_size = await self.redis.zcard(index_key)
         
         if cache_size > self.max_cache_size:
-            # Get all prompts
-            prompts = await self.redis.smembers(index_key)
-            
-            # Sort by timestamp (oldest first)
-            prompt_times = []
-            for prompt_hash in prompts:
-                prompt_hash = prompt_hash.decode() if isinstance(prompt_hash, bytes) else prompt_hash
-                cache_key = f"prompt_cache:data:{model}:{prompt_hash}"
-                
-                cached_data = await self.redis.get(cache_key)
-                if cached_data:
-                    data = json.loads(cached_data)
-                    timestamp = datetime.fromisoformat(data["timestamp"])
-                    prompt_times.append((prompt_hash, timestamp))
-            
-            # Sort and remove oldest
-            prompt_times.sort(key=lambda x: x[1])
             to_remove = cache_size - self.max_cache_size
+            oldest = await self.redis.zrange(index_key, 0, to_remove - 1)
             
-            for prompt_hash, _ in prompt_times[:to_remove]:
-                await self._remove_from_cache(prompt_hash, model)
+            await self._remove_many(
+                [h.decode() if isinstance(h, bytes) else h for h in oldest],
+                model
+            )
     
     async def _remove_from_cache(self, prompt_hash: str, model: str):
         """Remove prompt from cache."""
-        # Remove from index
-        index_key = f"prompt_cache:index:{model}"
-        await self.redis.srem(index_key, prompt_hash)
+        await self._remove_many([prompt_hash], model)
+    
+    async def _remove_many(self, prompt_hashes: List[str], model: str):
+        """Remove prompts from Redis (one pipeline) and the local index."""
+        if not prompt_hashes:
+            return
         
-        # Remove data
-        cache_key = f"prompt_cache:data:{model}:{prompt_hash}"
-        await self.redis.delete(cache_key)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zrem(self._index_key(model), *prompt_hashes)
+            pipe.delete(
+                *[self._key("data", model, h) for h in prompt_hashes],
+                *[self._key("embedding", model, h) for h in prompt_hashes]
+            )
+            await pipe.execute()
         
-        # Remove embedding
-        embedding_key = f"prompt_cache:embedding:{model}:{prompt_hash}"
-        await self.redis.delete(embedding_key)
+        index = self._indexes.get(model)
+        if index is not None:
+            for prompt_hash in prompt_hashes:
+                index.remove(prompt_hash)
     
     async def get_stats(self) -> dict:
         """Get cache statistics."""
@@ -343,12 +417,15 @@ class SemanticPromptCache:
         """Clear cache for model or all models."""
         if model:
             # Clear specific model
-            index_key = f"prompt_cache:index:{model}"
-            prompts = await self.redis.smembers(index_key)
+            await self._migrate_legacy_index(model)
+            prompts = await self.redis.zrange(self._index_key(model), 0, -1)
             
-            for prompt_hash in prompts:
-                prompt_hash = prompt_hash.decode() if isinstance(prompt_hash, bytes) else prompt_hash
-                await self._remove_from_cache(prompt_hash, model)
+            await self._remove_many(
+                [h.decode() if isinstance(h, bytes) else h for h in prompts],
+                model
+            )
+            self._indexes.pop(model, None)
+            self._last_sync.pop(model, None)
             
             logger.info(f"Cleared cache for model: {model}")
         else:
@@ -357,6 +434,9 @@ class SemanticPromptCache:
             if keys:
                 await self.redis.delete(*keys)
             
+            self._indexes.clear()
+            self._last_sync.clear()
+            
             logger.info("Cleared all prompt cache")
 
 
@@ -6,13 +6,97 @@ and per-endpoint configuration.
 """
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Tuple, Optional, Dict
-from datetime import datetime
+from datetime import datetime, timedelta
 from redis.asyncio import Redis
 from fastapi import Request, HTTPException, status, Depends
 
 logger = logging.getLogger(__name__)
 
+# Window name -> (key time format, TTL seconds)
+_WINDOWS = (
+    ("minute", "%Y%m%d%H%M", 60),
+    ("hour", "%Y%m%d%H", 3600),
+    ("day", "%Y%m%d", 86400),
+)
+
+# Check all windows and, only if every one has room, increment them all.
+# KEYS: minute, hour, day counters, then the reset generation;
+# ARGV: limits followed by TTLs.
+# Returns {allowed, minute_count, hour_count, day_count, reset_generation};
+# counts are after the increment when allowed, current values when blocked.
+_CHECK_AND_INCREMENT_LUA = """
+local generation = tonumber(redis.call('GET', KEYS[4]) or '0')
+local counts = {}
+for i = 1, 3 do
+    counts[i] = tonumber(redis.call('GET', KEYS[i]) or '0')
+end
+for i = 1, 3 do
+    if counts[i] >= tonumber(ARGV[i]) then
+        return {0, counts[1], counts[2], counts[3], generation}
+    end
+end
+for i = 1, 3 do
+    counts[i] = redis.call('INCR', KEYS[i])
+    if counts[i] == 1 then
+        redis.call('EXPIRE', KEYS[i], ARGV[3 + i])
+    end
+end
+return {1, counts[1], counts[2], counts[3], generation}
+"""
+
+# Identifiers tracked by the local pre-check (least recently seen dropped first)
+_MAX_LOCAL_BUCKETS = 100_000
+
+# Minimum seconds between reset-generation reads for a locally rejected identifier
+_RESET_CHECK_INTERVAL = 1.0
+
+# Per-identifier limits from RateLimitConfigService: (identifier, endpoint) -> (limits, expires_at)
+_limits_cache: "OrderedDict[Tuple[str, Optional[str]], Tuple[Dict[str, int], float]]" = OrderedDict()
+_limits_cache_lock = threading.Lock()
+_MAX_CACHED_LIMITS = 10_000
+
+
+def invalidate_rate_limit_config(identifier: Optional[str] = None) -> None:
+    """
+    Drop cached per-identifier limits after a config change.
+
+    Other processes pick the change up when their cache entry expires
+    (RATE_LIMIT_CONFIG_CACHE_TTL).
+
+    Args:
+        identifier: Identifier whose limits changed (None = all)
+    """
+    with _limits_cache_lock:
+        if identifier is None:
+            _limits_cache.clear()
+            return
+        for key in [key for key in _limits_cache if key[0] == identifier]:
+            del _limits_cache[key]
+
+
+class _LocalBucket:
+    """Per-identifier state of the local pre-check."""
+
+    __slots__ = (
+        "rpm", "tokens", "updated_at", "blocked_until", "remaining", "message",
+        "reset_generation", "reset_checked_at",
+    )
+
+    def __init__(self, rpm: int, now: float):
+        self.rpm = rpm
+        self.tokens = float(2 * rpm)
+        self.updated_at = now
+        self.blocked_until = 0.0
+        self.remaining: Dict[str, int] = {}
+        self.message: Optional[str] = None
+        # Reset generation seen in the last Redis verdict
+        self.reset_generation: Optional[int] = None
+        self.reset_checked_at = now
+
 
 class RateLimiter:
     """
@@ -23,6 +107,22 @@ class RateLimiter:
     - Per-user and per-IP rate limiting
     - Per-endpoint rate limits
     - Graceful degradation if Redis is unavailable
+
+    All windows are checked and incremented by one Lua script, so a check
+    costs a single Redis round trip; blocked requests do not consume quota.
+    Per-identifier limits from the database are cached in-process.
+
+    The optional local pre-check rejects without touching Redis when the
+    outcome is already known:
+    - Redis blocked the identifier and the blocking window has not rolled over
+    - This process alone admitted more than the fixed windows can allow: a
+      token bucket of 2 x rpm refilled at rpm per minute, which never runs
+      dry while the Redis limit still has room
+
+    reset_limit bumps a reset generation in Redis. Every Redis verdict
+    returns it, and a process rejecting an identifier locally re-reads it
+    (at most once per second per identifier), so a reset lifts local blocks
+    in all workers.
     """
 
     def __init__(
@@ -32,6 +132,8 @@ class RateLimiter:
         requests_per_hour: int = 1000,
         requests_per_day: int = 10000,
         enabled: bool = True,
+        local_precheck: Optional[bool] = None,
+        config_cache_ttl: Optional[int] = None,
     ):
         """
         Initialize rate limiter.
@@ -42,12 +144,147 @@ class RateLimiter:
             requests_per_hour: Maximum requests per hour
             requests_per_day: Maximum requests per day
             enabled: Whether rate limiting is enabled
+            local_precheck: Shed over-limit clients in-process
+                (default: RATE_LIMIT_LOCAL_PRECHECK)
+            config_cache_ttl: Seconds DB limits are cached
+                (default: RATE_LIMIT_CONFIG_CACHE_TTL)
         """
+        if local_precheck is None or config_cache_ttl is None:
+            from backend.config import settings
+
+            if local_precheck is None:
+                local_precheck = settings.RATE_LIMIT_LOCAL_PRECHECK
+            if config_cache_ttl is None:
+                config_cache_ttl = settings.RATE_LIMIT_CONFIG_CACHE_TTL
+
         self.redis = redis_client
         self.rpm = requests_per_minute
         self.rph = requests_per_hour
         self.rpd = requests_per_day
         self.enabled = enabled
+        self.local_precheck = local_precheck
+        self.config_cache_ttl = config_cache_ttl
+
+        self._script = redis_client.register_script(_CHECK_AND_INCREMENT_LUA)
+        self._buckets: "OrderedDict[Tuple[str, Optional[str]], _LocalBucket]" = OrderedDict()
+        self._buckets_lock = threading.Lock()
+
+        self.stats = {"checks": 0, "redis_checks": 0, "blocked": 0, "local_blocked": 0}
+
+    def _get_limits(
+        self, identifier: str, endpoint: Optional[str], db_session
+    ) -> Tuple[int, int, int]:
+        """Limits for an identifier (DB config cached for config_cache_ttl)."""
+        if not db_session:
+            return self.rpm, self.rph, self.rpd
+
+        key = (identifier, endpoint)
+        now = time.monotonic()
+        with _limits_cache_lock:
+            cached = _limits_cache.get(key)
+            if cached is not None and cached[1] > now:
+                _limits_cache.move_to_end(key)
+                limits = cached[0]
+                return limits["rpm"], limits["rph"], limits["rpd"]
+
+        try:
+            from backend.services.rate_limit_config_service import RateLimitConfigService
+            config_service = RateLimitConfigService(db_session)
+            config = config_service.get_rate_limit_for_identifier(identifier, endpoint)
+            limits = {
+                "rpm": config.get("rpm", self.rpm),
+                "rph": config.get("rph", self.rph),
+                "rpd": config.get("rpd", self.rpd),
+            }
+        except Exception as config_error:
+            logger.warning(f"Failed to get DB config, using defaults: {config_error}")
+            return self.rpm, self.rph, self.rpd
+
+        with _limits_cache_lock:
+            _limits_cache[key] = (limits, now + self.config_cache_ttl)
+            _limits_cache.move_to_end(key)
+            while len(_limits_cache) > _MAX_CACHED_LIMITS:
+                _limits_cache.popitem(last=False)
+
+        return limits["rpm"], limits["rph"], limits["rpd"]
+
+    def _local_check(
+        self, key: Tuple[str, Optional[str]], rpm: int, now: float
+    ) -> Optional[Tuple[bool, Optional[str], Dict[str, int]]]:
+        """
+        Local pre-check.
+
+        Returns:
+            Rejection result, or None if the request has to go to Redis
+        """
+        with self._buckets_lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.rpm != rpm:
+                bucket = _LocalBucket(rpm, now)
+                self._buckets[key] = bucket
+                while len(self._buckets) > _MAX_LOCAL_BUCKETS:
+                    self._buckets.popitem(last=False)
+            self._buckets.move_to_end(key)
+
+            if now < bucket.blocked_until:
+                return False, bucket.message, dict(bucket.remaining)
+
+            capacity = 2 * rpm
+            bucket.tokens = min(capacity, bucket.tokens + (now - bucket.updated_at) * rpm / 60.0)
+            bucket.updated_at = now
+            if bucket.tokens < 1:
+                remaining = dict(bucket.remaining)
+                remaining["minute"] = 0
+                return False, f"Rate limit exceeded: {rpm} requests per minute", remaining
+
+        return None
+
+    def _local_record(
+        self,
+        key: Tuple[str, Optional[str]],
+        allowed: bool,
+        message: Optional[str],
+        remaining: Dict[str, int],
+        window_end: float,
+        reset_generation: int,
+    ) -> None:
+        """Feed a Redis verdict back into the local pre-check."""
+        with self._buckets_lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return
+            bucket.reset_generation = reset_generation
+            bucket.remaining = remaining
+            if allowed:
+                bucket.tokens -= 1
+            else:
+                # Counts only drop when the blocking window rolls over
+                bucket.blocked_until = window_end
+                bucket.message = message
+
+    async def _reset_since_verdict(
+        self, identifier: str, endpoint: Optional[str], rpm: int, now: float
+    ) -> bool:
+        """
+        Whether the identifier was reset (by any process) since its last Redis verdict.
+
+        A reset replaces the local bucket, so the request goes to Redis.
+        """
+        key = (identifier, endpoint)
+        with self._buckets_lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or now - bucket.reset_checked_at < _RESET_CHECK_INTERVAL:
+                return False
+            bucket.reset_checked_at = now
+            known = bucket.reset_generation
+
+        generation = int(await self.redis.get(self._reset_key(identifier, endpoint)) or 0)
+        if generation == known:
+            return False
+
+        with self._buckets_lock:
+            self._buckets[key] = _LocalBucket(rpm, now)
+        return True
 
     async def check_rate_limit(
         self, identifier: str, endpoint: Optional[str] = None, db_session=None
@@ -69,77 +306,70 @@ class RateLimiter:
         if not self.enabled:
             return True, None, {}
 
+        self.stats["checks"] += 1
+
         try:
-            # Get rate limits from DB config if available
-            rpm, rph, rpd = self.rpm, self.rph, self.rpd
-            
-            if db_session:
-                try:
-                    from backend.services.rate_limit_config_service import RateLimitConfigService
-                    config_service = RateLimitConfigService(db_session)
-                    limits = config_service.get_rate_limit_for_identifier(identifier, endpoint)
-                    rpm = limits.get("rpm", self.rpm)
-                    rph = limits.get("rph", self.rph)
-                    rpd = limits.get("rpd", self.rpd)
-                except Exception as config_error:
-                    logger.warning(f"Failed to get DB config, using defaults: {config_error}")
-            
+            # Get rate limits (DB config if available, cached)
+            rpm, rph, rpd = self._get_limits(identifier, endpoint, db_session)
+            limits = {"minute": rpm, "hour": rph, "day": rpd}
+
+            bucket_key = (identifier, endpoint)
+            if self.local_precheck:
+                check_time = time.time()
+                rejected = self._local_check(bucket_key, rpm, check_time)
+                if rejected is not None and await self._reset_since_verdict(
+                    identifier, endpoint, rpm, check_time
+                ):
+                    rejected = None
+                if rejected is not None:
+                    self.stats["blocked"] += 1
+                    self.stats["local_blocked"] += 1
+                    return rejected
+
             now = datetime.now()
 
             # Generate keys for different time windows
-            minute_key = f"rate_limit:{identifier}:minute:{now.strftime('%Y%m%d%H%M')}"
-            hour_key = f"rate_limit:{identifier}:hour:{now.strftime('%Y%m%d%H')}"
-            day_key = f"rate_limit:{identifier}:day:{now.strftime('%Y%m%d')}"
+            keys = self._window_keys(identifier, endpoint, now)
 
-            if endpoint:
-                minute_key += f":{endpoint}"
-                hour_key += f":{endpoint}"
-                day_key += f":{endpoint}"
-
-            # Check and increment counters
-            minute_count = await self._increment_counter(minute_key, 60)
-            hour_count = await self._increment_counter(hour_key, 3600)
-            day_count = await self._increment_counter(day_key, 86400)
+            # Check and increment all counters in one round trip
+            self.stats["redis_checks"] += 1
+            allowed, *counts, reset_generation = await self._script(
+                keys=keys + [self._reset_key(identifier, endpoint)],
+                args=[rpm, rph, rpd] + [ttl for _, _, ttl in _WINDOWS],
+            )
+            counts = dict(zip(limits, (int(c) for c in counts)))
+            reset_generation = int(reset_generation)
 
             # Calculate remaining requests
             remaining = {
-                "minute": max(0, rpm - minute_count),
-                "hour": max(0, rph - hour_count),
-                "day": max(0, rpd - day_count),
+                window: max(0, limits[window] - counts[window]) for window in limits
             }
 
-            # Check limits
-            if minute_count > rpm:
-                return (
-                    False,
-                    f"Rate limit exceeded: {rpm} requests per minute",
-                    remaining,
-                )
-
-            if hour_count > rph:
-                return (
-                    False,
-                    f"Rate limit exceeded: {rph} requests per hour",
-                    remaining,
-                )
-
-            if day_count > rpd:
-                return (
-                    False,
-                    f"Rate limit exceeded: {rpd} requests per day",
-                    remaining,
-                )
+            if not allowed:
+                # First exhausted window
+                window = next(w for w in limits if counts[w] >= limits[w])
+                error_msg = f"Rate limit exceeded: {limits[window]} requests per {window}"
+                self.stats["blocked"] += 1
+                if self.local_precheck:
+                    self._local_record(
+                        bucket_key,
+                        False,
+                        error_msg,
+                        remaining,
+                        self._window_end(window, now),
+                        reset_generation,
+                    )
+                return False, error_msg, remaining
+
+            if self.local_precheck:
+                self._local_record(bucket_key, True, None, remaining, 0.0, reset_generation)
 
             logger.debug(
                 f"Rate limit check passed for {identifier}",
                 extra={
                     "identifier": identifier,
                     "endpoint": endpoint,
-                    "counts": {
-                        "minute": minute_count,
-                        "hour": hour_count,
-                        "day": day_count,
-                    },
+                    "counts": counts,
                     "remaining": remaining,
                     "limits": {"rpm": rpm, "rph": rph, "rpd": rpd}
                 },
@@ -152,52 +382,93 @@ class RateLimiter:
             logger.error(f"Rate limit check failed: {e}", exc_info=True)
             return True, None, {}
 
-    async def _increment_counter(self, key: str, ttl: int) -> int:
-        """
-        Increment counter and set TTL if new.
-
-        Args:
-            key: Redis key
-            ttl: Time to live in seconds
-
-        Returns:
-            Current count
-        """
-        count = await self.redis.incr(key)
-
-        # Set TTL only for new keys
-        if count == 1:
-            await self.redis.expire(key, ttl)
-
-        return count
+    @staticmethod
+    def _window_keys(identifier: str, endpoint: Optional[str], now: datetime) -> list:
+        """Redis counter keys of the current minute, hour and day windows."""
+        keys = [
+            f"rate_limit:{identifier}:{window}:{now.strftime(fmt)}"
+            for window, fmt, _ in _WINDOWS
+        ]
+        if endpoint:
+            keys = [f"{key}:{endpoint}" for key in keys]
+        return keys
+
+    @staticmethod
+    def _reset_key(identifier: str, endpoint: Optional[str]) -> str:
+        """Redis key of the identifier's reset generation."""
+        key = f"rate_limit_reset:{identifier}"
+        return f"{key}:{endpoint}" if endpoint else key
+
+    @staticmethod
+    def _window_end(window: str, now: datetime) -> float:
+        """Epoch time at which the current window rolls over."""
+        if window == "minute":
+            end = now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        elif window == "hour":
+            end = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        else:
+            end = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        return end.timestamp()
 
     async def reset_limit(self, identifier: str, endpoint: Optional[str] = None):
         """
         Reset rate limit for an identifier.
 
+        Other processes drop their local block when they next see the bumped
+        reset generation.
+
         Args:
             identifier: User identifier
             endpoint: Optional endpoint path
         """
         try:
-            now = datetime.now()
+            keys_to_delete = self._window_keys(identifier, endpoint, datetime.now())
 
-            keys_to_delete = [
-                f"rate_limit:{identifier}:minute:{now.strftime('%Y%m%d%H%M')}",
-                f"rate_limit:{identifier}:hour:{now.strftime('%Y%m%d%H')}",
-                f"rate_limit:{identifier}:day:{now.strftime('%Y%m%d')}",
-            ]
+            await self.redis.delete(*keys_to_delete)
 
-            if endpoint:
-                keys_to_delete = [f"{key}:{endpoint}" for key in keys_to_delete]
+            # Outlives the longest window, after which no block can remain
+            reset_key = self._reset_key(identifier, endpoint)
+            await self.redis.incr(reset_key)
+            await self.redis.expire(reset_key, _WINDOWS[-1][2])
 
-            await self.redis.delete(*keys_to_delete)
+            with self._buckets_lock:
+                self._buckets.pop((identifier, endpoint), None)
 
             logger.info(f"Rate limit reset for {identifier}")
 
         except Exception as e:
             logger.error(f"Failed to reset rate limit: {e}", exc_info=True)
 
+    def get_stats(self) -> Dict[str, int]:
+        """Rate limiter statistics."""
+        return {**self.stats, "local_buckets": len(self._buckets)}
+
+
+# Shared limiters, so the local pre-check state outlives a single request
+_rate_limiters: Dict[tuple, RateLimiter] = {}
+
+
+def get_rate_limiter(
+    redis_client: Redis,
+    requests_per_minute: int = 60,
+    requests_per_hour: int = 1000,
+    requests_per_day: int = 10000,
+    enabled: bool = True,
+) -> RateLimiter:
+    """Get the process-wide rate limiter for a Redis client and set of limits."""
+    key = (id(redis_client), requests_per_minute, requests_per_hour, requests_per_day, enabled)
+    limiter = _rate_limiters.get(key)
+    if limiter is None or limiter.redis is not redis_client:
+        limiter = RateLimiter(
+            redis_client=redis_client,
+            requests_per_minute=requests_per_minute,
+            requests_per_hour=requests_per_hour,
+            requests_per_day=requests_per_day,
+            enabled=enabled,
+        )
+        _rate_limiters[key] = limiter
+    return limiter
+
 
 # FastAPI dependency for rate limiting
 async def rate_limit_dependency(
@@ -228,8 +499,8 @@ async def rate_limit_dependency(
     except:
         identifier = request.client.host if request.client else "unknown"
 
-    # Create rate limiter
-    rate_limiter = RateLimiter(
+    # Get shared rate limiter
+    rate_limiter = get_rate_limiter(
         redis_client=redis_client,
         requests_per_minute=rpm,
         requests_per_hour=rph,
@@ -0,0 +1,178 @@
+"""
+In-process Vector Index
+
+Flat (exact) cosine-similarity index over a contiguous float32 matrix of
+normalized vectors. Used by caches that need similarity lookups without a
+round trip to Redis or Milvus: a search is one matrix-vector product over
+the occupied rows plus argmax / argpartition.
+"""
+
+import logging
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class FlatVectorIndex:
+    """
+    Exact cosine-similarity index with key lookup and slot reuse.
+
+    Vectors are normalized on insert, so similarity is a dot product.
+    Removed rows go on a free list and are reused by later inserts; the
+    matrix grows by doubling when full. Rows may carry an expiry time, which
+    searches given ``now`` mask out.
+    """
+
+    def __init__(self, dimension: Optional[int] = None, initial_capacity: int = 1024):
+        """
+        Initialize the index.
+
+        Args:
+            dimension: Vector dimension (inferred from the first insert if None)
+            initial_capacity: Rows allocated up front
+        """
+        self.dimension = dimension
+        self._capacity = max(1, initial_capacity)
+        self._vectors: Optional[np.ndarray] = None
+        self._occupied = np.zeros(self._capacity, dtype=bool)
+        self._expires_at = np.full(self._capacity, np.inf)
+        self._keys: List[Optional[Hashable]] = [None] * self._capacity
+        self._slots: Dict[Hashable, int] = {}
+        self._free: List[int] = []
+        self._high_water = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slots
+
+    def keys(self) -> List[Hashable]:
+        return list(self._slots)
+
+    @staticmethod
+    def normalize(vector) -> Optional[np.ndarray]:
+        """Return a unit-length float32 copy of a vector (None if zero)."""
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(array)
+        if norm == 0:
+            return None
+        return array / norm
+
+    def _grow(self):
+        new_capacity = self._capacity * 2
+        vectors = np.zeros((new_capacity, self.dimension), dtype=np.float32)
+        vectors[: self._capacity] = self._vectors
+        occupied = np.zeros(new_capacity, dtype=bool)
+        occupied[: self._capacity] = self._occupied
+        expires_at = np.full(new_capacity, np.inf)
+        expires_at[: self._capacity] = self._expires_at
+
+        self._vectors = vectors
+        self._occupied = occupied
+        self._expires_at = expires_at
+        self._keys.extend([None] * (new_capacity - self._capacity))
+        self._capacity = new_capacity
+
+    def add(self, key: Hashable, vector, expires_at: Optional[float] = None) -> bool:
+        """
+        Insert or replace the vector stored under key.
+
+        Args:
+            key: Entry key
+            vector: Embedding (list or ndarray)
+            expires_at: Unix time after which searches skip the row (None = never)
+
+        Returns:
+            True if stored, False if the vector is zero or has the wrong dimension
+        """
+        normalized = self.normalize(vector)
+        if normalized is None:
+            return False
+
+        if self.dimension is None:
+            self.dimension = normalized.shape[0]
+        if normalized.shape[0] != self.dimension:
+            logger.warning(
+                f"Vector dimension mismatch: expected {self.dimension}, "
+                f"got {normalized.shape[0]}"
+            )
+            return False
+        if self._vectors is None:
+            self._vectors = np.zeros((self._capacity, self.dimension), dtype=np.float32)
+
+        slot = self._slots.get(key)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                if self._high_water == self._capacity:
+                    self._grow()
+                slot = self._high_water
+                self._high_water += 1
+            self._slots[key] = slot
+            self._keys[slot] = key
+            self._occupied[slot] = True
+
+        self._vectors[slot] = normalized
+        self._expires_at[slot] = np.inf if expires_at is None else expires_at
+        return True
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove a key; returns False if it was not indexed."""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return False
+        self._keys[slot] = None
+        self._occupied[slot] = False
+        self._free.append(slot)
+        return True
+
+    def clear(self):
+        self._occupied[:] = False
+        self._keys = [None] * self._capacity
+        self._slots.clear()
+        self._free.clear()
+        self._high_water = 0
+
+    def search(
+        self, vector, top_k: int = 1, now: Optional[float] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Find the most similar indexed vectors.
+
+        Args:
+            vector: Query embedding
+            top_k: Number of results
+            now: Current Unix time; rows expired by then are skipped (None = no expiry check)
+
+        Returns:
+            List of (key, cosine similarity), best first
+        """
+        if not self._slots or top_k <= 0:
+            return []
+
+        query = self.normalize(vector)
+        if query is None or query.shape[0] != self.dimension:
+            return []
+
+        used = self._high_water
+        scores = self._vectors[:used] @ query
+        scores[~self._occupied[:used]] = -np.inf
+        if now is not None:
+            scores[self._expires_at[:used] <= now] = -np.inf
+
+        k = min(top_k, len(self._slots))
+        if k == 1:
+            best = [int(np.argmax(scores))]
+        else:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+            best = candidates[np.argsort(-scores[candidates])].tolist()
+
+        return [
+            (self._keys[slot], float(scores[slot]))
+            for slot in best
+            if scores[slot] != -np.inf
+        ]
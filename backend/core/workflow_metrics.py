@@ -92,6 +92,17 @@ workflow_cache_misses_total = Counter(
     ['node_type']
 )
 
+workflow_cache_evictions_total = Counter(
+    'workflow_cache_evictions_total',
+    'Total number of node results evicted from the cache',
+    ['node_type']
+)
+
+workflow_cache_bytes = Gauge(
+    'workflow_cache_bytes',
+    'Bytes held by the node result cache'
+)
+
 workflow_retries_total = Counter(
     'workflow_retries_total',
     'Total number of node execution retries',
@@ -253,6 +264,16 @@ class WorkflowMetrics:
         """Record cache miss."""
         workflow_cache_misses_total.labels(node_type=node_type).inc()
     
+    @staticmethod
+    def record_cache_eviction(node_type: str, count: int = 1):
+        """Record node results evicted to stay within the cache budget."""
+        workflow_cache_evictions_total.labels(node_type=node_type).inc(count)
+    
+    @staticmethod
+    def record_cache_size(size_bytes: int):
+        """Record the current size of the node result cache."""
+        workflow_cache_bytes.set(size_bytes)
+    
     @staticmethod
     def record_retry(node_type: str, attempt: int):
         """Record retry attempt."""
@@ -306,6 +306,40 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to stop scheduler: {e}")
 
+    # Stop document extraction workers
+    try:
+        from backend.services.extraction_pool import get_extraction_pool
+        extraction_pool = get_extraction_pool()
+        if extraction_pool:
+            extraction_pool.shutdown()
+            logger.info("Extraction pool stopped")
+    except Exception as e:
+        logger.warning(f"Failed to stop extraction pool: {e}")
+
+    # Persist knowledge graph changes since the last autosave
+    try:
+        from backend.services.knowledge_graph import save_knowledge_graph
+        if save_knowledge_graph():
+            logger.info("Knowledge graph saved")
+    except Exception as e:
+        logger.warning(f"Failed to save knowledge graph: {e}")
+
+    # Flush buffered semantic cache (L3) writes while Milvus is still connected
+    try:
+        from backend.core.multi_level_cache import close_l3_caches
+        await close_l3_caches()
+        logger.info("Semantic cache (L3) writes flushed")
+    except Exception as e:
+        logger.warning(f"Failed to flush semantic cache (L3) writes: {e}")
+
+    # Write queued embedding cache rows to disk
+    try:
+        from backend.services.embedding_cache import close_embedding_cache
+        close_embedding_cache()
+        logger.info("Embedding cache flushed")
+    except Exception as e:
+        logger.warning(f"Failed to flush embedding cache: {e}")
+
     # Cleanup connection pools
     from backend.core.connection_pool import cleanup_redis_pool
 
@@ -525,7 +559,7 @@ async def request_id_middleware(request: Request, call_next):
 @app.middleware("http")
 async def rate_limit_middleware(request: Request, call_next):
     """Global rate limiting middleware with Redis-based distributed limiting."""
-    from backend.core.rate_limiter import RateLimiter
+    from backend.core.rate_limiter import get_rate_limiter
     from backend.core.dependencies import get_redis_client
     
     # Skip rate limiting for health checks and static files
@@ -546,8 +580,8 @@ async def rate_limit_middleware(request: Request, call_next):
         except:
             pass
         
-        # Create rate limiter with default limits
-        rate_limiter = RateLimiter(
+        # Shared rate limiter with default limits
+        rate_limiter = get_rate_limiter(
             redis_client=redis_client,
             requests_per_minute=60,
             requests_per_hour=1000,
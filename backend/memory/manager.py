@@ -142,30 +142,18 @@ class MemoryManager:
             raise ValueError("query cannot be empty")
 
         try:
-            # Parallel execution of independent STM operations (now async)
-            import asyncio
-
-            # Execute STM operations in parallel (all are now async)
-            recent_history, working_memory, session_info = await asyncio.gather(
-                self.stm.get_conversation_history(
+            # History, working memory and session info in one STM round trip
+            try:
+                stm_context = await self.stm.get_session_context(
                     session_id=session_id, limit=self.max_history_length
-                ),
-                self.stm.get_working_memory(session_id=session_id),
-                self.stm.get_session_info(session_id=session_id),
-                return_exceptions=True,
-            )
-
-            # Handle exceptions
-            if isinstance(recent_history, Exception):
-                logger.error(f"Error getting recent history: {recent_history}")
+                )
+                recent_history = stm_context["history"]
+                working_memory = stm_context["working_memory"]
+                session_info = stm_context["session_info"]
+            except Exception as e:
+                logger.error(f"Error getting STM context: {e}")
                 recent_history = []
-
-            if isinstance(working_memory, Exception):
-                logger.error(f"Error getting working memory: {working_memory}")
                 working_memory = {}
-
-            if isinstance(session_info, Exception):
-                logger.error(f"Error getting session info: {session_info}")
                 session_info = {"session_id": session_id}
 
             # Get similar past interactions from LTM (requires query embedding)
@@ -241,13 +229,13 @@ class MemoryManager:
             raise ValueError("response cannot be empty")
 
         try:
-            # Add to STM conversation history (now async)
-            await self.stm.add_message(
-                session_id=session_id, role="user", content=query
-            )
-
-            await self.stm.add_message(
-                session_id=session_id, role="assistant", content=response
+            # Add the exchange to STM conversation history (one round trip)
+            await self.stm.add_messages(
+                session_id=session_id,
+                messages=[
+                    {"role": "user", "content": query},
+                    {"role": "assistant", "content": response},
+                ],
             )
 
             # If successful, also store in LTM
@@ -11,8 +11,25 @@ from datetime import datetime
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Message serializers; all of them can read messages written by the others
+SERIALIZERS = ("json", "orjson", "msgpack")
+
 
 class Message(dict):
     """Represents a message in the conversation."""
@@ -41,6 +58,11 @@ class ShortTermMemory:
     - Conversation history retrieval with limits
     - Working memory for intermediate results
     - Automatic expiration of old sessions
+    - Bounded history window (LTRIM) and compact message serialization
+
+    Every operation that needs several Redis commands sends them as one
+    pipeline (writes as a MULTI/EXEC transaction), so each call costs a
+    single round trip.
     """
 
     def __init__(
@@ -51,6 +73,8 @@ class ShortTermMemory:
         password: Optional[str] = None,
         ttl: int = 3600,
         max_retries: int = 3,
+        max_messages: Optional[int] = None,
+        serializer: str = "json",
     ):
         """
         Initialize ShortTermMemory with Redis connection.
@@ -62,6 +86,10 @@ class ShortTermMemory:
             password: Redis password (if required)
             ttl: Time-to-live for sessions in seconds (default: 1 hour)
             max_retries: Maximum connection retry attempts
+            max_messages: Messages kept per session; older ones are trimmed
+                on write (None = unbounded)
+            serializer: Message encoding for new messages - "json",
+                "orjson" or "msgpack" (falls back to json if unavailable)
 
         Raises:
             ValueError: If parameters are invalid
@@ -73,6 +101,17 @@ class ShortTermMemory:
             raise ValueError("port must be positive")
         if ttl <= 0:
             raise ValueError("ttl must be positive")
+        if max_messages is not None and max_messages <= 0:
+            raise ValueError("max_messages must be positive")
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"serializer must be one of {SERIALIZERS}")
+
+        if serializer == "orjson" and not ORJSON_AVAILABLE:
+            logger.warning("orjson not installed, STM messages use json")
+            serializer = "json"
+        elif serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack not installed, STM messages use json")
+            serializer = "json"
 
         self.host = host
         self.port = port
@@ -80,6 +119,8 @@ class ShortTermMemory:
         self.password = password
         self.ttl = ttl
         self.max_retries = max_retries
+        self.max_messages = max_messages
+        self.serializer = serializer
 
         # Initialize Redis client (will be connected async)
         self._client: Optional[Redis] = None
@@ -87,7 +128,8 @@ class ShortTermMemory:
 
         logger.info(
             f"ShortTermMemory initialized with Redis at {host}:{port}, "
-            f"db={db}, ttl={ttl}s (async mode)"
+            f"db={db}, ttl={ttl}s, max_messages={max_messages}, "
+            f"serializer={serializer} (async mode)"
         )
 
     async def _connect(self) -> None:
@@ -103,7 +145,8 @@ class ShortTermMemory:
                 port=self.port,
                 db=self.db,
                 password=self.password,
-                decode_responses=True,
+                # Raw bytes: messages may be msgpack-encoded
+                decode_responses=False,
                 socket_connect_timeout=5,
                 socket_timeout=5,
                 retry_on_timeout=True,
@@ -134,6 +177,59 @@ class ShortTermMemory:
         """Get Redis key for working memory."""
         return f"stm:working:{session_id}"
 
+    def _encode_message(self, message: Dict[str, Any]) -> bytes:
+        """Serialize a message with the configured serializer."""
+        if self.serializer == "msgpack":
+            return msgpack.packb(message, use_bin_type=True)
+        if self.serializer == "orjson":
+            return orjson.dumps(message)
+        return json.dumps(message).encode("utf-8")
+
+    @staticmethod
+    def _decode_message(raw: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Deserialize a stored message, whichever serializer wrote it.
+
+        JSON messages start with '{'; anything else is msgpack.
+        """
+        try:
+            if raw[:1] == b"{":
+                return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+            if MSGPACK_AVAILABLE:
+                return msgpack.unpackb(raw, raw=False)
+            logger.warning("Skipping msgpack-encoded message (msgpack not installed)")
+        except Exception as e:
+            logger.warning(f"Failed to parse message: {e}")
+        return None
+
+    def _decode_messages(self, raw_messages: List[bytes]) -> List[Dict[str, Any]]:
+        messages = []
+        for raw in raw_messages:
+            message = self._decode_message(raw)
+            if message is not None:
+                messages.append(message)
+        return messages
+
+    @staticmethod
+    def _decode_working_memory(all_values: Dict[bytes, bytes]) -> Dict[str, Any]:
+        result = {}
+        for k, v in all_values.items():
+            k = k.decode("utf-8")
+            try:
+                result[k] = json.loads(v)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to parse working memory value for '{k}': {e}")
+                result[k] = v.decode("utf-8", errors="replace")
+        return result
+
+    def _history_range(self, limit: Optional[int]) -> tuple:
+        """LRANGE bounds for the last `limit` messages (None = all)."""
+        if limit is None:
+            return 0, -1
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        return -limit, -1
+
     async def add_message(
         self,
         session_id: str,
@@ -161,29 +257,78 @@ class ShortTermMemory:
         if not content:
             raise ValueError("content cannot be empty")
 
+        # Create message
+        message = Message(
+            role=role, content=content, timestamp=datetime.now(), metadata=metadata
+        )
+
+        await self._append_messages(session_id, [message])
+
+        logger.debug(
+            f"Added {role} message to session {session_id}, "
+            f"content length: {len(content)}"
+        )
+
+    async def add_messages(
+        self, session_id: str, messages: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Add several messages to the conversation history in one round trip (async).
+
+        Args:
+            session_id: Unique session identifier
+            messages: Messages in order, each a dict with role, content and
+                optional metadata
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If Redis operation fails
+        """
+        if not session_id:
+            raise ValueError("session_id cannot be empty")
+
+        now = datetime.now()
+        batch = []
+        for message in messages:
+            if not message.get("role"):
+                raise ValueError("role cannot be empty")
+            if not message.get("content"):
+                raise ValueError("content cannot be empty")
+            batch.append(
+                Message(
+                    role=message["role"],
+                    content=message["content"],
+                    timestamp=now,
+                    metadata=message.get("metadata"),
+                )
+            )
+
+        if not batch:
+            return
+
+        await self._append_messages(session_id, batch)
+
+        logger.debug(f"Added {len(batch)} messages to session {session_id}")
+
+    async def _append_messages(self, session_id: str, messages: List[Message]) -> None:
+        """RPUSH, LTRIM and EXPIRE as one transaction."""
         try:
             # Ensure connection
             await self._ensure_connected()
 
-            # Create message
-            message = Message(
-                role=role, content=content, timestamp=datetime.now(), metadata=metadata
-            )
-
-            # Serialize message
-            message_json = json.dumps(message)
+            # Serialize messages
+            encoded = [self._encode_message(message) for message in messages]
 
             # Get key
             key = self._get_messages_key(session_id)
 
-            # Add to list and set TTL (async)
-            await self._client.rpush(key, message_json)
-            await self._client.expire(key, self.ttl)
-
-            logger.debug(
-                f"Added {role} message to session {session_id}, "
-                f"content length: {len(content)}"
-            )
+            # Add to list, trim to the window and set TTL (one round trip)
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.rpush(key, *encoded)
+                if self.max_messages is not None:
+                    pipe.ltrim(key, -self.max_messages, -1)
+                pipe.expire(key, self.ttl)
+                await pipe.execute()
 
         except RedisError as e:
             error_msg = f"Failed to add message to Redis: {str(e)}"
@@ -220,25 +365,12 @@ class ShortTermMemory:
 
             key = self._get_messages_key(session_id)
 
-            # Get messages (async)
-            if limit is None:
-                # Get all messages
-                messages_json = await self._client.lrange(key, 0, -1)
-            else:
-                # Get last N messages
-                if limit <= 0:
-                    raise ValueError("limit must be positive")
-                messages_json = await self._client.lrange(key, -limit, -1)
+            # Get all or the last N messages (async)
+            start, end = self._history_range(limit)
+            raw_messages = await self._client.lrange(key, start, end)
 
             # Deserialize messages
-            messages = []
-            for msg_json in messages_json:
-                try:
-                    message = json.loads(msg_json)
-                    messages.append(message)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse message: {e}")
-                    continue
+            messages = self._decode_messages(raw_messages)
 
             logger.debug(f"Retrieved {len(messages)} messages for session {session_id}")
 
@@ -283,9 +415,11 @@ class ShortTermMemory:
             # Get Redis key
             redis_key = self._get_working_memory_key(session_id)
 
-            # Store in hash and set TTL (async)
-            await self._client.hset(redis_key, key, value_json)
-            await self._client.expire(redis_key, self.ttl)
+            # Store in hash and set TTL (one round trip)
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.hset(redis_key, key, value_json)
+                pipe.expire(redis_key, self.ttl)
+                await pipe.execute()
 
             logger.debug(f"Stored working memory '{key}' for session {session_id}")
 
@@ -336,17 +470,7 @@ class ShortTermMemory:
                 all_values = await self._client.hgetall(redis_key)
 
                 # Deserialize all values
-                result = {}
-                for k, v in all_values.items():
-                    try:
-                        result[k] = json.loads(v)
-                    except json.JSONDecodeError as e:
-                        logger.warning(
-                            f"Failed to parse working memory value for '{k}': {e}"
-                        )
-                        result[k] = v
-
-                return result
+                return self._decode_working_memory(all_values)
 
         except RedisError as e:
             error_msg = f"Failed to retrieve working memory: {str(e)}"
@@ -407,27 +531,100 @@ class ShortTermMemory:
             messages_key = self._get_messages_key(session_id)
             working_key = self._get_working_memory_key(session_id)
 
-            # Get message count and TTL (async)
-            message_count = await self._client.llen(messages_key)
-            messages_ttl = await self._client.ttl(messages_key)
-
-            # Get working memory keys (async)
-            working_keys = list(await self._client.hkeys(working_key))
-            working_ttl = await self._client.ttl(working_key)
-
-            return {
-                "session_id": session_id,
-                "message_count": message_count,
-                "messages_ttl": messages_ttl if messages_ttl > 0 else None,
-                "working_memory_keys": working_keys,
-                "working_memory_ttl": working_ttl if working_ttl > 0 else None,
-                "exists": message_count > 0 or len(working_keys) > 0,
-            }
+            # Message count, working memory keys and TTLs (one round trip)
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.llen(messages_key)
+                pipe.ttl(messages_key)
+                pipe.hkeys(working_key)
+                pipe.ttl(working_key)
+                message_count, messages_ttl, working_keys, working_ttl = await pipe.execute()
+
+            working_keys = [k.decode("utf-8") for k in working_keys]
+            return self._session_info(
+                session_id, message_count, messages_ttl, working_keys, working_ttl
+            )
 
         except RedisError as e:
             logger.error(f"Failed to get session info: {str(e)}")
             return {"session_id": session_id, "error": str(e)}
 
+    @staticmethod
+    def _session_info(
+        session_id: str,
+        message_count: int,
+        messages_ttl: int,
+        working_keys: List[str],
+        working_ttl: int,
+    ) -> Dict[str, Any]:
+        return {
+            "session_id": session_id,
+            "message_count": message_count,
+            "messages_ttl": messages_ttl if messages_ttl > 0 else None,
+            "working_memory_keys": working_keys,
+            "working_memory_ttl": working_ttl if working_ttl > 0 else None,
+            "exists": message_count > 0 or len(working_keys) > 0,
+        }
+
+    async def get_session_context(
+        self, session_id: str, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve history, working memory and session info in one round trip (async).
+
+        Equivalent to get_conversation_history, get_working_memory and
+        get_session_info, read from the same snapshot.
+
+        Args:
+            session_id: Unique session identifier
+            limit: Maximum number of recent messages to retrieve (None = all)
+
+        Returns:
+            Dictionary with "history", "working_memory" and "session_info"
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If Redis operation fails
+        """
+        if not session_id:
+            raise ValueError("session_id cannot be empty")
+
+        start, end = self._history_range(limit)
+
+        try:
+            # Ensure connection
+            await self._ensure_connected()
+
+            messages_key = self._get_messages_key(session_id)
+            working_key = self._get_working_memory_key(session_id)
+
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.lrange(messages_key, start, end)
+                pipe.llen(messages_key)
+                pipe.ttl(messages_key)
+                pipe.hgetall(working_key)
+                pipe.ttl(working_key)
+                (
+                    raw_messages,
+                    message_count,
+                    messages_ttl,
+                    all_values,
+                    working_ttl,
+                ) = await pipe.execute()
+
+        except RedisError as e:
+            error_msg = f"Failed to retrieve session context: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        working_memory = self._decode_working_memory(all_values)
+        return {
+            "history": self._decode_messages(raw_messages),
+            "working_memory": working_memory,
+            "session_info": self._session_info(
+                session_id, message_count, messages_ttl, list(working_memory), working_ttl
+            ),
+        }
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Check Redis connection health (async).
@@ -1,5 +1,15 @@
 # Services package
-
-from .embedding import EmbeddingService
+#
+# EmbeddingService is resolved lazily: importing it loads torch and
+# sentence-transformers, which processes that only use other services
+# (e.g. extraction workers) must not pay for.
 
 __all__ = ["EmbeddingService"]
+
+
+def __getattr__(name):
+    if name == "EmbeddingService":
+        from .embedding import EmbeddingService
+
+        return EmbeddingService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -91,7 +91,9 @@ class AgentflowExecutor:
             # Update execution record
             execution.status = "completed" if result.get("success") else "failed"
             execution.output_data = result.get("output", {})
-            execution.execution_context = result.get("execution_context", {})
+            execution.execution_context = await self._final_execution_context(
+                execution, executor, result
+            )
             execution.error_message = result.get("error")
             execution.completed_at = datetime.utcnow()
             
@@ -188,7 +190,9 @@ class AgentflowExecutor:
             # Update execution record
             execution.status = "completed" if result.get("success") else "failed"
             execution.output_data = result.get("output", {})
-            execution.execution_context = result.get("execution_context", {})
+            execution.execution_context = await self._final_execution_context(
+                execution, executor, result
+            )
             execution.error_message = result.get("error")
             execution.completed_at = datetime.utcnow()
             
@@ -211,6 +215,48 @@ class AgentflowExecutor:
             logger.error(f"Agentflow streaming execution failed: {e}", exc_info=True)
             yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
     
+    async def _final_execution_context(
+        self,
+        execution: WorkflowExecution,
+        executor: WorkflowExecutor,
+        result: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Build the execution context to persist on completion.
+        
+        Node statuses are persisted separately by the NodeStatusWriter under
+        ``execution_context["node_statuses"]``; flush them first and carry
+        them over so the final context does not overwrite them.
+        
+        Args:
+            execution: Execution record
+            executor: Workflow executor that ran the execution
+            result: Executor result
+            
+        Returns:
+            Execution context including node statuses
+        """
+        context = dict(result.get("execution_context") or {})
+        
+        persisted = {}
+        try:
+            await executor.flush_node_statuses()
+            self.db.refresh(execution, attribute_names=["execution_context"])
+            persisted = execution.execution_context or {}
+        except Exception as e:
+            logger.warning(f"Failed to load persisted node statuses: {e}")
+        
+        # In-memory statuses are the latest (covers a failed flush)
+        statuses = dict(persisted.get("node_statuses") or {})
+        for node_id, status in executor.node_statuses.items():
+            statuses[node_id] = {**statuses.get(node_id, {}), **status}
+        if statuses:
+            context["node_statuses"] = statuses
+        if "node_statuses_updated_at" in persisted:
+            context["node_statuses_updated_at"] = persisted["node_statuses_updated_at"]
+        
+        return context
+    
     async def _record_token_usage(
         self,
         execution_context: Dict[str, Any],
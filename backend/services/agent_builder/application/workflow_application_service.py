@@ -15,6 +15,7 @@ from backend.services.agent_builder.domain.workflow.entities import WorkflowEnti
 from backend.services.agent_builder.domain.workflow.value_objects import NodeType
 from backend.services.agent_builder.domain.execution.aggregate import ExecutionAggregate
 from backend.services.agent_builder.infrastructure.execution.executor import UnifiedExecutor
+from backend.services.agent_builder.workflow_graph import invalidate_compiled_workflow
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +128,7 @@ class WorkflowApplicationService:
         
         # Save
         self._save_workflow(aggregate)
+        invalidate_compiled_workflow(workflow_id)
         
         logger.info(f"Updated workflow: {workflow_id}")
         return aggregate
@@ -143,6 +145,7 @@ class WorkflowApplicationService:
             self._delete_workflow(workflow_id)
         else:
             self._save_workflow(aggregate)
+        invalidate_compiled_workflow(workflow_id)
         
         logger.info(f"Deleted workflow: {workflow_id}")
         return True
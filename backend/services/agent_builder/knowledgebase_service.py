@@ -24,6 +24,7 @@ from backend.models.agent_builder import (
     KnowledgebaseUpdate,
     KnowledgebaseSearchResult
 )
+from backend.services.kb_catalog import invalidate_kb_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -182,6 +183,7 @@ class KnowledgebaseService:
             self.db.commit()
             self.db.refresh(kb)
             
+            invalidate_kb_catalog(kb_id)
             logger.info(f"Updated knowledgebase: {kb_id}")
             return kb
             
@@ -249,6 +251,7 @@ class KnowledgebaseService:
             self.db.delete(kb)
             self.db.commit()
             
+            invalidate_kb_catalog(kb_id)
             logger.info(f"Deleted knowledgebase: {kb_id}")
             return True
             
@@ -467,7 +470,7 @@ class KnowledgebaseService:
             texts = [pc["text"] for pc in processed_chunks]
             
             # Batch embeddings for efficiency (embed_batch is already async)
-            embeddings = await embedding_service.embed_batch(texts)
+            embeddings = await embedding_service.embed_batch(texts, as_numpy=True)
             
             # 6. Store in Milvus in batches
             milvus_manager = MilvusManager(
@@ -686,15 +689,15 @@ class KnowledgebaseService:
             # 벡터 검색 수행
             vector_results = []
             if search_mode in ["vector", "hybrid"]:
-                for q in queries_to_search:
-                    query_embedding = await embedding_service.embed_text(q)
-                    
-                    results = await milvus_manager.search(
-                        query_embedding=query_embedding,
-                        top_k=top_k * 2,
-                        filters=f'knowledgebase_id == "{kb_id}"'
-                    )
-                    
+                # 확장된 쿼리 전체를 한 번의 Milvus 요청으로 검색
+                query_embeddings = await embedding_service.embed_batch(queries_to_search)
+                results_per_query = await milvus_manager.search_many(
+                    query_embeddings,
+                    top_k=top_k * 2,
+                    filters=f'knowledgebase_id == "{kb_id}"'
+                )
+                
+                for results in results_per_query:
                     for result in results:
                         vector_results.append((
                             str(result.id),
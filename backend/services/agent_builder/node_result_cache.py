@@ -0,0 +1,297 @@
+"""
+Node Result Cache
+
+Process-wide cache of node results, shared by all workflow executions.
+Only nodes that opt in (``"cache": true``) are cached by the executor.
+
+- Local tier: LRU bounded by bytes (results are stored pickled, so the
+  budget is exact and every hit returns an independent copy) with a TTL
+- Optional Redis tier: results that survive a JSON round-trip unchanged
+  are also written to Redis and promoted to the local tier on a hit
+- Keys are one structural hash over the workflow, user, node type, node
+  configuration version and input, computed once per node execution
+- Hit / miss / eviction counters are exported through WorkflowMetrics
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from backend.core.workflow_metrics import WorkflowMetrics
+
+logger = logging.getLogger(__name__)
+
+# Bookkeeping bytes charged per entry on top of key and value
+_ENTRY_OVERHEAD = 128
+
+# Seconds between attempts to obtain a Redis client
+_REDIS_RETRY_INTERVAL = 30.0
+
+# Canonical JSON: sorted keys, no whitespace, non-JSON values as str
+_canonical = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+)
+
+
+def structural_hash(value: Any) -> Optional[str]:
+    """
+    Stable hash of a JSON-like structure (dict order does not matter).
+
+    Returns:
+        Hex digest, or None if the value cannot be encoded canonically
+        (e.g. dicts with mixed key types)
+    """
+    try:
+        encoded = _canonical.encode(value)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class NodeResultCache:
+    """Byte-bounded LRU/TTL cache with an optional Redis tier."""
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: int = 300,
+        redis_client=None,
+        use_redis: bool = False,
+        redis_prefix: str = "cache:node_result:",
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Local tier budget in bytes
+            default_ttl: Entry lifetime in seconds
+            redis_client: Async Redis client (default: the service container's)
+            use_redis: Whether to use the Redis tier
+            redis_prefix: Redis key prefix
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.use_redis = use_redis or redis_client is not None
+        self.redis_prefix = redis_prefix
+
+        self._redis = redis_client
+        self._redis_checked_at = 0.0
+
+        # key -> (pickled value, size, expires_at, node_type)
+        self._entries: "OrderedDict[str, Tuple[bytes, int, float, str]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "redis_hits": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "oversized": 0,
+            "unserializable": 0,
+            "redis_skipped": 0,
+            "redis_errors": 0,
+        }
+
+    @staticmethod
+    def make_key(
+        workflow_id: str,
+        user_id: Optional[str],
+        node_type: str,
+        config_hash: Optional[str],
+        data: Any,
+    ) -> Optional[str]:
+        """
+        Build the cache key of one node execution.
+
+        Args:
+            workflow_id: Workflow ID
+            user_id: User the execution runs for (results are never shared
+                across users)
+            node_type: Effective node type
+            config_hash: structural_hash of the node configuration
+            data: Node input
+
+        Returns:
+            Key, or None if the input cannot be hashed (do not cache)
+        """
+        if config_hash is None:
+            return None
+        input_hash = structural_hash(data)
+        if input_hash is None:
+            return None
+        return f"{workflow_id}:{user_id or '-'}:{node_type}:{config_hash}:{input_hash}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_redis(self):
+        """Redis client, looked up lazily (None if unavailable)."""
+        if not self.use_redis:
+            return None
+        if self._redis is None:
+            now = time.monotonic()
+            if now - self._redis_checked_at < _REDIS_RETRY_INTERVAL:
+                return None
+            self._redis_checked_at = now
+            try:
+                from backend.core.dependencies import get_container
+
+                self._redis = get_container().get_redis_client()
+            except Exception as e:
+                logger.debug(f"Node result cache: Redis not available yet ({e})")
+                return None
+        return self._redis
+
+    def _get_local(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            payload, size, expires_at, node_type = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._bytes -= size
+                self.stats["expirations"] += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+
+        return True, pickle.loads(payload)
+
+    def _set_local(self, key: str, payload: bytes, ttl: int, node_type: str) -> None:
+        size = len(payload) + len(key) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            self.stats["oversized"] += 1
+            return
+
+        evicted: Dict[str, int] = {}
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            while self._entries and self._bytes + size > self.max_bytes:
+                _, (_, old_size, _, old_type) = self._entries.popitem(last=False)
+                self._bytes -= old_size
+                evicted[old_type] = evicted.get(old_type, 0) + 1
+
+            self._entries[key] = (payload, size, time.monotonic() + ttl, node_type)
+            self._bytes += size
+            self.stats["sets"] += 1
+            self.stats["evictions"] += sum(evicted.values())
+            cached_bytes = self._bytes
+
+        for evicted_type, count in evicted.items():
+            WorkflowMetrics.record_cache_eviction(evicted_type, count)
+        WorkflowMetrics.record_cache_size(cached_bytes)
+
+    async def get(self, key: str, node_type: str) -> Tuple[bool, Any]:
+        """
+        Look up a node result.
+
+        Returns:
+            (hit, result)
+        """
+        hit, value = self._get_local(key)
+        if hit:
+            self.stats["hits"] += 1
+            WorkflowMetrics.record_cache_hit(node_type)
+            return True, value
+
+        redis = self._get_redis()
+        if redis is not None:
+            try:
+                raw = await redis.get(self.redis_prefix + key)
+                if raw is not None:
+                    value = json.loads(raw)
+                    self._set_local(
+                        key,
+                        pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                        self.default_ttl,
+                        node_type,
+                    )
+                    self.stats["hits"] += 1
+                    self.stats["redis_hits"] += 1
+                    WorkflowMetrics.record_cache_hit(node_type)
+                    return True, value
+            except Exception as e:
+                self.stats["redis_errors"] += 1
+                logger.warning(f"Node result cache Redis get failed: {e}")
+
+        self.stats["misses"] += 1
+        WorkflowMetrics.record_cache_miss(node_type)
+        return False, None
+
+    async def set(self, key: str, value: Any, node_type: str, ttl: Optional[int] = None) -> None:
+        """Store a node result (silently skipped if it cannot be serialized)."""
+        ttl = ttl or self.default_ttl
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            self.stats["unserializable"] += 1
+            return
+        self._set_local(key, payload, ttl, node_type)
+
+        redis = self._get_redis()
+        if redis is not None:
+            # Only exact JSON round-trips go to Redis (tuples, non-str keys
+            # etc. would come back different)
+            try:
+                encoded = json.dumps(value, separators=(",", ":"))
+                exact = json.loads(encoded) == value
+            except (TypeError, ValueError):
+                exact = False
+            if not exact:
+                self.stats["redis_skipped"] += 1
+                return
+            try:
+                await redis.set(self.redis_prefix + key, encoded, ex=ttl)
+            except Exception as e:
+                self.stats["redis_errors"] += 1
+                logger.warning(f"Node result cache Redis set failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all local entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+            "redis_enabled": self.use_redis,
+        }
+
+
+# Global instance
+_node_result_cache: Optional[NodeResultCache] = None
+
+
+def get_node_result_cache() -> NodeResultCache:
+    """Get the process-wide node result cache."""
+    global _node_result_cache
+
+    if _node_result_cache is None:
+        from backend.config import settings
+
+        _node_result_cache = NodeResultCache(
+            max_bytes=settings.WORKFLOW_NODE_CACHE_MAX_BYTES,
+            default_ttl=settings.WORKFLOW_NODE_CACHE_TTL,
+            use_redis=settings.WORKFLOW_NODE_CACHE_REDIS,
+        )
+    return _node_result_cache
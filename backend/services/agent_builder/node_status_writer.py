@@ -0,0 +1,244 @@
+"""
+Node Status Writer
+
+Write-behind persistence of workflow node statuses.
+
+Executors keep node statuses in memory (that is what SSE reads) and hand
+every update to the writer, which returns immediately. Pending updates are
+merged per execution and node, and written in one transaction per flush:
+
+- every ``flush_interval`` seconds while updates are pending
+- right away when a node fails
+- explicitly (``flush``) when an execution completes, pauses or fails
+
+Flushes are serialized, so updates reach the database in the order they
+were recorded. Writes run in a worker thread with their own session and
+never block the event loop or the executor's session.
+
+Statuses are stored under ``execution_context["node_statuses"]`` of the
+WorkflowExecution row.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Node statuses that trigger an immediate flush
+_URGENT_STATUSES = {"failed"}
+
+# Flush attempts before a batch is dropped
+_MAX_WRITE_ATTEMPTS = 3
+
+
+class NodeStatusWriter:
+    """Batches node status updates into periodic database writes."""
+
+    def __init__(
+        self,
+        flush_interval: float = 0.5,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            flush_interval: Seconds between flushes while updates are pending
+            session_factory: Creates SQLAlchemy sessions (default: SessionLocal)
+        """
+        self.flush_interval = flush_interval
+        self._session_factory = session_factory
+
+        # execution_id -> node_id -> merged update (insertion order = record order)
+        self._pending: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._attempts: Dict[str, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+        self.stats = {
+            "updates": 0,
+            "merged": 0,
+            "flushes": 0,
+            "rows_written": 0,
+            "write_errors": 0,
+            "dropped": 0,
+            "last_flush_ms": 0.0,
+        }
+
+    def _get_session(self):
+        if self._session_factory is None:
+            from backend.db.database import SessionLocal
+
+            self._session_factory = SessionLocal
+        return self._session_factory()
+
+    def record(self, execution_id: str, node_id: str, status_update: Dict[str, Any]) -> None:
+        """
+        Queue a node status update (never blocks).
+
+        Args:
+            execution_id: Execution ID
+            node_id: Node ID
+            status_update: Fields to merge into the node's status
+        """
+        nodes = self._pending.setdefault(execution_id, {})
+        if node_id in nodes:
+            self.stats["merged"] += 1
+            nodes[node_id].update(status_update)
+        else:
+            nodes[node_id] = dict(status_update)
+        self.stats["updates"] += 1
+
+        self._ensure_flusher()
+        if status_update.get("status") in _URGENT_STATUSES:
+            self._wake.set()
+
+    def has_pending(self, execution_id: Optional[str] = None) -> bool:
+        """Whether updates are waiting to be written."""
+        if execution_id is None:
+            return bool(self._pending)
+        return execution_id in self._pending
+
+    def _bind_loop(self) -> None:
+        """(Re)create loop-bound primitives for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._flusher = None
+
+    def _ensure_flusher(self) -> None:
+        self._bind_loop()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Flush on the interval (or when woken) until nothing is pending."""
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self, execution_id: Optional[str] = None) -> None:
+        """
+        Write pending updates now.
+
+        Args:
+            execution_id: Only this execution (default: all)
+        """
+        self._bind_loop()
+
+        async with self._flush_lock:
+            if execution_id is None:
+                batch, self._pending = self._pending, {}
+            elif execution_id in self._pending:
+                batch = {execution_id: self._pending.pop(execution_id)}
+            else:
+                return
+            if not batch:
+                return
+
+            start = time.perf_counter()
+            try:
+                written = await asyncio.to_thread(self._write, batch)
+            except Exception as e:
+                self.stats["write_errors"] += 1
+                logger.warning(f"Node status flush failed ({len(batch)} executions): {e}")
+                self._requeue(batch)
+                return
+
+            for flushed_id in batch:
+                self._attempts.pop(flushed_id, None)
+            self.stats["flushes"] += 1
+            self.stats["rows_written"] += written
+            self.stats["last_flush_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+    def _requeue(self, batch: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+        """Put a failed batch back in front of newer updates."""
+        for execution_id, nodes in batch.items():
+            attempts = self._attempts.get(execution_id, 0) + 1
+            if attempts >= _MAX_WRITE_ATTEMPTS:
+                self._attempts.pop(execution_id, None)
+                self.stats["dropped"] += len(nodes)
+                logger.error(
+                    f"Dropping {len(nodes)} node status update(s) for execution "
+                    f"{execution_id} after {attempts} failed writes"
+                )
+                continue
+            self._attempts[execution_id] = attempts
+
+            newer = self._pending.get(execution_id, {})
+            merged = {node_id: dict(update) for node_id, update in nodes.items()}
+            for node_id, update in newer.items():
+                merged.setdefault(node_id, {}).update(update)
+            self._pending[execution_id] = merged
+
+    def _write(self, batch: Dict[str, Dict[str, Dict[str, Any]]]) -> int:
+        """Merge a batch into the execution rows in one transaction (worker thread)."""
+        from backend.db.models.agent_builder import WorkflowExecution
+
+        session = self._get_session()
+        try:
+            rows = (
+                session.query(WorkflowExecution)
+                .filter(WorkflowExecution.id.in_(list(batch)))
+                .all()
+            )
+            for row in rows:
+                nodes = batch.get(str(row.id))
+                if nodes is None:
+                    continue
+                context = dict(row.execution_context or {})
+                statuses = dict(context.get("node_statuses") or {})
+                for node_id, update in nodes.items():
+                    statuses[node_id] = {**statuses.get(node_id, {}), **update}
+                context["node_statuses"] = statuses
+                context["node_statuses_updated_at"] = datetime.utcnow().isoformat()
+                # New dict so the JSONB change is detected
+                row.execution_context = context
+
+            missing = len(batch) - len(rows)
+            if missing:
+                logger.debug(f"Node status flush: {missing} execution row(s) not found")
+
+            session.commit()
+            return len(rows)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer statistics."""
+        return {
+            **self.stats,
+            "pending_executions": len(self._pending),
+            "pending_nodes": sum(len(nodes) for nodes in self._pending.values()),
+        }
+
+
+# Global instance
+_node_status_writer: Optional[NodeStatusWriter] = None
+
+
+def get_node_status_writer() -> NodeStatusWriter:
+    """Get the process-wide node status writer."""
+    global _node_status_writer
+
+    if _node_status_writer is None:
+        from backend.config import settings
+
+        _node_status_writer = NodeStatusWriter(
+            flush_interval=settings.WORKFLOW_STATUS_FLUSH_INTERVAL
+        )
+    return _node_status_writer
@@ -5,7 +5,8 @@ Executes workflows by processing nodes in order based on the graph structure.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Dict, Any, List, Optional, Callable, Awaitable
 from datetime import datetime
 import asyncio
 import time
@@ -29,8 +30,30 @@ from backend.services.agent_builder.workflow_errors import (
     ExpressionError,
     create_error_response,
 )
+from backend.services.agent_builder.node_result_cache import (
+    NodeResultCache,
+    get_node_result_cache,
+    structural_hash,
+)
+from backend.services.agent_builder.node_status_writer import get_node_status_writer
+from backend.services.agent_builder.workflow_graph import (
+    CompiledEdge,
+    CompiledNode,
+    CompiledWorkflow,
+    compile_workflow,
+    resolve_node_type,
+)
 
 logger = logging.getLogger(__name__)
+
+# Node types whose result selects outgoing edges by sourceHandle
+BRANCHING_NODE_TYPES = {"condition", "switch", "try_catch"}
+
+# Marks an edge that was ruled out (branch not taken / source skipped)
+_NOT_TAKEN = object()
+
+# Upper bound for a loop node's parallelism option
+MAX_LOOP_PARALLELISM = 32
 wf_logger = WorkflowLogger("executor")
 
 
@@ -49,15 +72,17 @@ class WorkflowExecutor:
         self.node_results: Dict[str, Any] = {}
         self.retry_counts: Dict[str, int] = {}  # Track retry attempts per node
         self.node_statuses: Dict[str, Dict[str, Any]] = {}  # Track node execution statuses for SSE
+        self.compiled: Optional[CompiledWorkflow] = None  # Compiled graph of this execution
+        self.execution_status: Optional[str] = None  # running / completed / failed / paused
         
-        # Node result caching
-        self.node_cache: Dict[str, tuple[Any, float]] = {}  # {cache_key: (result, timestamp)}
-        self.cache_ttl: int = 300  # 5 minutes cache TTL
+        # Node result caching (process-wide, shared by all executions)
+        self.node_cache: NodeResultCache = get_node_result_cache()
         self.cache_enabled: bool = True  # Can be disabled for debugging
         
         # Workflow-level settings
         self.workflow_timeout: int = 300  # 5 minutes default workflow timeout
         self.max_concurrent_executions: int = 5  # Max concurrent executions per workflow
+        self.max_parallel_nodes: int = 4  # Max nodes running at once within one execution
         self.cancelled: bool = False  # Flag for cancellation
         
     async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -127,6 +152,7 @@ class WorkflowExecutor:
                 
                 return result
             except asyncio.TimeoutError:
+                self.execution_status = "timeout"
                 duration_ms = (time.time() - start_time) * 1000
                 error = WorkflowTimeoutError(
                     message=f"Workflow execution timed out after {self.workflow_timeout} seconds",
@@ -207,6 +233,7 @@ class WorkflowExecutor:
         """Internal execution logic."""
         start_time = time.time()
         user_id = None
+        self.execution_status = "running"
         
         try:
             
@@ -231,23 +258,10 @@ class WorkflowExecutor:
                 logger.info(f"Node types: {[n.get('type') or n.get('configuration', {}).get('type') for n in nodes]}")
                 logger.info(f"Node structures: {[{'id': n.get('id'), 'type': n.get('type'), 'node_type': n.get('node_type'), 'config_type': n.get('configuration', {}).get('type')} for n in nodes]}")
             
-            # Find start node - improved detection
-            start_nodes = []
-            for n in nodes:
-                # Get node type from multiple possible fields
-                node_type = n.get("type") or n.get("node_type")
-                config_type = n.get("configuration", {}).get("type")
-                
-                # For control nodes, check configuration.type
-                if node_type == "control" and config_type:
-                    effective_type = config_type
-                else:
-                    effective_type = node_type or config_type
-                
-                # Check if it's a start or trigger node
-                if effective_type == "start" or (effective_type and effective_type.startswith("trigger")):
-                    start_nodes.append(n)
-                    logger.info(f"Found start/trigger node: {n.get('id')} (node_type: {node_type}, config_type: {config_type}, effective: {effective_type})")
+            compiled = self.compiled = compile_workflow(self.workflow, nodes, edges)
+            start_nodes = [compiled.nodes[i].raw for i in compiled.start_nodes]
+            for n in start_nodes:
+                logger.info(f"Found start/trigger node: {n.get('id')} (effective: {resolve_node_type(n)})")
             
             if not start_nodes:
                 # Provide detailed error message
@@ -272,6 +286,7 @@ class WorkflowExecutor:
             result = await self._execute_from_node(start_node, nodes, edges, input_data)
             
             logger.info(f"Workflow execution completed: {self.workflow.id}")
+            self.execution_status = "completed"
             
             # Record successful execution
             duration = time.time() - start_time
@@ -296,6 +311,7 @@ class WorkflowExecutor:
             # Check if workflow was paused for approval
             if isinstance(e, WorkflowPausedException):
                 logger.info(f"Workflow paused for approval: {e.approval_id}")
+                self.execution_status = "paused"
                 
                 # Record approval request
                 WorkflowMetrics.record_approval_request(str(self.workflow.id))
@@ -312,6 +328,7 @@ class WorkflowExecutor:
                 }
             
             logger.error(f"Workflow execution failed: {e}", exc_info=True)
+            self.execution_status = "failed"
             
             # Record failed execution
             duration = time.time() - start_time
@@ -333,6 +350,10 @@ class WorkflowExecutor:
                 "node_results": self.node_results,
                 "retry_counts": self.retry_counts,
             }
+        
+        finally:
+            # Final write of buffered node statuses (completed, paused or failed)
+            await self.flush_node_statuses()
     
     async def _execute_from_node(
         self,
@@ -345,32 +366,54 @@ class WorkflowExecutor:
         Execute workflow starting from a specific node.
         
         Args:
-            current_node: Current node to execute
+            current_node: Node to start from
             nodes: All nodes in the workflow
             edges: All edges in the workflow
+            data: Input data for the start node
+            
+        Returns:
+            Output data of the execution (see _run_graph)
+        """
+        compiled = compile_workflow(self.workflow, nodes, edges)
+        start = compiled.index.get(current_node.get("id"))
+        if start is None:
+            # Node is not part of the graph: run it on its own
+            return await self._execute_node(current_node, nodes, edges, data)
+        
+        async def run_node(node: CompiledNode, node_input: Any) -> Any:
+            # Looked up per call so per-node hooks set on the instance apply
+            return await self._execute_node(node.raw, nodes, edges, node_input)
+        
+        return await self._run_graph(compiled, start, data, run_node)
+    
+    async def _execute_node(
+        self,
+        current_node: Dict[str, Any],
+        nodes: List[Dict[str, Any]],
+        edges: List[Dict[str, Any]],
+        data: Any
+    ) -> Any:
+        """
+        Execute a single node and record its status, metrics and result.
+        
+        Args:
+            current_node: Node to execute
+            nodes: All nodes in the workflow
+            edges: All edges in the workflow
+            data: Input data for the node
             
         Note:
-            Checks for cancellation before each node execution.
-            data: Input data for the current node
+            Checks for cancellation before executing the node.
             
         Returns:
-            Output data from the execution path
+            Node result
         """
         # Check for cancellation
         if self.cancelled:
             raise Exception("Workflow execution was cancelled")
         
         node_id = current_node["id"]
-        # Check multiple possible fields for node type
-        raw_node_type = current_node.get("type") or current_node.get("node_type")
-        config_type = current_node.get("configuration", {}).get("type")
-        
-        # For control nodes, use configuration.type as the effective type
-        if raw_node_type == "control" and config_type:
-            node_type = config_type
-        else:
-            node_type = raw_node_type or config_type or "block"
-        
+        node_type = resolve_node_type(current_node)
         node_data = current_node.get("data") or current_node.get("configuration", {})
         
         logger.info(f"Executing node: {node_id} (type: {node_type})")
@@ -518,82 +561,189 @@ class WorkflowExecutor:
                 )
             raise
         
-        # Find next nodes
-        next_edges = [e for e in edges if e.get("source") == node_id]
-        
-        if not next_edges:
-            # No more nodes, return result
-            return result
-        
-        # Handle condition node (multiple branches)
-        if node_type == "condition" and isinstance(result, dict) and "branch" in result:
-            branch = result["branch"]
-            # Find edge matching the branch
-            next_edge = next(
-                (e for e in next_edges if e.get("sourceHandle") == branch),
-                next_edges[0] if next_edges else None
-            )
-            if next_edge:
-                next_node = next((n for n in nodes if n["id"] == next_edge["target"]), None)
-                if next_node:
-                    return await self._execute_from_node(next_node, nodes, edges, result.get("data", data))
-        else:
-            # Execute next node (single path)
-            if next_edges:
-                next_edge = next_edges[0]
-                next_node = next((n for n in nodes if n["id"] == next_edge["target"]), None)
-                if next_node:
-                    return await self._execute_from_node(next_node, nodes, edges, result)
-        
         return result
     
-    def _generate_cache_key(self, node_id: str, node_type: str, data: Any) -> str:
+    def _route_edges(
+        self,
+        node: CompiledNode,
+        result: Any,
+        out_edges: List[CompiledEdge],
+    ) -> List[CompiledEdge]:
+        """
+        Select the outgoing edges activated by a node result.
+
+        Branching nodes (condition, switch, try/catch) follow the edges whose
+        sourceHandle matches the returned branch, falling back to edges
+        without a handle and then to the first edge. All other nodes fan out
+        to every outgoing edge.
+        """
+        if not out_edges:
+            return []
+
+        if node.type in BRANCHING_NODE_TYPES and isinstance(result, dict) and "branch" in result:
+            branch = result["branch"]
+            taken = [e for e in out_edges if e.source_handle == branch]
+            if not taken:
+                taken = [e for e in out_edges if e.source_handle is None] or out_edges[:1]
+            return taken
+
+        return out_edges
+
+    async def _run_graph(
+        self,
+        compiled: CompiledWorkflow,
+        start: int,
+        data: Any,
+        run_node: Callable[[CompiledNode, Any], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run a compiled workflow from a start node with a ready-queue scheduler.
+
+        A node becomes ready once every incoming edge has been resolved -
+        either taken by its predecessor or ruled out (branch not taken, or
+        predecessor skipped). Nodes with no taken incoming edge are skipped
+        and their outgoing edges are ruled out in turn. Up to
+        max_parallel_nodes ready nodes run at once; each node and edge is
+        visited once, so a run is O(V + E) with no recursion.
+
+        A node with several taken incoming edges receives a dict of inputs
+        keyed by predecessor ID; otherwise it receives the single input.
+
+        Args:
+            compiled: Compiled workflow graph
+            start: Index of the start node
+            data: Input data for the start node
+            run_node: Coroutine executing one node (node, input) -> result
+
+        Returns:
+            Result of the last node if a single path finished, otherwise a
+            dict of results keyed by the IDs of the finished end nodes
+        """
+        plan = compiled.plan(start)
+        graph = self.workflow.graph_definition or {}
+        max_parallel = max(
+            1, int(graph.get("settings", {}).get("max_parallel_nodes", self.max_parallel_nodes))
+        )
+
+        remaining = list(plan.in_degree)
+        inputs: Dict[int, List[tuple]] = {}
+        ready: deque = deque([(start, data)])
+        running: Dict[asyncio.Task, tuple] = {}
+        finished: Dict[str, Any] = {}
+
+        def resolve(edge: CompiledEdge, payload: Any) -> None:
+            """Resolve one edge; payload is _NOT_TAKEN when the edge is ruled out."""
+            pending = [(edge, payload)]
+            while pending:
+                edge, payload = pending.pop()
+                target = edge.target
+                if payload is not _NOT_TAKEN:
+                    inputs.setdefault(target, []).append((compiled.nodes[edge.source].id, payload))
+                remaining[target] -= 1
+                if remaining[target]:
+                    continue
+
+                received = inputs.pop(target, None)
+                if received is None:
+                    # No path reaches this node: skip it and everything only it feeds
+                    logger.debug(f"Skipping node {compiled.nodes[target].id} (branch not taken)")
+                    pending.extend((e, _NOT_TAKEN) for e in plan.out_edges[target])
+                elif len(received) == 1:
+                    ready.append((target, received[0][1]))
+                else:
+                    ready.append((target, dict(received)))
+
+        try:
+            while ready or running:
+                while ready and len(running) < max_parallel:
+                    index, node_input = ready.popleft()
+                    task = asyncio.create_task(run_node(compiled.nodes[index], node_input))
+                    running[task] = (index, node_input)
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index, node_input = running.pop(task)
+                    # A failed node fails the execution; the rest is cancelled below
+                    result = task.result()
+                    node = compiled.nodes[index]
+
+                    out_edges = plan.out_edges[index]
+                    if not out_edges:
+                        finished[node.id] = result
+                        continue
+
+                    taken = self._route_edges(node, result, out_edges)
+                    payload = result
+                    if node.type in BRANCHING_NODE_TYPES and isinstance(result, dict) and "branch" in result:
+                        payload = result.get("data", node_input)
+
+                    taken_ids = {e.index for e in taken}
+                    for edge in out_edges:
+                        resolve(edge, payload if edge.index in taken_ids else _NOT_TAKEN)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        if len(finished) == 1:
+            return next(iter(finished.values()))
+        return finished
+
+    def _generate_cache_key(
+        self,
+        node_id: str,
+        node_type: str,
+        node_data: Dict[str, Any],
+        data: Any,
+    ) -> Optional[str]:
         """
         Generate cache key for node execution.
         
+        The node configuration hash is computed once per compiled workflow
+        version (the graph is compiled once per execution); only the input
+        is hashed per node execution.
+        
         Args:
             node_id: Node ID
             node_type: Node type
+            node_data: Node configuration
             data: Input data
             
         Returns:
-            Cache key string
+            Cache key string, or None if the input cannot be hashed
         """
-        import hashlib
-        import json
+        if self.compiled is None:
+            self.compiled = compile_workflow(self.workflow)
+        node = self.compiled.node(node_id)
+        if node is not None and node.data is node_data:
+            config_hash = node.config_hash
+        else:
+            config_hash = structural_hash(node_data)
         
-        try:
-            # Create deterministic hash of input data
-            data_str = json.dumps(data, sort_keys=True, default=str)
-            data_hash = hashlib.md5(data_str.encode()).hexdigest()
-            
-            # Combine node_id and data hash
-            cache_key = f"{node_id}:{node_type}:{data_hash}"
-            return cache_key
-        except Exception as e:
-            logger.warning(f"Failed to generate cache key: {e}")
-            # Return unique key that won't match anything
-            return f"{node_id}:{node_type}:{id(data)}"
+        return NodeResultCache.make_key(
+            workflow_id=str(self.workflow.id),
+            user_id=self.execution_context.get("user_id"),
+            node_type=node_type,
+            config_hash=config_hash,
+            data=data,
+        )
     
-    def _is_cacheable_node(self, node_type: str) -> bool:
+    def _is_cacheable_node(self, node_type: str, node_data: Dict[str, Any]) -> bool:
         """
-        Check if node type is cacheable.
+        Check if a node's results may be cached.
+        
+        Results are shared across executions, so caching is opt-in per node
+        (``"cache": true`` in the node configuration) and never applies to
+        node types with side effects or time-sensitive results.
         
         Args:
             node_type: Node type
+            node_data: Node configuration
             
         Returns:
             True if cacheable, False otherwise
         """
-        # Cacheable node types (deterministic, no side effects)
-        cacheable_types = {
-            "agent",
-            "block", 
-            "tool",
-            "code",
-            "condition",
-        }
-        
         # Non-cacheable node types (side effects or time-sensitive)
         non_cacheable_types = {
             "http_request",  # External API calls may change
@@ -608,7 +758,10 @@ class WorkflowExecutor:
             "schedule_trigger", # Time-based
         }
         
-        return node_type in cacheable_types
+        if node_type in non_cacheable_types:
+            return False
+        
+        return node_data.get("cache") is True
     
     async def _execute_node_with_cache(
         self,
@@ -639,29 +792,17 @@ class WorkflowExecutor:
         Returns:
             Node execution result
         """
-        import time
-        
         # Check if caching is enabled and node is cacheable
-        if self.cache_enabled and self._is_cacheable_node(node_type):
-            # Generate cache key
-            cache_key = self._generate_cache_key(node_id, node_type, data)
-            
-            # Check cache
-            if cache_key in self.node_cache:
-                cached_result, timestamp = self.node_cache[cache_key]
-                
-                # Check if cache is still valid
-                if time.time() - timestamp < self.cache_ttl:
-                    logger.info(f"Cache hit for node {node_id} (type: {node_type})")
-                    WorkflowMetrics.record_cache_hit(node_type)
-                    return cached_result
-                else:
-                    logger.debug(f"Cache expired for node {node_id}")
-                    del self.node_cache[cache_key]
+        cache_key = None
+        if self.cache_enabled and self._is_cacheable_node(node_type, node_data):
+            # Generate cache key (once: reused to store the result)
+            cache_key = self._generate_cache_key(node_id, node_type, node_data, data)
         
-        # Record cache miss
-        if self.cache_enabled and self._is_cacheable_node(node_type):
-            WorkflowMetrics.record_cache_miss(node_type)
+        if cache_key is not None:
+            hit, cached_result = await self.node_cache.get(cache_key, node_type)
+            if hit:
+                logger.info(f"Cache hit for node {node_id} (type: {node_type})")
+                return cached_result
         
         # Execute node (cache miss or not cacheable)
         result = await self._execute_node_with_retry(
@@ -677,9 +818,8 @@ class WorkflowExecutor:
         )
         
         # Cache result if applicable
-        if self.cache_enabled and self._is_cacheable_node(node_type):
-            cache_key = self._generate_cache_key(node_id, node_type, data)
-            self.node_cache[cache_key] = (result, time.time())
+        if cache_key is not None:
+            await self.node_cache.set(cache_key, result, node_type)
             logger.debug(f"Cached result for node {node_id}")
         
         return result
@@ -767,7 +907,7 @@ class WorkflowExecutor:
                 elif node_type == "http_request":
                     result = await self._execute_http_request_node(node_data, data)
                 elif node_type == "loop":
-                    result = await self._execute_loop_node(node_data, data, nodes, edges)
+                    result = await self._execute_loop_node(node_data, data, nodes, edges, node_id=node_id)
                 elif node_type == "parallel":
                     result = await self._execute_parallel_node(node_data, data)
                 elif node_type == "delay":
@@ -2106,12 +2246,26 @@ class WorkflowExecutor:
         node_data: Dict[str, Any], 
         data: Any,
         nodes: List[Dict[str, Any]],
-        edges: List[Dict[str, Any]]
+        edges: List[Dict[str, Any]],
+        node_id: Optional[str] = None,
     ) -> Any:
         """
         Execute loop node.
         
         Iterates over a collection and executes child nodes for each item.
+        
+        forEach and count loops accept:
+            parallelism: Iterations (or batches) running at once (default 1)
+            batchSize: forEach items passed to the loop body in one call
+                (default 1). Only honored when every body node declares
+                ``acceptsBatch: true`` in its data; otherwise items are
+                passed one at a time. The body receives the list of items;
+                a list result of the same length is spread back per item,
+                anything else is kept as one result for the batch.
+            ordered: Keep results in item order (default) or collect them
+                in completion order
+        
+        While loops always run sequentially.
         """
         loop_type = node_data.get("loopType", "forEach")
         items = node_data.get("items", [])
@@ -2119,8 +2273,17 @@ class WorkflowExecutor:
         condition = node_data.get("condition", "")
         count = node_data.get("count", 1)
         loop_body_nodes = node_data.get("loopBodyNodes", [])
+        parallelism = max(1, min(int(node_data.get("parallelism", 1)), MAX_LOOP_PARALLELISM))
+        batch_size = max(1, int(node_data.get("batchSize", 1)))
+        ordered = node_data.get("ordered", True)
         
-        logger.info(f"Executing loop: {loop_type}")
+        if batch_size > 1 and loop_body_nodes and not self._loop_body_accepts_batch(loop_body_nodes):
+            logger.warning(
+                f"Loop batchSize={batch_size} ignored: not every loop body node declares acceptsBatch"
+            )
+            batch_size = 1
+        
+        logger.info(f"Executing loop: {loop_type} (parallelism={parallelism}, batch_size={batch_size})")
         
         results = []
         iteration = 0
@@ -2135,17 +2298,27 @@ class WorkflowExecutor:
                 else:
                     items = node_data.get("items", [])
                 
-                for i, item in enumerate(items[:max_iterations]):
-                    logger.info(f"Loop iteration {i + 1}/{len(items)}")
-                    
+                items = items[:max_iterations]
+                
+                async def run_items(batch: List[Any], first_index: int) -> List[Any]:
                     # Execute loop body if defined
-                    if loop_body_nodes:
-                        result = await self._execute_loop_body(loop_body_nodes, item, i)
-                        results.append(result)
-                    else:
-                        results.append(item)
+                    if not loop_body_nodes:
+                        return list(batch)
+                    if batch_size == 1:
+                        return [await self._execute_loop_body(loop_body_nodes, batch[0], first_index)]
                     
-                    iteration = i + 1
+                    output = await self._execute_loop_body(loop_body_nodes, batch, first_index)
+                    if isinstance(output, list) and len(output) == len(batch):
+                        return output
+                    logger.warning(
+                        f"Loop body returned {type(output).__name__} for a batch of {len(batch)} items; "
+                        f"keeping it as one result"
+                    )
+                    return [output]
+                
+                iteration = await self._run_loop_iterations(
+                    items, run_items, results, parallelism, batch_size, ordered, node_id
+                )
                     
             elif loop_type == "while":
                 # While loop with condition evaluation
@@ -2188,17 +2361,24 @@ class WorkflowExecutor:
                         
             elif loop_type == "count":
                 # Count loop
-                for i in range(min(count, max_iterations)):
+                async def run_counts(batch: List[int], first_index: int) -> List[Any]:
+                    i = batch[0]
                     logger.info(f"Count loop iteration {i + 1}/{count}")
                     
                     # Execute loop body if defined
                     if loop_body_nodes:
-                        result = await self._execute_loop_body(loop_body_nodes, data, i)
-                        results.append(result)
-                    else:
-                        results.append({"iteration": i + 1, "data": data})
-                    
-                    iteration = i + 1
+                        return [await self._execute_loop_body(loop_body_nodes, data, i)]
+                    return [{"iteration": i + 1, "data": data}]
+                
+                iteration = await self._run_loop_iterations(
+                    list(range(min(count, max_iterations))),
+                    run_counts,
+                    results,
+                    parallelism,
+                    1,
+                    ordered,
+                    node_id,
+                )
             
             return {
                 "loop_results": results,
@@ -2212,13 +2392,89 @@ class WorkflowExecutor:
             logger.error(f"Loop execution failed: {e}", exc_info=True)
             return {
                 "loop_results": results,
-                "iterations": iteration,
+                "iterations": iteration or len(results),
                 "loop_type": loop_type,
                 "success": False,
                 "error": str(e),
                 "timestamp": datetime.utcnow().isoformat(),
             }
     
+    async def _run_loop_iterations(
+        self,
+        inputs: List[Any],
+        run_batch: Callable[[List[Any], int], Awaitable[List[Any]]],
+        results: List[Any],
+        parallelism: int,
+        batch_size: int,
+        ordered: bool,
+        node_id: Optional[str] = None,
+    ) -> int:
+        """
+        Run loop iterations in batches with bounded concurrency.
+        
+        Args:
+            inputs: Iteration inputs
+            run_batch: Coroutine (batch inputs, index of first input) -> results
+            results: Receives the results; on failure it holds those of the
+                batches that finished
+            parallelism: Batches running at once
+            batch_size: Inputs per batch
+            ordered: Input order (True) or completion order (False)
+            node_id: Loop node ID, for progress updates
+            
+        Returns:
+            Number of inputs processed
+        """
+        total = len(inputs)
+        batches = [(start, inputs[start:start + batch_size]) for start in range(0, total, batch_size)]
+        batch_results: List[Optional[List[Any]]] = [None] * len(batches)
+        pending = iter(enumerate(batches))
+        processed = 0
+        
+        async def worker() -> None:
+            nonlocal processed
+            # Shared iterator: each batch is taken by exactly one worker
+            for batch_index, (start, batch) in pending:
+                output = await run_batch(batch, start)
+                batch_results[batch_index] = output
+                if not ordered:
+                    results.extend(output)
+                processed += len(batch)
+                
+                # Stream progress and the latest results to status readers
+                if node_id and self.execution_id:
+                    await self.update_node_status(
+                        self.execution_id,
+                        node_id,
+                        {
+                            "progress": {"completed": processed, "total": total},
+                            "partial_results": str(output)[:500],
+                        },
+                    )
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(parallelism, len(batches)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            
+            if ordered:
+                for output in batch_results:
+                    if output is not None:
+                        results.extend(output)
+        
+        return processed
+    
+    @staticmethod
+    def _loop_body_accepts_batch(loop_body_nodes: List[Dict[str, Any]]) -> bool:
+        """Whether every loop body node handles a list of items (``acceptsBatch``)."""
+        return all(
+            (node_config.get("data") or node_config.get("configuration", {})).get("acceptsBatch", False)
+            for node_config in loop_body_nodes
+        )
+    
     async def _execute_loop_body(
         self,
         loop_body_nodes: List[Dict[str, Any]],
@@ -2242,8 +2498,8 @@ class WorkflowExecutor:
             node_type = node_config.get("type") or node_config.get("node_type")
             node_data = node_config.get("data") or node_config.get("configuration", {})
             
-            # Add iteration context
-            node_data["_iteration"] = iteration
+            # Add iteration context (on a copy: iterations may run concurrently)
+            node_data = {**node_data, "_iteration": iteration}
             
             # Execute node
             if node_type == "agent":
@@ -2747,6 +3003,9 @@ class WorkflowExecutor:
         """
         Update node execution status for SSE streaming.
         
+        SSE reads the in-memory state; persistence is write-behind
+        (NodeStatusWriter), so this never waits on the database.
+        
         Args:
             execution_id: Execution ID
             node_id: Node ID
@@ -2756,8 +3015,18 @@ class WorkflowExecutor:
             self.node_statuses[node_id] = {}
         
         self.node_statuses[node_id].update(status_update)
+        get_node_status_writer().record(execution_id, node_id, status_update)
         logger.debug(f"Updated node status: {node_id} -> {status_update.get('status')}")
     
+    async def flush_node_statuses(self) -> None:
+        """Persist buffered node statuses of this execution now."""
+        if not self.execution_id:
+            return
+        try:
+            await get_node_status_writer().flush(self.execution_id)
+        except Exception as e:
+            logger.warning(f"Failed to flush node statuses for {self.execution_id}: {e}")
+    
     async def get_execution_status(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """
         Get current execution status for SSE streaming.
@@ -2769,7 +3038,9 @@ class WorkflowExecutor:
             Execution status with node statuses
         """
         # Determine overall status
-        if not self.node_statuses:
+        if self.execution_status is not None:
+            status = self.execution_status
+        elif not self.node_statuses:
             status = "pending"
         elif any(s.get("status") == "failed" for s in self.node_statuses.values()):
             status = "failed"
@@ -4202,6 +4473,7 @@ async def execute_workflow_stream(
     from backend.db.models.agent_builder import WorkflowExecution
     
     execution_id = str(uuid.uuid4())
+    executor = None
     
     try:
         # Create execution record
@@ -4241,15 +4513,8 @@ async def execute_workflow_stream(
             logger.info(f"  - Node {n.get('id')}: type={node_type}, config_type={config_type}")
         
         # Find start node
-        start_node = None
-        for n in nodes:
-            node_type = n.get("type") or n.get("node_type")
-            config_type = n.get("configuration", {}).get("type")
-            effective_type = config_type if node_type == "control" and config_type else (node_type or config_type)
-            
-            if effective_type == "start" or (effective_type and effective_type.startswith("trigger")):
-                start_node = n
-                break
+        compiled = compile_workflow(workflow, nodes, edges)
+        start_node = compiled.nodes[compiled.start_nodes[0]].raw if compiled.start_nodes else None
         
         if not start_node:
             yield {
@@ -4272,6 +4537,7 @@ async def execute_workflow_stream(
         
         # Get final result
         result = executor.node_results.get(start_node["id"], input_data)
+        await executor.flush_node_statuses()
         
         # Update execution record
         execution.status = "completed"
@@ -4296,6 +4562,8 @@ async def execute_workflow_stream(
         
         # Update execution record
         try:
+            if executor is not None:
+                await executor.flush_node_statuses()
             execution.status = "failed"
             execution.completed_at = datetime.utcnow()
             execution.error_message = str(e)
@@ -4322,59 +4590,98 @@ async def _stream_node_execution(
     data: Any
 ):
     """
-    Stream node execution events recursively.
+    Stream node execution events.
+    
+    Nodes are scheduled by WorkflowExecutor._run_graph, so independent
+    branches run concurrently and their events interleave.
     
     Args:
         executor: WorkflowExecutor instance
-        current_node: Current node to execute
+        current_node: Node to start from
         nodes: All workflow nodes
         edges: All workflow edges
-        data: Input data for current node
+        data: Input data for the start node
         
     Yields:
         Execution events
     """
-    node_id = current_node["id"]
-    raw_node_type = current_node.get("type") or current_node.get("node_type")
-    config_type = current_node.get("configuration", {}).get("type")
-    node_type = config_type if raw_node_type == "control" and config_type else (raw_node_type or config_type or "block")
-    node_data = current_node.get("data") or current_node.get("configuration", {})
-    node_name = node_data.get("name") or node_data.get("label") or node_type
-    
-    start_time = datetime.utcnow()
-    
-    # Yield node start event
-    yield {
-        "type": "node_start",
-        "data": {
-            "node_id": node_id,
-            "node_type": node_type,
-            "label": node_name,
-            "timestamp": start_time.isoformat()
-        }
-    }
+    compiled = compile_workflow(executor.workflow, nodes, edges)
+    events: asyncio.Queue = asyncio.Queue()
     
-    try:
-        # Execute node
-        result = await executor._execute_node_with_retry(
-            node_id=node_id,
-            node_type=node_type,
-            node_data=node_data,
-            data=data,
-            nodes=nodes,
-            edges=edges,
-            max_retries=node_data.get("maxRetries", 3),
-            retry_delay=node_data.get("retryDelay", 1),
-            retry_backoff=node_data.get("retryBackoff", "exponential"),
+    async def run_node(node: CompiledNode, node_input: Any) -> Any:
+        node_id = node.id
+        node_type = node.type
+        node_data = node.data
+        node_name = node_data.get("name") or node_data.get("label") or node_type
+        
+        start_time = datetime.utcnow()
+        await executor.update_node_status(
+            executor.execution_id,
+            node_id,
+            {"node_name": node_name, "status": "running", "start_time": start_time.timestamp()},
         )
         
+        # Node start event
+        events.put_nowait({
+            "type": "node_start",
+            "data": {
+                "node_id": node_id,
+                "node_type": node_type,
+                "label": node_name,
+                "timestamp": start_time.isoformat()
+            }
+        })
+        
+        try:
+            result = await executor._execute_node_with_retry(
+                node_id=node_id,
+                node_type=node_type,
+                node_data=node_data,
+                data=node_input,
+                nodes=nodes,
+                edges=edges,
+                max_retries=node_data.get("maxRetries", 3),
+                retry_delay=node_data.get("retryDelay", 1),
+                retry_backoff=node_data.get("retryBackoff", "exponential"),
+            )
+        except Exception as e:
+            end_time = datetime.utcnow()
+            await executor.update_node_status(
+                executor.execution_id,
+                node_id,
+                {"status": "failed", "end_time": end_time.timestamp(), "error": str(e)},
+            )
+            
+            # Node error event
+            events.put_nowait({
+                "type": "node_error",
+                "data": {
+                    "node_id": node_id,
+                    "status": "failed",
+                    "duration": (end_time - start_time).total_seconds(),
+                    "error": str(e),
+                    "timestamp": end_time.isoformat()
+                }
+            })
+            
+            # Don't continue execution after error
+            raise
+        
         end_time = datetime.utcnow()
         duration = (end_time - start_time).total_seconds()
         
         # Store result
         executor.node_results[node_id] = result
+        await executor.update_node_status(
+            executor.execution_id,
+            node_id,
+            {
+                "status": "success",
+                "end_time": end_time.timestamp(),
+                "output": str(result)[:500] if result else None,
+            },
+        )
         
-        # Yield node complete event
         # For AI Agent nodes (both ai_agent type and tool type with ai_agent tool_id), include full output
         tool_id = node_data.get("tool_id") or node_data.get("toolId")
         is_ai_agent = node_type == "ai_agent" or (node_type == "tool" and tool_id == "ai_agent")
@@ -4384,7 +4691,8 @@ async def _stream_node_execution(
         else:
             output_data = str(result)[:500] if result else None
         
-        yield {
+        # Node complete event
+        events.put_nowait({
             "type": "node_complete",
             "data": {
                 "node_id": node_id,
@@ -4394,64 +4702,37 @@ async def _stream_node_execution(
                 "output": output_data,
                 "timestamp": end_time.isoformat()
             }
-        }
-        
-        # Find and execute next nodes
-        # Support both 'source' and 'source_node_id' field names
-        next_edges = [e for e in edges if e.get("source") == node_id or e.get("source_node_id") == node_id]
-        
-        logger.info(f"Node {node_id} ({node_type}) completed. Found {len(next_edges)} next edges")
-        if not next_edges:
-            logger.warning(f"No next edges found for node {node_id}. Available edges: {[(e.get('source') or e.get('source_node_id'), e.get('target') or e.get('target_node_id')) for e in edges]}")
-        
-        if next_edges:
-            # Handle condition node (multiple branches)
-            if node_type == "condition" and isinstance(result, dict) and "branch" in result:
-                branch = result["branch"]
-                next_edge = next(
-                    (e for e in next_edges if e.get("sourceHandle") == branch),
-                    next_edges[0] if next_edges else None
-                )
-                if next_edge:
-                    next_node = next((n for n in nodes if n["id"] == next_edge["target"]), None)
-                    if next_node:
-                        async for event in _stream_node_execution(
-                            executor, next_node, nodes, edges, result.get("data", data)
-                        ):
-                            yield event
-            else:
-                # Execute next node (single path)
-                next_edge = next_edges[0]
-                target_id = next_edge.get("target") or next_edge.get("target_node_id")
-                next_node = next((n for n in nodes if n["id"] == target_id), None)
-                
-                if next_node:
-                    logger.info(f"Executing next node: {target_id} (type: {next_node.get('type') or next_node.get('node_type')})")
-                    async for event in _stream_node_execution(
-                        executor, next_node, nodes, edges, result
-                    ):
-                        yield event
-                else:
-                    logger.error(f"Next node not found: {target_id}. Available nodes: {[n['id'] for n in nodes]}")
+        })
         
-    except Exception as e:
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
-        
-        # Yield node error event
-        yield {
-            "type": "node_error",
-            "data": {
-                "node_id": node_id,
-                "status": "failed",
-                "duration": duration,
-                "error": str(e),
-                "timestamp": end_time.isoformat()
-            }
-        }
-        
-        # Don't continue execution after error
-        raise
+        logger.info(f"Node {node_id} ({node_type}) completed. {len(node.out_edges)} next edge(s)")
+        return result
+    
+    start = compiled.index.get(current_node["id"])
+    if start is None:
+        logger.error(f"Start node not found in graph: {current_node['id']}")
+        return
+    
+    runner = asyncio.create_task(executor._run_graph(compiled, start, data, run_node))
+    try:
+        while True:
+            getter = asyncio.create_task(events.get())
+            done, _ = await asyncio.wait({getter, runner}, return_when=asyncio.FIRST_COMPLETED)
+            if getter in done:
+                yield getter.result()
+                continue
+            getter.cancel()
+            break
+        
+        # Events emitted right before the run finished
+        while not events.empty():
+            yield events.get_nowait()
+        
+        # Re-raise a node failure
+        runner.result()
+    finally:
+        if not runner.done():
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
 
 
     # ==================== Additional Trigger Handlers ====================
@@ -298,9 +298,9 @@ class WorkflowExecutorV2:
         node_count = 0
         
         # Hook into node execution for state updates
-        original_execute_from_node = original_executor._execute_from_node
+        original_execute_node = original_executor._execute_node
         
-        async def wrapped_execute_from_node(current_node, nodes, edges, data):
+        async def wrapped_execute_node(current_node, nodes, edges, data):
             nonlocal node_count
             node_id = current_node["id"]
             
@@ -313,7 +313,7 @@ class WorkflowExecutorV2:
             )
             
             # Execute node
-            result = await original_execute_from_node(current_node, nodes, edges, data)
+            result = await original_execute_node(current_node, nodes, edges, data)
             
             # Update state with result
             await self.state_manager.update_node_result(
@@ -334,7 +334,7 @@ class WorkflowExecutorV2:
             return result
         
         # Replace method
-        original_executor._execute_from_node = wrapped_execute_from_node
+        original_executor._execute_node = wrapped_execute_node
         
         # Execute
         result = await original_executor._execute_internal(input_data)
@@ -0,0 +1,295 @@
+"""
+Compiled Workflow Graph
+
+Indexes a workflow graph definition once - node table, adjacency lists,
+in-degrees and resolved effective node types - so the executor can schedule
+nodes in O(V + E) instead of scanning the edge and node lists at every step.
+
+Compiled graphs are immutable and cached per workflow version.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from backend.services.agent_builder.node_result_cache import structural_hash
+
+logger = logging.getLogger(__name__)
+
+# Compiled graphs kept in memory (one per workflow version)
+_MAX_CACHED_GRAPHS = 256
+
+
+def resolve_node_type(node: Dict[str, Any]) -> str:
+    """
+    Effective type of a node.
+
+    Control nodes carry their real type in configuration.type; other nodes
+    use type, node_type or configuration.type, in that order.
+    """
+    raw_type = node.get("type") or node.get("node_type")
+    config_type = (node.get("configuration") or {}).get("type")
+
+    if raw_type == "control" and config_type:
+        return config_type
+    return raw_type or config_type or "block"
+
+
+def is_start_type(node_type: Optional[str]) -> bool:
+    """Whether a node type starts a workflow (start or trigger*)."""
+    return bool(node_type) and (node_type == "start" or node_type.startswith("trigger"))
+
+
+@dataclass(frozen=True)
+class CompiledEdge:
+    """Edge between two node table indexes."""
+
+    index: int
+    source: int
+    target: int
+    source_handle: Optional[str] = None
+
+
+@dataclass
+class CompiledNode:
+    """Node table entry."""
+
+    index: int
+    id: str
+    type: str
+    data: Dict[str, Any]
+    raw: Dict[str, Any]
+    out_edges: List[CompiledEdge] = field(default_factory=list)
+    in_degree: int = 0
+
+    @cached_property
+    def config_hash(self) -> Optional[str]:
+        """Structural hash of the node configuration (once per graph version)."""
+        return structural_hash(self.data)
+
+
+@dataclass
+class ExecutionPlan:
+    """
+    Schedule for one start node.
+
+    Only nodes reachable from the start node take part; edges that close a
+    cycle are dropped so every node's in-degree can reach zero.
+    """
+
+    start: int
+    out_edges: List[List[CompiledEdge]]
+    in_degree: List[int]
+    reachable: int
+    back_edges: List[CompiledEdge]
+
+
+class CompiledWorkflow:
+    """Indexed, immutable view of a workflow graph."""
+
+    def __init__(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]]):
+        self.nodes: List[CompiledNode] = []
+        self.index: Dict[str, int] = {}
+        self.edges: List[CompiledEdge] = []
+        self.dropped_edges = 0
+
+        for raw in nodes:
+            node_id = raw.get("id")
+            if node_id is None or node_id in self.index:
+                # First definition wins, as with the previous linear lookup
+                continue
+            self.index[node_id] = len(self.nodes)
+            self.nodes.append(
+                CompiledNode(
+                    index=len(self.nodes),
+                    id=node_id,
+                    type=resolve_node_type(raw),
+                    data=raw.get("data") or raw.get("configuration", {}),
+                    raw=raw,
+                )
+            )
+
+        for raw in edges:
+            # Support both 'source'/'target' and '*_node_id' field names
+            source = self.index.get(raw.get("source") or raw.get("source_node_id"))
+            target = self.index.get(raw.get("target") or raw.get("target_node_id"))
+            if source is None or target is None:
+                self.dropped_edges += 1
+                continue
+
+            edge = CompiledEdge(
+                index=len(self.edges),
+                source=source,
+                target=target,
+                source_handle=raw.get("sourceHandle") or raw.get("source_handle"),
+            )
+            self.edges.append(edge)
+            self.nodes[source].out_edges.append(edge)
+            self.nodes[target].in_degree += 1
+
+        if self.dropped_edges:
+            logger.warning(
+                f"Ignored {self.dropped_edges} workflow edge(s) referencing unknown nodes"
+            )
+
+        self.start_nodes: List[int] = [
+            node.index for node in self.nodes if is_start_type(node.type)
+        ]
+        self._plans: Dict[int, ExecutionPlan] = {}
+        self._plans_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def node(self, node_id: str) -> Optional[CompiledNode]:
+        """Look up a node by ID."""
+        index = self.index.get(node_id)
+        return self.nodes[index] if index is not None else None
+
+    def plan(self, start: int) -> ExecutionPlan:
+        """Execution plan from a start node (computed once, then cached)."""
+        plan = self._plans.get(start)
+        if plan is None:
+            with self._plans_lock:
+                plan = self._plans.get(start)
+                if plan is None:
+                    plan = self._build_plan(start)
+                    self._plans[start] = plan
+        return plan
+
+    def _build_plan(self, start: int) -> ExecutionPlan:
+        """Iterative DFS from start: reachable set and back edges in O(V + E)."""
+        WHITE, GRAY, BLACK = 0, 1, 2
+        color = [WHITE] * len(self.nodes)
+        back_edges: List[CompiledEdge] = []
+
+        color[start] = GRAY
+        stack: List[Tuple[int, int]] = [(start, 0)]
+        reachable = 1
+        while stack:
+            index, position = stack[-1]
+            out_edges = self.nodes[index].out_edges
+            if position == len(out_edges):
+                color[index] = BLACK
+                stack.pop()
+                continue
+
+            stack[-1] = (index, position + 1)
+            edge = out_edges[position]
+            if color[edge.target] == WHITE:
+                color[edge.target] = GRAY
+                reachable += 1
+                stack.append((edge.target, 0))
+            elif color[edge.target] == GRAY:
+                back_edges.append(edge)
+
+        dropped = {edge.index for edge in back_edges}
+        out_edges: List[List[CompiledEdge]] = [[] for _ in self.nodes]
+        in_degree = [0] * len(self.nodes)
+        for node in self.nodes:
+            if color[node.index] == WHITE:
+                continue
+            for edge in node.out_edges:
+                if edge.index not in dropped:
+                    out_edges[node.index].append(edge)
+                    in_degree[edge.target] += 1
+
+        if back_edges:
+            logger.warning(
+                "Workflow graph has cycles; ignoring edge(s) "
+                + ", ".join(
+                    f"{self.nodes[e.source].id}->{self.nodes[e.target].id}" for e in back_edges
+                )
+            )
+
+        return ExecutionPlan(
+            start=start,
+            out_edges=out_edges,
+            in_degree=in_degree,
+            reachable=reachable,
+            back_edges=back_edges,
+        )
+
+
+_compiled_cache: "OrderedDict[Hashable, CompiledWorkflow]" = OrderedDict()
+_compiled_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0, "compiled": 0}
+
+
+def _version_key(workflow: Any, nodes: List[Any], edges: List[Any]) -> Optional[Hashable]:
+    """Cache key for a workflow version (None if the workflow has no version)."""
+    workflow_id = getattr(workflow, "id", None)
+    updated_at = getattr(workflow, "updated_at", None)
+    if workflow_id is None or updated_at is None:
+        return None
+    # Sizes catch unsaved in-memory edits that keep the same updated_at
+    return (str(workflow_id), str(updated_at), len(nodes), len(edges))
+
+
+def compile_workflow(
+    workflow: Any,
+    nodes: Optional[List[Dict[str, Any]]] = None,
+    edges: Optional[List[Dict[str, Any]]] = None,
+) -> CompiledWorkflow:
+    """
+    Get the compiled graph of a workflow.
+
+    Args:
+        workflow: Workflow model instance (id, updated_at, graph_definition)
+        nodes: Node list (default: from graph_definition)
+        edges: Edge list (default: from graph_definition)
+
+    Returns:
+        CompiledWorkflow, shared between executions of the same version
+    """
+    graph = getattr(workflow, "graph_definition", None) or {}
+    graph_nodes = graph.get("nodes", [])
+    graph_edges = graph.get("edges", [])
+    if nodes is None:
+        nodes = graph_nodes
+    if edges is None:
+        edges = graph_edges
+
+    # Only the stored definition is cached; ad-hoc node/edge lists are compiled as given
+    key = None
+    if nodes is graph_nodes and edges is graph_edges:
+        key = _version_key(workflow, nodes, edges)
+
+    if key is not None:
+        with _compiled_cache_lock:
+            compiled = _compiled_cache.get(key)
+            if compiled is not None:
+                _compiled_cache.move_to_end(key)
+                _cache_stats["hits"] += 1
+                return compiled
+            _cache_stats["misses"] += 1
+
+    compiled = CompiledWorkflow(nodes, edges)
+    _cache_stats["compiled"] += 1
+
+    if key is not None:
+        with _compiled_cache_lock:
+            _compiled_cache[key] = compiled
+            while len(_compiled_cache) > _MAX_CACHED_GRAPHS:
+                _compiled_cache.popitem(last=False)
+
+    return compiled
+
+
+def invalidate_compiled_workflow(workflow_id: Any) -> int:
+    """Drop cached compiled graphs of a workflow; returns the number removed."""
+    workflow_id = str(workflow_id)
+    with _compiled_cache_lock:
+        keys = [key for key in _compiled_cache if key[0] == workflow_id]
+        for key in keys:
+            del _compiled_cache[key]
+    return len(keys)
+
+
+def get_compiled_cache_stats() -> Dict[str, Any]:
+    """Compiled graph cache statistics."""
+    with _compiled_cache_lock:
+        return {**_cache_stats, "size": len(_compiled_cache), "max_size": _MAX_CACHED_GRAPHS}
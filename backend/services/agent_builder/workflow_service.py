@@ -8,6 +8,7 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 
 from backend.db.models.agent_builder import Workflow, WorkflowNode, WorkflowEdge
+from backend.services.agent_builder.workflow_graph import invalidate_compiled_workflow
 from backend.models.agent_builder import (
     WorkflowCreate,
     WorkflowUpdate,
@@ -266,6 +267,7 @@ class WorkflowService:
         
         self.db.commit()
         self.db.refresh(workflow)
+        invalidate_compiled_workflow(workflow_id)
         
         logger.info(f"Updated workflow: {workflow_id}")
         return workflow
@@ -295,6 +297,7 @@ class WorkflowService:
         # Delete workflow
         self.db.delete(workflow)
         self.db.commit()
+        invalidate_compiled_workflow(workflow_id)
         
         logger.info(f"Deleted workflow: {workflow_id}")
         return True
@@ -181,6 +181,10 @@ class BatchUploadService:
         # Concurrency limit to avoid overwhelming the system
         MAX_CONCURRENT = 5
 
+        from backend.config import settings
+
+        streaming = settings.ENABLE_STREAMING_INGESTION
+
         try:
             logger.info(
                 f"Starting background processing for batch {batch_id} "
@@ -201,9 +205,10 @@ class BatchUploadService:
                         f"in batch {batch_id}: {file.filename}"
                     )
 
-                    # Upload document using DocumentService
+                    # Upload document using DocumentService; streaming keeps
+                    # memory bounded per file while 5 files run concurrently
                     document = await self.document_service.upload_document(
-                        user_id=user_id, file=file
+                        user_id=user_id, file=file, streaming=streaming
                     )
 
                     logger.info(
@@ -0,0 +1,287 @@
+# Memory-mapped BM25 Segment Format
+"""
+Versioned binary on-disk format for BM25 segments, opened through mmap.
+
+A segment file is written once and never modified, so every worker process
+that opens it shares the same pages through the OS page cache and opening it
+costs a header read rather than deserializing the index.
+
+Layout (native byte order, every section aligned to 8 bytes):
+
+    header       magic, format version, byte-order mark, counts, k1, b,
+                 total length and the offset of every section below
+    doc_lengths  uint32[num_docs]
+    doc_id_offs  uint64[num_docs + 1]   offsets into doc_id_blob
+    doc_id_blob  UTF-8 document IDs
+    doc_id_sort  uint32[num_docs]       local doc indices sorted by ID bytes
+    term_offs    uint64[num_terms + 1]  offsets into term_blob
+    term_blob    UTF-8 terms, sorted by bytes
+    post_offs    uint64[num_terms + 1]  postings range per term
+    post_docs    uint32[num_postings]   doc indices (sorted per term)
+    post_tfs     uint32[num_postings]   term frequencies
+"""
+
+import logging
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_MAGIC = b"BM25SEG\x00"
+SEGMENT_FORMAT_VERSION = 1
+SEGMENT_SUFFIX = ".bm25"
+
+_BYTE_ORDER_MARK = 0x01020304
+_HEADER = struct.Struct("=8sIIIIQddQ10Q")
+_SECTIONS = (
+    "doc_lengths",
+    "doc_id_offs",
+    "doc_id_blob",
+    "doc_id_sort",
+    "term_offs",
+    "term_blob",
+    "post_offs",
+    "post_docs",
+    "post_tfs",
+    "end",
+)
+
+
+class SegmentFormatError(Exception):
+    """Raised when a segment file is not a readable BM25 segment."""
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class _StringTable:
+    """Read-only sequence of strings stored as offsets + UTF-8 blob."""
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def raw(self, idx: int) -> bytes:
+        return bytes(self._blob[self._offsets[idx] : self._offsets[idx + 1]])
+
+    def __getitem__(self, idx: int) -> str:
+        if idx < 0:
+            idx += len(self)
+        return self.raw(idx).decode("utf-8")
+
+
+def write_segment(path: Path, index) -> int:
+    """
+    Write a BM25 index to ``path`` atomically (temp file, fsync, rename).
+
+    Args:
+        path: Destination segment file
+        index: In-memory BM25 index (anything exposing doc_ids, doc_lengths,
+            iter_postings, k1 and b)
+
+    Returns:
+        Number of bytes written
+    """
+    path = Path(path)
+
+    doc_ids = [doc_id.encode("utf-8") for doc_id in index.doc_ids]
+    num_docs = len(doc_ids)
+
+    doc_id_offs = array("Q", [0])
+    for encoded in doc_ids:
+        doc_id_offs.append(doc_id_offs[-1] + len(encoded))
+    doc_id_sort = array("I", sorted(range(num_docs), key=doc_ids.__getitem__))
+
+    terms = sorted(
+        ((term.encode("utf-8"), entry) for term, entry in index.iter_postings()),
+        key=lambda item: item[0],
+    )
+    term_offs = array("Q", [0])
+    post_offs = array("Q", [0])
+    post_docs = array("I")
+    post_tfs = array("I")
+    for encoded, (docs, tfs) in terms:
+        term_offs.append(term_offs[-1] + len(encoded))
+        post_docs.extend(docs)
+        post_tfs.extend(tfs)
+        post_offs.append(len(post_docs))
+
+    sections = [
+        array("I", index.doc_lengths).tobytes(),
+        doc_id_offs.tobytes(),
+        b"".join(doc_ids),
+        doc_id_sort.tobytes(),
+        term_offs.tobytes(),
+        b"".join(encoded for encoded, _ in terms),
+        post_offs.tobytes(),
+        post_docs.tobytes(),
+        post_tfs.tobytes(),
+    ]
+
+    offsets = []
+    offset = _align(_HEADER.size)
+    for data in sections:
+        offsets.append(offset)
+        offset = _align(offset + len(data))
+    offsets.append(offset)
+
+    header = _HEADER.pack(
+        SEGMENT_MAGIC,
+        SEGMENT_FORMAT_VERSION,
+        _BYTE_ORDER_MARK,
+        num_docs,
+        len(terms),
+        len(post_docs),
+        index.k1,
+        index.b,
+        sum(index.doc_lengths),
+        *offsets,
+    )
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for section_offset, data in zip(offsets, sections):
+            f.write(b"\x00" * (section_offset - f.tell()))
+            f.write(data)
+        f.write(b"\x00" * (offsets[-1] - f.tell()))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    return offsets[-1]
+
+
+class MmapBM25Segment:
+    """
+    Read-only BM25 segment backed by a memory-mapped file.
+
+    Exposes the same read API as the in-memory ``BM25`` index
+    (``doc_ids``, ``doc_lengths``, ``get_postings``, ``iter_postings``,
+    ``doc_freq``, ``find_doc``), so ``SegmentedBM25`` can mix both.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open a segment file.
+
+        Args:
+            path: Segment file written by ``write_segment``
+
+        Raises:
+            SegmentFormatError: If the file is not a compatible segment
+        """
+        self.path = Path(path)
+
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < _HEADER.size:
+            raise SegmentFormatError(f"{self.path}: truncated header")
+
+        fields = _HEADER.unpack_from(self._mm, 0)
+        magic, version, byte_order_mark = fields[:3]
+        if magic != SEGMENT_MAGIC:
+            raise SegmentFormatError(f"{self.path}: not a BM25 segment")
+        if version != SEGMENT_FORMAT_VERSION:
+            raise SegmentFormatError(
+                f"{self.path}: unsupported segment version {version}"
+            )
+        if byte_order_mark != _BYTE_ORDER_MARK:
+            raise SegmentFormatError(f"{self.path}: written with another byte order")
+
+        self.num_docs, self.num_terms, self.num_postings = fields[3:6]
+        self.k1, self.b, self.total_length = fields[6:9]
+        offsets = dict(zip(_SECTIONS, fields[9:]))
+        if offsets["end"] > len(self._mm):
+            raise SegmentFormatError(f"{self.path}: truncated file")
+
+        view = memoryview(self._mm)
+
+        def section(name: str, count: int, typecode: str) -> memoryview:
+            start = offsets[name]
+            return view[start : start + count * struct.calcsize(typecode)].cast(typecode)
+
+        def blob(name: str, size: int) -> memoryview:
+            start = offsets[name]
+            return view[start : start + size]
+
+        self.doc_lengths = section("doc_lengths", self.num_docs, "I")
+        doc_id_offs = section("doc_id_offs", self.num_docs + 1, "Q")
+        self.doc_ids = _StringTable(doc_id_offs, blob("doc_id_blob", doc_id_offs[-1]))
+        self._doc_id_sort = section("doc_id_sort", self.num_docs, "I")
+
+        term_offs = section("term_offs", self.num_terms + 1, "Q")
+        self._terms = _StringTable(term_offs, blob("term_blob", term_offs[-1]))
+        self._post_offs = section("post_offs", self.num_terms + 1, "Q")
+        self._post_docs = section("post_docs", self.num_postings, "I")
+        self._post_tfs = section("post_tfs", self.num_postings, "I")
+
+    def _find_term(self, term: str) -> int:
+        """Binary search the sorted term dictionary."""
+        target = term.encode("utf-8")
+        terms = self._terms
+        lo, hi = 0, self.num_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = terms.raw(mid)
+            if value < target:
+                lo = mid + 1
+            elif value > target:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def get_postings(self, term: str) -> Optional[Tuple[memoryview, memoryview]]:
+        """Return (doc indices, term frequencies) for a term, or None."""
+        term_idx = self._find_term(term)
+        if term_idx < 0:
+            return None
+        start, end = self._post_offs[term_idx], self._post_offs[term_idx + 1]
+        return self._post_docs[start:end], self._post_tfs[start:end]
+
+    def iter_postings(self) -> Iterator[Tuple[str, Tuple[memoryview, memoryview]]]:
+        """Iterate (term, (doc indices, term frequencies)) in term order."""
+        post_offs = self._post_offs
+        for term_idx in range(self.num_terms):
+            start, end = post_offs[term_idx], post_offs[term_idx + 1]
+            yield self._terms[term_idx], (
+                self._post_docs[start:end],
+                self._post_tfs[start:end],
+            )
+
+    def doc_freq(self, term: str) -> int:
+        term_idx = self._find_term(term)
+        if term_idx < 0:
+            return 0
+        return self._post_offs[term_idx + 1] - self._post_offs[term_idx]
+
+    def find_doc(self, doc_id: str) -> int:
+        """Return the doc index of a document ID, or -1."""
+        target = doc_id.encode("utf-8")
+        order = self._doc_id_sort
+        doc_ids = self.doc_ids
+        lo, hi = 0, self.num_docs
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = doc_ids.raw(order[mid])
+            if value < target:
+                lo = mid + 1
+            elif value > target:
+                hi = mid
+            else:
+                return order[mid]
+        return -1
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._mm)
@@ -1,12 +1,30 @@
 # BM25 Keyword Search Service
+import heapq
 import math
 import logging
-from typing import List, Dict, Tuple
-from collections import Counter, defaultdict
+from array import array
+from bisect import bisect_left
+from operator import itemgetter
+from typing import List, Dict, Optional, Set, Tuple
+from collections import Counter
 import re
+import threading
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Postings arrays: doc indices and term frequencies as unsigned 32-bit ints,
+# per-document length norms as doubles.
+_POSTING_TYPECODE = "I"
+_NORM_TYPECODE = "d"
+
+_TOKEN_PATTERN = re.compile(r"\b\w+\b")
+
+
+def bm25_idf(num_docs: int, doc_freq: int) -> float:
+    """IDF = log((N - df + 0.5) / (df + 0.5) + 1)"""
+    return math.log((num_docs - doc_freq + 0.5) / (doc_freq + 0.5) + 1.0)
+
 
 class BM25:
     """
@@ -14,6 +32,12 @@ class BM25:
 
     Combines term frequency (TF) and inverse document frequency (IDF)
     with document length normalization.
+
+    The index is inverted: each term maps to a postings list of
+    (doc index, term frequency) held in two compact arrays, and the
+    length-normalization part of the BM25 denominator is precomputed per
+    document. A query therefore only touches documents that contain at
+    least one query term, and top-k selection uses a heap.
     """
 
     def __init__(self, k1: float = 1.5, b: float = 0.75):
@@ -26,18 +50,20 @@ class BM25:
         """
         self.k1 = k1
         self.b = b
-        self.corpus: List[List[str]] = []
         self.doc_ids: List[str] = []
-        self.doc_lengths: List[int] = []
+        self.doc_lengths: array = array(_POSTING_TYPECODE)
+        self.length_norms: array = array(_NORM_TYPECODE)
         self.avg_doc_length: float = 0.0
         self.doc_freqs: Dict[str, int] = {}
         self.idf: Dict[str, float] = {}
+        self.postings: Dict[str, Tuple[array, array]] = {}
         self.num_docs: int = 0
+        self._doc_index: Optional[Dict[str, int]] = None
 
     def tokenize(self, text: str) -> List[str]:
         """Tokenize text into words"""
         # Convert to lowercase and split on non-alphanumeric
-        tokens = re.findall(r"\b\w+\b", text.lower())
+        tokens = _TOKEN_PATTERN.findall(text.lower())
         return tokens
 
     def fit(self, corpus: List[str], doc_ids: List[str]):
@@ -48,34 +74,147 @@ class BM25:
             corpus: List of document texts
             doc_ids: List of document IDs
         """
-        self.corpus = [self.tokenize(doc) for doc in corpus]
-        self.doc_ids = doc_ids
-        self.num_docs = len(corpus)
+        self.doc_ids = []
+        self.doc_lengths = array(_POSTING_TYPECODE)
+        self.doc_freqs = {}
+        self.postings = {}
+        self.num_docs = 0
 
-        # Calculate document lengths
-        self.doc_lengths = [len(doc) for doc in self.corpus]
-        self.avg_doc_length = (
-            sum(self.doc_lengths) / self.num_docs if self.num_docs > 0 else 0
-        )
-
-        # Calculate document frequencies
-        self.doc_freqs = defaultdict(int)
-        for doc in self.corpus:
-            unique_terms = set(doc)
-            for term in unique_terms:
-                self.doc_freqs[term] += 1
-
-        # Calculate IDF scores
-        self.idf = {}
-        for term, freq in self.doc_freqs.items():
-            # IDF = log((N - df + 0.5) / (df + 0.5) + 1)
-            self.idf[term] = math.log((self.num_docs - freq + 0.5) / (freq + 0.5) + 1.0)
+        self.extend(corpus, doc_ids)
 
         logger.info(
             f"BM25 index built: {self.num_docs} documents, "
             f"{len(self.idf)} unique terms"
         )
 
+    def extend(self, corpus: List[str], doc_ids: List[str]):
+        """
+        Append documents to the index without re-tokenizing existing ones.
+
+        New postings are appended to the existing arrays (doc indices stay
+        sorted), then IDF and length norms are refreshed for the new corpus
+        statistics.
+
+        Args:
+            corpus: List of document texts
+            doc_ids: List of document IDs
+        """
+        postings = self.postings
+        doc_freqs = self.doc_freqs
+        doc_idx = self.num_docs
+
+        for text in corpus:
+            tokens = self.tokenize(text)
+            self.doc_lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                entry = postings.get(term)
+                if entry is None:
+                    postings[term] = (
+                        array(_POSTING_TYPECODE, (doc_idx,)),
+                        array(_POSTING_TYPECODE, (tf,)),
+                    )
+                    doc_freqs[term] = 1
+                else:
+                    entry[0].append(doc_idx)
+                    entry[1].append(tf)
+                    doc_freqs[term] += 1
+            doc_idx += 1
+
+        self.doc_ids.extend(doc_ids)
+        self.num_docs = doc_idx
+        self._doc_index = None
+
+        self._refresh_statistics()
+
+    @classmethod
+    def from_postings(
+        cls,
+        doc_ids: List[str],
+        doc_lengths: array,
+        postings: Dict[str, Tuple[array, array]],
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> "BM25":
+        """
+        Build an index directly from prebuilt postings (used by segment merges).
+
+        Args:
+            doc_ids: Document IDs, indexed by doc index
+            doc_lengths: Token count per document
+            postings: term -> (sorted doc indices, term frequencies)
+            k1: Term frequency saturation parameter
+            b: Length normalization parameter
+
+        Returns:
+            BM25 index over the given postings
+        """
+        index = cls(k1=k1, b=b)
+        index.doc_ids = doc_ids
+        index.doc_lengths = doc_lengths
+        index.postings = postings
+        index.doc_freqs = {term: len(entry[0]) for term, entry in postings.items()}
+        index.num_docs = len(doc_ids)
+        index._refresh_statistics()
+        return index
+
+    def _refresh_statistics(self):
+        """Recompute IDF and length norms from doc_freqs and doc_lengths."""
+        n = self.num_docs
+        self.idf = {term: bm25_idf(n, freq) for term, freq in self.doc_freqs.items()}
+
+        self._compute_length_norms()
+
+    @property
+    def total_length(self) -> int:
+        return sum(self.doc_lengths)
+
+    def get_postings(self, term: str) -> Optional[Tuple[array, array]]:
+        """Return (doc indices, term frequencies) for a term, or None."""
+        return self.postings.get(term)
+
+    def iter_postings(self):
+        """Iterate (term, (doc indices, term frequencies)) pairs."""
+        return iter(self.postings.items())
+
+    def doc_freq(self, term: str) -> int:
+        return self.doc_freqs.get(term, 0)
+
+    def find_doc(self, doc_id: str) -> int:
+        """Return the doc index of a document ID, or -1."""
+        doc_index = getattr(self, "_doc_index", None)
+        if doc_index is None:
+            doc_index = {value: idx for idx, value in enumerate(self.doc_ids)}
+            self._doc_index = doc_index
+        return doc_index.get(doc_id, -1)
+
+    def _compute_length_norms(self):
+        """Precompute k1 * (1 - b + b * dl / avgdl) for every document."""
+        total_length = sum(self.doc_lengths)
+        self.avg_doc_length = total_length / self.num_docs if self.num_docs > 0 else 0.0
+
+        if self.avg_doc_length > 0:
+            base = self.k1 * (1 - self.b)
+            slope = self.k1 * self.b / self.avg_doc_length
+            self.length_norms = array(
+                _NORM_TYPECODE, (base + slope * length for length in self.doc_lengths)
+            )
+        else:
+            self.length_norms = array(_NORM_TYPECODE, [self.k1] * self.num_docs)
+
+    def _query_term_weights(self, query: str) -> List[Tuple[str, float]]:
+        """
+        Tokenize a query once and return (term, weight) pairs.
+
+        Repeated query terms contribute once per occurrence, so their IDF is
+        multiplied by the query term frequency. Unknown terms are dropped.
+        """
+        weights = []
+        for term, qtf in Counter(self.tokenize(query)).items():
+            idf = self.idf.get(term)
+            if idf is not None:
+                weights.append((term, idf * qtf))
+        return weights
+
     def score(self, query: str, doc_idx: int) -> float:
         """
         Calculate BM25 score for a query-document pair.
@@ -87,30 +226,43 @@ class BM25:
         Returns:
             BM25 score
         """
-        query_terms = self.tokenize(query)
-        doc = self.corpus[doc_idx]
-        doc_length = self.doc_lengths[doc_idx]
-
-        # Count term frequencies in document
-        term_freqs = Counter(doc)
+        norm = self.length_norms[doc_idx]
+        k1_plus_1 = self.k1 + 1
 
         score = 0.0
-        for term in query_terms:
-            if term not in self.idf:
+        for term, weight in self._query_term_weights(query):
+            docs, tfs = self.postings[term]
+            pos = bisect_left(docs, doc_idx)
+            if pos == len(docs) or docs[pos] != doc_idx:
                 continue
 
-            tf = term_freqs.get(term, 0)
-            idf = self.idf[term]
+            tf = tfs[pos]
+            score += weight * (tf * k1_plus_1) / (tf + norm)
 
-            # BM25 formula
-            numerator = tf * (self.k1 + 1)
-            denominator = tf + self.k1 * (
-                1 - self.b + self.b * (doc_length / self.avg_doc_length)
-            )
+        return score
 
-            score += idf * (numerator / denominator)
+    def get_scores(self, query: str) -> Dict[int, float]:
+        """
+        Score every document that contains at least one query term.
 
-        return score
+        Args:
+            query: Query text
+
+        Returns:
+            Dict mapping document index to BM25 score
+        """
+        scores: Dict[int, float] = {}
+        norms = self.length_norms
+        k1_plus_1 = self.k1 + 1
+
+        for term, weight in self._query_term_weights(query):
+            docs, tfs = self.postings[term]
+            for doc_idx, tf in zip(docs, tfs):
+                scores[doc_idx] = scores.get(doc_idx, 0.0) + weight * (
+                    (tf * k1_plus_1) / (tf + norms[doc_idx])
+                )
+
+        return scores
 
     def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
         """
@@ -123,20 +275,344 @@ class BM25:
         Returns:
             List of (doc_id, score) tuples, sorted by score descending
         """
-        if self.num_docs == 0:
+        if self.num_docs == 0 or top_k <= 0:
             return []
 
-        # Calculate scores for all documents
-        scores = []
-        for idx in range(self.num_docs):
-            score = self.score(query, idx)
-            if score > 0:
-                scores.append((self.doc_ids[idx], score))
+        scores = self.get_scores(query)
+        top = heapq.nlargest(top_k, scores.items(), key=itemgetter(1))
+
+        return [(self.doc_ids[doc_idx], score) for doc_idx, score in top if score > 0]
+
+
+@dataclass
+class BM25Segment:
+    """
+    An immutable BM25 index over one ingestion batch plus its tombstones.
+
+    ``index`` is either an in-memory ``BM25`` or a memory-mapped segment
+    (see ``backend.services.bm25_mmap``); both expose the same read API.
+    ``name`` is the segment file name once the segment has been persisted.
+    """
+
+    index: BM25
+    deleted: Set[int] = field(default_factory=set)
+    name: Optional[str] = None
+
+    @property
+    def live_docs(self) -> int:
+        return self.index.num_docs - len(self.deleted)
+
+    def find_live(self, doc_id: str) -> int:
+        """Return the local index of a live document, or -1."""
+        local = self.index.find_doc(doc_id)
+        if local < 0 or local in self.deleted:
+            return -1
+        return local
+
 
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
+class SegmentedBM25:
+    """
+    Incremental BM25 index made of append-only segments.
+
+    - ``add`` indexes only the new documents into a fresh segment
+    - ``delete`` tombstones documents in their segment
+    - ``merge`` compacts segments (dropping tombstoned documents) and is
+      safe to run in a background thread while searches and writes continue
+
+    The live document count and total length are kept as running totals, and
+    document frequencies are summed per query term across segments, so IDF
+    and avgdl stay current without touching existing segments. As in Lucene,
+    document frequencies still count tombstoned documents until their
+    segment is merged.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        max_segments: int = 8,
+        merge_factor: int = 4,
+        max_deleted_ratio: float = 0.3,
+    ):
+        """
+        Initialize an empty segmented index.
+
+        Args:
+            k1: Term frequency saturation parameter
+            b: Length normalization parameter
+            max_segments: Segment count above which small segments are merged
+            merge_factor: Number of smallest segments merged at a time
+            max_deleted_ratio: Tombstone ratio that makes a segment eligible for merge
+        """
+        self.k1 = k1
+        self.b = b
+        self.max_segments = max_segments
+        self.merge_factor = max(2, merge_factor)
+        self.max_deleted_ratio = max_deleted_ratio
+
+        # Copy-on-write: searches iterate a snapshot of this list
+        self.segments: List[BM25Segment] = []
+        self.num_docs: int = 0
+        self.total_length: int = 0
+
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_segments(cls, segments: List[BM25Segment], **kwargs) -> "SegmentedBM25":
+        """
+        Assemble an index from existing (e.g. memory-mapped) segments.
+
+        Args:
+            segments: Segments with their tombstones
+            **kwargs: Constructor arguments (k1, b, merge policy)
+
+        Returns:
+            SegmentedBM25 over the given segments
+        """
+        index = cls(**kwargs)
+        index.segments = list(segments)
+        for segment in segments:
+            lengths = segment.index.doc_lengths
+            index.num_docs += segment.live_docs
+            index.total_length += segment.index.total_length - sum(
+                lengths[local] for local in segment.deleted
+            )
+        return index
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def avg_doc_length(self) -> float:
+        return self.total_length / self.num_docs if self.num_docs > 0 else 0.0
+
+    @property
+    def deleted_docs(self) -> int:
+        return sum(len(segment.deleted) for segment in self.segments)
+
+    def tokenize(self, text: str) -> List[str]:
+        """Tokenize text into words"""
+        return _TOKEN_PATTERN.findall(text.lower())
+
+    def doc_freq(self, term: str) -> int:
+        """Document frequency of a term across all segments."""
+        return sum(segment.index.doc_freq(term) for segment in self.segments)
+
+    def add(self, corpus: List[str], doc_ids: List[str]) -> int:
+        """
+        Index a batch of documents as a new segment.
+
+        Documents whose ID is already indexed are replaced (the old copy is
+        tombstoned).
+
+        Args:
+            corpus: List of document texts
+            doc_ids: List of document IDs
+
+        Returns:
+            Number of documents added
+        """
+        if not doc_ids:
+            return 0
+
+        # Tokenizing and building postings happens outside the lock
+        index = BM25(k1=self.k1, b=self.b)
+        index.extend(corpus, doc_ids)
+        segment = BM25Segment(index=index)
+
+        with self._lock:
+            self._delete_locked(doc_ids)
+
+            self.num_docs += index.num_docs
+            self.total_length += index.total_length
+            self.segments = self.segments + [segment]
+
+        return index.num_docs
+
+    def delete(self, doc_ids: List[str]) -> int:
+        """
+        Tombstone documents.
+
+        Args:
+            doc_ids: IDs of documents to delete
+
+        Returns:
+            Number of documents that were live and are now deleted
+        """
+        with self._lock:
+            return self._delete_locked(doc_ids)
+
+    def _delete_locked(self, doc_ids: List[str]) -> int:
+        deleted = 0
+        segments = self.segments
+        for doc_id in doc_ids:
+            # Newest segment first: that is where a live copy usually is
+            for segment in reversed(segments):
+                local = segment.find_live(doc_id)
+                if local < 0:
+                    continue
+                segment.deleted.add(local)
+                self.num_docs -= 1
+                self.total_length -= segment.index.doc_lengths[local]
+                deleted += 1
+                break
+        return deleted
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Search for top-k live documents matching query.
+
+        Args:
+            query: Query text
+            top_k: Number of results to return
+
+        Returns:
+            List of (doc_id, score) tuples, sorted by score descending
+        """
+        num_docs = self.num_docs
+        if num_docs == 0 or top_k <= 0:
+            return []
+
+        k1_plus_1 = self.k1 + 1
+        base = self.k1 * (1 - self.b)
+        avg_doc_length = self.avg_doc_length
+        slope = self.k1 * self.b / avg_doc_length if avg_doc_length > 0 else 0.0
+
+        segments = self.segments
+        scores: Dict[str, float] = {}
+
+        for term, qtf in Counter(self.tokenize(query)).items():
+            entries = []
+            doc_freq = 0
+            for segment in segments:
+                entry = segment.index.get_postings(term)
+                if entry is not None:
+                    entries.append((segment, entry))
+                    doc_freq += len(entry[0])
+            if not doc_freq:
+                continue
+            weight = bm25_idf(num_docs, min(doc_freq, num_docs)) * qtf
+
+            for segment, (docs, tfs) in entries:
+                ids = segment.index.doc_ids
+                lengths = segment.index.doc_lengths
+                deleted = segment.deleted
+                for local, tf in zip(docs, tfs):
+                    if deleted and local in deleted:
+                        continue
+                    doc_id = ids[local]
+                    scores[doc_id] = scores.get(doc_id, 0.0) + weight * (
+                        (tf * k1_plus_1) / (tf + base + slope * lengths[local])
+                    )
+
+        top = heapq.nlargest(top_k, scores.items(), key=itemgetter(1))
+        return [(doc_id, score) for doc_id, score in top if score > 0]
+
+    def select_merge(self) -> List[BM25Segment]:
+        """
+        Pick segments worth merging.
+
+        Returns:
+            Segments with too many tombstones, plus the smallest segments when
+            the segment count exceeds max_segments; empty if no merge is due
+        """
+        segments = self.segments
+        candidates = [
+            segment
+            for segment in segments
+            if segment.index.num_docs
+            and len(segment.deleted) / segment.index.num_docs > self.max_deleted_ratio
+        ]
+
+        if len(segments) > self.max_segments:
+            by_size = sorted(segments, key=lambda segment: segment.live_docs)
+            for segment in by_size[: self.merge_factor]:
+                if not any(segment is c for c in candidates):
+                    candidates.append(segment)
+
+        return candidates
+
+    def merge(self, segments: Optional[List[BM25Segment]] = None) -> int:
+        """
+        Merge segments into one, dropping tombstoned documents.
+
+        The merged postings are built without holding the lock; deletes that
+        land on the source segments meanwhile are carried over on swap.
+
+        Args:
+            segments: Segments to merge (default: all segments)
+
+        Returns:
+            Number of segments merged
+        """
+        if segments is None:
+            segments = list(self.segments)
+        if not segments or (len(segments) == 1 and not segments[0].deleted):
+            return 0
+
+        snapshots = [set(segment.deleted) for segment in segments]
+
+        doc_ids: List[str] = []
+        doc_lengths = array(_POSTING_TYPECODE)
+        remaps: List[List[int]] = []
+        for segment, deleted in zip(segments, snapshots):
+            remap = []
+            ids = segment.index.doc_ids
+            lengths = segment.index.doc_lengths
+            for local in range(segment.index.num_docs):
+                if local in deleted:
+                    remap.append(-1)
+                else:
+                    remap.append(len(doc_ids))
+                    doc_ids.append(ids[local])
+                    doc_lengths.append(lengths[local])
+            remaps.append(remap)
+
+        # Segments are visited in order, so merged doc indices stay sorted
+        doc_lists: Dict[str, array] = {}
+        tf_lists: Dict[str, array] = {}
+        for segment, remap in zip(segments, remaps):
+            for term, (docs, tfs) in segment.index.iter_postings():
+                merged_docs = doc_lists.get(term)
+                if merged_docs is None:
+                    merged_docs = doc_lists[term] = array(_POSTING_TYPECODE)
+                    tf_lists[term] = array(_POSTING_TYPECODE)
+                merged_tfs = tf_lists[term]
+                for local, tf in zip(docs, tfs):
+                    new_idx = remap[local]
+                    if new_idx >= 0:
+                        merged_docs.append(new_idx)
+                        merged_tfs.append(tf)
+
+        postings = {
+            term: (docs, tf_lists[term]) for term, docs in doc_lists.items() if docs
+        }
+        merged = BM25Segment(
+            index=BM25.from_postings(doc_ids, doc_lengths, postings, k1=self.k1, b=self.b)
+        )
+
+        with self._lock:
+            merged_ids = {id(segment) for segment in segments}
+            for segment, deleted, remap in zip(segments, snapshots, remaps):
+                # Deletes that arrived while the merge was running
+                for local in segment.deleted - deleted:
+                    merged.deleted.add(remap[local])
+
+            remaining = [segment for segment in self.segments if id(segment) not in merged_ids]
+            self.segments = [merged] + remaining if merged.index.num_docs else remaining
+
+        logger.info(
+            f"Merged {len(segments)} BM25 segments into one with "
+            f"{merged.index.num_docs} documents ({len(self.segments)} segments left)"
+        )
 
-        return scores[:top_k]
+        return len(segments)
 
 
 class BM25SearchService:
@@ -5,7 +5,10 @@ Integrates DocumentProcessor, EmbeddingService, and MilvusManager to provide
 a complete document upload and indexing workflow.
 """
 
+import asyncio
 import logging
+import time
+import uuid
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -15,6 +18,7 @@ from backend.services.document_processor import (
 )
 from backend.services.embedding import EmbeddingService
 from backend.services.milvus import MilvusManager
+from backend.services.streaming_ingestion import StreamingIngestionPipeline
 from backend.models.document import Document, TextChunk
 
 logger = logging.getLogger(__name__)
@@ -37,6 +41,8 @@ class DocumentIngestionService:
         embedding_service: EmbeddingService,
         milvus_manager: MilvusManager,
         hybrid_search_manager=None,
+        bm25_compaction_interval: float = 60.0,
+        streaming: Optional[bool] = None,
     ):
         """
         Initialize DocumentIngestionService.
@@ -46,12 +52,28 @@ class DocumentIngestionService:
             embedding_service: Service for generating embeddings
             milvus_manager: Manager for Milvus operations
             hybrid_search_manager: Optional HybridSearchManager for BM25 indexing
+            bm25_compaction_interval: Minimum seconds between BM25 segment merges
+            streaming: Ingest page by page through bounded queues
+                (default: ENABLE_STREAMING_INGESTION)
         """
         self.document_processor = document_processor
         self.embedding_service = embedding_service
         self.milvus_manager = milvus_manager
         self.hybrid_search = hybrid_search_manager
 
+        # BM25 change feed: inserts are added as segments, deletes tombstoned,
+        # and segments are compacted in the background at most this often
+        self.bm25_compaction_interval = bm25_compaction_interval
+        self._bm25_bootstrap_lock = asyncio.Lock()
+        self._bm25_compaction_task: Optional[asyncio.Task] = None
+        self._last_bm25_compaction = 0.0
+
+        if streaming is None:
+            from backend.config import settings
+
+            streaming = settings.ENABLE_STREAMING_INGESTION
+        self.streaming = streaming
+
         logger.info(
             f"DocumentIngestionService initialized "
             f"(hybrid_search={'enabled' if hybrid_search_manager else 'disabled'})"
@@ -89,6 +111,11 @@ class DocumentIngestionService:
         try:
             logger.info(f"Starting document ingestion: {filename}")
 
+            if self.streaming:
+                return await self._ingest_streaming(
+                    file_content, filename, file_size, start_time
+                )
+
             # Step 1: Process document (extract and chunk)
             document, chunks = await self.document_processor.process_document(
                 file_content=file_content, filename=filename, file_size=file_size
@@ -115,7 +142,7 @@ class DocumentIngestionService:
                 f"Generating embeddings for {num_chunks} chunks (batch_size={batch_size})"
             )
             embeddings = await self.embedding_service.embed_batch(
-                texts=chunk_texts, batch_size=batch_size
+                texts=chunk_texts, batch_size=batch_size, as_numpy=True
             )
 
             logger.info(f"Generated {len(embeddings)} embeddings")
@@ -172,8 +199,7 @@ class DocumentIngestionService:
             # Update BM25 index if hybrid search is enabled
             if self.hybrid_search:
                 try:
-                    await self._update_bm25_index()
-                    logger.info("BM25 index updated successfully")
+                    await self._update_bm25_index(metadata_list)
                 except Exception as e:
                     logger.warning(f"Failed to update BM25 index: {e}")
                     # Don't fail the ingestion if BM25 update fails
@@ -244,6 +270,74 @@ class DocumentIngestionService:
                 "error": error_msg,
             }
 
+    async def _ingest_streaming(
+        self, file_content: bytes, filename: str, file_size: int, start_time: datetime
+    ) -> Dict[str, Any]:
+        """
+        Ingest through the streaming pipeline (extract page -> chunk -> embed -> store).
+
+        Chunks are inserted into Milvus and the BM25 index batch by batch, so
+        they become searchable while later pages are still being parsed.
+        Partially stored data is removed if a later batch fails.
+        """
+        document_id = str(uuid.uuid4())
+        pipeline = StreamingIngestionPipeline(
+            document_processor=self.document_processor,
+            embedding_service=self.embedding_service,
+            milvus_manager=self.milvus_manager,
+            on_batch_stored=self._update_bm25_index if self.hybrid_search else None,
+        )
+
+        row_metadata = {
+            "document_name": filename,
+            "file_type": self.document_processor.detect_file_type(filename),
+            "upload_date": int(start_time.timestamp()),
+            # Optional metadata fields
+            "author": "",
+            "creation_date": 0,
+            "language": "",
+            "keywords": "",
+        }
+
+        try:
+            outcome = await pipeline.run(
+                file_content,
+                filename=filename,
+                file_size=file_size,
+                row_metadata=row_metadata,
+                document_id=document_id,
+            )
+        except Exception:
+            # Always clean up: batches still queued on the Milvus writer when
+            # the pipeline failed are written even though chunks_stored does
+            # not count them (delete_by_document_id flushes them first)
+            try:
+                await self.milvus_manager.delete_by_document_id(document_id)
+                if self.hybrid_search:
+                    self.hybrid_search.delete_document_chunks(document_id)
+                logger.info(f"Cleaned up partial data for {document_id}")
+            except Exception as cleanup_error:
+                logger.warning(f"Failed to clean up: {str(cleanup_error)}")
+            raise
+
+        processing_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+
+        logger.info(
+            f"Document ingestion completed: {document_id} "
+            f"in {processing_time_ms:.2f}ms (streamed, first batch "
+            f"stored after {outcome.first_batch_ms}ms)"
+        )
+
+        return {
+            "document_id": document_id,
+            "filename": filename,
+            "status": "completed",
+            "chunk_count": outcome.chunk_count,
+            "processing_time_ms": round(processing_time_ms, 2),
+            "metadata": outcome.metadata,
+            "error": None,
+        }
+
     async def get_document_chunks(
         self, document_id: str, top_k: int = 100
     ) -> List[Dict[str, Any]]:
@@ -324,6 +418,14 @@ class DocumentIngestionService:
 
             logger.info(f"Deleted {chunks_deleted} chunks for document {document_id}")
 
+            if self.hybrid_search:
+                try:
+                    tombstoned = self.hybrid_search.delete_document_chunks(document_id)
+                    logger.debug(f"Tombstoned {tombstoned} BM25 chunks for {document_id}")
+                    self._schedule_bm25_compaction()
+                except Exception as e:
+                    logger.warning(f"Failed to update BM25 index: {e}")
+
             return {
                 "document_id": document_id,
                 "status": "deleted",
@@ -342,48 +444,72 @@ class DocumentIngestionService:
                 "error": error_msg,
             }
 
-    async def _update_bm25_index(self):
+    async def _update_bm25_index(self, chunks: List[Dict[str, Any]]):
         """
-        Update BM25 index with all documents from Milvus.
+        Apply newly inserted chunks to the BM25 index as a delta.
+
+        The first update in a process loads the existing collection once;
+        after that only the new chunks are tokenized and indexed.
 
-        This is called after each document ingestion to keep the
-        BM25 index synchronized with the vector database.
+        Args:
+            chunks: Chunk metadata as inserted into Milvus ('id', 'document_id', 'text')
         """
         try:
-            logger.info("Updating BM25 index...")
+            if self.hybrid_search.bm25 is None:
+                await self._bootstrap_bm25_index()
 
-            # Get all documents from Milvus
-            # Use a dummy embedding to retrieve all documents
-            dummy_embedding = [0.0] * self.embedding_service.dimension
+            # The bootstrap may not see these chunks (the Milvus writer can
+            # still be buffering them); re-adding an indexed chunk replaces it
+            added = self.hybrid_search.add_documents(chunks)
+            logger.info(f"Added {added} chunks to BM25 index")
 
-            # Retrieve a large number of documents
-            all_results = await self.milvus_manager.search(
-                query_embedding=dummy_embedding,
-                top_k=10000,  # Adjust based on your collection size
-            )
+            self._schedule_bm25_compaction()
 
-            # Prepare documents for BM25 indexing
+        except Exception as e:
+            logger.error(f"Failed to update BM25 index: {e}")
+            raise
+
+    async def _bootstrap_bm25_index(self):
+        """Build the BM25 index from every chunk stored in Milvus (once per process)."""
+        async with self._bm25_bootstrap_lock:
+            if self.hybrid_search.bm25 is not None:
+                return
+
+            logger.info("Building BM25 index from Milvus collection...")
             documents = []
-            for result in all_results:
-                doc = {
-                    "id": result.id,
-                    "document_id": result.document_id,
-                    "text": result.text,
-                    "document_name": result.document_name,
-                    "chunk_index": result.chunk_index,
-                }
-                documents.append(doc)
+            async for batch in self.milvus_manager.iter_chunks(
+                output_fields=["id", "document_id", "text"]
+            ):
+                documents.extend(batch)
 
-            # Build BM25 index
             if documents:
                 self.hybrid_search.build_bm25_index(documents)
                 logger.info(f"BM25 index built with {len(documents)} documents")
             else:
                 logger.warning("No documents found for BM25 indexing")
 
+    def _schedule_bm25_compaction(self):
+        """Merge BM25 segments in the background, at most once per interval."""
+        if self._bm25_compaction_task is not None and not self._bm25_compaction_task.done():
+            return
+        if not self.hybrid_search.needs_compaction():
+            return
+
+        self._bm25_compaction_task = asyncio.create_task(self._compact_bm25_index())
+
+    async def _compact_bm25_index(self):
+        delay = self._last_bm25_compaction + self.bm25_compaction_interval - time.monotonic()
+        if delay > 0:
+            # Changes arriving meanwhile are picked up by the same merge
+            await asyncio.sleep(delay)
+
+        try:
+            merged = await asyncio.to_thread(self.hybrid_search.compact)
+            logger.info(f"Compacted BM25 index ({merged} segments merged)")
         except Exception as e:
-            logger.error(f"Failed to update BM25 index: {e}")
-            raise
+            logger.warning(f"BM25 compaction failed: {e}")
+        finally:
+            self._last_bm25_compaction = time.monotonic()
 
     def get_service_info(self) -> Dict[str, Any]:
         """
@@ -403,4 +529,7 @@ class DocumentIngestionService:
                 self.document_processor.SUPPORTED_TYPES.keys()
             ),
             "hybrid_search_enabled": self.hybrid_search is not None,
+            "bm25_index": (
+                self.hybrid_search.get_bm25_stats() if self.hybrid_search else None
+            ),
         }
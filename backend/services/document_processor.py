@@ -5,9 +5,10 @@ Supports PDF, TXT, DOCX, HWP, and HWPX file formats with configurable chunking
 and comprehensive error handling.
 """
 
+import asyncio
 import logging
 import uuid
-from typing import List, Dict, Any, Optional, BinaryIO
+from typing import List, Dict, Any, Iterator, Optional, BinaryIO, Union
 from datetime import datetime
 import io
 import zipfile
@@ -251,6 +252,53 @@ class DocumentProcessor:
             logger.error(error_msg)
             raise DocumentProcessingError(error_msg) from e
 
+    def open_pdf(self, source: Union[bytes, str, BinaryIO]) -> PdfReader:
+        """
+        Open a PDF for page-by-page extraction.
+
+        Pages are parsed lazily, so a file path or file object is never read
+        into memory as a whole.
+
+        Args:
+            source: PDF content, file path or binary file object
+
+        Returns:
+            PdfReader
+
+        Raises:
+            DocumentProcessingError: If the PDF cannot be opened
+        """
+        try:
+            if isinstance(source, bytes):
+                source = io.BytesIO(source)
+            return PdfReader(source)
+        except Exception as e:
+            raise DocumentProcessingError(f"Failed to open PDF: {str(e)}") from e
+
+    def iter_pdf_pages(self, reader: PdfReader) -> Iterator[str]:
+        """
+        Yield the normalized text of each PDF page.
+
+        Pages without text are skipped.
+
+        Args:
+            reader: Reader from open_pdf
+
+        Yields:
+            Page text prefixed with its page marker
+        """
+        for page_num, page in enumerate(reader.pages):
+            try:
+                page_text = page.extract_text()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to extract text from page {page_num + 1}: {str(e)}"
+                )
+                continue
+
+            if page_text and page_text.strip():
+                yield self._normalize_text(f"[Page {page_num + 1}]\n{page_text}")
+
     def extract_text_from_txt(self, file_content: bytes) -> str:
         """
         Extract text from TXT file.
@@ -972,13 +1020,7 @@ class DocumentProcessor:
             f"chunk_size={self.chunk_size}, overlap={self.chunk_overlap}"
         )
 
-        # Use semantic chunker
-        try:
-            chunk_texts = self.semantic_chunker.chunk_text(text)
-        except Exception as e:
-            logger.error(f"Semantic chunking failed: {e}, using fallback")
-            # Fallback to simple chunking
-            chunk_texts = self._fallback_chunking(text)
+        chunk_texts = self.split_text(text)
 
         # Convert to TextChunk objects
         chunks = []
@@ -1016,6 +1058,24 @@ class DocumentProcessor:
 
         return chunks
 
+    def split_text(self, text: str) -> List[str]:
+        """
+        Split text into chunk strings with the configured strategy.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of chunk texts
+        """
+        # Use semantic chunker
+        try:
+            return self.semantic_chunker.chunk_text(text)
+        except Exception as e:
+            logger.error(f"Semantic chunking failed: {e}, using fallback")
+            # Fallback to simple chunking
+            return self._fallback_chunking(text)
+
     def _fallback_chunking(self, text: str) -> List[str]:
         """
         Fallback chunking method (simple fixed-size with sentence boundaries).
@@ -1093,6 +1153,110 @@ class DocumentProcessor:
 
         return metadata
 
+    async def _extract_and_chunk(
+        self, file_content: bytes, file_type: str, document_id: str, chunk: bool = True
+    ) -> tuple[str, Optional[List[TextChunk]], Dict[str, Any]]:
+        """
+        Extract text, chunks and file metadata without blocking the event loop.
+
+        Runs in the extraction process pool when enabled (bounded, with
+        per-format timeouts), otherwise in a thread. Semantic chunking needs
+        the embedding model, so it stays in this process (in a thread)
+        instead of loading the model into every worker.
+
+        Args:
+            file_content: File content as bytes
+            file_type: Detected file type
+            document_id: ID used for chunk IDs
+            chunk: Whether to chunk the text (False returns chunks as None)
+
+        Returns:
+            tuple: (text, chunks, rich metadata)
+
+        Raises:
+            ValueError: If the file content or type is invalid
+            DocumentProcessingError: If extraction fails or times out
+        """
+        from concurrent.futures.process import BrokenProcessPool
+
+        from backend.services.extraction_pool import (
+            ExtractionTimeoutError,
+            get_extraction_pool,
+        )
+        from backend.services.extraction_worker import extract_and_chunk
+
+        pool = get_extraction_pool()
+        if pool is None:
+            return await asyncio.to_thread(
+                self._extract_and_chunk_sync, file_content, file_type, document_id, chunk
+            )
+
+        chunk_in_worker = chunk and self.chunking_strategy != "semantic"
+        config = {
+            "chunk_size": self.chunk_size,
+            "chunk_overlap": self.chunk_overlap,
+            "max_file_size": self.max_file_size,
+            # Workers that only extract must not load the semantic model
+            "chunking_strategy": self.chunking_strategy if chunk_in_worker else "sentence",
+        }
+
+        try:
+            result = await pool.run(
+                file_type,
+                extract_and_chunk,
+                file_content,
+                file_type,
+                document_id,
+                config,
+                chunk_in_worker,
+            )
+        except ExtractionTimeoutError as e:
+            raise DocumentProcessingError(str(e)) from e
+        except BrokenProcessPool as e:
+            raise DocumentProcessingError(
+                f"Extraction worker crashed while processing {file_type} file"
+            ) from e
+
+        text = result["text"]
+        chunks = result["chunks"]
+        if chunk and chunks is None:
+            chunks = await asyncio.to_thread(self.chunk_text, text, document_id)
+
+        return text, chunks, result["metadata"]
+
+    def _extract_and_chunk_sync(
+        self, file_content: bytes, file_type: str, document_id: str, chunk: bool = True
+    ) -> tuple[str, Optional[List[TextChunk]], Dict[str, Any]]:
+        """In-process extraction used when the extraction pool is disabled."""
+        text = self.extract_text(file_content, file_type)
+        chunks = self.chunk_text(text, document_id) if chunk else None
+        rich_metadata = self.metadata_extractor.extract_metadata(
+            file_content=file_content, file_type=file_type, text=text
+        )
+        return text, chunks, rich_metadata
+
+    async def extract_async(
+        self, file_content: bytes, file_type: str
+    ) -> tuple[str, Dict[str, Any]]:
+        """
+        Extract normalized text and file metadata without blocking the event loop.
+
+        Args:
+            file_content: File content as bytes
+            file_type: Detected file type
+
+        Returns:
+            tuple: (text, rich metadata)
+
+        Raises:
+            ValueError: If the file content or type is invalid
+            DocumentProcessingError: If extraction fails or times out
+        """
+        text, _, rich_metadata = await self._extract_and_chunk(
+            file_content, file_type, document_id="extract", chunk=False
+        )
+        return text, rich_metadata
+
     async def process_document(
         self, file_content: bytes, filename: str, file_size: int
     ) -> tuple[Document, List[TextChunk]]:
@@ -1134,25 +1298,16 @@ class DocumentProcessor:
                 metadata={},
             )
 
-            # Extract text
+            # Extract text, chunk it and extract file metadata off the event loop
             try:
-                text = self.extract_text(file_content, file_type)
+                text, chunks, rich_metadata = await self._extract_and_chunk(
+                    file_content, file_type, document_id
+                )
             except DocumentProcessingError as e:
                 document.processing_status = "failed"
                 document.error_message = str(e)
                 raise
 
-            # Chunk text
-            chunks = self.chunk_text(text, document_id)
-
-            # Extract rich metadata
-            from backend.services.metadata_extractor import get_metadata_extractor
-
-            metadata_extractor = get_metadata_extractor()
-            rich_metadata = metadata_extractor.extract_metadata(
-                file_content=file_content, file_type=file_type, text=text
-            )
-
             # Store metadata
             metadata = self.extract_metadata(filename, file_size, file_type, text)
             metadata.update(rich_metadata)
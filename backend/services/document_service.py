@@ -75,7 +75,9 @@ class DocumentService:
 
         logger.info("DocumentService initialized")
 
-    async def upload_document(self, user_id: UUID, file: UploadFile) -> Document:
+    async def upload_document(
+        self, user_id: UUID, file: UploadFile, streaming: bool = False
+    ) -> Document:
         """
         Upload and process a document for a user.
 
@@ -93,6 +95,9 @@ class DocumentService:
         Args:
             user_id: User's unique identifier
             file: Uploaded file object
+            streaming: Run processing, embedding, vector storage and BM25
+                indexing as a bounded page-by-page pipeline
+                (StreamingIngestionPipeline)
 
         Returns:
             Document: Created document record
@@ -181,169 +186,220 @@ class DocumentService:
                 logger.error(f"Failed to update document status to processing: {e}")
                 raise DocumentServiceError(f"Failed to update document status: {e}")
 
-            # Step 6: Process document
-            try:
-                # Read file content
-                with open(file_path, 'rb') as f:
-                    file_content = f.read()
-                
-                # Process document with standard processor
-                document_obj, chunks = await self.doc_processor.process_document(
-                    file_content=file_content,
-                    filename=file.filename,
-                    file_size=file_size
-                )
-                
-                # Extract text and file_type from document_obj
-                text = "\n\n".join([chunk.text for chunk in chunks])
-                file_type = document_obj.file_type
-                
-                logger.info(
-                    f"Document processing completed for {document_id}: "
-                    f"file_type={file_type}, chunks={len(chunks)}"
-                )
+            if streaming:
+                # Steps 6-9 streamed: the stored file is read page by page and
+                # chunks are embedded, stored and BM25-indexed batch by batch
+                from backend.services.bm25_indexer import get_bm25_indexer
+                from backend.services.streaming_ingestion import StreamingIngestionPipeline
 
-            except (DocumentProcessingError, ValueError) as e:
-                # Update document status to 'failed'
+                pipeline = StreamingIngestionPipeline(
+                    document_processor=self.doc_processor,
+                    embedding_service=self.embedding_service,
+                    milvus_manager=self.milvus_manager,
+                    on_batch_stored=get_bm25_indexer().index_chunks,
+                )
                 try:
-                    self.document_repo.update_document_status(
-                        document_id, "failed", error_message=str(e)
+                    outcome = await pipeline.run(
+                        file_path,
+                        filename=file.filename,
+                        file_size=file_size,
+                        row_metadata={
+                            "document_name": file.filename,
+                            "file_type": self.doc_processor.detect_file_type(file.filename),
+                            "upload_date": int(datetime.utcnow().timestamp()),
+                            "author": "",
+                            "creation_date": 0,
+                            "language": "",
+                            "keywords": "",
+                        },
+                        document_id=str(document_id),
                     )
-                except Exception as status_error:
+                    chunk_count = outcome.chunk_count
+                except Exception as e:
+                    vectors_inserted = pipeline.chunks_stored > 0
+                    try:
+                        self.document_repo.update_document_status(
+                            document_id, "failed", error_message=str(e)
+                        )
+                    except Exception as status_error:
+                        logger.error(
+                            f"Failed to update document status to failed: {status_error}"
+                        )
+
                     logger.error(
-                        f"Failed to update document status to failed: {status_error}"
+                        f"Streaming ingestion failed for document {document_id}: {e}",
+                        exc_info=True,
                     )
+                    raise DocumentServiceError(f"Failed to process document: {e}")
 
-                logger.error(
-                    f"Document processing failed for document {document_id}: {e}",
-                    exc_info=True,
-                )
-                raise DocumentServiceError(f"Failed to process document: {e}")
-
-            # Step 7: Generate embeddings
-            try:
-                # Handle both dict and object chunks
-                chunk_texts = []
-                for chunk in chunks:
-                    if isinstance(chunk, dict):
-                        # Dict format: get 'text' or 'content' key
-                        chunk_text = chunk.get('text') or chunk.get('content', '')
-                    else:
-                        # Object format: use .text attribute
-                        chunk_text = chunk.text
-                    chunk_texts.append(chunk_text)
-                
-                embeddings = await self.embedding_service.embed_batch(chunk_texts)
-                logger.info(
-                    f"Generated {len(embeddings)} embeddings for document {document_id}"
-                )
-            except Exception as e:
-                # Update document status to 'failed'
+            else:
+                # Step 6: Process document
                 try:
-                    self.document_repo.update_document_status(
-                        document_id,
-                        "failed",
-                        error_message=f"Embedding generation failed: {e}",
+                    # Read file content
+                    with open(file_path, 'rb') as f:
+                        file_content = f.read()
+                
+                    # Process document with standard processor
+                    document_obj, chunks = await self.doc_processor.process_document(
+                        file_content=file_content,
+                        filename=file.filename,
+                        file_size=file_size
                     )
-                except Exception as status_error:
-                    logger.error(
-                        f"Failed to update document status to failed: {status_error}"
+                
+                    # Extract text and file_type from document_obj
+                    text = "\n\n".join([chunk.text for chunk in chunks])
+                    file_type = document_obj.file_type
+                
+                    logger.info(
+                        f"Document processing completed for {document_id}: "
+                        f"file_type={file_type}, chunks={len(chunks)}"
                     )
 
-                logger.error(
-                    f"Embedding generation failed for document {document_id}: {e}",
-                    exc_info=True,
-                )
-                raise DocumentServiceError(f"Failed to generate embeddings: {e}")
+                except (DocumentProcessingError, ValueError) as e:
+                    # Update document status to 'failed'
+                    try:
+                        self.document_repo.update_document_status(
+                            document_id, "failed", error_message=str(e)
+                        )
+                    except Exception as status_error:
+                        logger.error(
+                            f"Failed to update document status to failed: {status_error}"
+                        )
 
-            # Step 8: Store vectors in Milvus with user_id in metadata
-            try:
-                # Prepare metadata for Milvus
-                metadata_list = []
-                upload_timestamp = int(datetime.utcnow().timestamp())
+                    logger.error(
+                        f"Document processing failed for document {document_id}: {e}",
+                        exc_info=True,
+                    )
+                    raise DocumentServiceError(f"Failed to process document: {e}")
 
-                for i, chunk in enumerate(chunks):
+                # Step 7: Generate embeddings
+                try:
                     # Handle both dict and object chunks
-                    if isinstance(chunk, dict):
-                        chunk_id = chunk.get('chunk_id', f"{document_id}_chunk_{i}")
-                        chunk_text = chunk.get('text') or chunk.get('content', '')
-                        chunk_index = chunk.get('chunk_index', i)
-                    else:
-                        chunk_id = chunk.chunk_id
-                        chunk_text = chunk.text
-                        chunk_index = chunk.chunk_index
-                    
-                    metadata = {
-                        "id": chunk_id,
-                        "document_id": str(document_id),
-                        "text": chunk_text,
-                        "chunk_index": chunk_index,
-                        "document_name": file.filename,
-                        "file_type": file_type,
-                        "upload_date": upload_timestamp,
-                        # Optional metadata fields (will be populated from document metadata if available)
-                        "author": "",
-                        "creation_date": 0,
-                        "language": "",
-                        "keywords": "",
-                    }
-                    metadata_list.append(metadata)
-
-                # Insert into Milvus
-                inserted_ids = await self.milvus_manager.insert_embeddings(
-                    embeddings=embeddings, metadata=metadata_list
-                )
-                vectors_inserted = True
-                logger.info(
-                    f"Inserted {len(inserted_ids)} vectors into Milvus "
-                    f"for document {document_id}"
-                )
+                    chunk_texts = []
+                    for chunk in chunks:
+                        if isinstance(chunk, dict):
+                            # Dict format: get 'text' or 'content' key
+                            chunk_text = chunk.get('text') or chunk.get('content', '')
+                        else:
+                            # Object format: use .text attribute
+                            chunk_text = chunk.text
+                        chunk_texts.append(chunk_text)
+                
+                    embeddings = await self.embedding_service.embed_batch(
+                        chunk_texts, as_numpy=True
+                    )
+                    logger.info(
+                        f"Generated {len(embeddings)} embeddings for document {document_id}"
+                    )
+                except Exception as e:
+                    # Update document status to 'failed'
+                    try:
+                        self.document_repo.update_document_status(
+                            document_id,
+                            "failed",
+                            error_message=f"Embedding generation failed: {e}",
+                        )
+                    except Exception as status_error:
+                        logger.error(
+                            f"Failed to update document status to failed: {status_error}"
+                        )
 
-            except Exception as e:
-                # Update document status to 'failed'
+                    logger.error(
+                        f"Embedding generation failed for document {document_id}: {e}",
+                        exc_info=True,
+                    )
+                    raise DocumentServiceError(f"Failed to generate embeddings: {e}")
+
+                # Step 8: Store vectors in Milvus with user_id in metadata
                 try:
-                    self.document_repo.update_document_status(
-                        document_id,
-                        "failed",
-                        error_message=f"Vector storage failed: {e}",
+                    # Prepare metadata for Milvus
+                    metadata_list = []
+                    upload_timestamp = int(datetime.utcnow().timestamp())
+
+                    for i, chunk in enumerate(chunks):
+                        # Handle both dict and object chunks
+                        if isinstance(chunk, dict):
+                            chunk_id = chunk.get('chunk_id', f"{document_id}_chunk_{i}")
+                            chunk_text = chunk.get('text') or chunk.get('content', '')
+                            chunk_index = chunk.get('chunk_index', i)
+                        else:
+                            chunk_id = chunk.chunk_id
+                            chunk_text = chunk.text
+                            chunk_index = chunk.chunk_index
+                    
+                        metadata = {
+                            "id": chunk_id,
+                            "document_id": str(document_id),
+                            "text": chunk_text,
+                            "chunk_index": chunk_index,
+                            "document_name": file.filename,
+                            "file_type": file_type,
+                            "upload_date": upload_timestamp,
+                            # Optional metadata fields (will be populated from document metadata if available)
+                            "author": "",
+                            "creation_date": 0,
+                            "language": "",
+                            "keywords": "",
+                        }
+                        metadata_list.append(metadata)
+
+                    # Insert into Milvus
+                    inserted_ids = await self.milvus_manager.insert_embeddings(
+                        embeddings=embeddings, metadata=metadata_list
                     )
-                except Exception as status_error:
+                    vectors_inserted = True
+                    logger.info(
+                        f"Inserted {len(inserted_ids)} vectors into Milvus "
+                        f"for document {document_id}"
+                    )
+
+                except Exception as e:
+                    # Update document status to 'failed'
+                    try:
+                        self.document_repo.update_document_status(
+                            document_id,
+                            "failed",
+                            error_message=f"Vector storage failed: {e}",
+                        )
+                    except Exception as status_error:
+                        logger.error(
+                            f"Failed to update document status to failed: {status_error}"
+                        )
+
                     logger.error(
-                        f"Failed to update document status to failed: {status_error}"
+                        f"Vector storage failed for document {document_id}: {e}",
+                        exc_info=True,
                     )
+                    raise DocumentServiceError(f"Failed to store vectors: {e}")
 
-                logger.error(
-                    f"Vector storage failed for document {document_id}: {e}",
-                    exc_info=True,
-                )
-                raise DocumentServiceError(f"Failed to store vectors: {e}")
+                # Step 9: Index in BM25 for keyword search
+                try:
+                    from backend.services.bm25_indexer import get_bm25_indexer
 
-            # Step 9: Index in BM25 for keyword search
-            try:
-                from backend.services.bm25_indexer import get_bm25_indexer
+                    bm25_indexer = get_bm25_indexer()
 
-                bm25_indexer = get_bm25_indexer()
+                    # Prepare chunks for BM25 indexing
+                    bm25_chunks = [
+                        {"id": chunk.chunk_id, "text": chunk.text} for chunk in chunks
+                    ]
 
-                # Prepare chunks for BM25 indexing
-                bm25_chunks = [
-                    {"id": chunk.chunk_id, "text": chunk.text} for chunk in chunks
-                ]
+                    indexed_count = await bm25_indexer.index_chunks(bm25_chunks)
+                    logger.info(
+                        f"Indexed {indexed_count} chunks in BM25 for document {document_id}"
+                    )
 
-                indexed_count = await bm25_indexer.index_chunks(bm25_chunks)
-                logger.info(
-                    f"Indexed {indexed_count} chunks in BM25 for document {document_id}"
-                )
+                except Exception as e:
+                    # BM25 indexing failure shouldn't block document upload
+                    logger.warning(f"BM25 indexing failed for document {document_id}: {e}")
 
-            except Exception as e:
-                # BM25 indexing failure shouldn't block document upload
-                logger.warning(f"BM25 indexing failed for document {document_id}: {e}")
+                chunk_count = len(chunks)
 
             # Step 10: Update document status to 'completed' and chunk_count
             try:
                 self.document_repo.update_document_status(document_id, "completed")
                 self.document_repo.update_document_processing(
                     document_id,
-                    chunk_count=len(chunks),
+                    chunk_count=chunk_count,
                     collection=self.milvus_manager.collection_name,
                 )
                 logger.info(f"Document processing completed: {document_id}")
@@ -372,7 +428,7 @@ class DocumentService:
 
             logger.info(
                 f"Document upload completed successfully: {document_id} "
-                f"({len(chunks)} chunks, {file_size} bytes)"
+                f"({chunk_count} chunks, {file_size} bytes)"
             )
 
             return document
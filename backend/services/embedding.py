@@ -7,11 +7,14 @@ with model caching and error handling.
 
 import logging
 import asyncio
-from typing import List, Optional
+from typing import List, Optional, Union
 from concurrent.futures import ThreadPoolExecutor
 from sentence_transformers import SentenceTransformer
 import numpy as np
 
+from backend.services.embedding_batcher import EmbeddingBatcher
+from backend.services.embedding_cache import EmbeddingCache, get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,17 +26,26 @@ class EmbeddingService:
     - Configurable embedding model
     - Single and batch text embedding
     - Model caching for performance
+    - Cross-request micro-batching of embed_text calls
+    - Persistent content-addressed embedding cache (skips re-embedding)
+    - Zero-copy mode: as_numpy=True returns contiguous float32 ndarrays
     - Comprehensive error handling
     """
 
     # Class-level cache for models to avoid reloading
     _model_cache = {}
+    # Class-level micro-batchers, shared by instances with the same model,
+    # micro-batch settings and embedding cache (see _batcher_key)
+    _batchers = {}
     # Thread pool for CPU-intensive embedding operations
     _executor = ThreadPoolExecutor(max_workers=4)
 
     def __init__(
         self,
         model_name: Optional[str] = None,
+        microbatch_max_size: Optional[int] = None,
+        microbatch_max_wait_ms: Optional[float] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
     ):
         """
         Initialize the EmbeddingService with a specific model.
@@ -51,6 +63,12 @@ class EmbeddingService:
                        English only (NOT recommended for Korean):
                        - sentence-transformers/all-MiniLM-L6-v2 (384d, English only)
                        - sentence-transformers/all-mpnet-base-v2 (768d, English only)
+            microbatch_max_size: Max concurrent embed_text calls coalesced into
+                       one model call (default: EMBEDDING_MICROBATCH_MAX_SIZE, 1 disables)
+            microbatch_max_wait_ms: Max time an embed_text call waits for its batch
+                       to fill (default: EMBEDDING_MICROBATCH_MAX_WAIT_MS)
+            embedding_cache: Embedding cache to use (default: the shared cache,
+                       disabled by ENABLE_EMBEDDING_CACHE=false)
 
         Raises:
             ValueError: If model_name is empty or invalid
@@ -65,9 +83,19 @@ class EmbeddingService:
         if not model_name or not isinstance(model_name, str):
             raise ValueError("model_name must be a non-empty string")
 
+        if microbatch_max_size is None or microbatch_max_wait_ms is None:
+            from backend.config import settings
+            if microbatch_max_size is None:
+                microbatch_max_size = getattr(settings, "EMBEDDING_MICROBATCH_MAX_SIZE", 32)
+            if microbatch_max_wait_ms is None:
+                microbatch_max_wait_ms = getattr(settings, "EMBEDDING_MICROBATCH_MAX_WAIT_MS", 5.0)
+
         self.model_name = model_name
+        self.microbatch_max_size = microbatch_max_size
+        self.microbatch_max_wait_ms = microbatch_max_wait_ms
         self._model: Optional[SentenceTransformer] = None
         self._dimension: Optional[int] = None
+        self._cache = embedding_cache if embedding_cache is not None else get_embedding_cache()
 
         # Initialize model on creation
         self._load_model()
@@ -164,15 +192,18 @@ class EmbeddingService:
             raise RuntimeError("Model not properly initialized")
         return self._model
 
-    async def embed_text(self, text: str) -> List[float]:
+    async def embed_text(
+        self, text: str, as_numpy: bool = False
+    ) -> Union[List[float], np.ndarray]:
         """
         Generate embedding for a single text (async).
 
         Args:
             text: Input text to embed
+            as_numpy: Return a float32 ndarray instead of a list of floats
 
         Returns:
-            List[float]: Embedding vector as a list of floats
+            Embedding vector as a list of floats (or ndarray with as_numpy)
 
         Raises:
             ValueError: If text is empty or invalid
@@ -185,26 +216,140 @@ class EmbeddingService:
             raise ValueError("text cannot be only whitespace")
 
         try:
-            # Run CPU-intensive embedding in thread pool
-            loop = asyncio.get_event_loop()
-            embedding_list = await loop.run_in_executor(
-                self._executor, self._embed_text_sync, text
-            )
+            # Memory-tier hit: no thread hop, no batching delay
+            if self._cache is not None:
+                cached = self._cache.get_memory(self.model_name, text, self.dimension)
+                if cached is not None:
+                    # Cached vectors are shared and read-only: hand out a copy
+                    return cached.copy() if as_numpy else cached.tolist()
+
+            batcher = self._get_batcher()
+            if batcher is not None:
+                # Coalesce with concurrent callers into one model call
+                embedding = await batcher.submit(text)
+            else:
+                # Run CPU-intensive embedding in thread pool
+                loop = asyncio.get_event_loop()
+                embedding = await loop.run_in_executor(
+                    self._executor, self._embed_text_sync, text
+                )
 
             # Use DEBUG for individual embeddings (too verbose for INFO)
             logger.debug(
                 f"Generated embedding: text_length={len(text)}, "
-                f"dimension={len(embedding_list)}"
+                f"dimension={len(embedding)}"
             )
 
-            return embedding_list
+            return embedding if as_numpy else embedding.tolist()
 
         except Exception as e:
             error_msg = f"Failed to generate embedding for text: {str(e)}"
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
-    def _embed_text_sync(self, text: str) -> List[float]:
+    def _batcher_key(self) -> tuple:
+        """
+        Key of the micro-batcher this instance may share.
+
+        The batcher encodes through the first instance's bound method, so
+        instances only share it when model, batch settings and cache match.
+        The batcher keeps that instance (and its cache) alive, so the cache
+        id cannot be reused while the entry exists.
+        """
+        return (
+            self.model_name,
+            self.microbatch_max_size,
+            self.microbatch_max_wait_ms,
+            id(self._cache),
+        )
+
+    def _get_batcher(self) -> Optional[EmbeddingBatcher]:
+        """Return the shared micro-batcher for this instance (None if disabled)."""
+        if self.microbatch_max_size <= 1:
+            return None
+
+        key = self._batcher_key()
+        batcher = self._batchers.get(key)
+        if batcher is None:
+            batcher = EmbeddingBatcher(
+                encode_batch=self._encode_microbatch_sync,
+                executor=self._executor,
+                max_batch_size=self.microbatch_max_size,
+                max_wait_ms=self.microbatch_max_wait_ms,
+            )
+            self._batchers[key] = batcher
+        return batcher
+
+    def _encode_microbatch_sync(self, texts: List[str]) -> np.ndarray:
+        """Encode one micro-batch of queued embed_text calls (thread pool)."""
+        return self._encode_cached(texts, batch_size=len(texts), show_progress=False)
+
+    def _encode_cached(
+        self, texts: List[str], batch_size: int, show_progress: bool
+    ) -> np.ndarray:
+        """
+        Encode texts, reusing cached vectors and running the model on misses only.
+
+        Args:
+            texts: Input texts
+            batch_size: Model batch size for the misses
+            show_progress: Whether to show progress bar
+
+        Returns:
+            np.ndarray: (len(texts), dimension) float32 embeddings
+        """
+        if self._cache is None:
+            return self.model.encode(
+                texts,
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=show_progress,
+            )
+
+        cached = self._cache.get_many(self.model_name, texts, self.dimension)
+
+        # Encode each distinct missing text once
+        missing = {}
+        for i, vector in enumerate(cached):
+            if vector is None:
+                missing.setdefault(texts[i], []).append(i)
+
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for i, vector in enumerate(cached):
+            if vector is not None:
+                embeddings[i] = vector
+
+        if missing:
+            missing_texts = list(missing)
+            encoded = self.model.encode(
+                missing_texts,
+                batch_size=min(batch_size, len(missing_texts)),
+                convert_to_numpy=True,
+                show_progress_bar=show_progress,
+            )
+            for text, vector in zip(missing_texts, encoded):
+                embeddings[missing[text]] = vector
+            self._cache.put_many(self.model_name, missing_texts, encoded, self.dimension)
+
+        if len(missing) < len(texts):
+            logger.debug(
+                f"Embedding cache: {len(texts) - sum(map(len, missing.values()))}/"
+                f"{len(texts)} texts served from cache"
+            )
+
+        return embeddings
+
+    def get_batching_stats(self) -> dict:
+        """
+        Get micro-batching metrics for embed_text.
+
+        Returns:
+            dict: Batch size and queue wait statistics (empty if disabled)
+        """
+        batcher = self._batchers.get(self._batcher_key())
+        return batcher.get_stats() if batcher is not None else {}
+
+    def _embed_text_sync(self, text: str) -> np.ndarray:
         """
         Synchronous embedding generation (runs in thread pool).
 
@@ -212,15 +357,10 @@ class EmbeddingService:
             text: Input text to embed
 
         Returns:
-            List[float]: Embedding vector
+            np.ndarray: float32 embedding vector
         """
-        # Generate embedding
-        embedding = self.model.encode(
-            text, convert_to_numpy=True, show_progress_bar=False
-        )
-
-        # Convert to list
-        return embedding.tolist()
+        # Generate embedding (or reuse the cached vector)
+        return self._encode_cached([text], batch_size=1, show_progress=False)[0]
 
     def _calculate_optimal_batch_size(self, num_texts: int) -> int:
         """
@@ -249,8 +389,12 @@ class EmbeddingService:
             return 128
 
     async def embed_batch(
-        self, texts: List[str], batch_size: int = None, show_progress: bool = None
-    ) -> List[List[float]]:
+        self,
+        texts: List[str],
+        batch_size: int = None,
+        show_progress: bool = None,
+        as_numpy: bool = False,
+    ) -> Union[List[List[float]], np.ndarray]:
         """
         Generate embeddings for multiple texts in batch with dynamic optimization (async).
 
@@ -262,9 +406,12 @@ class EmbeddingService:
             texts: List of input texts to embed
             batch_size: Number of texts to process in each batch (default: auto)
             show_progress: Whether to show progress bar (default: auto based on size)
+            as_numpy: Return one contiguous (len(texts), dimension) float32
+                ndarray instead of lists. Avoids materializing a Python float
+                per component, which dominates memory for large documents.
 
         Returns:
-            List[List[float]]: List of embedding vectors
+            List of embedding vectors (or a 2-D ndarray with as_numpy)
 
         Raises:
             ValueError: If texts is empty or contains invalid entries
@@ -292,16 +439,16 @@ class EmbeddingService:
         try:
             # Run CPU-intensive batch embedding in thread pool
             loop = asyncio.get_event_loop()
-            embeddings_list = await loop.run_in_executor(
+            embeddings = await loop.run_in_executor(
                 self._executor, self._embed_batch_sync, texts, batch_size, show_progress
             )
 
             logger.info(
-                f"Generated {len(embeddings_list)} embeddings in batch "
-                f"(batch_size={batch_size}, dimension={len(embeddings_list[0])})"
+                f"Generated {len(embeddings)} embeddings in batch "
+                f"(batch_size={batch_size}, dimension={embeddings.shape[1]})"
             )
 
-            return embeddings_list
+            return embeddings if as_numpy else embeddings.tolist()
 
         except Exception as e:
             error_msg = f"Failed to generate batch embeddings: {str(e)}"
@@ -310,7 +457,7 @@ class EmbeddingService:
 
     def _embed_batch_sync(
         self, texts: List[str], batch_size: int, show_progress: bool
-    ) -> List[List[float]]:
+    ) -> np.ndarray:
         """
         Synchronous batch embedding generation (runs in thread pool).
 
@@ -320,18 +467,11 @@ class EmbeddingService:
             show_progress: Whether to show progress bar
 
         Returns:
-            List[List[float]]: List of embedding vectors
+            np.ndarray: Contiguous (len(texts), dimension) float32 embeddings
         """
-        # Generate embeddings in batch
-        embeddings = self.model.encode(
-            texts,
-            batch_size=batch_size,
-            convert_to_numpy=True,
-            show_progress_bar=show_progress,
-        )
-
-        # Convert to list of lists
-        return embeddings.tolist()
+        # Generate embeddings in batch (cached texts are not re-encoded)
+        embeddings = self._encode_cached(texts, batch_size, show_progress)
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
 
     def get_model_info(self) -> dict:
         """
@@ -345,6 +485,8 @@ class EmbeddingService:
             "dimension": self.dimension,
             "max_seq_length": self.model.max_seq_length,
             "cached": self.model_name in self._model_cache,
+            "microbatching": self.get_batching_stats(),
+            "embedding_cache": self._cache.get_stats() if self._cache is not None else {},
         }
 
     @classmethod
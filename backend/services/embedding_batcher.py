@@ -0,0 +1,195 @@
+"""
+Embedding Micro-Batcher
+
+Coalesces concurrent single-text embedding requests into one model forward
+pass. Requests wait in a queue for at most ``max_wait_ms`` (or until
+``max_batch_size`` requests are queued), then the whole batch is encoded in
+the embedding thread pool and each caller receives its own vector.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EmbeddingRequest:
+    """Queued embedding request."""
+
+    text: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class _LoopQueue:
+    """Queue state bound to one event loop (futures cannot cross loops)."""
+
+    def __init__(self):
+        self.requests: Deque[EmbeddingRequest] = deque()
+        self.batch_ready = asyncio.Event()
+        self.worker: Optional[asyncio.Task] = None
+
+
+class EmbeddingBatcher:
+    """
+    Async coalescing queue in front of a batch encode function.
+
+    Features:
+    - Flush on max_batch_size queued requests or after max_wait_ms
+    - One encode call per batch, run in the given executor
+    - Encode errors propagate to every caller in the failed batch
+    - Batch size and queue wait statistics
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], Any],
+        executor: Optional[Executor] = None,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            encode_batch: Synchronous function mapping texts to a sequence of
+                embeddings (one per text, same order)
+            executor: Executor the encode function runs in (default loop executor)
+            max_batch_size: Maximum texts per model call
+            max_wait_ms: Maximum time a request waits for the batch to fill
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.encode_batch = encode_batch
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self._queues: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopQueue]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Statistics
+        self.stats: Dict[str, float] = {
+            "total_requests": 0,
+            "batches_processed": 0,
+            "avg_batch_size": 0.0,
+            "max_batch_size_seen": 0,
+            "avg_queue_wait_ms": 0.0,
+            "max_queue_wait_ms": 0.0,
+            "failed_batches": 0,
+        }
+
+    def _queue(self) -> _LoopQueue:
+        loop = asyncio.get_running_loop()
+        queue = self._queues.get(loop)
+        if queue is None:
+            queue = _LoopQueue()
+            self._queues[loop] = queue
+        return queue
+
+    async def submit(self, text: str) -> Any:
+        """
+        Queue a text and wait for its embedding.
+
+        Args:
+            text: Input text
+
+        Returns:
+            The embedding produced for this text by encode_batch
+        """
+        queue = self._queue()
+        future = asyncio.get_running_loop().create_future()
+        queue.requests.append(EmbeddingRequest(text=text, future=future))
+        self.stats["total_requests"] += 1
+
+        if len(queue.requests) >= self.max_batch_size:
+            queue.batch_ready.set()
+
+        if queue.worker is None or queue.worker.done():
+            queue.worker = asyncio.create_task(self._drain(queue))
+
+        return await future
+
+    async def _drain(self, queue: _LoopQueue):
+        """Flush batches until the queue is empty."""
+        while queue.requests:
+            if len(queue.requests) < self.max_batch_size:
+                queue.batch_ready.clear()
+                try:
+                    await asyncio.wait_for(
+                        queue.batch_ready.wait(), timeout=self.max_wait_ms / 1000
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+            batch: List[EmbeddingRequest] = []
+            while queue.requests and len(batch) < self.max_batch_size:
+                request = queue.requests.popleft()
+                # Skip callers that were cancelled while waiting
+                if not request.future.done():
+                    batch.append(request)
+
+            if batch:
+                await self._run_batch(batch)
+
+    async def _run_batch(self, batch: List[EmbeddingRequest]):
+        started = time.perf_counter()
+        waits_ms = [(started - request.enqueued_at) * 1000 for request in batch]
+        self._record(len(batch), waits_ms)
+
+        try:
+            loop = asyncio.get_running_loop()
+            embeddings = await loop.run_in_executor(
+                self.executor, self.encode_batch, [request.text for request in batch]
+            )
+        except Exception as e:
+            self.stats["failed_batches"] += 1
+            logger.error(f"Embedding batch of {len(batch)} failed: {e}")
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        for request, embedding in zip(batch, embeddings):
+            if not request.future.done():
+                request.future.set_result(embedding)
+
+        logger.debug(
+            f"Embedded micro-batch: size={len(batch)}, "
+            f"max_wait={max(waits_ms):.1f}ms, "
+            f"encode={(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+
+    def _record(self, batch_size: int, waits_ms: List[float]):
+        stats = self.stats
+        stats["batches_processed"] += 1
+        batches = stats["batches_processed"]
+
+        stats["avg_batch_size"] += (batch_size - stats["avg_batch_size"]) / batches
+        stats["max_batch_size_seen"] = max(stats["max_batch_size_seen"], batch_size)
+
+        avg_wait = sum(waits_ms) / len(waits_ms)
+        stats["avg_queue_wait_ms"] += (avg_wait - stats["avg_queue_wait_ms"]) / batches
+        stats["max_queue_wait_ms"] = max(stats["max_queue_wait_ms"], max(waits_ms))
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get batching statistics."""
+        queued = sum(len(queue.requests) for queue in list(self._queues.values()))
+        return {
+            **self.stats,
+            "avg_batch_size": round(self.stats["avg_batch_size"], 2),
+            "avg_queue_wait_ms": round(self.stats["avg_queue_wait_ms"], 2),
+            "max_queue_wait_ms": round(self.stats["max_queue_wait_ms"], 2),
+            "queue_depth": queued,
+            "config_max_batch_size": self.max_batch_size,
+            "config_max_wait_ms": self.max_wait_ms,
+        }
@@ -0,0 +1,412 @@
+"""
+Persistent Content-Addressed Embedding Cache
+
+One embedding cache shared by every embedding service. Vectors are keyed by
+(model name, dimension, hash of the normalized text) and stored as float32
+bytes in two tiers:
+
+- L1: in-process LRU of numpy arrays
+- L2: local SQLite blob store (WAL mode, safe to share between workers)
+
+Puts update the memory tier immediately and queue the rows for a background
+writer thread, which commits everything queued since its last write in one
+transaction. SQLite reads are blocking: async callers run them with
+``asyncio.to_thread``.
+
+Re-ingesting a document or re-asking a query therefore reuses vectors
+instead of running the model again.
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# SQLite limits the number of bound parameters per statement
+_SQL_BATCH_SIZE = 500
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keying (NFC, trimmed, collapsed whitespace)."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def embedding_cache_key(model_name: str, text: str, dimension: Optional[int] = None) -> bytes:
+    """Content address of a text under a given embedding model (and dimension)."""
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    if dimension is not None:
+        digest.update(f":{dimension}".encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(normalize_text(text).encode("utf-8"))
+    return digest.digest()
+
+
+class EmbeddingCache:
+    """
+    Two-tier (memory LRU + SQLite) embedding cache.
+
+    Features:
+    - Content-addressed keys: (model name, dimension, normalized-text hash)
+    - Vectors of the wrong dimension are never returned or stored
+    - float32 storage, returned as read-only numpy arrays
+    - Bulk get_many / put_many; disk writes batched on a writer thread
+    - Thread-safe (used from the embedding thread pool)
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = "./data/embedding_cache/embeddings.sqlite3",
+        memory_max_entries: int = 50000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: SQLite file for the on-disk tier (None = memory only)
+            memory_max_entries: Maximum vectors kept in the in-process LRU
+        """
+        self.memory_max_entries = memory_max_entries
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        # Serializes use of the SQLite connection (readers and the writer)
+        self._db_lock = threading.Lock()
+        # Rows queued for the writer thread: key -> (key, model, dim, blob)
+        self._unwritten: Dict[bytes, tuple] = {}
+        self._write_event = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self.db_path = db_path
+
+        if db_path:
+            try:
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    "key BLOB PRIMARY KEY, model TEXT NOT NULL, "
+                    "dim INTEGER NOT NULL, vector BLOB NOT NULL)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding disk cache disabled ({db_path}): {e}")
+                self._db = None
+
+        # Statistics
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "disk_writes": 0,
+            "disk_write_batches": 0,
+            "dimension_mismatches": 0,
+        }
+
+        logger.info(
+            f"EmbeddingCache initialized: memory_max_entries={memory_max_entries}, "
+            f"disk={'enabled' if self._db else 'disabled'}"
+        )
+
+    def _remember(self, key: bytes, vector: np.ndarray):
+        """Insert into the LRU tier (caller holds the lock)."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _as_vector(data) -> np.ndarray:
+        vector = np.array(data, dtype=np.float32).ravel()
+        vector.setflags(write=False)
+        return vector
+
+    def _matches(self, vector: np.ndarray, dimension: Optional[int]) -> bool:
+        """Check a vector against the expected dimension (caller holds the lock)."""
+        if dimension is None or vector.shape[0] == dimension:
+            return True
+        self.stats["dimension_mismatches"] += 1
+        return False
+
+    def _lookup_memory(self, key: bytes, dimension: Optional[int]) -> Optional[np.ndarray]:
+        """LRU lookup that evicts vectors of the wrong dimension (caller holds the lock)."""
+        vector = self._memory.get(key)
+        if vector is None:
+            return None
+        if not self._matches(vector, dimension):
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return vector
+
+    def get_memory(
+        self, model_name: str, text: str, dimension: Optional[int] = None
+    ) -> Optional[np.ndarray]:
+        """Look a text up in the in-process tier only (never touches disk)."""
+        key = embedding_cache_key(model_name, text, dimension)
+        with self._lock:
+            vector = self._lookup_memory(key, dimension)
+            if vector is not None:
+                self.stats["memory_hits"] += 1
+        return vector
+
+    def get_many(
+        self, model_name: str, texts: Sequence[str], dimension: Optional[int] = None
+    ) -> List[Optional[np.ndarray]]:
+        """
+        Look up cached vectors for a batch of texts.
+
+        Args:
+            model_name: Embedding model name (the model actually loaded)
+            texts: Input texts
+            dimension: Embedding dimension of the model; part of the key, and
+                cached vectors of any other dimension are treated as misses
+
+        Returns:
+            One float32 vector (or None on miss) per text, in order
+        """
+        keys = [embedding_cache_key(model_name, text, dimension) for text in texts]
+        results: List[Optional[np.ndarray]] = [None] * len(keys)
+        missing: Dict[bytes, List[int]] = {}
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._lookup_memory(key, dimension)
+                if vector is None and key in self._unwritten:
+                    # Evicted from the LRU before the writer got to it
+                    vector = np.frombuffer(self._unwritten[key][3], dtype=np.float32)
+                    self._remember(key, vector)
+                if vector is not None:
+                    results[i] = vector
+                    self.stats["memory_hits"] += 1
+                else:
+                    missing.setdefault(key, []).append(i)
+
+        rows = self._read_disk(list(missing)) if missing else []
+
+        with self._lock:
+            for key, blob in rows:
+                vector = np.frombuffer(blob, dtype=np.float32)
+                if not self._matches(vector, dimension):
+                    continue
+                self._remember(key, vector)
+                for i in missing.pop(key):
+                    results[i] = vector
+                    self.stats["disk_hits"] += 1
+
+            self.stats["misses"] += sum(len(indices) for indices in missing.values())
+
+        return results
+
+    def _read_disk(self, keys: List[bytes]) -> List[tuple]:
+        """Fetch (key, blob) rows from the disk tier (blocking)."""
+        if self._db is None:
+            return []
+
+        rows = []
+        with self._db_lock:
+            try:
+                for start in range(0, len(keys), _SQL_BATCH_SIZE):
+                    batch = keys[start : start + _SQL_BATCH_SIZE]
+                    rows.extend(
+                        self._db.execute(
+                            "SELECT key, vector FROM embeddings WHERE key IN "
+                            f"({','.join('?' * len(batch))})",
+                            batch,
+                        ).fetchall()
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding disk cache read failed: {e}")
+        return rows
+
+    def put_many(
+        self,
+        model_name: str,
+        texts: Sequence[str],
+        embeddings: Sequence,
+        dimension: Optional[int] = None,
+    ) -> None:
+        """
+        Store vectors for a batch of texts.
+
+        The memory tier is updated before returning; the disk write is left
+        to the writer thread.
+
+        Args:
+            model_name: Embedding model name (the model actually loaded)
+            texts: Input texts
+            embeddings: One vector per text (lists or numpy arrays)
+            dimension: Embedding dimension of the model (vectors of any other
+                dimension are not stored)
+        """
+        if not texts:
+            return
+
+        rows = []
+        with self._lock:
+            for text, embedding in zip(texts, embeddings):
+                key = embedding_cache_key(model_name, text, dimension)
+                vector = self._as_vector(embedding)
+                if not self._matches(vector, dimension):
+                    continue
+                self._remember(key, vector)
+                rows.append((key, model_name, vector.shape[0], vector.tobytes()))
+
+            self.stats["writes"] += len(rows)
+
+            if self._db is None or not rows or self._closed:
+                return
+            for row in rows:
+                self._unwritten[row[0]] = row
+            self._ensure_writer()
+
+        self._write_event.set()
+
+    def _ensure_writer(self) -> None:
+        """Start the disk writer thread if it is not running (caller holds the lock)."""
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(
+                target=self._write_loop, name="embedding-cache-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _write_loop(self) -> None:
+        while not self._closed:
+            self._write_event.wait()
+            self._write_event.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all queued rows to the disk tier in one transaction (blocking).
+
+        Returns:
+            Number of rows written
+        """
+        with self._db_lock:
+            with self._lock:
+                rows = list(self._unwritten.values())
+                self._unwritten.clear()
+            if not rows or self._db is None:
+                return 0
+
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, model, dim, vector) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding disk cache write failed ({len(rows)} rows): {e}")
+                return 0
+
+        with self._lock:
+            self.stats["disk_writes"] += len(rows)
+            self.stats["disk_write_batches"] += 1
+        return len(rows)
+
+    def get(
+        self, model_name: str, text: str, dimension: Optional[int] = None
+    ) -> Optional[np.ndarray]:
+        """Look up one text (memory, then disk)."""
+        return self.get_many(model_name, [text], dimension)[0]
+
+    def put(
+        self, model_name: str, text: str, embedding, dimension: Optional[int] = None
+    ) -> None:
+        """Store one vector."""
+        self.put_many(model_name, [text], [embedding], dimension)
+
+    def clear(self, model_name: Optional[str] = None) -> None:
+        """
+        Drop cached vectors.
+
+        Args:
+            model_name: Only drop this model's vectors from disk (the memory
+                tier is always cleared)
+        """
+        with self._db_lock:
+            with self._lock:
+                self._memory.clear()
+                self._unwritten = {
+                    key: row
+                    for key, row in self._unwritten.items()
+                    if model_name and row[1] != model_name
+                }
+            if self._db is not None:
+                if model_name:
+                    self._db.execute("DELETE FROM embeddings WHERE model = ?", (model_name,))
+                else:
+                    self._db.execute("DELETE FROM embeddings")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Stop the writer thread and write the rows it has not written yet."""
+        with self._lock:
+            self._closed = True
+            writer = self._writer
+        self._write_event.set()
+        if writer is not None:
+            writer.join(timeout=10)
+        self.flush()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        return {
+            **self.stats,
+            "memory_entries": len(self._memory),
+            "pending_disk_writes": len(self._unwritten),
+        }
+
+
+# Global embedding cache instance
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Get the process-wide embedding cache.
+
+    Returns:
+        Shared EmbeddingCache, or None if ENABLE_EMBEDDING_CACHE is off
+    """
+    global _embedding_cache
+    if _embedding_cache is None:
+        from backend.config import settings
+
+        if not getattr(settings, "ENABLE_EMBEDDING_CACHE", True):
+            return None
+
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                _embedding_cache = EmbeddingCache(
+                    db_path=getattr(
+                        settings,
+                        "EMBEDDING_CACHE_PATH",
+                        "./data/embedding_cache/embeddings.sqlite3",
+                    ),
+                    memory_max_entries=getattr(settings, "EMBEDDING_CACHE_MEMORY_ENTRIES", 50000),
+                )
+    return _embedding_cache
+
+
+def close_embedding_cache() -> None:
+    """Write queued embeddings to disk (call on shutdown)."""
+    if _embedding_cache is not None:
+        _embedding_cache.close()
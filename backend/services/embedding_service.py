@@ -1,7 +1,7 @@
 """Embedding service for vector memory operations."""
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 from sentence_transformers import SentenceTransformer
 import asyncio
@@ -9,6 +9,8 @@ from functools import lru_cache
 import hashlib
 import json
 
+from backend.services.embedding_cache import EmbeddingCache, get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 class EmbeddingService:
@@ -17,8 +19,14 @@ class EmbeddingService:
     def __init__(self, model_name: str = "jhgan/ko-sroberta-multitask"):
         self.model_name = model_name
         self._model = None
-        self._embedding_cache = {}
+        # Name and dimension of the model actually loaded (may be the fallback)
+        self._loaded_model_name: Optional[str] = None
+        self._dimension: Optional[int] = None
         self.max_cache_size = 1000
+        # Shared persistent cache; per-instance memory cache if it is disabled
+        self._embedding_cache = get_embedding_cache() or EmbeddingCache(
+            db_path=None, memory_max_entries=self.max_cache_size
+        )
         
     @property
     def model(self):
@@ -27,31 +35,47 @@ class EmbeddingService:
             try:
                 logger.info(f"Loading embedding model: {self.model_name}")
                 self._model = SentenceTransformer(self.model_name)
+                self._loaded_model_name = self.model_name
                 logger.info("Embedding model loaded successfully")
             except Exception as e:
                 logger.error(f"Failed to load embedding model: {e}")
                 # Fallback to a smaller model
                 try:
                     self._model = SentenceTransformer("all-MiniLM-L6-v2")
+                    self._loaded_model_name = "all-MiniLM-L6-v2"
                     logger.info("Loaded fallback embedding model: all-MiniLM-L6-v2")
                 except Exception as fallback_error:
                     logger.error(f"Failed to load fallback model: {fallback_error}")
                     raise RuntimeError("Could not load any embedding model")
+            self._dimension = self._model.get_sentence_embedding_dimension()
         return self._model
     
+    async def _cache_namespace(self) -> Tuple[str, int]:
+        """Name and dimension of the loaded model, used to key cached vectors."""
+        if self._model is None:
+            # Load off the event loop; the fallback model changes the namespace
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, lambda: self.model)
+        return self._loaded_model_name, self._dimension
+    
     def _get_cache_key(self, text: str) -> str:
         """Generate cache key for text."""
         return hashlib.md5(text.encode('utf-8')).hexdigest()
     
     async def encode_text(self, text: str) -> np.ndarray:
         """Encode single text to embedding vector."""
-        cache_key = self._get_cache_key(text)
-        
-        # Check cache first
-        if cache_key in self._embedding_cache:
-            return self._embedding_cache[cache_key]
-        
         try:
+            # Check cache first
+            model_name, dimension = await self._cache_namespace()
+            cached = self._embedding_cache.get_memory(model_name, text, dimension)
+            if cached is None:
+                # Disk tier lookup is blocking SQLite
+                cached = await asyncio.to_thread(
+                    self._embedding_cache.get, model_name, text, dimension
+                )
+            if cached is not None:
+                return cached
+            
             # Run encoding in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             embedding = await loop.run_in_executor(
@@ -60,8 +84,7 @@ class EmbeddingService:
             )
             
             # Cache the result
-            if len(self._embedding_cache) < self.max_cache_size:
-                self._embedding_cache[cache_key] = embedding
+            self._embedding_cache.put(model_name, text, embedding, dimension)
             
             return embedding
             
@@ -80,10 +103,18 @@ class EmbeddingService:
         uncached_texts = []
         uncached_indices = []
         
+        try:
+            model_name, dimension = await self._cache_namespace()
+        except Exception as e:
+            logger.error(f"Failed to encode texts: {e}")
+            return [np.zeros(384) for _ in texts]
+        
+        cached = await asyncio.to_thread(
+            self._embedding_cache.get_many, model_name, texts, dimension
+        )
         for i, text in enumerate(texts):
-            cache_key = self._get_cache_key(text)
-            if cache_key in self._embedding_cache:
-                cached_embeddings[i] = self._embedding_cache[cache_key]
+            if cached[i] is not None:
+                cached_embeddings[i] = cached[i]
             else:
                 uncached_texts.append(text)
                 uncached_indices.append(i)
@@ -99,10 +130,9 @@ class EmbeddingService:
                 )
                 
                 # Cache new embeddings
-                for i, embedding in enumerate(new_embeddings):
-                    if len(self._embedding_cache) < self.max_cache_size:
-                        cache_key = self._get_cache_key(uncached_texts[i])
-                        self._embedding_cache[cache_key] = embedding
+                self._embedding_cache.put_many(
+                    model_name, uncached_texts, new_embeddings, dimension
+                )
                         
             except Exception as e:
                 logger.error(f"Failed to encode texts: {e}")
@@ -167,7 +197,8 @@ class EmbeddingService:
         """Get embedding service statistics."""
         return {
             'model_name': self.model_name,
-            'cache_size': len(self._embedding_cache),
+            'loaded_model_name': self._loaded_model_name,
+            'cache_size': self._embedding_cache.get_stats()['memory_entries'],
             'max_cache_size': self.max_cache_size,
             'model_loaded': self._model is not None,
             'embedding_dimension': 384 if self._model is None else self.model.get_sentence_embedding_dimension()
@@ -175,7 +206,7 @@ class EmbeddingService:
     
     def clear_cache(self):
         """Clear embedding cache."""
-        self._embedding_cache.clear()
+        self._embedding_cache.clear(self._loaded_model_name or self.model_name)
         logger.info("Embedding cache cleared")
 
 # Global embedding service instance
@@ -0,0 +1,387 @@
+# Extraction Process Pool
+"""
+Bounded process pool for document text extraction and chunking.
+
+Parsers for PDF, HWP/HWPX, Office formats and OCR are CPU-bound and can take
+seconds to minutes on large files; run inline they block the event loop of
+the whole worker. Here each document goes to a worker process owned by the
+pool (entry points live in extraction_worker, which spawned workers import
+without loading the rest of the backend):
+
+- Concurrency is bounded by the number of workers; callers beyond that wait
+  for a free worker (queue depth is reported as back-pressure)
+- Each file type has its own timeout; a worker that exceeds it is killed
+  and replaced
+- Workers are recycled after a number of documents to cap memory leaked by
+  parser libraries
+- Per-format latency (avg / p95 / max) and queue wait are tracked
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.services.extraction_worker import worker_main
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds allowed per file type (OCR and converted formats are slowest)
+DEFAULT_EXTRACTION_TIMEOUTS: Dict[str, float] = {
+    "txt": 30.0,
+    "md": 30.0,
+    "csv": 60.0,
+    "json": 60.0,
+    "pdf": 300.0,
+    "hwp": 300.0,
+    "hwpx": 300.0,
+    "docx": 120.0,
+    "pptx": 120.0,
+    "ppt": 120.0,
+    "xlsx": 180.0,
+    "xls": 180.0,
+    "png": 180.0,
+    "jpg": 180.0,
+    "jpeg": 180.0,
+    "gif": 180.0,
+    "bmp": 180.0,
+    "webp": 180.0,
+}
+
+# Samples kept per format for the p95 estimate
+_LATENCY_WINDOW = 200
+
+
+class ExtractionTimeoutError(TimeoutError):
+    """Raised when extraction exceeds its per-format timeout."""
+
+
+class _Worker:
+    """One worker process owned by the pool and the number of documents it handled."""
+
+    def __init__(self, mp_context):
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=worker_main, args=(child_conn,), name="extraction-worker", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def call(self, fn: Callable[..., Any], args: tuple) -> Any:
+        """
+        Run fn(*args) in the worker process (blocking; called in a thread).
+
+        Raises:
+            BrokenProcessPool: If the process died or was killed
+            Exception: Whatever fn raised in the worker
+        """
+        try:
+            self.conn.send((fn, args))
+            ok, value = self.conn.recv()
+        except (EOFError, OSError) as e:
+            raise BrokenProcessPool("Extraction worker process died") from e
+        if ok:
+            return value
+        raise value
+
+    def retire(self):
+        """Let the process exit once idle."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.conn.close()
+
+    def kill(self):
+        """Terminate the process even if it is still running a task."""
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+class ExtractionPool:
+    """
+    Bounded pool of recyclable extraction workers.
+
+    Workers are started lazily on first use, so creating the pool is free.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_tasks_per_worker: int = 50,
+        default_timeout: float = 120.0,
+        timeouts: Optional[Dict[str, float]] = None,
+        start_method: str = "spawn",
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_workers: Number of worker processes (max concurrent documents)
+            max_tasks_per_worker: Documents a worker handles before it is replaced
+            default_timeout: Timeout for file types without their own entry
+            timeouts: Per-file-type timeouts in seconds
+            start_method: multiprocessing start method ("spawn" avoids
+                inheriting model weights and threads from the parent)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.max_tasks_per_worker = max(1, max_tasks_per_worker)
+        self.default_timeout = default_timeout
+        self.timeouts = dict(DEFAULT_EXTRACTION_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+
+        self._mp_context = multiprocessing.get_context(start_method)
+        # Free slots; None means "start a worker on checkout"
+        self._slots: Optional[asyncio.Queue] = None
+        self._workers: List[_Worker] = []
+        self._waiting = 0
+        self._running = 0
+        self._closed = False
+
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "workers_started": 0,
+            "workers_recycled": 0,
+            "workers_killed": 0,
+            "max_queue_depth": 0,
+            "total_queue_wait_ms": 0.0,
+        }
+        self._format_stats: Dict[str, Dict[str, Any]] = {}
+
+        logger.info(
+            f"ExtractionPool initialized: workers={max_workers}, "
+            f"recycle_after={self.max_tasks_per_worker}, default_timeout={default_timeout}s"
+        )
+
+    def timeout_for(self, file_type: str) -> float:
+        """Timeout in seconds for a file type."""
+        return self.timeouts.get(file_type, self.default_timeout)
+
+    def _get_slots(self) -> asyncio.Queue:
+        if self._slots is None:
+            self._slots = asyncio.Queue()
+            for _ in range(self.max_workers):
+                self._slots.put_nowait(None)
+        return self._slots
+
+    async def _checkout(self) -> _Worker:
+        if self._closed:
+            raise RuntimeError("Extraction pool is shut down")
+        slots = self._get_slots()
+
+        if slots.empty():
+            # All workers busy: this caller is queued (back-pressure)
+            self._waiting += 1
+            self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self._waiting)
+            try:
+                worker = await slots.get()
+            finally:
+                self._waiting -= 1
+        else:
+            worker = slots.get_nowait()
+
+        if self._closed:
+            # Shut down while queued: pass the wake-up on to the next caller
+            slots.put_nowait(worker)
+            raise RuntimeError("Extraction pool is shut down")
+
+        if worker is None:
+            worker = _Worker(self._mp_context)
+            self._workers.append(worker)
+            self.stats["workers_started"] += 1
+        return worker
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        if self._closed or worker not in self._workers:
+            # The pool was shut down while this task ran
+            worker.kill()
+            return
+
+        if not healthy:
+            worker.kill()
+            self.stats["workers_killed"] += 1
+        elif worker.tasks >= self.max_tasks_per_worker:
+            worker.retire()
+            self.stats["workers_recycled"] += 1
+        else:
+            self._get_slots().put_nowait(worker)
+            return
+
+        # Replacement starts on the next checkout
+        self._workers.remove(worker)
+        self._get_slots().put_nowait(None)
+
+    def _record(self, file_type: str, elapsed_ms: float, outcome: str) -> None:
+        entry = self._format_stats.get(file_type)
+        if entry is None:
+            entry = self._format_stats[file_type] = {
+                "count": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "recent_ms": deque(maxlen=_LATENCY_WINDOW),
+            }
+        entry["count"] += 1
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        entry["recent_ms"].append(elapsed_ms)
+        if outcome == "timeout":
+            entry["timeouts"] += 1
+        elif outcome == "error":
+            entry["errors"] += 1
+
+    async def run(
+        self,
+        file_type: str,
+        fn: Callable[..., Any],
+        *args,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Run fn(*args) in a worker process.
+
+        Args:
+            file_type: File type (selects the timeout and latency bucket)
+            fn: Picklable module-level function (defined in a module that is
+                cheap to import, see extraction_worker)
+            *args: Picklable arguments
+            timeout: Override of the per-format timeout
+
+        Returns:
+            fn's return value
+
+        Raises:
+            ExtractionTimeoutError: If the worker exceeded the timeout (it is killed)
+            BrokenProcessPool: If the worker died (it is replaced)
+            Exception: Whatever fn raised in the worker
+        """
+        if timeout is None:
+            timeout = self.timeout_for(file_type)
+
+        self.stats["submitted"] += 1
+        queued_at = time.perf_counter()
+        worker = await self._checkout()
+        started_at = time.perf_counter()
+        self.stats["total_queue_wait_ms"] += (started_at - queued_at) * 1000
+
+        self._running += 1
+        healthy = True
+        outcome = "error"
+        try:
+            worker.tasks += 1
+            result = await asyncio.wait_for(
+                asyncio.to_thread(worker.call, fn, args), timeout=timeout
+            )
+            outcome = "ok"
+            self.stats["completed"] += 1
+            return result
+
+        except asyncio.TimeoutError as e:
+            healthy = False
+            outcome = "timeout"
+            self.stats["timeouts"] += 1
+            self.stats["failed"] += 1
+            logger.warning(f"Extraction of {file_type} timed out after {timeout}s; worker killed")
+            raise ExtractionTimeoutError(
+                f"Extraction of {file_type} file timed out after {timeout:g}s"
+            ) from e
+
+        except asyncio.CancelledError:
+            # The caller gave up; the worker may still be busy with the task
+            healthy = False
+            raise
+
+        except BrokenProcessPool:
+            healthy = False
+            self.stats["failed"] += 1
+            logger.error(f"Extraction worker died while processing {file_type} file")
+            raise
+
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+
+        finally:
+            self._running -= 1
+            self._record(file_type, (time.perf_counter() - started_at) * 1000, outcome)
+            self._release(worker, healthy)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool, back-pressure and per-format latency statistics."""
+        formats = {}
+        for file_type, entry in self._format_stats.items():
+            recent = sorted(entry["recent_ms"])
+            formats[file_type] = {
+                "count": entry["count"],
+                "errors": entry["errors"],
+                "timeouts": entry["timeouts"],
+                "avg_ms": round(entry["total_ms"] / entry["count"], 2),
+                "p95_ms": round(recent[max(0, math.ceil(0.95 * len(recent)) - 1)], 2),
+                "max_ms": round(entry["max_ms"], 2),
+            }
+
+        submitted = self.stats["submitted"]
+        return {
+            **self.stats,
+            "queue_depth": self._waiting,
+            "in_flight": self._running,
+            "workers": self.max_workers,
+            "live_workers": len(self._workers),
+            "avg_queue_wait_ms": (
+                round(self.stats["total_queue_wait_ms"] / submitted, 2) if submitted else 0.0
+            ),
+            "formats": formats,
+        }
+
+    def shutdown(self) -> None:
+        """Stop all workers; in-flight and queued calls fail."""
+        self._closed = True
+        for worker in self._workers:
+            worker.kill()
+        self._workers = []
+        if self._slots is not None:
+            # Wake queued callers (each passes it on before failing)
+            self._slots.put_nowait(None)
+
+
+# Global pool (None when disabled)
+_extraction_pool: Optional[ExtractionPool] = None
+_extraction_pool_initialized = False
+
+
+def get_extraction_pool() -> Optional[ExtractionPool]:
+    """
+    Get the global extraction pool.
+
+    Returns:
+        ExtractionPool, or None if EXTRACTION_POOL_WORKERS is 0
+    """
+    global _extraction_pool, _extraction_pool_initialized
+
+    if not _extraction_pool_initialized:
+        from backend.config import settings
+
+        workers = settings.EXTRACTION_POOL_WORKERS
+        if workers > 0:
+            _extraction_pool = ExtractionPool(
+                max_workers=workers,
+                max_tasks_per_worker=settings.EXTRACTION_POOL_MAX_TASKS_PER_WORKER,
+                default_timeout=settings.EXTRACTION_TIMEOUT_SECONDS,
+            )
+        _extraction_pool_initialized = True
+
+    return _extraction_pool
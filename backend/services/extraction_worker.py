@@ -0,0 +1,91 @@
+# Extraction Worker
+"""
+Entry points of extraction worker processes.
+
+Spawned workers import this module to unpickle their target and tasks, so it
+only imports the standard library at module level; DocumentProcessor is
+loaded on the first document. Keep heavy imports (models, torch, the
+service registry) out of this module.
+"""
+
+from typing import Any, Dict, Optional
+
+_worker_processor = None
+_worker_config: Optional[tuple] = None
+
+
+def _get_worker_processor(config: Dict[str, Any]):
+    """DocumentProcessor reused for every document a worker handles."""
+    global _worker_processor, _worker_config
+
+    key = tuple(sorted(config.items()))
+    if _worker_processor is None or _worker_config != key:
+        from backend.services.document_processor import DocumentProcessor
+
+        _worker_processor = DocumentProcessor(**config)
+        _worker_config = key
+    return _worker_processor
+
+
+def extract_and_chunk(
+    file_content: bytes,
+    file_type: str,
+    document_id: str,
+    config: Dict[str, Any],
+    chunk: bool = True,
+) -> Dict[str, Any]:
+    """
+    Extract text, chunks and file metadata from a document (worker entry point).
+
+    Args:
+        file_content: File content as bytes
+        file_type: Detected file type
+        document_id: ID used for chunk IDs
+        config: DocumentProcessor arguments (chunk_size, chunk_overlap,
+            max_file_size, chunking_strategy)
+        chunk: Whether to chunk in the worker (False leaves chunks to the caller)
+
+    Returns:
+        Dict with text, chunks (None if not chunked) and metadata
+    """
+    processor = _get_worker_processor(config)
+
+    text = processor.extract_text(file_content, file_type)
+    chunks = processor.chunk_text(text, document_id) if chunk else None
+    metadata = processor.metadata_extractor.extract_metadata(
+        file_content=file_content, file_type=file_type, text=text
+    )
+
+    return {"text": text, "chunks": chunks, "metadata": metadata}
+
+
+def worker_main(conn) -> None:
+    """
+    Serve tasks from the pool until told to stop (worker process target).
+
+    Each request is ``(fn, args)``; the reply is ``(True, result)`` or
+    ``(False, exception)``. ``None`` or a closed pipe stops the worker.
+
+    Args:
+        conn: Worker end of the pool's pipe
+    """
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+
+        fn, args = request
+        try:
+            reply = (True, fn(*args))
+        except Exception as e:
+            reply = (False, e)
+
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # Result or exception could not be pickled
+            error = e if reply[0] else reply[1]
+            conn.send((False, RuntimeError(f"{type(error).__name__}: {error}")))
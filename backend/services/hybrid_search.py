@@ -1,8 +1,12 @@
 # Hybrid Search Service (Vector + BM25)
+import asyncio
 import logging
-from typing import List, Dict, Tuple, Optional
+from typing import AsyncIterator, List, Dict, Set, Tuple, Optional
 from dataclasses import dataclass
 
+from backend.services.bm25_search import SegmentedBM25
+from backend.services.rank_fusion import FusionMethod, Retriever, fuse, fuse_stream
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +48,133 @@ class HybridSearchService:
         self.vector_weight = vector_weight / total_weight
         self.bm25_weight = bm25_weight / total_weight
 
+        # Optional in-process BM25 index, kept current through a change feed
+        # (add_documents / delete_documents) and compacted by compact()
+        self.bm25: Optional[SegmentedBM25] = None
+        # document_id -> chunk IDs, so a document delete can tombstone its chunks
+        self._document_chunks: Dict[str, Set[str]] = {}
+
+    def build_bm25_index(self, documents: List[Dict]):
+        """
+        Build the in-process BM25 index used when no bm25_search_fn is given.
+
+        Replaces any existing index; use add_documents for incremental updates.
+
+        Args:
+            documents: List of chunks with 'id' and 'text' (or 'content') keys
+                and optionally 'document_id'
+        """
+        self.bm25 = None
+        self._document_chunks = {}
+        self.add_documents(documents)
+
+    def add_documents(self, documents: List[Dict]) -> int:
+        """
+        Add chunks to the BM25 index as a new segment.
+
+        Only the given chunks are tokenized; chunks whose ID is already
+        indexed are replaced.
+
+        Args:
+            documents: List of chunks with 'id' and 'text' (or 'content') keys
+                and optionally 'document_id'
+
+        Returns:
+            Number of chunks added
+        """
+        if not documents:
+            return 0
+
+        corpus = [doc.get("text") or doc.get("content", "") for doc in documents]
+        doc_ids = [doc["id"] for doc in documents]
+
+        if self.bm25 is None:
+            self.bm25 = SegmentedBM25()
+        added = self.bm25.add(corpus, doc_ids)
+
+        for doc in documents:
+            document_id = doc.get("document_id")
+            if document_id:
+                self._document_chunks.setdefault(document_id, set()).add(doc["id"])
+
+        return added
+
+    def delete_documents(self, doc_ids: List[str]) -> int:
+        """
+        Tombstone chunks in the BM25 index.
+
+        Tombstoned chunks are skipped at query time and dropped by compact().
+
+        Args:
+            doc_ids: Chunk IDs to delete
+
+        Returns:
+            Number of chunks deleted
+        """
+        if self.bm25 is None or not doc_ids:
+            return 0
+        return self.bm25.delete(doc_ids)
+
+    def delete_document_chunks(self, document_id: str) -> int:
+        """
+        Tombstone all indexed chunks of a document.
+
+        Args:
+            document_id: ID of the document
+
+        Returns:
+            Number of chunks deleted
+        """
+        return self.delete_documents(list(self._document_chunks.pop(document_id, ())))
+
+    def needs_compaction(self) -> bool:
+        """Whether the merge policy selects any BM25 segments."""
+        return self.bm25 is not None and bool(self.bm25.select_merge())
+
+    def compact(self, force: bool = False) -> int:
+        """
+        Merge BM25 segments, physically dropping tombstoned chunks.
+
+        Safe to run in a worker thread while searches and updates continue.
+
+        Args:
+            force: Merge all segments instead of those selected by the merge policy
+
+        Returns:
+            Number of segments merged
+        """
+        bm25 = self.bm25
+        if bm25 is None:
+            return 0
+        return bm25.merge(None if force else bm25.select_merge() or [])
+
+    def get_bm25_stats(self) -> Dict:
+        """Get BM25 index statistics."""
+        if self.bm25 is None:
+            return {"indexed": False}
+        return {
+            "indexed": True,
+            "num_docs": self.bm25.num_docs,
+            "deleted_docs": self.bm25.deleted_docs,
+            "segments": len(self.bm25.segments),
+            "documents": len(self._document_chunks),
+        }
+
+    async def bm25_search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Search the in-process BM25 index.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+
+        Returns:
+            List of (doc_id, score) tuples, empty if no index was built
+        """
+        if self.bm25 is None:
+            return []
+        return self.bm25.search(query, top_k)
+
     def reciprocal_rank_fusion(
         self,
         vector_results: List[Tuple[str, float]],
@@ -63,24 +194,13 @@ class HybridSearchService:
         Returns:
             Merged list of (doc_id, score) tuples
         """
-        rrf_scores = {}
-
-        # Add vector search scores
-        for rank, (doc_id, _) in enumerate(vector_results, start=1):
-            rrf_scores[doc_id] = rrf_scores.get(doc_id, 0.0) + (
-                self.vector_weight / (self.rrf_k + rank)
-            )
-
-        # Add BM25 scores
-        for rank, (doc_id, _) in enumerate(bm25_results, start=1):
-            rrf_scores[doc_id] = rrf_scores.get(doc_id, 0.0) + (
-                self.bm25_weight / (self.rrf_k + rank)
-            )
-
-        # Sort by RRF score
-        merged = sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
-
-        return merged[:top_k]
+        return fuse(
+            [vector_results, bm25_results],
+            method=FusionMethod.RRF,
+            weights=[self.vector_weight, self.bm25_weight],
+            top_k=top_k,
+            rrf_k=self.rrf_k,
+        )
 
     def weighted_score_fusion(
         self,
@@ -101,40 +221,18 @@ class HybridSearchService:
         Returns:
             Merged list of (doc_id, score) tuples
         """
-        combined_scores = {}
-
-        # Normalize vector scores
-        if vector_results:
-            max_vector_score = max(score for _, score in vector_results)
-            if max_vector_score > 0:
-                for doc_id, score in vector_results:
-                    normalized_score = score / max_vector_score
-                    combined_scores[doc_id] = (
-                        combined_scores.get(doc_id, 0.0)
-                        + self.vector_weight * normalized_score
-                    )
-
-        # Normalize BM25 scores
-        if bm25_results:
-            max_bm25_score = max(score for _, score in bm25_results)
-            if max_bm25_score > 0:
-                for doc_id, score in bm25_results:
-                    normalized_score = score / max_bm25_score
-                    combined_scores[doc_id] = (
-                        combined_scores.get(doc_id, 0.0)
-                        + self.bm25_weight * normalized_score
-                    )
-
-        # Sort by combined score
-        merged = sorted(combined_scores.items(), key=lambda x: x[1], reverse=True)
-
-        return merged[:top_k]
+        return fuse(
+            [vector_results, bm25_results],
+            method=FusionMethod.WEIGHTED,
+            weights=[self.vector_weight, self.bm25_weight],
+            top_k=top_k,
+        )
 
     async def search(
         self,
         query: str,
         vector_search_fn,
-        bm25_search_fn,
+        bm25_search_fn=None,
         top_k: int = 10,
         fusion_method: str = "rrf",
     ) -> List[SearchResult]:
@@ -145,15 +243,20 @@ class HybridSearchService:
             query: Search query
             vector_search_fn: Async function for vector search
             bm25_search_fn: Async function for BM25 search
+                (defaults to the in-process BM25 index)
             top_k: Number of results to return
             fusion_method: 'rrf' or 'weighted'
 
         Returns:
             List of SearchResult objects
         """
-        # Perform both searches
-        vector_results = await vector_search_fn(query, top_k * 2)
-        bm25_results = await bm25_search_fn(query, top_k * 2)
+        if bm25_search_fn is None:
+            bm25_search_fn = self.bm25_search
+
+        # Perform both searches concurrently
+        vector_results, bm25_results = await asyncio.gather(
+            vector_search_fn(query, top_k * 2), bm25_search_fn(query, top_k * 2)
+        )
 
         logger.info(
             f"Hybrid search: vector={len(vector_results)}, " f"bm25={len(bm25_results)}"
@@ -179,6 +282,54 @@ class HybridSearchService:
 
         return results
 
+    async def search_stream(
+        self,
+        query: str,
+        vector_search_fn,
+        bm25_search_fn=None,
+        top_k: int = 10,
+        fusion_method: str = "rrf",
+    ) -> AsyncIterator[List[SearchResult]]:
+        """
+        Hybrid search yielding the fused top-k as each retriever finishes.
+
+        The first yield comes from whichever search returns first; the last
+        one is the full hybrid ranking (same as ``search``).
+
+        Args:
+            query: Search query
+            vector_search_fn: Async function for vector search
+            bm25_search_fn: Async function for BM25 search
+                (defaults to the in-process BM25 index)
+            top_k: Number of results to return
+            fusion_method: 'rrf' or 'weighted'
+
+        Yields:
+            Lists of SearchResult objects
+        """
+        if bm25_search_fn is None:
+            bm25_search_fn = self.bm25_search
+
+        method = FusionMethod.RRF if fusion_method == "rrf" else FusionMethod.WEIGHTED
+        retrievers = [
+            Retriever("vector", vector_search_fn(query, top_k * 2), self.vector_weight),
+            Retriever("bm25", bm25_search_fn(query, top_k * 2), self.bm25_weight),
+        ]
+
+        async for snapshot in fuse_stream(
+            retrievers,
+            key_fn=lambda item: item[0],
+            score_fn=lambda item: item[1],
+            method=method,
+            top_k=top_k,
+            rrf_k=self.rrf_k,
+        ):
+            source = "hybrid" if snapshot.is_final else snapshot.source
+            yield [
+                SearchResult(doc_id=item[0], content="", score=score, source=source)
+                for item, score, _ in snapshot.results
+            ]
+
 
 # Global hybrid search service
 _hybrid_search_service: HybridSearchService = None
@@ -0,0 +1,257 @@
+"""
+Knowledgebase Catalog.
+
+In-process cache of what a knowledgebase search needs from the database and
+Milvus:
+- Milvus collection name, embedding model and dimension (from the DB)
+- Metric type, index type/params and size (from the collection's index)
+- Reusable pymilvus Collection handles
+
+Entries are loaded in a worker thread on first use (one DB query for all
+missing KBs), refreshed after a TTL and invalidated when a knowledgebase is
+updated or deleted. Searches run on a shared thread pool, so the per-KB
+searches of a multi-KB query overlap instead of blocking the event loop one
+after another.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class KBCatalogEntry:
+    """Search metadata of one knowledgebase."""
+    kb_id: str
+    collection_name: str
+    embedding_model: Optional[str] = None
+    embedding_dim: Optional[int] = None
+    metric_type: str = "L2"
+    index_type: str = "IVF_FLAT"
+    index_params: Dict[str, Any] = field(default_factory=dict)
+    num_entities: int = 0
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def similarity(self, distance: float) -> float:
+        """Convert a Milvus distance into a similarity score."""
+        if self.metric_type == "L2":
+            return 1.0 - distance
+        # COSINE / IP: larger is more similar already
+        return distance
+
+
+class KBCatalog:
+    """Cached knowledgebase metadata, collection handles and search executor."""
+
+    def __init__(self, ttl: float = 300.0, max_workers: int = 16, using: str = "default"):
+        """
+        Initialize catalog.
+
+        Args:
+            ttl: Seconds before an entry is reloaded
+            max_workers: Threads for DB loads and Milvus searches
+            using: pymilvus connection alias for KB collections
+        """
+        self.ttl = ttl
+        self.using = using
+        self._entries: Dict[str, KBCatalogEntry] = {}
+        self._collections: Dict[str, Any] = {}
+        self._collections_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="kb-search"
+        )
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "invalidations": 0,
+            "searches": 0,
+        }
+
+    async def get_many(self, kb_ids: List[str]) -> Dict[str, KBCatalogEntry]:
+        """
+        Get catalog entries, loading missing or expired ones in one DB query.
+
+        Args:
+            kb_ids: Knowledgebase IDs
+
+        Returns:
+            Dictionary mapping found KB IDs to their entries
+        """
+        now = time.monotonic()
+        entries = {}
+        missing = []
+        for kb_id in kb_ids:
+            entry = self._entries.get(str(kb_id))
+            if entry is not None and now - entry.loaded_at < self.ttl:
+                entries[entry.kb_id] = entry
+                self.stats["hits"] += 1
+            else:
+                missing.append(str(kb_id))
+
+        if missing:
+            self.stats["misses"] += len(missing)
+            loaded = await self._run(self._load, missing)
+            self._entries.update(loaded)
+            entries.update(loaded)
+            for kb_id in missing:
+                if kb_id not in loaded:
+                    logger.warning(f"Knowledgebase {kb_id} not found")
+
+        return entries
+
+    async def get(self, kb_id: str) -> Optional[KBCatalogEntry]:
+        """Get the catalog entry of one knowledgebase (None if not found)."""
+        return (await self.get_many([kb_id])).get(str(kb_id))
+
+    def invalidate(self, kb_id: Optional[str] = None) -> None:
+        """
+        Drop cached entries so the next search reloads them.
+
+        Args:
+            kb_id: Knowledgebase to invalidate (None = all)
+        """
+        if kb_id is None:
+            removed = list(self._entries.values())
+            self._entries.clear()
+        else:
+            entry = self._entries.pop(str(kb_id), None)
+            removed = [entry] if entry else []
+
+        with self._collections_lock:
+            for entry in removed:
+                self._collections.pop(entry.collection_name, None)
+
+        self.stats["invalidations"] += 1
+
+    async def search(
+        self,
+        entry: KBCatalogEntry,
+        query_embeddings: List[List[float]],
+        top_k: int,
+        output_fields: Optional[List[str]] = None,
+    ):
+        """
+        Search a knowledgebase collection off the event loop.
+
+        Args:
+            entry: Catalog entry of the knowledgebase
+            query_embeddings: Query vectors (searched in one request)
+            top_k: Number of results per query
+            output_fields: Fields to return
+
+        Returns:
+            pymilvus search results (one hit list per query)
+        """
+        from backend.models.milvus_schema import get_search_params
+
+        params = get_search_params(entry.index_type, entry.num_entities, entry.metric_type)
+        self.stats["searches"] += 1
+
+        def search():
+            return self._collection(entry.collection_name).search(
+                data=query_embeddings,
+                anns_field="embedding",
+                param=params,
+                limit=top_k,
+                output_fields=output_fields,
+            )
+
+        return await self._run(search)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _collection(self, collection_name: str):
+        """Reusable Collection handle (worker thread)."""
+        with self._collections_lock:
+            collection = self._collections.get(collection_name)
+        if collection is None:
+            from pymilvus import Collection
+
+            collection = Collection(collection_name, using=self.using)
+            with self._collections_lock:
+                collection = self._collections.setdefault(collection_name, collection)
+        return collection
+
+    def _load(self, kb_ids: List[str]) -> Dict[str, KBCatalogEntry]:
+        """Load entries from the DB and Milvus (worker thread)."""
+        from backend.db.database import SessionLocal
+        from backend.db.models.agent_builder import Knowledgebase
+
+        db = SessionLocal()
+        try:
+            rows = db.query(
+                Knowledgebase.id,
+                Knowledgebase.milvus_collection_name,
+                Knowledgebase.embedding_model,
+                Knowledgebase.embedding_dimension,
+            ).filter(Knowledgebase.id.in_(kb_ids)).all()
+        finally:
+            db.close()
+
+        entries = {}
+        for kb_id, collection_name, embedding_model, embedding_dim in rows:
+            if not collection_name:
+                continue
+            entry = KBCatalogEntry(
+                kb_id=str(kb_id),
+                collection_name=collection_name,
+                embedding_model=embedding_model,
+                embedding_dim=embedding_dim,
+            )
+            try:
+                collection = self._collection(collection_name)
+                if collection.indexes:
+                    params = dict(collection.indexes[0].params)
+                    entry.metric_type = params.get("metric_type", entry.metric_type)
+                    entry.index_type = params.get("index_type", entry.index_type)
+                    entry.index_params = params.get("params", {})
+                entry.num_entities = collection.num_entities
+            except Exception as e:
+                # Search with defaults; the handle is retried on the next load
+                logger.warning(f"Failed to read index of collection {collection_name}: {e}")
+                with self._collections_lock:
+                    self._collections.pop(collection_name, None)
+            entries[entry.kb_id] = entry
+
+        self.stats["loads"] += 1
+        return entries
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Catalog statistics."""
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "collections": len(self._collections),
+        }
+
+
+# Global instance
+_kb_catalog: Optional[KBCatalog] = None
+
+
+def get_kb_catalog() -> KBCatalog:
+    """Get or create the global KB catalog."""
+    global _kb_catalog
+    if _kb_catalog is None:
+        from backend.config import settings
+
+        _kb_catalog = KBCatalog(
+            ttl=settings.KB_CATALOG_TTL,
+            max_workers=settings.KB_SEARCH_MAX_WORKERS,
+        )
+    return _kb_catalog
+
+
+def invalidate_kb_catalog(kb_id: Optional[str] = None) -> None:
+    """Invalidate cached KB metadata after a knowledgebase update or delete."""
+    if _kb_catalog is not None:
+        _kb_catalog.invalidate(kb_id)
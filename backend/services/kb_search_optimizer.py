@@ -2,7 +2,10 @@
 Knowledgebase Search Optimizer.
 
 Advanced optimization for KB search including:
-- Adaptive timeout based on KB size
+- Adaptive per-KB deadlines from latency histograms (KB size as fallback)
+- Partial results when some KBs miss their deadline
+- Optional hedged requests to slow KBs
+- Streaming (as_completed) search mode
 - Search result caching
 - Query preprocessing
 - Performance tracking
@@ -11,7 +14,8 @@ Advanced optimization for KB search including:
 import logging
 import time
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
+from bisect import bisect_left
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
@@ -38,29 +42,100 @@ class KBProfile:
     collection_size: int  # Number of vectors
 
 
+class LatencyHistogram:
+    """Bucketed search latency of one KB, aged so it follows recent behavior."""
+
+    # Bucket upper bounds in seconds (last bucket is open-ended)
+    BOUNDS = (
+        0.005, 0.01, 0.02, 0.035, 0.05, 0.075, 0.1, 0.15, 0.2,
+        0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0,
+    )
+
+    def __init__(self, max_count: int = 200):
+        """
+        Initialize histogram.
+
+        Args:
+            max_count: Halve all counts once this many samples are held
+        """
+        self.max_count = max_count
+        self.counts = [0.0] * (len(self.BOUNDS) + 1)
+        self.count = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one latency sample."""
+        if self.count >= self.max_count:
+            self.counts = [c / 2 for c in self.counts]
+            self.count /= 2
+        self.counts[bisect_left(self.BOUNDS, seconds)] += 1
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (seconds)."""
+        target = q * self.count
+        cumulative = 0.0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count:
+                break
+        return self.BOUNDS[i] if i < len(self.BOUNDS) else self.BOUNDS[-1] * 2
+
+    def snapshot(self) -> Dict[str, float]:
+        """Sample count and latency percentiles."""
+        return {
+            'samples': round(self.count, 1),
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+        }
+
+
 class KBSearchOptimizer:
     """
     Optimizer for knowledgebase search operations.
     
     Features:
-    - Adaptive timeouts based on KB size
+    - Per-KB deadlines from latency histograms (KB size as fallback)
+    - Partial results and optional hedged requests
     - Search result caching
     - Performance profiling
     - Query preprocessing
     """
     
-    def __init__(self, redis_client, cache_ttl: int = 300):
+    def __init__(
+        self,
+        redis_client,
+        cache_ttl: int = 300,
+        hedge_requests: bool = False,
+        latency_quantile: float = 0.95,
+        timeout_margin: float = 1.5,
+        min_latency_samples: int = 20,
+    ):
         """
         Initialize optimizer.
         
         Args:
             redis_client: Redis client for caching
             cache_ttl: Cache TTL in seconds (default: 5 minutes)
+            hedge_requests: Send a second request to a KB that has not
+                answered by its usual (p90) latency
+            latency_quantile: Latency quantile a KB deadline is based on
+            timeout_margin: Multiplier applied to that quantile
+            min_latency_samples: Samples needed before a KB's histogram
+                replaces the size-based timeout
         """
         self.redis_client = redis_client
         self.cache_ttl = cache_ttl
+        self.hedge_requests = hedge_requests
+        self.latency_quantile = latency_quantile
+        self.timeout_margin = timeout_margin
+        self.min_latency_samples = min_latency_samples
         self.kb_profiles: Dict[str, KBProfile] = {}
         self.search_metrics: List[KBSearchMetrics] = []
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.hedged_requests = 0
+        # Searches left running after a stream consumer stopped early
+        self._background: set = set()
         
         logger.info("KBSearchOptimizer initialized")
     
@@ -70,9 +145,9 @@ class KBSearchOptimizer:
         base_timeout: float = 1.0
     ) -> float:
         """
-        Calculate adaptive timeout based on KB profiles.
+        Calculate the overall timeout of a multi-KB search.
         
-        Larger KBs get more time, smaller KBs get less.
+        This is the longest per-KB deadline (see calculate_kb_timeout).
         
         Args:
             kb_ids: List of KB IDs to search
@@ -84,12 +159,30 @@ class KBSearchOptimizer:
         if not kb_ids:
             return base_timeout
         
-        # Get max document count from profiles
-        max_docs = 0
-        for kb_id in kb_ids:
-            profile = self.kb_profiles.get(kb_id)
-            if profile:
-                max_docs = max(max_docs, profile.document_count)
+        return max(self.calculate_kb_timeout(kb_id, base_timeout) for kb_id in kb_ids)
+    
+    def calculate_kb_timeout(self, kb_id: str, base_timeout: float = 1.0) -> float:
+        """
+        Calculate the search deadline of one KB.
+        
+        With enough latency samples the deadline is the KB's observed
+        latency quantile times a margin (bounded to 0.25x-3x the base);
+        otherwise larger KBs get more time, smaller KBs get less.
+        
+        Args:
+            kb_id: Knowledgebase ID
+            base_timeout: Base timeout in seconds
+            
+        Returns:
+            Timeout in seconds
+        """
+        histogram = self.latency.get(kb_id)
+        if histogram and histogram.count >= self.min_latency_samples:
+            timeout = histogram.quantile(self.latency_quantile) * self.timeout_margin
+            return min(max(timeout, base_timeout * 0.25), base_timeout * 3.0)
+        
+        profile = self.kb_profiles.get(kb_id)
+        max_docs = profile.document_count if profile else 0
         
         # Adaptive timeout based on document count
         if max_docs == 0:
@@ -103,12 +196,29 @@ class KBSearchOptimizer:
         else:
             return base_timeout * 2.0  # Very large KB: 2.0s
     
+    def record_latency(self, kb_id: str, seconds: float) -> None:
+        """Add a search latency sample to the KB's histogram."""
+        histogram = self.latency.get(kb_id)
+        if histogram is None:
+            histogram = self.latency[kb_id] = LatencyHistogram()
+        histogram.record(seconds)
+    
+    def _hedge_delay(self, kb_id: str, timeout: float) -> Optional[float]:
+        """Delay before a hedged request (None = do not hedge)."""
+        histogram = self.latency.get(kb_id)
+        if histogram and histogram.count >= self.min_latency_samples:
+            delay = histogram.quantile(0.9)
+        else:
+            delay = timeout / 2
+        return delay if delay < timeout else None
+    
     async def search_with_cache(
         self,
         kb_id: str,
         query_hash: str,
         search_func,
         *args,
+        hedge_delay: Optional[float] = None,
         **kwargs
     ) -> Tuple[List[Any], bool]:
         """
@@ -119,6 +229,8 @@ class KBSearchOptimizer:
             query_hash: Hash of the query
             search_func: Async search function
             *args, **kwargs: Arguments for search function
+            hedge_delay: Send a second request if the first has not
+                finished after this many seconds (None = no hedging)
             
         Returns:
             Tuple of (results, cache_hit)
@@ -130,51 +242,75 @@ class KBSearchOptimizer:
             cached = await self.redis_client.get(cache_key)
             if cached:
                 import json
-                results = json.loads(cached)
+                from backend.services.milvus import SearchResult
+                results = [SearchResult(**item) for item in json.loads(cached)]
                 logger.debug(f"Cache hit for KB {kb_id}")
                 return results, True
         except Exception as e:
             logger.warning(f"Cache check failed: {e}")
         
         # Cache miss - perform search
-        results = await search_func(*args, **kwargs)
+        if hedge_delay is None:
+            results = await search_func(*args, **kwargs)
+        else:
+            results = await self._hedged_search(kb_id, search_func, args, kwargs, hedge_delay)
         
-        # Store in cache
+        # Store in cache (full SearchResult fields so hits can be rebuilt)
         try:
             import json
-            # Convert results to JSON-serializable format
-            serializable_results = [
-                {
-                    'id': getattr(r, 'id', None),
-                    'content': getattr(r, 'content', str(r)),
-                    'score': getattr(r, 'score', 0),
-                    'metadata': getattr(r, 'metadata', {})
-                }
-                for r in results
-            ]
-            await self.redis_client.setex(
-                cache_key,
-                self.cache_ttl,
-                json.dumps(serializable_results)
-            )
+            if all(hasattr(r, 'to_dict') for r in results):
+                await self.redis_client.setex(
+                    cache_key,
+                    self.cache_ttl,
+                    json.dumps([r.to_dict() for r in results])
+                )
         except Exception as e:
             logger.warning(f"Cache store failed: {e}")
         
         return results, False
     
+    async def _hedged_search(self, kb_id: str, search_func, args, kwargs, hedge_delay: float):
+        """Run search_func; after hedge_delay race it against a second call."""
+        primary = asyncio.ensure_future(search_func(*args, **kwargs))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+            if done:
+                return primary.result()
+            
+            self.hedged_requests += 1
+            logger.debug(f"Hedging search of KB {kb_id} after {hedge_delay:.3f}s")
+            pending.add(asyncio.ensure_future(search_func(*args, **kwargs)))
+            
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+    
     async def search_kbs_optimized(
         self,
         kb_ids: List[str],
         search_func,
         query_hash: str,
         *args,
+        base_timeout: float = 1.0,
+        hedge: Optional[bool] = None,
         **kwargs
     ) -> Tuple[List[Any], List[KBSearchMetrics]]:
         """
         Search multiple KBs with optimization.
         
         Features:
-        - Adaptive timeouts
+        - Per-KB adaptive deadlines: a KB that misses its deadline is
+          reported as "timeout" while the other KBs keep their results
+        - Optional hedged requests
         - Result caching
         - Performance tracking
         - Parallel execution
@@ -184,6 +320,8 @@ class KBSearchOptimizer:
             search_func: Search function for single KB
             query_hash: Hash of query for caching
             *args, **kwargs: Arguments for search function
+            base_timeout: Base timeout the per-KB deadlines scale
+            hedge: Hedge slow KBs (default: the optimizer's setting)
             
         Returns:
             Tuple of (all results, metrics)
@@ -191,75 +329,133 @@ class KBSearchOptimizer:
         if not kb_ids:
             return [], []
         
-        # Calculate adaptive timeout
-        timeout = self.calculate_adaptive_timeout(kb_ids)
-        
         logger.info(
-            f"Searching {len(kb_ids)} KBs with adaptive timeout: {timeout:.2f}s"
+            f"Searching {len(kb_ids)} KBs with adaptive timeout: "
+            f"{self.calculate_adaptive_timeout(kb_ids, base_timeout):.2f}s"
         )
         
-        # Create search tasks with caching
-        tasks = []
-        for kb_id in kb_ids:
-            task = self._search_single_kb_with_metrics(
-                kb_id,
-                query_hash,
-                search_func,
-                *args,
-                **kwargs
+        # Execute in parallel, each KB with its own deadline
+        results_with_metrics = await asyncio.gather(*(
+            self._search_kb_with_deadline(
+                kb_id, query_hash, search_func, base_timeout, hedge, args, kwargs
             )
-            tasks.append(task)
-        
-        # Execute in parallel with timeout
-        try:
-            results_with_metrics = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True),
-                timeout=timeout
-            )
-        except asyncio.TimeoutError:
-            logger.warning(f"KB search timeout after {timeout:.2f}s")
-            results_with_metrics = [
-                ([], KBSearchMetrics(kb_id, timeout, 0, False, "timeout"))
-                for kb_id in kb_ids
-            ]
+            for kb_id in kb_ids
+        ))
         
         # Collect results and metrics
         all_results = []
         all_metrics = []
         
-        for kb_id, result in zip(kb_ids, results_with_metrics):
-            if isinstance(result, Exception):
-                logger.error(f"KB search failed for {kb_id}: {result}")
-                all_metrics.append(
-                    KBSearchMetrics(kb_id, 0, 0, False, str(result))
-                )
-            else:
-                results, metrics = result
-                all_results.extend(results)
-                all_metrics.append(metrics)
-        
-        # Store metrics
-        self.search_metrics.extend(all_metrics)
+        for results, metrics in results_with_metrics:
+            all_results.extend(results)
+            all_metrics.append(metrics)
         
         # Log summary
         total_results = len(all_results)
         cache_hits = sum(1 for m in all_metrics if m.cache_hit)
+        timeouts = sum(1 for m in all_metrics if m.error == "timeout")
         avg_time = sum(m.search_time for m in all_metrics) / len(all_metrics) if all_metrics else 0
         
         logger.info(
             f"KB search completed: {total_results} results, "
             f"{cache_hits}/{len(kb_ids)} cache hits, "
+            f"{timeouts} timeouts, "
             f"avg time: {avg_time:.3f}s"
         )
         
         return all_results, all_metrics
     
+    async def search_kbs_stream(
+        self,
+        kb_ids: List[str],
+        search_func,
+        query_hash: str,
+        *args,
+        base_timeout: float = 1.0,
+        hedge: Optional[bool] = None,
+        **kwargs
+    ) -> AsyncIterator[Tuple[str, List[Any], KBSearchMetrics]]:
+        """
+        Search multiple KBs, yielding each KB's results as it completes.
+        
+        Lets the caller start on the first K answers. If the caller stops
+        early, the remaining searches still finish within their deadlines
+        in the background (filling the cache and latency histograms).
+        
+        Args:
+            kb_ids: List of KB IDs
+            search_func: Search function for single KB
+            query_hash: Hash of query for caching
+            *args, **kwargs: Arguments for search function
+            base_timeout: Base timeout the per-KB deadlines scale
+            hedge: Hedge slow KBs (default: the optimizer's setting)
+            
+        Yields:
+            (kb_id, results, metrics) in completion order
+        """
+        tasks = [
+            asyncio.ensure_future(self._search_kb_with_deadline(
+                kb_id, query_hash, search_func, base_timeout, hedge, args, kwargs
+            ))
+            for kb_id in kb_ids
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                results, metrics = await next_done
+                yield metrics.kb_id, results, metrics
+        finally:
+            for task in tasks:
+                if not task.done():
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+    
+    async def _search_kb_with_deadline(
+        self,
+        kb_id: str,
+        query_hash: str,
+        search_func,
+        base_timeout: float,
+        hedge: Optional[bool],
+        args: tuple,
+        kwargs: dict
+    ) -> Tuple[List[Any], KBSearchMetrics]:
+        """Search one KB within its own deadline and record its metrics."""
+        timeout = self.calculate_kb_timeout(kb_id, base_timeout)
+        if hedge is None:
+            hedge = self.hedge_requests
+        hedge_delay = self._hedge_delay(kb_id, timeout) if hedge else None
+        
+        try:
+            results, metrics = await asyncio.wait_for(
+                self._search_single_kb_with_metrics(
+                    kb_id,
+                    query_hash,
+                    search_func,
+                    *args,
+                    hedge_delay=hedge_delay,
+                    **kwargs
+                ),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"KB search timeout for {kb_id} after {timeout:.2f}s")
+            results, metrics = [], KBSearchMetrics(kb_id, timeout, 0, False, "timeout")
+        
+        # Cache hits say nothing about search latency; timeouts count at
+        # the deadline so a slow KB's deadline grows
+        if not metrics.cache_hit and (metrics.error is None or metrics.error == "timeout"):
+            self.record_latency(kb_id, metrics.search_time)
+        
+        self.search_metrics.append(metrics)
+        return results, metrics
+    
     async def _search_single_kb_with_metrics(
         self,
         kb_id: str,
         query_hash: str,
         search_func,
         *args,
+        hedge_delay: Optional[float] = None,
         **kwargs
     ) -> Tuple[List[Any], KBSearchMetrics]:
         """
@@ -284,6 +480,7 @@ class KBSearchOptimizer:
                 search_func,
                 kb_id,
                 *args,
+                hedge_delay=hedge_delay,
                 **kwargs
             )
             
@@ -380,9 +577,19 @@ class KBSearchOptimizer:
             'avg_search_time': avg_time,
             'cache_hit_rate': cache_hits / total if total > 0 else 0,
             'error_rate': errors / total if total > 0 else 0,
-            'kb_profiles': len(self.kb_profiles)
+            'kb_profiles': len(self.kb_profiles),
+            'hedged_requests': self.hedged_requests
         }
     
+    def get_latency_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-KB latency percentiles.
+        
+        Returns:
+            Dictionary mapping KB IDs to sample count and p50/p95/p99 (seconds)
+        """
+        return {kb_id: histogram.snapshot() for kb_id, histogram in self.latency.items()}
+    
     def clear_old_metrics(self, hours: int = 24):
         """
         Clear metrics older than specified hours.
@@ -413,6 +620,8 @@ def get_kb_search_optimizer(redis_client) -> KBSearchOptimizer:
     global _optimizer
     
     if _optimizer is None:
-        _optimizer = KBSearchOptimizer(redis_client)
+        from backend.config import settings
+        
+        _optimizer = KBSearchOptimizer(redis_client, hedge_requests=settings.KB_SEARCH_HEDGE)
     
     return _optimizer
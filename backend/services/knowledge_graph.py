@@ -1,12 +1,25 @@
 # Knowledge Graph Service for Document Relationships
+import json
 import logging
-from typing import List, Dict, Set, Optional, Tuple
+import os
+import re
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
-from collections import defaultdict
-import networkx as nx
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from scipy import sparse
 
 logger = logging.getLogger(__name__)
 
+# On-disk format version (bump when the saved arrays change)
+_FORMAT_VERSION = 1
+
+# Technology names / concepts (capitalized words)
+_TECH_PATTERN = re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b")
+
 
 @dataclass
 class Entity:
@@ -38,13 +51,92 @@ class KnowledgeGraph:
     - Relationship mapping between entities
     - Document similarity based on shared entities
     - Graph-based reasoning and traversal
+
+    Documents and entities are interned to integer ids. The graph is kept as
+    a document -> entity index and its inverse (entity -> documents); queries
+    run on a CSR snapshot of both, rebuilt lazily after changes, so related
+    document scoring only touches documents that share an entity with the
+    source document. The index can be saved to and loaded from a single
+    ``.npz`` file.
     """
 
-    def __init__(self):
-        self.graph = nx.DiGraph()
+    def __init__(self, path: Optional[str] = None, autosave_interval: float = 60.0):
+        """
+        Initialize an empty knowledge graph.
+
+        Args:
+            path: File the graph is saved to (None = memory only)
+            autosave_interval: Min seconds between automatic saves after
+                updates (negative = only explicit saves)
+        """
+        self.path = path
+        self.autosave_interval = autosave_interval
+
         self.entities: Dict[str, Entity] = {}
         self.relationships: List[Relationship] = []
-        self.doc_entities: Dict[str, Set[str]] = defaultdict(set)
+        self.doc_metadata: Dict[str, Dict] = {}
+
+        # Interned ids (removed documents leave an empty slot until the next load)
+        self._entity_ids: Dict[str, int] = {}
+        self._entity_names: List[str] = []
+        self._doc_ids: Dict[str, int] = {}
+        self._doc_names: List[Optional[str]] = []
+
+        # doc id -> entity ids, entity id -> doc ids
+        self._doc_links: List[Set[int]] = []
+        self._entity_links: List[Set[int]] = []
+
+        # (doc x entity CSR, entity x doc CSR, entities per doc), None when stale
+        self._snapshot: Optional[Tuple[sparse.csr_matrix, sparse.csr_matrix, np.ndarray]] = None
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+    @property
+    def doc_entities(self) -> Dict[str, Set[str]]:
+        """Entity names per document (built on access)."""
+        with self._lock:
+            return {
+                doc_id: {self._entity_names[e] for e in self._doc_links[doc]}
+                for doc_id, doc in self._doc_ids.items()
+                if self._doc_links[doc]
+            }
+
+    def _intern_doc(self, doc_id: str) -> int:
+        doc = self._doc_ids.get(doc_id)
+        if doc is None:
+            doc = len(self._doc_names)
+            self._doc_ids[doc_id] = doc
+            self._doc_names.append(doc_id)
+            self._doc_links.append(set())
+        return doc
+
+    def _link(self, doc: int, entity_name: str, entity_type: str = "concept") -> Entity:
+        """Connect a document to an entity (idempotent)."""
+        entity_id = self._entity_ids.get(entity_name)
+        if entity_id is None:
+            entity_id = len(self._entity_names)
+            self._entity_ids[entity_name] = entity_id
+            self._entity_names.append(entity_name)
+            self._entity_links.append(set())
+
+        entity = self.entities.get(entity_name)
+        if entity is None:
+            entity = Entity(name=entity_name, type=entity_type, mentions=0, documents=set())
+            self.entities[entity_name] = entity
+
+        if doc not in self._entity_links[entity_id]:
+            self._entity_links[entity_id].add(doc)
+            self._doc_links[doc].add(entity_id)
+            entity.mentions += 1
+            entity.documents.add(self._doc_names[doc])
+            self._changed()
+
+        return entity
+
+    def _changed(self) -> None:
+        self._snapshot = None
+        self._dirty = True
 
     def extract_entities(self, text: str, doc_id: str) -> List[Entity]:
         """
@@ -54,47 +146,91 @@ class KnowledgeGraph:
         """
         entities = []
 
-        # Simple pattern-based extraction
-        # Technology names (capitalized words)
-        import re
-
-        tech_pattern = r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b"
-        matches = re.findall(tech_pattern, text)
-
-        for match in set(matches):
-            if len(match) > 2:  # Filter short matches
-                entity_name = match.lower()
-
-                if entity_name not in self.entities:
-                    self.entities[entity_name] = Entity(
-                        name=entity_name, type="concept", mentions=0, documents=set()
-                    )
-
-                self.entities[entity_name].mentions += 1
-                self.entities[entity_name].documents.add(doc_id)
-                self.doc_entities[doc_id].add(entity_name)
+        with self._lock:
+            doc = self._intern_doc(doc_id)
 
-                entities.append(self.entities[entity_name])
+            # Simple pattern-based extraction
+            for match in set(_TECH_PATTERN.findall(text)):
+                if len(match) > 2:  # Filter short matches
+                    entities.append(self._link(doc, match.lower()))
 
         return entities
 
     def add_document(self, doc_id: str, text: str, metadata: Dict = None):
-        """Add document to knowledge graph"""
-        # Extract entities
-        entities = self.extract_entities(text, doc_id)
+        """Add document to knowledge graph (replaces an existing document)"""
+        with self._lock:
+            self._unlink_document(doc_id)
 
-        # Add document node
-        self.graph.add_node(doc_id, type="document", metadata=metadata or {})
+            # Extract entities and connect document to them
+            entities = self.extract_entities(text, doc_id)
+            self.doc_metadata[doc_id] = metadata or {}
+            self._changed()
 
-        # Add entity nodes and edges
-        for entity in entities:
-            if not self.graph.has_node(entity.name):
-                self.graph.add_node(entity.name, type="entity", entity_type=entity.type)
+        logger.info(f"Added document {doc_id} with {len(entities)} entities")
+        self._maybe_autosave()
 
-            # Connect document to entity
-            self.graph.add_edge(doc_id, entity.name, relation="contains")
+    def remove_document(self, doc_id: str) -> bool:
+        """
+        Remove a document and its entity links.
 
-        logger.info(f"Added document {doc_id} with {len(entities)} entities")
+        Returns:
+            True if the document was in the graph
+        """
+        with self._lock:
+            known = doc_id in self.doc_metadata
+            if not self._unlink_document(doc_id) and not known:
+                return False
+            self.doc_metadata.pop(doc_id, None)
+            self._changed()
+
+        self._maybe_autosave()
+        return True
+
+    def _unlink_document(self, doc_id: str) -> bool:
+        """Drop all entity links of a document; returns whether it had any."""
+        doc = self._doc_ids.get(doc_id)
+        if doc is None or not self._doc_links[doc]:
+            return False
+
+        for entity_id in self._doc_links[doc]:
+            self._entity_links[entity_id].discard(doc)
+            name = self._entity_names[entity_id]
+            entity = self.entities[name]
+            entity.mentions -= 1
+            entity.documents.discard(doc_id)
+            if not self._entity_links[entity_id]:
+                # Keep the interned id, drop the orphaned entity
+                del self.entities[name]
+        self._doc_links[doc] = set()
+        self._changed()
+        return True
+
+    def _matrices(self) -> Tuple[sparse.csr_matrix, sparse.csr_matrix, np.ndarray]:
+        """CSR snapshot of the index (rebuilt once after each change)."""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None:
+                sizes = np.fromiter(
+                    (len(links) for links in self._doc_links),
+                    dtype=np.int64,
+                    count=len(self._doc_links),
+                )
+                indptr = np.zeros(len(sizes) + 1, dtype=np.int64)
+                np.cumsum(sizes, out=indptr[1:])
+                indices = np.fromiter(
+                    (e for links in self._doc_links for e in sorted(links)),
+                    dtype=np.int32,
+                    count=int(indptr[-1]),
+                )
+                doc_entity = sparse.csr_matrix(
+                    (np.ones(len(indices), dtype=np.int32), indices, indptr),
+                    shape=(len(self._doc_links), len(self._entity_links)),
+                )
+                self._snapshot = (doc_entity, doc_entity.T.tocsr(), sizes)
+            return self._snapshot
 
     def find_related_documents(
         self, doc_id: str, max_results: int = 5
@@ -102,84 +238,239 @@ class KnowledgeGraph:
         """
         Find documents related to given document based on shared entities.
 
+        Scores are Jaccard similarities of the entity sets. Candidates come
+        from the postings of the document's entities, so documents without
+        a shared entity are never looked at.
+
         Returns:
             List of (doc_id, similarity_score) tuples
         """
-        if doc_id not in self.doc_entities:
+        doc = self._doc_ids.get(doc_id)
+        if doc is None or max_results <= 0:
             return []
 
-        source_entities = self.doc_entities[doc_id]
-
-        # Calculate similarity with other documents
-        similarities = []
-        for other_doc_id, other_entities in self.doc_entities.items():
-            if other_doc_id == doc_id:
-                continue
-
-            # Jaccard similarity
-            intersection = len(source_entities & other_entities)
-            union = len(source_entities | other_entities)
+        doc_entity, entity_doc, sizes = self._matrices()
+        if doc >= doc_entity.shape[0] or not sizes[doc]:
+            return []
 
-            if union > 0:
-                similarity = intersection / union
-                if similarity > 0:
-                    similarities.append((other_doc_id, similarity))
+        # Postings of the source entities -> shared entity count per document
+        postings = entity_doc[doc_entity.indices[doc_entity.indptr[doc] : doc_entity.indptr[doc + 1]]]
+        candidates, shared = np.unique(postings.indices, return_counts=True)
+        keep = candidates != doc
+        candidates, shared = candidates[keep], shared[keep]
+        if not candidates.size:
+            return []
 
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        # |A ∩ B| / |A ∪ B|
+        scores = shared / (sizes[doc] + sizes[candidates] - shared)
 
-        return similarities[:max_results]
+        # Highest score first, ties in insertion order
+        order = np.lexsort((candidates, -scores))[:max_results]
+        return [(self._doc_names[candidates[i]], float(scores[i])) for i in order]
 
     def find_entity_connections(self, entity: str, max_depth: int = 2) -> List[str]:
-        """Find entities connected to given entity"""
-        if entity not in self.graph:
+        """
+        Find entities connected to given entity.
+
+        Walks the document-entity graph in both directions; each step from an
+        entity to a document (or back) is one hop, so max_depth=2 returns the
+        entities that share a document with the given one.
+        """
+        entity_id = self._entity_ids.get(entity)
+        if entity_id is not None and entity in self.entities:
+            start = (False, entity_id)
+        elif entity in self.doc_metadata:
+            start = (True, self._doc_ids[entity])
+        else:
             return []
 
-        # BFS to find connected entities
+        doc_entity, entity_doc, _ = self._matrices()
+
+        # BFS over the bipartite graph; nodes are (is_document, id)
         connected = []
-        visited = set()
-        queue = [(entity, 0)]
+        visited = {start}
+        queue = deque([(start, 0)])
 
         while queue:
-            current, depth = queue.pop(0)
+            (is_doc, index), depth = queue.popleft()
 
-            if current in visited or depth > max_depth:
-                continue
+            if not is_doc and (is_doc, index) != start:
+                connected.append(self._entity_names[index])
 
-            visited.add(current)
-
-            if current != entity and self.graph.nodes[current].get("type") == "entity":
-                connected.append(current)
+            if depth == max_depth:
+                continue
 
-            # Add neighbors
-            for neighbor in self.graph.neighbors(current):
-                if neighbor not in visited:
-                    queue.append((neighbor, depth + 1))
+            adjacency = doc_entity if is_doc else entity_doc
+            if index >= adjacency.shape[0]:
+                continue
+            neighbors = adjacency.indices[adjacency.indptr[index] : adjacency.indptr[index + 1]]
+            for neighbor in neighbors.tolist():
+                node = (not is_doc, neighbor)
+                if node not in visited:
+                    visited.add(node)
+                    queue.append((node, depth + 1))
 
         return connected
 
     def get_graph_stats(self) -> Dict:
         """Get knowledge graph statistics"""
+        _, _, sizes = self._matrices()
+        total_links = int(sizes.sum())
         return {
-            "total_nodes": self.graph.number_of_nodes(),
-            "total_edges": self.graph.number_of_edges(),
+            "total_nodes": len(self.doc_metadata) + len(self.entities),
+            "total_edges": total_links,
             "total_entities": len(self.entities),
-            "total_documents": len(self.doc_entities),
+            "total_documents": len(self.doc_metadata),
             "avg_entities_per_doc": (
-                sum(len(e) for e in self.doc_entities.values()) / len(self.doc_entities)
-                if self.doc_entities
-                else 0
+                total_links / len(self.doc_metadata) if self.doc_metadata else 0
             ),
+            "path": self.path,
+            "unsaved_changes": self._dirty,
         }
 
+    def save(self, path: Optional[str] = None) -> bool:
+        """
+        Write the graph to disk (atomically replaces the previous file).
+
+        Args:
+            path: Target file (default: self.path)
+
+        Returns:
+            True if the graph was written
+        """
+        path = path or self.path
+        if not path:
+            return False
+
+        with self._lock:
+            doc_entity, _, _ = self._matrices()
+            meta = {
+                "version": _FORMAT_VERSION,
+                "entity_names": self._entity_names,
+                "entity_types": [
+                    self.entities[name].type if name in self.entities else None
+                    for name in self._entity_names
+                ],
+                "doc_names": [
+                    name if name is not None and name in self.doc_metadata else None
+                    for name in self._doc_names
+                ],
+                "doc_metadata": self.doc_metadata,
+            }
+            encoded = json.dumps(meta, ensure_ascii=False, default=str).encode("utf-8")
+            indptr, indices = doc_entity.indptr, doc_entity.indices
+            self._dirty = False
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    indptr=indptr,
+                    indices=indices,
+                    meta=np.frombuffer(encoded, dtype=np.uint8),
+                )
+            os.replace(tmp_path, path)
+        except Exception:
+            with self._lock:
+                self._dirty = True
+            raise
+
+        self._last_save = time.monotonic()
+        logger.info(
+            f"Saved knowledge graph to {path} "
+            f"({len(self.doc_metadata)} documents, {len(self.entities)} entities)"
+        )
+        return True
+
+    def _maybe_autosave(self) -> None:
+        if not self.path or self.autosave_interval < 0 or not self._dirty:
+            return
+        if time.monotonic() - self._last_save < self.autosave_interval:
+            return
+        try:
+            self.save()
+        except Exception as e:
+            logger.warning(f"Knowledge graph autosave failed: {e}")
+
+    @classmethod
+    def load(cls, path: str, autosave_interval: float = 60.0) -> "KnowledgeGraph":
+        """
+        Load a saved graph (an empty graph if the file is missing or unreadable).
+
+        Removed documents and orphaned entities are compacted away.
+
+        Args:
+            path: File written by save()
+            autosave_interval: Passed to the new graph
+
+        Returns:
+            KnowledgeGraph bound to path
+        """
+        graph = cls(path=path, autosave_interval=autosave_interval)
+        if not path or not os.path.exists(path):
+            return graph
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                indptr = data["indptr"]
+                indices = data["indices"]
+                meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+            if meta.get("version") != _FORMAT_VERSION:
+                raise ValueError(f"unsupported format version {meta.get('version')}")
+        except Exception as e:
+            logger.warning(f"Could not load knowledge graph from {path}, starting empty: {e}")
+            return graph
+
+        entity_names = meta["entity_names"]
+        entity_types = meta["entity_types"]
+        doc_metadata = meta.get("doc_metadata", {})
+
+        with graph._lock:
+            for doc, doc_id in enumerate(meta["doc_names"]):
+                if doc_id is None:
+                    continue
+                new_doc = graph._intern_doc(doc_id)
+                for entity_id in indices[indptr[doc] : indptr[doc + 1]].tolist():
+                    graph._link(
+                        new_doc,
+                        entity_names[entity_id],
+                        entity_types[entity_id] or "concept",
+                    )
+                graph.doc_metadata[doc_id] = doc_metadata.get(doc_id, {})
+
+            graph._dirty = False
+
+        logger.info(
+            f"Loaded knowledge graph from {path} "
+            f"({len(graph.doc_metadata)} documents, {len(graph.entities)} entities)"
+        )
+        return graph
+
 
 # Global knowledge graph instance
 _knowledge_graph: Optional[KnowledgeGraph] = None
 
 
 def get_knowledge_graph() -> KnowledgeGraph:
-    """Get global knowledge graph instance"""
+    """Get global knowledge graph instance (loaded from KNOWLEDGE_GRAPH_PATH)"""
     global _knowledge_graph
     if _knowledge_graph is None:
-        _knowledge_graph = KnowledgeGraph()
+        from backend.config import settings
+
+        _knowledge_graph = KnowledgeGraph.load(
+            settings.KNOWLEDGE_GRAPH_PATH,
+            autosave_interval=settings.KNOWLEDGE_GRAPH_AUTOSAVE_INTERVAL,
+        )
     return _knowledge_graph
+
+
+def save_knowledge_graph() -> bool:
+    """Save the global knowledge graph if it was loaded and has unsaved changes"""
+    if _knowledge_graph is None or not _knowledge_graph._dirty:
+        return False
+    return _knowledge_graph.save()
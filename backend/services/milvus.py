@@ -7,7 +7,8 @@ capabilities with retry logic and comprehensive error handling.
 
 import logging
 import time
-from typing import List, Dict, Any, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, Union
+import numpy as np
 from pymilvus import connections, Collection, utility, CollectionSchema, MilvusException
 from backend.models.milvus_schema import (
     get_document_collection_schema,
@@ -18,6 +19,21 @@ from backend.models.milvus_schema import (
 
 logger = logging.getLogger(__name__)
 
+# Columns per insert (document collection schema, without auto fields)
+_INSERT_FIELD_COUNT = 13
+
+# Fields returned for search results and hydrated chunks by default
+_DEFAULT_OUTPUT_FIELDS = [
+    "id",
+    "document_id",
+    "knowledgebase_id",
+    "text",
+    "document_name",
+    "chunk_index",
+    "file_type",
+    "upload_date",
+]
+
 
 class SearchResult:
     """Represents a single search result from Milvus."""
@@ -113,6 +129,17 @@ class MilvusManager:
         self._connected = False
         self._collection_loaded = False  # Track if collection is loaded in memory
         self._load_lock = None  # Will be initialized as asyncio.Lock when needed
+        # MilvusBatchWriter per event loop, created on a loop's first insert
+        self._writers: Dict[Any, Any] = {}
+
+        # Index type / metric / size used to pick search params, refreshed
+        # in the background instead of read from Milvus on every search
+        self._search_meta: Optional[Dict[str, Any]] = None
+        self._search_meta_time = 0.0
+        self._meta_refresh_task = None
+
+        # Chunk payloads by id for hydrating ids-only search results
+        self._chunk_cache = None
 
         logger.info(
             f"MilvusManager initialized for {host}:{port}, "
@@ -270,6 +297,9 @@ class MilvusManager:
 
             # Create collection
             logger.info(f"Creating collection: {self.collection_name}")
+            self._search_meta = None
+            if self._chunk_cache is not None:
+                self._chunk_cache.clear()
             self._collection = Collection(
                 name=self.collection_name, schema=schema, using=self._connection_alias
             )
@@ -379,14 +409,51 @@ class MilvusManager:
                     logger.error(f"Failed to load collection: {e}")
                     raise
 
+    def _get_writer(self):
+        """Batched writer for this collection, bound to the running event loop."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        writer = self._writers.get(loop)
+        if writer is None:
+            from backend.config import settings
+            from backend.services.milvus_writer import MilvusBatchWriter
+
+            self._drop_closed_writers()
+            writer = self._writers[loop] = MilvusBatchWriter(
+                get_collection=self.get_collection,
+                num_fields=_INSERT_FIELD_COUNT,
+                max_batch_rows=settings.MILVUS_WRITE_BATCH_ROWS,
+                max_delay=settings.MILVUS_WRITE_MAX_DELAY_MS / 1000.0,
+                flush_interval=settings.MILVUS_FLUSH_INTERVAL,
+                name=self.collection_name,
+            )
+        return writer
+
+    def _drop_closed_writers(self) -> None:
+        """Forget writers whose event loop has been closed."""
+        for loop in [loop for loop in self._writers if loop.is_closed()]:
+            writer = self._writers.pop(loop)
+            if writer.pending_rows:
+                logger.warning(
+                    f"Event loop closed with {writer.pending_rows} rows queued "
+                    f"for '{self.collection_name}'; they were not inserted"
+                )
+
     async def insert_embeddings(
-        self, embeddings: List[List[float]], metadata: List[Dict[str, Any]]
+        self,
+        embeddings: Union[List[List[float]], np.ndarray],
+        metadata: List[Dict[str, Any]],
     ) -> List[str]:
         """
         Insert embeddings with metadata into the collection.
 
+        Rows go through the collection's batched writer, so concurrent
+        callers share inserts; returns once the rows are durable in Milvus.
+
         Args:
-            embeddings: List of embedding vectors
+            embeddings: List of embedding vectors, or a 2-D float32 ndarray
+                (passed to Milvus as row views without per-float conversion)
             metadata: List of metadata dictionaries (one per embedding)
                      Must include: id, document_id, text, chunk_index,
                      document_name, file_type, upload_date
@@ -398,7 +465,23 @@ class MilvusManager:
             ValueError: If inputs are invalid
             RuntimeError: If insertion fails
         """
-        if not embeddings:
+        future = await self.submit_embeddings(embeddings, metadata)
+        primary_keys = await future
+
+        logger.info(
+            f"Successfully inserted {len(primary_keys)} entities, "
+            f"IDs: {primary_keys[:5]}..."
+        )
+
+        return primary_keys
+
+    def _build_insert_columns(
+        self,
+        embeddings: Union[List[List[float]], np.ndarray],
+        metadata: List[Dict[str, Any]],
+    ) -> List[list]:
+        """Validate rows and convert them to column format (schema field order)."""
+        if embeddings is None or len(embeddings) == 0:
             raise ValueError("embeddings cannot be empty")
         if not metadata:
             raise ValueError("metadata cannot be empty")
@@ -409,140 +492,211 @@ class MilvusManager:
             )
 
         # Validate embedding dimensions
-        for i, emb in enumerate(embeddings):
-            if len(emb) != self.embedding_dim:
+        if isinstance(embeddings, np.ndarray):
+            if embeddings.ndim != 2 or embeddings.shape[1] != self.embedding_dim:
                 raise ValueError(
-                    f"Embedding {i} has dimension {len(emb)}, "
-                    f"expected {self.embedding_dim}"
+                    f"Embeddings have shape {embeddings.shape}, "
+                    f"expected (n, {self.embedding_dim})"
                 )
-
-        try:
-            # Ensure connection is established
-            if not self._connected:
-                logger.debug("Milvus not connected, establishing connection...")
-                self.connect()
-
-            # Ensure collection is loaded
-            await self._ensure_collection_loaded()
-
-            collection = self.get_collection()
-
-            # Prepare data for insertion
-            # Extract fields from metadata
-            ids = []
-            document_ids = []
-            knowledgebase_ids = []
-            texts = []
-            chunk_indices = []
-            document_names = []
-            file_types = []
-            upload_dates = []
-            authors = []
-            creation_dates = []
-            languages = []
-            keywords_list = []
-
-            required_fields = [
-                "id",
-                "document_id",
-                "text",
-                "chunk_index",
-                "document_name",
-                "file_type",
-                "upload_date",
-            ]
-
-            for i, meta in enumerate(metadata):
-                # Validate required fields
-                missing_fields = [f for f in required_fields if f not in meta]
-                if missing_fields:
+            # Row views of one contiguous float32 block (no Python floats)
+            embeddings = list(np.ascontiguousarray(embeddings, dtype=np.float32))
+        else:
+            for i, emb in enumerate(embeddings):
+                if len(emb) != self.embedding_dim:
                     raise ValueError(
-                        f"Metadata {i} missing required fields: {missing_fields}"
+                        f"Embedding {i} has dimension {len(emb)}, "
+                        f"expected {self.embedding_dim}"
                     )
 
-                ids.append(meta["id"])
-                document_ids.append(meta["document_id"])
-                knowledgebase_ids.append(meta.get("knowledgebase_id", ""))
-                texts.append(meta["text"])
-                chunk_indices.append(meta["chunk_index"])
-                document_names.append(meta["document_name"])
-                file_types.append(meta["file_type"])
+        # Extract fields from metadata
+        ids = []
+        document_ids = []
+        knowledgebase_ids = []
+        texts = []
+        chunk_indices = []
+        document_names = []
+        file_types = []
+        upload_dates = []
+        authors = []
+        creation_dates = []
+        languages = []
+        keywords_list = []
+
+        required_fields = [
+            "id",
+            "document_id",
+            "text",
+            "chunk_index",
+            "document_name",
+            "file_type",
+            "upload_date",
+        ]
+
+        for i, meta in enumerate(metadata):
+            # Validate required fields
+            missing_fields = [f for f in required_fields if f not in meta]
+            if missing_fields:
+                raise ValueError(
+                    f"Metadata {i} missing required fields: {missing_fields}"
+                )
+
+            ids.append(meta["id"])
+            document_ids.append(meta["document_id"])
+            knowledgebase_ids.append(meta.get("knowledgebase_id", ""))
+            texts.append(meta["text"])
+            chunk_indices.append(meta["chunk_index"])
+            document_names.append(meta["document_name"])
+            file_types.append(meta["file_type"])
+
+            # Convert upload_date to Unix timestamp if it's a string
+            upload_date = meta["upload_date"]
+            if isinstance(upload_date, str):
+                from datetime import datetime
+
+                upload_date = int(
+                    datetime.fromisoformat(
+                        upload_date.replace("Z", "+00:00")
+                    ).timestamp()
+                )
+            upload_dates.append(upload_date)
+
+            # Optional metadata fields with defaults
+            authors.append(meta.get("author", ""))
 
-                # Convert upload_date to Unix timestamp if it's a string
-                upload_date = meta["upload_date"]
-                if isinstance(upload_date, str):
-                    from datetime import datetime
+            # Convert creation_date to Unix timestamp if present
+            creation_date = meta.get("creation_date", 0)
+            if isinstance(creation_date, str):
+                from datetime import datetime
 
-                    upload_date = int(
+                try:
+                    creation_date = int(
                         datetime.fromisoformat(
-                            upload_date.replace("Z", "+00:00")
+                            creation_date.replace("Z", "+00:00")
                         ).timestamp()
                     )
-                upload_dates.append(upload_date)
-
-                # Optional metadata fields with defaults
-                authors.append(meta.get("author", ""))
-
-                # Convert creation_date to Unix timestamp if present
-                creation_date = meta.get("creation_date", 0)
-                if isinstance(creation_date, str):
-                    from datetime import datetime
-
-                    try:
-                        creation_date = int(
-                            datetime.fromisoformat(
-                                creation_date.replace("Z", "+00:00")
-                            ).timestamp()
-                        )
-                    except:
-                        creation_date = 0
-                creation_dates.append(creation_date)
-
-                languages.append(meta.get("language", ""))
-                keywords_list.append(meta.get("keywords", ""))
-
-            # Prepare data in column format (must match schema field order)
-            data = [
-                ids,
-                document_ids,
-                knowledgebase_ids,
-                texts,
-                embeddings,
-                chunk_indices,
-                document_names,
-                file_types,
-                upload_dates,
-                authors,
-                creation_dates,
-                languages,
-                keywords_list,
-            ]
+                except:
+                    creation_date = 0
+            creation_dates.append(creation_date)
+
+            languages.append(meta.get("language", ""))
+            keywords_list.append(meta.get("keywords", ""))
+
+        # Prepare data in column format (must match schema field order)
+        data = [
+            ids,
+            document_ids,
+            knowledgebase_ids,
+            texts,
+            embeddings,
+            chunk_indices,
+            document_names,
+            file_types,
+            upload_dates,
+            authors,
+            creation_dates,
+            languages,
+            keywords_list,
+        ]
+
+        return data
+
+    async def submit_embeddings(
+        self,
+        embeddings: Union[List[List[float]], np.ndarray],
+        metadata: List[Dict[str, Any]],
+    ) -> "asyncio.Future":
+        """
+        Queue embeddings for insertion without waiting for the write.
 
-            logger.info(
-                f"Inserting {len(embeddings)} embeddings into {self.collection_name}"
-            )
+        Lets a producer keep working while its rows are inserted; await the
+        returned future before relying on the rows (e.g. before indexing
+        them elsewhere).
 
-            # Insert data
-            insert_result = collection.insert(data)
+        Args:
+            embeddings: Embedding vectors (see insert_embeddings)
+            metadata: Metadata dictionaries (see insert_embeddings)
 
-            # Flush to ensure data is persisted
-            collection.flush()
+        Returns:
+            Future resolving to the inserted IDs
 
-            logger.info(
-                f"Successfully inserted {insert_result.insert_count} entities, "
-                f"IDs: {insert_result.primary_keys[:5]}..."
-            )
+        Raises:
+            ValueError: If inputs are invalid
+            RuntimeError: If the collection is unavailable
+        """
+        data = self._build_insert_columns(embeddings, metadata)
 
-            return insert_result.primary_keys
+        try:
+            # Ensure connection is established
+            if not self._connected:
+                logger.debug("Milvus not connected, establishing connection...")
+                self.connect()
 
+            # Ensure collection is loaded
+            await self._ensure_collection_loaded()
         except MilvusException as e:
             error_msg = f"Failed to insert embeddings: {str(e)}"
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error during insertion: {str(e)}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
+
+        # Rewritten chunks must not be hydrated from stale cached text
+        if self._chunk_cache is not None:
+            for chunk_id in data[0]:
+                self._chunk_cache.delete(chunk_id)
+
+        logger.debug(f"Queueing {len(data[0])} embeddings for {self.collection_name}")
+
+        return self._get_writer().submit(data)
+
+    async def flush_writes(self) -> None:
+        """Insert all rows queued on this event loop now and wait for them."""
+        import asyncio
+
+        writer = self._writers.get(asyncio.get_running_loop())
+        if writer is not None:
+            await writer.drain()
+
+    async def close_writer(self, timeout: float = 30.0) -> None:
+        """
+        Drain queued rows, flush and stop the batched writers.
+
+        Writers of other running event loops are closed on their own loop.
+
+        Args:
+            timeout: Seconds to wait for a writer on another loop
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        self._drop_closed_writers()
+        for writer_loop, writer in list(self._writers.items()):
+            try:
+                if writer_loop is loop:
+                    await writer.close()
+                elif writer_loop.is_running():
+                    future = asyncio.run_coroutine_threadsafe(writer.close(), writer_loop)
+                    await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+                elif writer.pending_rows:
+                    logger.warning(
+                        f"Event loop is not running; {writer.pending_rows} rows queued "
+                        f"for '{self.collection_name}' were not inserted"
+                    )
+            except Exception as e:
+                logger.error(f"Failed to close writer of '{self.collection_name}': {e}")
+            finally:
+                self._writers.pop(writer_loop, None)
+
+    def get_writer_stats(self) -> Dict[str, Any]:
+        """Batched writer statistics, summed over event loops (empty before the first insert)."""
+        totals: Dict[str, Any] = {}
+        for writer in self._writers.values():
+            for key, value in writer.get_stats().items():
+                if key in ("max_batch_rows_seen", "last_insert_ms"):
+                    totals[key] = max(totals.get(key, 0), value)
+                else:
+                    totals[key] = totals.get(key, 0) + value
+        if totals.get("inserts"):
+            totals["avg_batch_rows"] = round(totals["inserted_rows"] / totals["inserts"], 1)
+        return totals
 
     async def search(
         self,
@@ -550,6 +704,7 @@ class MilvusManager:
         top_k: int = 5,
         filters: Optional[str] = None,
         output_fields: Optional[List[str]] = None,
+        ids_only: bool = False,
     ) -> List[SearchResult]:
         """
         Perform similarity search in the collection.
@@ -559,6 +714,7 @@ class MilvusManager:
             top_k: Number of results to return
             filters: Optional filter expression (e.g., "document_id == 'doc123'")
             output_fields: Fields to include in results (default: all)
+            ids_only: Return only ids and scores (see search_many)
 
         Returns:
             List[SearchResult]: Search results sorted by similarity
@@ -567,16 +723,61 @@ class MilvusManager:
             ValueError: If inputs are invalid
             RuntimeError: If search fails
         """
-        if not query_embedding:
+        if query_embedding is None or len(query_embedding) == 0:
             raise ValueError("query_embedding cannot be empty")
-        if len(query_embedding) != self.embedding_dim:
-            raise ValueError(
-                f"Query embedding dimension {len(query_embedding)} "
-                f"does not match expected {self.embedding_dim}"
-            )
+
+        results = await self.search_many(
+            [query_embedding],
+            top_k=top_k,
+            filters=filters,
+            output_fields=output_fields,
+            ids_only=ids_only,
+        )
+        return results[0]
+
+    async def search_many(
+        self,
+        embeddings: Union[List[List[float]], np.ndarray],
+        top_k: int = 5,
+        filters: Optional[str] = None,
+        output_fields: Optional[List[str]] = None,
+        ids_only: bool = False,
+    ) -> List[List[SearchResult]]:
+        """
+        Search several query vectors in one Milvus request.
+
+        Args:
+            embeddings: Query vectors (list of vectors or 2-D array)
+            top_k: Number of results to return per query
+            filters: Optional filter expression applied to every query
+            output_fields: Fields to include in results (default: all)
+            ids_only: Return only ids and scores (text is None) so that
+                candidates cut by fusion/reranking are never transferred;
+                fill in the survivors with hydrate()
+
+        Returns:
+            One list of SearchResult per query, in input order
+
+        Raises:
+            ValueError: If inputs are invalid
+            RuntimeError: If search fails
+        """
+        import asyncio
+
+        if embeddings is None or len(embeddings) == 0:
+            raise ValueError("embeddings cannot be empty")
+        for embedding in embeddings:
+            if len(embedding) != self.embedding_dim:
+                raise ValueError(
+                    f"Query embedding dimension {len(embedding)} "
+                    f"does not match expected {self.embedding_dim}"
+                )
         if top_k <= 0:
             raise ValueError("top_k must be positive")
 
+        if isinstance(embeddings, np.ndarray):
+            embeddings = embeddings.astype(np.float32, copy=False).tolist()
+
         try:
             # Ensure connection is established
             if not self._connected:
@@ -588,51 +789,29 @@ class MilvusManager:
             # Ensure collection is loaded (only once, thread-safe)
             await self._ensure_collection_loaded()
 
-            # Default output fields
-            if output_fields is None:
-                output_fields = [
-                    "id",
-                    "document_id",
-                    "knowledgebase_id",
-                    "text",
-                    "document_name",
-                    "chunk_index",
-                    "file_type",
-                    "upload_date",
-                ]
+            # Default output fields (the primary key is always returned)
+            if ids_only:
+                output_fields = []
+            elif output_fields is None:
+                output_fields = _DEFAULT_OUTPUT_FIELDS
 
-            # Get collection size and index info for optimal search params
-            collection_size = collection.num_entities
-            index_info = collection.indexes[0] if collection.indexes else None
-
-            # Extract index type and metric type from existing index
-            if index_info:
-                index_type = index_info.params.get("index_type", "HNSW")
-                # IMPORTANT: Use the same metric_type as the index
-                metric_type = index_info.params.get("metric_type", "COSINE")
-                logger.debug(
-                    f"Using existing index: type={index_type}, metric={metric_type}"
-                )
-            else:
-                # Fallback to defaults if no index exists
-                index_type = "HNSW"
-                metric_type = "COSINE"
-                logger.warning(
-                    f"No index found, using defaults: type={index_type}, metric={metric_type}"
-                )
+            meta = await self._get_search_meta(collection)
 
             # Search parameters (must match index metric_type)
-            search_params = get_search_params(index_type, collection_size, metric_type)
+            search_params = get_search_params(
+                meta["index_type"], meta["num_entities"], meta["metric_type"]
+            )
 
             filter_str = f" with filters: {filters}" if filters else ""
             logger.info(
-                f"Searching for top {top_k} results (index: {index_type}, size: {collection_size})"
-                f"{filter_str}"
+                f"Searching {len(embeddings)} queries for top {top_k} results "
+                f"(index: {meta['index_type']}, size: {meta['num_entities']}){filter_str}"
             )
 
-            # Perform search
-            search_results = collection.search(
-                data=[query_embedding],
+            # One request for all query vectors, off the event loop
+            search_results = await asyncio.to_thread(
+                collection.search,
+                data=embeddings,
                 anns_field="embedding",
                 param=search_params,
                 limit=top_k,
@@ -640,31 +819,29 @@ class MilvusManager:
                 output_fields=output_fields,
             )
 
-            # Parse results
-            results = []
-            for hits in search_results:
-                for hit in hits:
-                    result = SearchResult(
-                        id=hit.entity.get("id"),
-                        document_id=hit.entity.get("document_id"),
-                        text=hit.entity.get("text"),
-                        score=hit.score,
-                        document_name=hit.entity.get("document_name"),
-                        chunk_index=hit.entity.get("chunk_index"),
-                        metadata={
-                            "filename": hit.entity.get("document_name"),
-                            "document_name": hit.entity.get("document_name"),
-                            "chunk_index": hit.entity.get("chunk_index"),
-                            "file_type": hit.entity.get("file_type"),
-                            "upload_date": hit.entity.get("upload_date"),
-                            "page_number": hit.entity.get("page_number"),
-                            "line_number": hit.entity.get("line_number"),
-                        },
-                    )
-                    results.append(result)
+            if ids_only:
+                results = [
+                    [
+                        SearchResult(
+                            id=hit.id,
+                            document_id=None,
+                            text=None,
+                            score=hit.score,
+                            document_name=None,
+                            chunk_index=None,
+                        )
+                        for hit in hits
+                    ]
+                    for hits in search_results
+                ]
+            else:
+                results = [
+                    [self._result_from_entity(hit.entity, hit.score) for hit in hits]
+                    for hits in search_results
+                ]
 
             # Use DEBUG for search results count (too frequent for INFO)
-            logger.debug(f"Search returned {len(results)} results")
+            logger.debug(f"Search returned {sum(len(r) for r in results)} results")
 
             return results
 
@@ -677,6 +854,226 @@ class MilvusManager:
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    @staticmethod
+    def _result_from_entity(entity, score: float) -> SearchResult:
+        """Build a SearchResult from a Milvus entity (hit.entity or query row)."""
+        return SearchResult(
+            id=entity.get("id"),
+            document_id=entity.get("document_id"),
+            text=entity.get("text"),
+            score=score,
+            document_name=entity.get("document_name"),
+            chunk_index=entity.get("chunk_index"),
+            metadata={
+                "filename": entity.get("document_name"),
+                "document_name": entity.get("document_name"),
+                "chunk_index": entity.get("chunk_index"),
+                "file_type": entity.get("file_type"),
+                "upload_date": entity.get("upload_date"),
+                "page_number": entity.get("page_number"),
+                "line_number": entity.get("line_number"),
+            },
+        )
+
+    def _get_chunk_cache(self):
+        if self._chunk_cache is None:
+            from backend.config import settings
+            from backend.core.performance import LRUCache
+
+            self._chunk_cache = LRUCache(max_size=settings.MILVUS_CHUNK_CACHE_SIZE)
+        return self._chunk_cache
+
+    async def fetch_chunks(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get chunk payloads by id (chunk LRU first, then one batched query).
+
+        Args:
+            ids: Chunk ids
+
+        Returns:
+            Dictionary mapping found ids to their fields
+
+        Raises:
+            RuntimeError: If the query fails
+        """
+        import asyncio
+        import json
+
+        cache = self._get_chunk_cache()
+        chunks: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for chunk_id in dict.fromkeys(ids):
+            entity = cache.get(chunk_id)
+            if entity is None:
+                missing.append(chunk_id)
+            else:
+                chunks[chunk_id] = entity
+
+        if not missing:
+            return chunks
+
+        try:
+            collection = self.get_collection()
+            rows = await asyncio.to_thread(
+                collection.query,
+                expr=f"id in {json.dumps(missing)}",
+                output_fields=_DEFAULT_OUTPUT_FIELDS,
+            )
+        except Exception as e:
+            error_msg = f"Failed to fetch {len(missing)} chunks: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        for row in rows:
+            chunks[row["id"]] = row
+            cache.set(row["id"], row)
+
+        logger.debug(
+            f"Hydrated {len(ids)} chunks: {len(ids) - len(missing)} cached, "
+            f"{len(rows)} fetched"
+        )
+        return chunks
+
+    async def hydrate(self, results: List[SearchResult]) -> List[SearchResult]:
+        """
+        Fill in text and metadata of ids-only search results.
+
+        Args:
+            results: Results from search/search_many with ids_only=True
+                (already hydrated results are kept as they are)
+
+        Returns:
+            The results in the same order; chunks deleted since the search
+            are dropped
+        """
+        pending = [r.id for r in results if r.text is None]
+        if not pending:
+            return results
+
+        chunks = await self.fetch_chunks(pending)
+        hydrated = []
+        for result in results:
+            if result.text is not None:
+                hydrated.append(result)
+            elif result.id in chunks:
+                hydrated.append(self._result_from_entity(chunks[result.id], result.score))
+        return hydrated
+
+    async def _get_search_meta(self, collection: Collection) -> Dict[str, Any]:
+        """
+        Cached index type, metric type and entity count for search params.
+
+        Reads Milvus only on first use; afterwards a stale entry is served
+        while a background task refreshes it.
+        """
+        import asyncio
+        from backend.config import settings
+
+        if self._search_meta is None:
+            self._search_meta = await asyncio.to_thread(self._read_search_meta, collection)
+            self._search_meta_time = time.monotonic()
+        elif (
+            time.monotonic() - self._search_meta_time
+            > settings.MILVUS_METADATA_REFRESH_INTERVAL
+            and (self._meta_refresh_task is None or self._meta_refresh_task.done())
+        ):
+            self._meta_refresh_task = asyncio.create_task(
+                self._refresh_search_meta(collection)
+            )
+
+        return self._search_meta
+
+    async def _refresh_search_meta(self, collection: Collection) -> None:
+        import asyncio
+
+        try:
+            self._search_meta = await asyncio.to_thread(self._read_search_meta, collection)
+        except Exception as e:
+            logger.warning(f"Failed to refresh search metadata: {e}")
+        # Retry after the interval on failure too, not on every search
+        self._search_meta_time = time.monotonic()
+
+    @staticmethod
+    def _read_search_meta(collection: Collection) -> Dict[str, Any]:
+        """Read index and size information from Milvus (blocking)."""
+        indexes = collection.indexes
+        if indexes:
+            index_type = indexes[0].params.get("index_type", "HNSW")
+            # IMPORTANT: Use the same metric_type as the index
+            metric_type = indexes[0].params.get("metric_type", "COSINE")
+            logger.debug(f"Using existing index: type={index_type}, metric={metric_type}")
+        else:
+            # Fallback to defaults if no index exists
+            index_type = "HNSW"
+            metric_type = "COSINE"
+            logger.warning(
+                f"No index found, using defaults: type={index_type}, metric={metric_type}"
+            )
+
+        return {
+            "index_type": index_type,
+            "metric_type": metric_type,
+            "num_entities": collection.num_entities,
+        }
+
+    async def iter_chunks(
+        self,
+        filters: Optional[str] = None,
+        output_fields: Optional[List[str]] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Page through stored chunks with a query iterator.
+
+        Unlike search with a dummy vector, this has no top_k cap and does no
+        similarity computation. Iterator calls run in a worker thread.
+
+        Args:
+            filters: Optional filter expression
+            output_fields: Fields to return (default: id, document_id, text)
+            batch_size: Rows per page
+
+        Yields:
+            Lists of row dictionaries
+
+        Raises:
+            RuntimeError: If the query fails
+        """
+        import asyncio
+
+        if output_fields is None:
+            output_fields = ["id", "document_id", "text"]
+
+        try:
+            await self._ensure_collection_loaded()
+            collection = self.get_collection()
+            iterator = await asyncio.to_thread(
+                collection.query_iterator,
+                batch_size=batch_size,
+                expr=filters or "",
+                output_fields=output_fields,
+            )
+        except MilvusException as e:
+            error_msg = f"Chunk query failed: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        def next_page() -> List[Dict[str, Any]]:
+            return [dict(row) for row in iterator.next() or []]
+
+        try:
+            while True:
+                batch = await asyncio.to_thread(next_page)
+                if not batch:
+                    break
+                yield batch
+        except MilvusException as e:
+            error_msg = f"Chunk query failed: {str(e)}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+        finally:
+            await asyncio.to_thread(iterator.close)
+
     async def delete_by_document_id(self, document_id: str) -> int:
         """
         Delete all chunks belonging to a specific document.
@@ -695,6 +1092,9 @@ class MilvusManager:
             raise ValueError("document_id cannot be empty")
 
         try:
+            # Queued rows of this document must be inserted before deleting
+            await self.flush_writes()
+
             collection = self.get_collection()
 
             # Build filter expression
@@ -714,6 +1114,10 @@ class MilvusManager:
             # Delete by expression
             collection.delete(expr)
 
+            if self._chunk_cache is not None:
+                for row in query_results:
+                    self._chunk_cache.delete(row["id"])
+
             # Flush to ensure deletion is persisted
             collection.flush()
 
@@ -0,0 +1,276 @@
+"""
+Milvus Batch Writer
+
+Asynchronous, batched insert path for one Milvus collection.
+
+Callers submit column-format rows and get a future back. Rows from all
+callers (e.g. the documents of a batch upload) are appended to shared
+column buffers; a background task inserts the buffer in a worker thread
+once it reaches ``max_batch_rows`` or the oldest row has waited
+``max_delay`` seconds. Each future resolves with its primary keys when the
+insert carrying its rows is acknowledged - at that point Milvus has the rows
+in its write-ahead log and they are durable and searchable. If a combined
+insert fails, its submissions are retried one by one, so only the
+submission with bad rows fails.
+
+No flush is forced per insert (that seals a small segment every time);
+segments are sealed by Milvus auto-flush, plus an optional periodic flush
+every ``flush_interval`` seconds while new rows arrive.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MilvusBatchWriter:
+    """Coalesces inserts into one collection into large batched writes."""
+
+    def __init__(
+        self,
+        get_collection: Callable[[], Any],
+        num_fields: int,
+        max_batch_rows: int = 2048,
+        max_delay: float = 0.02,
+        flush_interval: float = 60.0,
+        name: str = "milvus",
+    ):
+        """
+        Initialize the writer (bound to the running event loop).
+
+        Args:
+            get_collection: Returns the pymilvus Collection (called in the
+                worker thread)
+            num_fields: Number of columns per insert
+            max_batch_rows: Insert once this many rows are buffered
+            max_delay: Max seconds a row waits in the buffer
+            flush_interval: Seconds between flushes while rows arrive
+                (0 = rely on Milvus auto-flush)
+            name: Collection name for logging
+        """
+        self._get_collection = get_collection
+        self.num_fields = num_fields
+        self.max_batch_rows = max_batch_rows
+        self.max_delay = max_delay
+        self.flush_interval = flush_interval
+        self.name = name
+
+        self.loop = asyncio.get_running_loop()
+        self._columns: List[list] = [[] for _ in range(num_fields)]
+        # (future, row count) per submission, in buffer order
+        self._waiters: List[Tuple[asyncio.Future, int]] = []
+        self._oldest: Optional[float] = None
+        self._wake = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._rows_since_flush = 0
+        self._last_flush = time.monotonic()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.stats = {
+            "submissions": 0,
+            "rows": 0,
+            "inserts": 0,
+            "inserted_rows": 0,
+            "failed_inserts": 0,
+            "retried_submissions": 0,
+            "flushes": 0,
+            "max_batch_rows_seen": 0,
+            "last_insert_ms": 0.0,
+        }
+
+    @property
+    def pending_rows(self) -> int:
+        """Rows buffered and not yet sent to Milvus."""
+        return len(self._columns[0]) if self._columns else 0
+
+    def submit(self, columns: List[list]) -> asyncio.Future:
+        """
+        Queue rows for insertion (never blocks).
+
+        Args:
+            columns: One list per field, all of the same length
+
+        Returns:
+            Future resolving to the inserted primary keys, or raising
+            RuntimeError if the insert failed
+        """
+        if self._closed:
+            raise RuntimeError(f"Milvus writer for '{self.name}' is closed")
+        if len(columns) != self.num_fields:
+            raise ValueError(f"Expected {self.num_fields} columns, got {len(columns)}")
+
+        count = len(columns[0])
+        future = self.loop.create_future()
+        if count == 0:
+            future.set_result([])
+            return future
+
+        for buffer, column in zip(self._columns, columns):
+            buffer.extend(column)
+        self._waiters.append((future, count))
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+
+        self.stats["submissions"] += 1
+        self.stats["rows"] += count
+        self._idle.clear()
+
+        if self._task is None or self._task.done():
+            self._task = self.loop.create_task(self._run())
+        if self.pending_rows >= self.max_batch_rows:
+            self._wake.set()
+
+        return future
+
+    async def _run(self) -> None:
+        """Insert buffered rows by size or age until the buffer is empty."""
+        try:
+            while self._waiters:
+                delay = self.max_delay - (time.monotonic() - self._oldest)
+                if delay > 0 and self.pending_rows < self.max_batch_rows:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                self._wake.clear()
+                await self._insert_buffer()
+        finally:
+            if not self._waiters:
+                self._idle.set()
+
+    async def _insert_buffer(self) -> None:
+        columns, self._columns = self._columns, [[] for _ in range(self.num_fields)]
+        waiters, self._waiters = self._waiters, []
+        self._oldest = None
+        rows = len(columns[0])
+
+        start = time.perf_counter()
+        try:
+            primary_keys = await asyncio.to_thread(self._insert, columns)
+        except Exception as e:
+            self.stats["failed_inserts"] += 1
+            if len(waiters) == 1:
+                logger.error(f"Batched insert of {rows} rows into '{self.name}' failed: {e}")
+                self._fail(waiters[0][0], e)
+                return
+            # Don't fail every caller for one bad submission: retry them one by one
+            logger.warning(
+                f"Batched insert of {rows} rows from {len(waiters)} submissions into "
+                f"'{self.name}' failed ({e}); retrying submissions separately"
+            )
+            await self._insert_each(columns, waiters)
+            return
+
+        self._record_insert(rows, start)
+        logger.debug(
+            f"Inserted {rows} rows from {len(waiters)} submission(s) into '{self.name}' "
+            f"in {self.stats['last_insert_ms']}ms"
+        )
+
+        offset = 0
+        for future, count in waiters:
+            if not future.done():
+                future.set_result(primary_keys[offset : offset + count])
+            offset += count
+
+        self._maybe_flush()
+
+    async def _insert_each(
+        self, columns: List[list], waiters: List[Tuple[asyncio.Future, int]]
+    ) -> None:
+        """Insert each submission of a failed batch on its own."""
+        offset = 0
+        for future, count in waiters:
+            part = [column[offset : offset + count] for column in columns]
+            offset += count
+            self.stats["retried_submissions"] += 1
+
+            start = time.perf_counter()
+            try:
+                primary_keys = await asyncio.to_thread(self._insert, part)
+            except Exception as e:
+                self.stats["failed_inserts"] += 1
+                logger.error(f"Insert of {count} rows into '{self.name}' failed: {e}")
+                self._fail(future, e)
+                continue
+
+            self._record_insert(count, start)
+            if not future.done():
+                future.set_result(primary_keys)
+
+        self._maybe_flush()
+
+    def _record_insert(self, rows: int, start: float) -> None:
+        """Count an acknowledged insert."""
+        self.stats["inserts"] += 1
+        self.stats["inserted_rows"] += rows
+        self.stats["max_batch_rows_seen"] = max(self.stats["max_batch_rows_seen"], rows)
+        self.stats["last_insert_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        self._rows_since_flush += rows
+
+    @staticmethod
+    def _fail(future: asyncio.Future, error: Exception) -> None:
+        if not future.done():
+            future.set_exception(RuntimeError(f"Failed to insert embeddings: {error}"))
+
+    def _insert(self, columns: List[list]) -> List[Any]:
+        """Insert one batch (worker thread)."""
+        result = self._get_collection().insert(columns)
+        return list(result.primary_keys)
+
+    def _maybe_flush(self) -> None:
+        """Start a background flush if flush_interval has passed since the last one."""
+        if self.flush_interval <= 0 or not self._rows_since_flush:
+            return
+        if time.monotonic() - self._last_flush < self.flush_interval:
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        self._flush_task = self.loop.create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Seal inserted rows into persisted segments (collection.flush)."""
+        self._rows_since_flush = 0
+        self._last_flush = time.monotonic()
+        try:
+            await asyncio.to_thread(lambda: self._get_collection().flush())
+            self.stats["flushes"] += 1
+        except Exception as e:
+            logger.warning(f"Periodic flush of '{self.name}' failed: {e}")
+
+    async def drain(self) -> None:
+        """Insert everything buffered now and wait until it is acknowledged."""
+        if self._waiters:
+            self._wake.set()
+        await self._idle.wait()
+
+    async def close(self, flush: bool = True) -> None:
+        """
+        Drain the buffer and stop accepting rows.
+
+        Args:
+            flush: Also flush rows inserted since the last flush
+        """
+        await self.drain()
+        self._closed = True
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        if flush and self._rows_since_flush:
+            await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer statistics."""
+        inserts = self.stats["inserts"]
+        return {
+            **self.stats,
+            "pending_rows": self.pending_rows,
+            "pending_submissions": len(self._waiters),
+            "avg_batch_rows": round(self.stats["inserted_rows"] / inserts, 1) if inserts else 0.0,
+        }
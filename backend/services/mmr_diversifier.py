@@ -2,8 +2,6 @@
 import logging
 import numpy as np
 from typing import List, Dict, Any, Optional
-import torch
-from sentence_transformers import util
 
 logger = logging.getLogger(__name__)
 
@@ -70,49 +68,34 @@ class MMRDiversifier:
                 # Fallback: use scores only
                 return self._diversify_by_scores(results, top_k, lambda_val)
 
-            # Convert to tensors
-            query_tensor = torch.tensor(query_emb).unsqueeze(0)
-            result_tensors = torch.tensor(result_embs)
+            # One float32 matrix (zero-copy for ndarray embeddings)
+            query_vec = _normalize_rows(np.asarray(query_emb, dtype=np.float32)[None, :])[0]
+            result_matrix = _normalize_rows(np.asarray(result_embs, dtype=np.float32))
 
-            # Calculate relevance scores
-            relevance_scores = util.cos_sim(query_tensor, result_tensors)[0]
+            # Relevance to query (cosine similarity)
+            relevance_scores = result_matrix @ query_vec
 
-            # MMR selection
+            # MMR selection, tracking each candidate's max similarity to the
+            # selected set incrementally (one matvec per pick)
             selected_indices = []
-            remaining_indices = list(range(len(results)))
+            max_sim = np.zeros(len(results), dtype=np.float32)
+            available = np.ones(len(results), dtype=bool)
 
             # Select first result (highest relevance)
-            first_idx = int(torch.argmax(relevance_scores))
+            first_idx = int(np.argmax(relevance_scores))
             selected_indices.append(first_idx)
-            remaining_indices.remove(first_idx)
+            available[first_idx] = False
+            np.maximum(max_sim, result_matrix @ result_matrix[first_idx], out=max_sim)
 
             # Select remaining results using MMR
-            while len(selected_indices) < top_k and remaining_indices:
-                mmr_scores = []
-
-                for idx in remaining_indices:
-                    # Relevance to query
-                    relevance = float(relevance_scores[idx])
-
-                    # Max similarity to already selected results
-                    max_sim = 0.0
-                    for selected_idx in selected_indices:
-                        sim = float(
-                            util.cos_sim(
-                                result_tensors[idx].unsqueeze(0),
-                                result_tensors[selected_idx].unsqueeze(0),
-                            )[0][0]
-                        )
-                        max_sim = max(max_sim, sim)
-
-                    # MMR score
-                    mmr_score = lambda_val * relevance - (1 - lambda_val) * max_sim
-                    mmr_scores.append((idx, mmr_score))
-
-                # Select result with highest MMR score
-                best_idx, best_score = max(mmr_scores, key=lambda x: x[1])
+            while len(selected_indices) < top_k and available.any():
+                mmr_scores = lambda_val * relevance_scores - (1 - lambda_val) * max_sim
+                mmr_scores[~available] = -np.inf
+
+                best_idx = int(np.argmax(mmr_scores))
                 selected_indices.append(best_idx)
-                remaining_indices.remove(best_idx)
+                available[best_idx] = False
+                np.maximum(max_sim, result_matrix @ result_matrix[best_idx], out=max_sim)
 
             # Return selected results
             diversified = [results[idx] for idx in selected_indices]
@@ -263,6 +246,13 @@ class MMRDiversifier:
             return 0.0
 
 
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
 # Global diversifier instance
 _mmr_diversifier: Optional[MMRDiversifier] = None
 
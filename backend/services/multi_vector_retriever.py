@@ -1,10 +1,13 @@
 # Multi-Vector Retrieval - Multiple perspectives for better recall
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, Tuple
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+_VECTOR_ID_PATTERN = re.compile(r"^(.*)_(original|summary|keypoints|questions_\d+)$")
+
 
 class MultiVectorRetriever:
     """
@@ -258,20 +261,25 @@ Key points:"""
             query_vector = await self.embedding_service.embed(query)
 
             # Search in Milvus
-            results = await self.milvus_manager.search(
-                query_vectors=[query_vector],
+            results = await self.milvus_manager.search_many(
+                [query_vector],
                 top_k=top_k * 3,  # Get more for aggregation
-                output_fields=["chunk_id", "document_id", "text", "vector_type"],
+                output_fields=["id", "document_id", "text"],
             )
 
             # Aggregate by chunk_id
             chunk_scores = {}
             chunk_data = {}
 
-            for result in results[0]:  # First query results
-                chunk_id = result.get("chunk_id")
-                score = result.get("score", 0.0)
-                vector_type = result.get("vector_type", "original")
+            for hit in results[0]:  # First query results
+                chunk_id, vector_type = self._split_vector_id(hit.id)
+                score = hit.score
+                result = {
+                    "chunk_id": chunk_id,
+                    "document_id": hit.document_id,
+                    "text": hit.text,
+                    "vector_type": vector_type,
+                }
 
                 # Filter by vector type if specified
                 if vector_types and not any(vt in vector_type for vt in vector_types):
@@ -313,6 +321,14 @@ Key points:"""
             logger.error(f"Multi-vector search failed: {e}")
             return []
 
+    @staticmethod
+    def _split_vector_id(vector_id: str) -> Tuple[str, str]:
+        """Split a stored id ("{chunk_id}_{vector_type}") into its parts."""
+        match = _VECTOR_ID_PATTERN.match(str(vector_id))
+        if not match:
+            return str(vector_id), "original"
+        return match.group(1), match.group(2)
+
     def get_stats(self) -> Dict[str, Any]:
         """Get multi-vector statistics"""
         return {
@@ -1,17 +1,44 @@
 # Persistent BM25 Index Service
 """
-Persistent BM25 index using pickle for serialization.
+Persistent BM25 index stored as memory-mapped segment files.
 
 This service provides disk-based BM25 indexing to avoid re-indexing on restart.
-Uses pickle for fast serialization/deserialization.
+Each segment is an immutable binary file (see bm25_mmap) opened through mmap,
+so startup only reads a small JSON manifest and uvicorn workers share the
+index pages through the OS page cache. Segment files and the manifest are
+written to a temp file and renamed into place.
+
+Every worker process may update and save the index. A save holds an
+exclusive lock on ``writer.lock`` (loads take a shared one) and bumps the
+manifest generation; if another process saved since this one loaded, the
+save first reopens the on-disk index and replays its own unsaved adds and
+deletes on top, so no worker overwrites another's changes. Workers without
+unsaved changes pick up a newer manifest within ``reload_interval`` seconds.
 """
 
+import asyncio
+import json
 import logging
 import pickle
 import os
-from typing import List, Dict, Tuple, Optional
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, List, Dict, Tuple, Optional
 from pathlib import Path
-from backend.services.bm25_search import BM25
+from backend.services.bm25_search import BM25, BM25Segment, SegmentedBM25
+from backend.services.bm25_mmap import (
+    SEGMENT_SUFFIX,
+    MmapBM25Segment,
+    write_segment,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, assume a single process
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
@@ -23,15 +50,17 @@ class PersistentBM25Service:
     Features:
     - Automatic index persistence to disk
     - Fast loading on startup
-    - Incremental updates
-    - Index versioning
+    - Incremental updates (append-only segments, tombstone deletes)
+    - Background segment merges
+    - Index versioning (manifest generations shared by all worker processes)
     """
 
     def __init__(
         self,
         index_path: str = "./data/bm25_index",
         auto_save: bool = True,
-        save_interval: int = 100  # Save every N documents
+        save_interval: int = 100,  # Save every N documents
+        reload_interval: float = 5.0  # Seconds between manifest change checks
     ):
         """
         Initialize Persistent BM25 Service.
@@ -40,25 +69,47 @@ class PersistentBM25Service:
             index_path: Directory path for storing index files
             auto_save: Automatically save index after updates
             save_interval: Number of documents between auto-saves
+            reload_interval: Seconds between checks for a manifest saved by
+                another process
         """
         self.index_path = Path(index_path)
         self.auto_save = auto_save
         self.save_interval = save_interval
+        self.reload_interval = reload_interval
         
         # Create index directory if it doesn't exist
         self.index_path.mkdir(parents=True, exist_ok=True)
         
         # Index files
+        self.manifest_file = self.index_path / "manifest.json"
+        self.lock_file = self.index_path / "writer.lock"
+        
+        # Segment files listed in the manifest this process loaded or wrote
+        self._segment_files: set = set()
+        
+        # Generation and (mtime, size) of the manifest this process loaded or wrote
+        self._generation = 0
+        self._manifest_stamp: Optional[Tuple[int, int]] = None
+        self._last_reload_check = time.monotonic()
+        
+        # Changes not saved yet, replayed if another process saved first:
+        # ("reset", None), ("add", (corpus, doc_ids)) or ("delete", doc_ids)
+        self._pending_ops: List[Tuple[str, Any]] = []
+        self._save_mutex = threading.Lock()
+        self._persist_lock = asyncio.Lock()
+        
+        # Pickle files written by earlier versions (migrated on load)
         self.index_file = self.index_path / "bm25_index.pkl"
         self.metadata_file = self.index_path / "metadata.pkl"
         
-        # BM25 instance
-        self.bm25: Optional[BM25] = None
+        # Segmented BM25 instance
+        self.bm25: Optional[SegmentedBM25] = None
         self.indexed = False
+        self._merge_task: Optional[asyncio.Task] = None
         
         # Metadata
         self.metadata = {
-            "version": "1.0",
+            "version": "3.0",
             "num_docs": 0,
             "last_updated": None,
             "doc_count_since_save": 0
@@ -70,9 +121,77 @@ class PersistentBM25Service:
         logger.info(
             f"PersistentBM25Service initialized: "
             f"index_path={index_path}, indexed={self.indexed}, "
-            f"docs={self.metadata['num_docs']}"
+            f"docs={self.metadata['num_docs']}, generation={self._generation}"
         )
 
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """
+        Hold the index directory lock (exclusive for saves, shared for loads).
+        
+        Args:
+            exclusive: Take the lock exclusively
+        """
+        if fcntl is None:
+            yield
+            return
+        
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)
+
+    def _manifest_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.manifest_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_manifest(self) -> Optional[Dict]:
+        """Read the manifest (caller holds the directory lock)."""
+        if not self.manifest_file.exists():
+            return None
+        with open(self.manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _open_index(self, manifest: Dict) -> SegmentedBM25:
+        """Open the segments of a manifest through mmap (caller holds the directory lock)."""
+        segments = [
+            BM25Segment(
+                index=MmapBM25Segment(self.index_path / entry["name"]),
+                deleted=set(entry.get("deleted", [])),
+                name=entry["name"],
+            )
+            for entry in manifest["segments"]
+        ]
+        return SegmentedBM25.from_segments(segments, k1=manifest["k1"], b=manifest["b"])
+
+    def _read_index(self) -> Optional[Tuple[SegmentedBM25, Dict, Optional[Tuple[int, int]]]]:
+        """
+        Open the on-disk index (blocking).
+        
+        Returns:
+            (index, manifest, manifest stamp), or None if there is no manifest
+        """
+        with self._locked(exclusive=False):
+            manifest = self._read_manifest()
+            if manifest is None:
+                return None
+            return self._open_index(manifest), manifest, self._manifest_stat()
+
+    def _adopt(self, bm25: SegmentedBM25, manifest: Dict, stamp: Optional[Tuple[int, int]]):
+        """Make a loaded on-disk index the current one."""
+        self.bm25 = bm25
+        self.indexed = bool(bm25.segments)
+        self._segment_files = {entry["name"] for entry in manifest["segments"]}
+        self._generation = manifest.get("generation", 0)
+        self._manifest_stamp = stamp
+        self.metadata.update(manifest.get("metadata", {}))
+        self.metadata['num_docs'] = bm25.num_docs
+
     def _load_index(self) -> bool:
         """
         Load BM25 index from disk.
@@ -81,23 +200,20 @@ class PersistentBM25Service:
             bool: True if index was loaded successfully
         """
         try:
-            if not self.index_file.exists():
+            loaded = self._read_index()
+            if loaded is None:
+                if self.index_file.exists():
+                    return self._load_legacy_index()
                 logger.info("No existing BM25 index found")
                 return False
             
-            # Load BM25 index
-            with open(self.index_file, 'rb') as f:
-                self.bm25 = pickle.load(f)
-            
-            # Load metadata
-            if self.metadata_file.exists():
-                with open(self.metadata_file, 'rb') as f:
-                    self.metadata = pickle.load(f)
-            
-            self.indexed = True
+            # Segment files are mapped; nothing is deserialized here
+            self._adopt(*loaded)
             
             logger.info(
-                f"Loaded BM25 index: {self.metadata['num_docs']} documents, "
+                f"Loaded BM25 index: {self.metadata['num_docs']} documents "
+                f"in {len(self.bm25.segments)} segments, "
+                f"generation {self._generation}, "
                 f"last updated: {self.metadata['last_updated']}"
             )
             
@@ -110,41 +226,225 @@ class PersistentBM25Service:
             self.indexed = False
             return False
 
-    def _save_index(self) -> bool:
+    async def _maybe_reload(self):
+        """Pick up a manifest saved by another process (at most every reload_interval)."""
+        now = time.monotonic()
+        if now - self._last_reload_check < self.reload_interval:
+            return
+        self._last_reload_check = now
+        
+        # With unsaved changes, the next save rebases onto the newer manifest
+        if self._pending_ops or self._persist_lock.locked():
+            return
+        stamp = self._manifest_stat()
+        if stamp is None or stamp == self._manifest_stamp:
+            return
+        
+        try:
+            loaded = await asyncio.to_thread(self._read_index)
+        except Exception as e:
+            logger.error(f"Failed to reload BM25 index: {e}")
+            return
+        
+        if loaded is None or self._pending_ops or self._persist_lock.locked():
+            return
+        if loaded[1].get("generation", 0) != self._generation:
+            self._adopt(*loaded)
+            logger.info(
+                f"Reloaded BM25 index generation {self._generation}: "
+                f"{self.metadata['num_docs']} documents"
+            )
+        else:
+            self._manifest_stamp = loaded[2]
+
+    def _load_legacy_index(self) -> bool:
+        """Load a pickled index from an earlier version and rewrite it as segments."""
+        with open(self.index_file, 'rb') as f:
+            legacy = pickle.load(f)
+        
+        self.bm25 = self._migrate_legacy_index(legacy)
+        self.metadata['num_docs'] = self.bm25.num_docs
+        self.indexed = True
+        
+        if self._save():
+            self.index_file.unlink()
+            if self.metadata_file.exists():
+                self.metadata_file.unlink()
+        
+        logger.info(f"Migrated pickled BM25 index: {self.metadata['num_docs']} documents")
+        return True
+
+    @staticmethod
+    def _apply_op(bm25: Optional[SegmentedBM25], op: Tuple[str, Any]) -> SegmentedBM25:
+        """Apply one recorded change to an index (returns the resulting index)."""
+        kind, payload = op
+        if kind == "reset" or bm25 is None:
+            bm25 = SegmentedBM25()
+        if kind == "add":
+            bm25.add(*payload)
+        elif kind == "delete":
+            bm25.delete(payload)
+        return bm25
+
+    def _save_index(
+        self, bm25: Optional[SegmentedBM25], ops: List[Tuple[str, Any]]
+    ) -> Optional[SegmentedBM25]:
         """
-        Save BM25 index to disk.
+        Save BM25 index to disk (blocking).
+        
+        Under the exclusive directory lock: if another process saved since
+        this one loaded, the on-disk index is reopened and ``ops`` are
+        replayed on it. Segments that are not on disk yet are written under
+        unique names (and reopened through mmap), then the manifest is
+        replaced atomically with the next generation. Segment files the new
+        manifest no longer references, e.g. after a merge, are removed.
+        
+        Args:
+            bm25: Index to save
+            ops: Changes made since the last save
         
         Returns:
-            bool: True if index was saved successfully
+            The index that was saved (``bm25`` or the rebased index), or None on failure
         """
         try:
-            if self.bm25 is None:
-                logger.warning("No BM25 index to save")
-                return False
-            
-            # Save BM25 index
-            with open(self.index_file, 'wb') as f:
-                pickle.dump(self.bm25, f, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._save_mutex, self._locked(exclusive=True):
+                manifest = self._read_manifest()
+                generation = manifest.get("generation", 0) if manifest else 0
+                on_disk = {entry["name"] for entry in manifest["segments"]} if manifest else set()
+                
+                if generation != self._generation:
+                    # Another process saved since we loaded: rebase our changes
+                    logger.info(
+                        f"BM25 index generation {generation} on disk "
+                        f"(loaded {self._generation}), replaying {len(ops)} changes"
+                    )
+                    bm25 = self._open_index(manifest) if manifest else None
+                    for op in ops:
+                        bm25 = self._apply_op(bm25, op)
+                if bm25 is None:
+                    bm25 = SegmentedBM25()
+                
+                segments = bm25.segments
+                for segment in segments:
+                    if segment.name is not None:
+                        continue
+                    name = f"seg_{uuid.uuid4().hex}{SEGMENT_SUFFIX}"
+                    write_segment(self.index_path / name, segment.index)
+                    segment.index = MmapBM25Segment(self.index_path / name)
+                    segment.name = name
+                
+                self.metadata['num_docs'] = bm25.num_docs
+                self.metadata['last_updated'] = datetime.now().isoformat()
+                self.metadata['doc_count_since_save'] = 0
+                
+                manifest = {
+                    "generation": generation + 1,
+                    "k1": bm25.k1,
+                    "b": bm25.b,
+                    "segments": [
+                        {"name": segment.name, "deleted": sorted(segment.deleted)}
+                        for segment in segments
+                    ],
+                    "metadata": self.metadata,
+                }
+                
+                tmp_file = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.manifest_file)
+                
+                # Unlinking is safe even if another worker still maps the file;
+                # loads hold the shared lock, so none is opening it right now
+                live_files = {segment.name for segment in segments}
+                for name in (on_disk | self._segment_files) - live_files:
+                    (self.index_path / name).unlink(missing_ok=True)
+                self._segment_files = live_files
+                self._generation = generation + 1
+                self._manifest_stamp = self._manifest_stat()
             
-            # Update and save metadata
-            from datetime import datetime
-            self.metadata['last_updated'] = datetime.now().isoformat()
-            self.metadata['doc_count_since_save'] = 0
-            
-            with open(self.metadata_file, 'wb') as f:
-                pickle.dump(self.metadata, f, protocol=pickle.HIGHEST_PROTOCOL)
+            logger.info(
+                f"Saved BM25 index generation {self._generation}: "
+                f"{self.metadata['num_docs']} documents in {len(segments)} segments"
+            )
             
-            logger.info(f"Saved BM25 index: {self.metadata['num_docs']} documents")
-            
-            return True
+            return bm25
             
         except Exception as e:
             logger.error(f"Failed to save BM25 index: {e}")
+            return None
+
+    def _finish_save(
+        self,
+        bm25: Optional[SegmentedBM25],
+        saved: Optional[SegmentedBM25],
+        ops: List[Tuple[str, Any]],
+    ) -> bool:
+        """Adopt the result of _save_index; changes made meanwhile stay pending."""
+        if saved is None:
+            # Keep the changes for the next save
+            self._pending_ops = ops + self._pending_ops
             return False
+        
+        if saved is not bm25 or self.bm25 is not bm25:
+            # Rebased (or reset meanwhile): replay what happened during the save
+            for op in self._pending_ops:
+                saved = self._apply_op(saved, op)
+            self.bm25 = saved
+        
+        self.indexed = bool(self.bm25.segments)
+        self.metadata['num_docs'] = self.bm25.num_docs
+        self.metadata['doc_count_since_save'] = sum(
+            len(payload[1]) if kind == "add" else len(payload or ())
+            for kind, payload in self._pending_ops
+        )
+        return True
+
+    def _save(self) -> bool:
+        """Save from the calling thread (startup and force_save)."""
+        ops, self._pending_ops = self._pending_ops, []
+        bm25 = self.bm25
+        return self._finish_save(bm25, self._save_index(bm25, ops), ops)
+
+    async def _persist(self) -> bool:
+        """Save in a worker thread, keeping file writes and fsync off the event loop."""
+        async with self._persist_lock:
+            ops, self._pending_ops = self._pending_ops, []
+            bm25 = self.bm25
+            saved = await asyncio.to_thread(self._save_index, bm25, ops)
+            return self._finish_save(bm25, saved, ops)
+
+    @staticmethod
+    def _migrate_legacy_index(legacy) -> SegmentedBM25:
+        """Convert an index pickled by an earlier version to segments."""
+        if isinstance(legacy, SegmentedBM25):
+            return SegmentedBM25.from_segments(
+                [BM25Segment(index=s.index, deleted=s.deleted) for s in legacy.segments],
+                k1=legacy.k1,
+                b=legacy.b,
+            )
+        
+        # Indexes pickled before the inverted-index layout only carry
+        # token lists; rebuild postings from them once.
+        if not hasattr(legacy, "postings"):
+            index = BM25(k1=legacy.k1, b=legacy.b)
+            index.fit([" ".join(doc) for doc in legacy.corpus], legacy.doc_ids)
+            legacy = index
+        
+        return SegmentedBM25.from_segments(
+            [BM25Segment(index=legacy)], k1=legacy.k1, b=legacy.b
+        )
+
+    async def _maybe_auto_save(self):
+        """Save once enough documents changed since the last save."""
+        if self.auto_save and not self._persist_lock.locked():
+            if self.metadata['doc_count_since_save'] >= self.save_interval:
+                await self._persist()
 
     async def index_documents(self, documents: List[Dict[str, str]]) -> int:
         """
-        Index documents for BM25 search.
+        Index documents for BM25 search (replaces the existing index).
         
         Args:
             documents: List of documents with 'id' and 'content' keys
@@ -161,20 +461,20 @@ class PersistentBM25Service:
             doc_ids = [doc["id"] for doc in documents]
             
             # Create new BM25 index
-            self.bm25 = BM25()
-            self.bm25.fit(corpus, doc_ids)
+            bm25 = SegmentedBM25()
+            bm25.add(corpus, doc_ids)
+            self.bm25 = bm25
             self.indexed = True
+            self._pending_ops.append(("reset", None))
+            self._pending_ops.append(("add", (corpus, doc_ids)))
             
             # Update metadata
-            self.metadata['num_docs'] = len(documents)
+            self.metadata['num_docs'] = bm25.num_docs
             self.metadata['doc_count_since_save'] += len(documents)
             
             logger.info(f"Indexed {len(documents)} documents for BM25 search")
             
-            # Auto-save if enabled
-            if self.auto_save:
-                if self.metadata['doc_count_since_save'] >= self.save_interval:
-                    self._save_index()
+            await self._maybe_auto_save()
             
             return len(documents)
             
@@ -186,6 +486,10 @@ class PersistentBM25Service:
         """
         Add new documents to existing index (incremental update).
         
+        Only the new documents are tokenized; they become a new segment and
+        the corpus statistics are updated in place. Documents whose ID is
+        already indexed are replaced.
+        
         Args:
             new_documents: List of new documents to add
         
@@ -196,37 +500,30 @@ class PersistentBM25Service:
             return 0
         
         try:
-            # If no existing index, just index all
-            if not self.indexed or self.bm25 is None:
-                return await self.index_documents(new_documents)
-            
-            # Combine with existing documents
-            existing_corpus = [" ".join(doc) for doc in self.bm25.corpus]
-            existing_ids = self.bm25.doc_ids
+            await self._maybe_reload()
             
             new_corpus = [doc["content"] for doc in new_documents]
             new_ids = [doc["id"] for doc in new_documents]
             
-            # Rebuild index with all documents
-            all_corpus = existing_corpus + new_corpus
-            all_ids = existing_ids + new_ids
-            
-            self.bm25 = BM25()
-            self.bm25.fit(all_corpus, all_ids)
+            # Start an empty index rather than replacing one another process saved
+            if self.bm25 is None:
+                self.bm25 = SegmentedBM25()
+            self.bm25.add(new_corpus, new_ids)
+            self.indexed = True
+            self._pending_ops.append(("add", (new_corpus, new_ids)))
             
             # Update metadata
-            self.metadata['num_docs'] = len(all_ids)
+            self.metadata['num_docs'] = self.bm25.num_docs
             self.metadata['doc_count_since_save'] += len(new_documents)
             
             logger.info(
                 f"Added {len(new_documents)} documents to BM25 index "
-                f"(total: {self.metadata['num_docs']})"
+                f"(total: {self.metadata['num_docs']}, "
+                f"segments: {len(self.bm25.segments)})"
             )
             
-            # Auto-save if threshold reached
-            if self.auto_save:
-                if self.metadata['doc_count_since_save'] >= self.save_interval:
-                    self._save_index()
+            self._schedule_merge()
+            await self._maybe_auto_save()
             
             return len(new_documents)
             
@@ -234,6 +531,100 @@ class PersistentBM25Service:
             logger.error(f"Failed to add documents: {e}")
             return 0
 
+    async def delete_documents(self, doc_ids: List[str]) -> int:
+        """
+        Delete documents from the index by tombstoning them.
+        
+        Tombstoned documents are skipped at query time and physically removed
+        by the next segment merge.
+        
+        Args:
+            doc_ids: IDs of documents (chunks) to delete
+        
+        Returns:
+            Number of documents deleted
+        """
+        if not doc_ids:
+            return 0
+        
+        try:
+            await self._maybe_reload()
+            
+            # Recorded even if not indexed here: a rebase may find them on disk
+            doc_ids = list(doc_ids)
+            self._pending_ops.append(("delete", doc_ids))
+            if self.bm25 is None:
+                return 0
+            deleted = self.bm25.delete(doc_ids)
+            
+            self.metadata['num_docs'] = self.bm25.num_docs
+            self.metadata['doc_count_since_save'] += deleted
+            
+            logger.info(
+                f"Deleted {deleted} documents from BM25 index "
+                f"(total: {self.metadata['num_docs']})"
+            )
+            
+            self._schedule_merge()
+            await self._maybe_auto_save()
+            
+            return deleted
+            
+        except Exception as e:
+            logger.error(f"Failed to delete documents: {e}")
+            return 0
+
+    def _schedule_merge(self):
+        """Start a background merge if the merge policy selects segments."""
+        if self.bm25 is None:
+            return
+        if self._merge_task is not None and not self._merge_task.done():
+            return
+        
+        segments = self.bm25.select_merge()
+        if not segments:
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        
+        self._merge_task = loop.create_task(self._background_merge(segments))
+
+    async def _background_merge(self, segments: List[BM25Segment]):
+        merged = await self._run_merge(segments)
+        # Persist the merged segment so the replaced files can be removed
+        if merged and self.auto_save:
+            await self._persist()
+
+    async def _run_merge(self, segments: Optional[List[BM25Segment]] = None) -> int:
+        bm25 = self.bm25
+        if bm25 is None:
+            return 0
+        
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, bm25.merge, segments)
+        except Exception as e:
+            logger.error(f"BM25 segment merge failed: {e}")
+            return 0
+
+    async def compact(self) -> int:
+        """
+        Merge all segments into one, dropping tombstoned documents.
+        
+        Returns:
+            Number of segments merged
+        """
+        if self._merge_task is not None and not self._merge_task.done():
+            await self._merge_task
+        
+        merged = await self._run_merge()
+        if merged:
+            await self._persist()
+        return merged
+
     async def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
         """
         Search documents using BM25.
@@ -245,6 +636,8 @@ class PersistentBM25Service:
         Returns:
             List of (doc_id, score) tuples
         """
+        await self._maybe_reload()
+        
         if not self.indexed or self.bm25 is None:
             logger.warning("BM25 index not built, returning empty results")
             return []
@@ -265,16 +658,24 @@ class PersistentBM25Service:
         Returns:
             bool: True if successful
         """
-        return self._save_index()
+        return self._save()
 
     def get_stats(self) -> Dict:
         """Get index statistics"""
         return {
             "indexed": self.indexed,
             "num_docs": self.metadata['num_docs'],
+            "segments": len(self.bm25.segments) if self.bm25 else 0,
+            "deleted_docs": self.bm25.deleted_docs if self.bm25 else 0,
             "last_updated": self.metadata['last_updated'],
-            "index_size_bytes": self.index_file.stat().st_size if self.index_file.exists() else 0,
-            "doc_count_since_save": self.metadata['doc_count_since_save']
+            "index_size_bytes": sum(
+                path.stat().st_size
+                for path in (self.index_path / name for name in self._segment_files)
+                if path.exists()
+            ),
+            "doc_count_since_save": self.metadata['doc_count_since_save'],
+            "generation": self._generation,
+            "pending_changes": len(self._pending_ops),
         }
 
     def clear_index(self) -> bool:
@@ -285,17 +686,20 @@ class PersistentBM25Service:
             bool: True if successful
         """
         try:
-            # Clear memory
+            # Clear memory; saving the reset writes an empty manifest (the next
+            # generation, so other workers drop their copy too) and removes
+            # the segment files
+            self.bm25 = None
+            self._pending_ops.append(("reset", None))
+            if not self._save():
+                return False
             self.bm25 = None
             self.indexed = False
             self.metadata['num_docs'] = 0
-            self.metadata['doc_count_since_save'] = 0
             
-            # Delete files
-            if self.index_file.exists():
-                self.index_file.unlink()
-            if self.metadata_file.exists():
-                self.metadata_file.unlink()
+            for path in (self.index_file, self.metadata_file):
+                if path.exists():
+                    path.unlink()
             
             logger.info("Cleared BM25 index")
             return True
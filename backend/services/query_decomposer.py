@@ -309,15 +309,19 @@ class QueryRouter:
         self, sub_queries: List[Dict[str, str]], top_k: int
     ) -> List[Dict[str, Any]]:
         """Execute multiple sub-queries in parallel"""
-        # Execute all sub-queries
-        tasks = [
-            self.vector_agent.search(
-                query=sq["query"], top_k=top_k, search_mode="hybrid"
+        # Execute all sub-queries (one batched vector search when supported)
+        if hasattr(self.vector_agent, "search_many"):
+            results_list = await self.vector_agent.search_many(
+                [sq["query"] for sq in sub_queries], top_k=top_k, search_mode="hybrid"
             )
-            for sq in sub_queries
-        ]
-
-        results_list = await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            tasks = [
+                self.vector_agent.search(
+                    query=sq["query"], top_k=top_k, search_mode="hybrid"
+                )
+                for sq in sub_queries
+            ]
+            results_list = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Aggregate results
         all_results = []
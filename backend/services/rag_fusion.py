@@ -1,8 +1,9 @@
 # RAG Fusion - Multiple Query Perspectives
 import logging
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 import asyncio
-from collections import defaultdict
+
+from backend.services.rank_fusion import RankFusion, Retriever, fuse_stream
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,10 @@ class RAGFusion:
             # Step 3: Fuse results using RRF
             fused_results = self._reciprocal_rank_fusion(all_results, top_k)
 
+            # Step 4: Fetch text for the fused top-k only
+            if hasattr(self.vector_agent, "hydrate"):
+                fused_results = await self.vector_agent.hydrate(fused_results)
+
             logger.info(
                 f"RAG Fusion: {sum(len(r) for r in all_results)} total results → "
                 f"{len(fused_results)} fused results"
@@ -156,15 +161,22 @@ Rewritten queries (one per line, labeled with perspective):"""
     async def _search_all_perspectives(
         self, perspectives: List[Dict[str, str]], top_k: int
     ) -> List[List[Dict[str, Any]]]:
-        """Search with all perspectives in parallel"""
-        tasks = [
-            self.vector_agent.search(
-                query=p["query"], top_k=top_k, search_mode="hybrid"
+        """Search with all perspectives (one batched vector search when supported)"""
+        if hasattr(self.vector_agent, "search_many"):
+            results = await self.vector_agent.search_many(
+                [p["query"] for p in perspectives],
+                top_k=top_k,
+                search_mode="hybrid",
+                hydrate=False,  # fused_search hydrates the fused top-k
             )
-            for p in perspectives
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            tasks = [
+                self.vector_agent.search(
+                    query=p["query"], top_k=top_k, search_mode="hybrid"
+                )
+                for p in perspectives
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Filter out exceptions
         valid_results = []
@@ -196,36 +208,73 @@ Rewritten queries (one per line, labeled with perspective):"""
         Returns:
             Fused and ranked results
         """
-        rrf_scores = defaultdict(float)
-        result_data = {}
-
-        # Calculate RRF scores
+        fusion = RankFusion(rrf_k=self.rrf_k)
         for results in results_lists:
-            for rank, result in enumerate(results, start=1):
-                result_id = result.get("chunk_id") or result.get("id")
-
-                # RRF score
-                rrf_score = 1.0 / (self.rrf_k + rank)
-                rrf_scores[result_id] += rrf_score
-
-                # Store result data (keep highest scoring version)
-                if result_id not in result_data or rrf_scores[result_id] > result_data[
-                    result_id
-                ].get("rrf_score", 0):
-                    result_data[result_id] = {
-                        **result,
-                        "rrf_score": rrf_scores[result_id],
-                        "fusion_count": 1,
-                    }
-                else:
-                    result_data[result_id]["fusion_count"] += 1
+            fusion.add([self._result_id(r) for r in results], payloads=results)
+
+        return self._fused_results(fusion.top_k_payloads(top_k))
+
+    @staticmethod
+    def _result_id(result: Dict[str, Any]) -> Any:
+        return result.get("chunk_id") or result.get("id")
+
+    @staticmethod
+    def _fused_results(ranked) -> List[Dict[str, Any]]:
+        """Build output dicts for the fused top-k only."""
+        return [
+            {**result, "rrf_score": score, "fusion_count": count}
+            for result, score, count in ranked
+        ]
+
+    async def fused_search_stream(
+        self,
+        original_query: str,
+        top_k: int = 10,
+        num_perspectives: int = 5,
+        perspective_types: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        RAG Fusion search yielding fused results as each perspective finishes.
 
-        # Sort by RRF score
-        sorted_results = sorted(
-            result_data.values(), key=lambda x: x["rrf_score"], reverse=True
+        Args:
+            original_query: Original user query
+            top_k: Number of final results
+            num_perspectives: Number of query perspectives
+            perspective_types: Specific perspectives to use
+
+        Yields:
+            Dicts with "results" (fused top-k so far), "perspective" (the one
+            that just finished), "completed", "pending" and "is_final"
+        """
+        perspectives = await self.generate_perspectives(
+            original_query, num_perspectives, perspective_types
         )
 
-        return sorted_results[:top_k]
+        async def search(perspective: Dict[str, str]) -> List[Dict[str, Any]]:
+            results = await self.vector_agent.search(
+                query=perspective["query"], top_k=top_k * 2, search_mode="hybrid"
+            )
+            for r in results:
+                r["perspective"] = perspective["perspective"]
+            return results
+
+        # Perspective labels may repeat; index them for the stream
+        retrievers = [
+            Retriever(f"{i}:{p['perspective']}", search(p))
+            for i, p in enumerate(perspectives)
+        ]
+
+        async for snapshot in fuse_stream(
+            retrievers, key_fn=self._result_id, top_k=top_k, rrf_k=self.rrf_k
+        ):
+            yield {
+                "results": self._fused_results(snapshot.results),
+                "perspective": snapshot.source.split(":", 1)[-1],
+                "completed": len(snapshot.completed),
+                "pending": len(snapshot.pending),
+                "failed": len(snapshot.failed),
+                "is_final": snapshot.is_final,
+            }
 
     def get_stats(self) -> Dict[str, Any]:
         """Get RAG Fusion statistics"""
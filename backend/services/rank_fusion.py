@@ -0,0 +1,422 @@
+# Rank Fusion Engine
+"""
+Shared fusion of N ranked result lists.
+
+Used by hybrid search (vector + BM25), RAG Fusion (one list per query
+perspective) and the aggregator (one list per retrieval source).
+
+Methods:
+- rrf:      sum(weight / (k + rank))
+- weighted: sum(weight * score / max_score)
+- minmax:   sum(weight * (score - min) / (max - min))
+- zscore:   sum(weight * (score - mean) / std)
+
+``fuse`` accumulates (doc_id, score) lists in a plain dict. ``RankFusion``
+interns document IDs to row numbers once and accumulates per-row scores and
+list counts in flat Python lists (no array conversion per list); result
+payloads are kept by reference (never copied) until the final top-k is
+built. Only top-k selection over large fused sets switches to numpy.
+``fuse_stream`` yields a fused top-k each time a retriever finishes, so the
+first answer is available before the slowest retriever returns.
+"""
+
+import asyncio
+import heapq
+import logging
+from dataclasses import dataclass, field
+from enum import Enum
+from operator import itemgetter
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class FusionMethod(str, Enum):
+    """Score fusion method."""
+
+    RRF = "rrf"
+    WEIGHTED = "weighted"
+    MINMAX = "minmax"
+    ZSCORE = "zscore"
+
+
+# Below this many fused documents top-k selection stays in Python
+_SMALL_FUSION = 512
+
+_RRF_CACHE: Dict[int, List[float]] = {}
+
+
+def _rrf_reciprocals(rrf_k: int, n: int) -> List[float]:
+    """
+    1 / (k + rank) for ranks 1, 2, ... (cached per k, grown on demand).
+
+    The cached list is returned as is, so it may be longer than n; callers
+    zip it with the ranked IDs and must not modify it.
+    """
+    cached = _RRF_CACHE.get(rrf_k)
+    if cached is None or len(cached) < n:
+        size = max(n, 1024)
+        cached = [1.0 / (rrf_k + rank) for rank in range(1, size + 1)]
+        _RRF_CACHE[rrf_k] = cached
+    return cached
+
+
+def _contributions(
+    method: FusionMethod,
+    rrf_k: int,
+    n: int,
+    scores: Optional[Sequence[float]],
+    weight: float,
+) -> Optional[List[float]]:
+    """
+    Per-position fused contribution of one list (None = list ignored).
+
+    The result may be longer than n (rrf); zip it with the IDs.
+    """
+    if method is FusionMethod.RRF:
+        reciprocals = _rrf_reciprocals(rrf_k, n)
+        if weight == 1.0:
+            return reciprocals
+        return [weight * r for r in reciprocals[:n]]
+
+    if scores is None:
+        raise ValueError(f"{method.value} fusion requires scores")
+
+    if method is FusionMethod.WEIGHTED:
+        max_score = max(scores)
+        if max_score <= 0:
+            return None
+        scale = weight / max_score
+        return [score * scale for score in scores]
+
+    if method is FusionMethod.MINMAX:
+        low = min(scores)
+        spread = max(scores) - low
+        if spread == 0:
+            return [weight] * n
+        scale = weight / spread
+        return [(score - low) * scale for score in scores]
+
+    mean = sum(scores) / n
+    std = (sum((score - mean) ** 2 for score in scores) / n) ** 0.5
+    if std == 0:
+        return [0.0] * n
+    scale = weight / std
+    return [(score - mean) * scale for score in scores]
+
+
+class RankFusion:
+    """
+    Incremental N-way rank fusion.
+
+    Lists can be added one at a time (e.g. as retrievers finish); top_k can
+    be read after every add.
+    """
+
+    def __init__(
+        self,
+        method: Union[FusionMethod, str] = FusionMethod.RRF,
+        rrf_k: int = 60,
+    ):
+        """
+        Initialize the fusion state.
+
+        Args:
+            method: Fusion method (rrf, weighted, minmax, zscore)
+            rrf_k: RRF constant (rrf only)
+        """
+        self.method = FusionMethod(method)
+        self.rrf_k = rrf_k
+
+        # Parallel per-row lists; row = first-seen order of the document ID
+        self._rows: Dict[Hashable, int] = {}
+        self._ids: List[Hashable] = []
+        self._payloads: List[Any] = []
+        self._scores: List[float] = []
+        self._counts: List[int] = []
+        self._last_list: List[int] = []  # Last list that counted the row
+        self.lists_added = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(
+        self,
+        ids: Sequence[Hashable],
+        scores: Optional[Sequence[float]] = None,
+        weight: float = 1.0,
+        payloads: Optional[Sequence[Any]] = None,
+    ) -> None:
+        """
+        Fuse one ranked list (best first).
+
+        Args:
+            ids: Document IDs in rank order
+            scores: Retriever scores (required except for rrf)
+            weight: List weight
+            payloads: Optional result objects, stored by reference
+        """
+        self.lists_added += 1
+        n = len(ids)
+        if n == 0:
+            return
+
+        contributions = _contributions(self.method, self.rrf_k, n, scores, weight)
+        if contributions is None:
+            return
+
+        self._accumulate(ids, contributions, payloads)
+
+    def _accumulate(
+        self,
+        ids: Sequence[Hashable],
+        contributions: Sequence[float],
+        payloads: Optional[Sequence[Any]],
+    ) -> None:
+        rows = self._rows
+        row_ids = self._ids
+        row_scores = self._scores
+        counts = self._counts
+        last_list = self._last_list
+        list_no = self.lists_added
+        first_new_row = len(row_scores)
+
+        for doc_id, contribution in zip(ids, contributions):
+            row = rows.get(doc_id)
+            if row is None:
+                rows[doc_id] = len(row_scores)
+                row_ids.append(doc_id)
+                row_scores.append(contribution)
+                counts.append(1)
+                last_list.append(list_no)
+                continue
+
+            row_scores[row] += contribution
+            # Repeated IDs within one list count the list once
+            if last_list[row] != list_no:
+                counts[row] += 1
+                last_list[row] = list_no
+
+        if payloads is not None and len(row_scores) > first_new_row:
+            # First occurrence wins (lists added earlier take priority)
+            row_payloads = self._payloads
+            row_payloads.extend([None] * (first_new_row - len(row_payloads)))
+            for doc_id, payload in zip(ids, payloads):
+                if rows[doc_id] == len(row_payloads):
+                    row_payloads.append(payload)
+
+    def _top_rows(self, k: Optional[int]) -> List[int]:
+        scores = self._scores
+        n = len(scores)
+        if k is not None and k <= 0:
+            return []
+        if n <= _SMALL_FUSION or k is None or k >= n:
+            # Stable descending sort: ties keep first-seen order
+            return sorted(range(n), key=scores.__getitem__, reverse=True)[:k]
+
+        # Candidates at or above the k-th score, in first-seen order, so ties
+        # resolve exactly like a stable sort over the whole vector
+        values = np.array(scores, dtype=np.float64)
+        kth = np.partition(values, n - k)[n - k]
+        candidates = np.flatnonzero(values >= kth)
+        return candidates[np.argsort(-values[candidates], kind="stable")][:k].tolist()
+
+    def top_k(self, k: Optional[int] = None) -> List[Tuple[Hashable, float]]:
+        """Return the fused (doc_id, score) list, best first."""
+        ids = self._ids
+        scores = self._scores
+        return [(ids[row], scores[row]) for row in self._top_rows(k)]
+
+    def top_k_payloads(self, k: Optional[int] = None) -> List[Tuple[Any, float, int]]:
+        """Return (payload, fused score, number of lists containing it), best first."""
+        payloads = self._payloads
+        if len(payloads) < len(self._rows):
+            payloads.extend([None] * (len(self._rows) - len(payloads)))
+        scores = self._scores
+        counts = self._counts
+        return [(payloads[row], scores[row], counts[row]) for row in self._top_rows(k)]
+
+
+def fuse(
+    ranked_lists: Sequence[Sequence[Tuple[Hashable, float]]],
+    method: Union[FusionMethod, str] = FusionMethod.RRF,
+    weights: Optional[Sequence[float]] = None,
+    top_k: Optional[int] = None,
+    rrf_k: int = 60,
+) -> List[Tuple[Hashable, float]]:
+    """
+    Fuse (doc_id, score) lists in one call.
+
+    Without payloads or per-row counts to keep, a plain dict keyed by
+    document ID is the cheapest accumulator at every list size.
+
+    Args:
+        ranked_lists: Lists of (doc_id, score), each best first
+        method: Fusion method
+        weights: Per-list weights (default 1.0 each)
+        top_k: Number of results (None = all)
+        rrf_k: RRF constant
+
+    Returns:
+        Fused list of (doc_id, score), best first
+    """
+    method = FusionMethod(method)
+    fused: Dict[Hashable, float] = {}
+    for i, results in enumerate(ranked_lists):
+        if not results:
+            continue
+        weight = weights[i] if weights is not None else 1.0
+
+        if method is FusionMethod.WEIGHTED:
+            max_score = max(score for _, score in results)
+            if max_score <= 0:
+                continue
+            scale = weight / max_score
+            for doc_id, score in results:
+                fused[doc_id] = fused.get(doc_id, 0.0) + score * scale
+            continue
+
+        contributions = _contributions(
+            method,
+            rrf_k,
+            len(results),
+            None if method is FusionMethod.RRF else [score for _, score in results],
+            weight,
+        )
+        for (doc_id, _), contribution in zip(results, contributions):
+            fused[doc_id] = fused.get(doc_id, 0.0) + contribution
+
+    if top_k is not None and top_k <= 0:
+        return []
+    if top_k is not None and len(fused) > _SMALL_FUSION:
+        # Same order as the stable sort below, without sorting everything
+        return heapq.nlargest(top_k, fused.items(), key=itemgetter(1))
+    # Stable descending sort: ties keep first-seen order
+    ranked = sorted(fused.items(), key=itemgetter(1), reverse=True)
+    return ranked if top_k is None else ranked[:top_k]
+
+
+@dataclass
+class FusionSnapshot:
+    """Fused top-k after one more retriever finished."""
+
+    results: List[Tuple[Any, float, int]]
+    source: str
+    completed: List[str] = field(default_factory=list)
+    pending: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+
+    @property
+    def is_final(self) -> bool:
+        return not self.pending
+
+
+@dataclass
+class Retriever:
+    """One retriever taking part in streamed fusion."""
+
+    name: str
+    call: Awaitable[Sequence[Any]]
+    weight: float = 1.0
+
+
+async def fuse_stream(
+    retrievers: Sequence[Retriever],
+    key_fn,
+    score_fn=None,
+    method: Union[FusionMethod, str] = FusionMethod.RRF,
+    top_k: Optional[int] = 10,
+    rrf_k: int = 60,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[FusionSnapshot]:
+    """
+    Run retrievers concurrently and yield the fused top-k as each finishes.
+
+    Args:
+        retrievers: Retrievers to run
+        key_fn: Maps a result to its document ID
+        score_fn: Maps a result to its score (required except for rrf)
+        method: Fusion method
+        top_k: Number of results per snapshot
+        rrf_k: RRF constant
+        timeout: Overall deadline; unfinished retrievers are cancelled and
+            reported as failed in the final snapshot
+
+    Yields:
+        FusionSnapshot with payloads (results as returned by the retrievers)
+    """
+    fusion = RankFusion(method=method, rrf_k=rrf_k)
+    tasks = {
+        asyncio.ensure_future(retriever.call): retriever for retriever in retrievers
+    }
+    completed: List[str] = []
+    failed: List[str] = []
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout is not None else None
+
+    try:
+        outstanding = set(tasks)
+        while outstanding:
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait(
+                outstanding, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if not done:
+                # Deadline reached
+                for task in outstanding:
+                    task.cancel()
+                    failed.append(tasks[task].name)
+                logger.warning(f"Fusion deadline reached, dropped: {failed}")
+                yield FusionSnapshot(
+                    results=fusion.top_k_payloads(top_k),
+                    source="timeout",
+                    completed=list(completed),
+                    pending=[],
+                    failed=list(failed),
+                )
+                return
+
+            for task in done:
+                outstanding.discard(task)
+                retriever = tasks[task]
+                try:
+                    results = list(task.result() or [])
+                except Exception as e:
+                    logger.warning(f"Retriever '{retriever.name}' failed: {e}")
+                    failed.append(retriever.name)
+                    results = None
+
+                if results is not None:
+                    fusion.add(
+                        [key_fn(r) for r in results],
+                        [score_fn(r) for r in results] if score_fn else None,
+                        weight=retriever.weight,
+                        payloads=results,
+                    )
+                    completed.append(retriever.name)
+
+                yield FusionSnapshot(
+                    results=fusion.top_k_payloads(top_k),
+                    source=retriever.name,
+                    completed=list(completed),
+                    pending=[tasks[t].name for t in outstanding],
+                    failed=list(failed),
+                )
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
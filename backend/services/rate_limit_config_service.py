@@ -5,6 +5,7 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 
+from backend.core.rate_limiter import invalidate_rate_limit_config
 from backend.db.models.rate_limit_config import (
     RateLimitConfig,
     RateLimitOverride,
@@ -200,6 +201,7 @@ class RateLimitConfigService:
         self.db.add(config)
         self.db.commit()
         self.db.refresh(config)
+        invalidate_rate_limit_config(scope_id)
         
         logger.info(f"Created rate limit config: {config.id} for {scope}:{scope_id}")
         
@@ -237,6 +239,7 @@ class RateLimitConfigService:
         
         self.db.commit()
         self.db.refresh(config)
+        invalidate_rate_limit_config(config.scope_id)
         
         logger.info(f"Updated rate limit config: {config_id}")
         
@@ -270,6 +273,7 @@ class RateLimitConfigService:
         self.db.add(override)
         self.db.commit()
         self.db.refresh(override)
+        invalidate_rate_limit_config(scope_id)
         
         logger.info(f"Created rate limit override: {override.id} for {scope}:{scope_id}")
         
@@ -316,8 +320,10 @@ class RateLimitConfigService:
         if not config:
             return False
         
+        scope_id = config.scope_id
         self.db.delete(config)
         self.db.commit()
+        invalidate_rate_limit_config(scope_id)
         
         logger.info(f"Deleted rate limit config: {config_id}")
         
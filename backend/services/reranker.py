@@ -5,7 +5,7 @@ Cross-encoder와 MMR을 사용하여 검색 결과의 정확도와 다양성을
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import numpy as np
 from sentence_transformers import CrossEncoder
 
@@ -199,42 +199,36 @@ class RerankerService:
                 logger.warning("No embeddings found, using text-based similarity")
                 return self._text_based_mmr(query, results, top_k, lambda_param)
 
+            # 관련성 점수 (원본 점수 사용) 및 정규화된 임베딩 행렬
+            relevance = np.array(
+                [r.get("combined_score", r.get("score", 0.0)) for r in results],
+                dtype=np.float64,
+            )
+            vectors = self._embedding_matrix(results)
+
             selected = []
-            remaining = results.copy()
-
-            target_count = top_k if top_k else len(results)
-
-            while len(selected) < target_count and remaining:
-                mmr_scores = []
-
-                for candidate in remaining:
-                    # 관련성 점수 (원본 점수 사용)
-                    relevance = candidate.get(
-                        "combined_score", candidate.get("score", 0.0)
-                    )
-
-                    # 다양성 점수 (이미 선택된 문서와의 유사도)
-                    if selected:
-                        similarities = [
-                            self._cosine_similarity(
-                                candidate.get("embedding", []), s.get("embedding", [])
-                            )
-                            for s in selected
-                        ]
-                        diversity = max(similarities) if similarities else 0
-                    else:
-                        diversity = 0
-
-                    # MMR 점수 계산
-                    mmr_score = (
-                        lambda_param * relevance - (1 - lambda_param) * diversity
-                    )
-                    mmr_scores.append(mmr_score)
+            target_count = min(top_k if top_k else len(results), len(results))
+
+            # 다양성 점수: 선택된 문서와의 최대 유사도 (선택 시마다 갱신)
+            diversity = np.zeros(len(results), dtype=np.float64)
+            available = np.ones(len(results), dtype=bool)
+
+            while len(selected) < target_count:
+                # MMR 점수 계산
+                mmr_scores = lambda_param * relevance - (1 - lambda_param) * diversity
+                mmr_scores[~available] = -np.inf
 
                 # 최고 MMR 점수 선택
-                best_idx = mmr_scores.index(max(mmr_scores))
-                selected_result = remaining.pop(best_idx)
-                selected_result["mmr_score"] = mmr_scores[best_idx]
+                best_idx = int(np.argmax(mmr_scores))
+                available[best_idx] = False
+                similarities = vectors @ vectors[best_idx]
+                if selected:
+                    np.maximum(diversity, similarities, out=diversity)
+                else:
+                    diversity = similarities.astype(np.float64)
+
+                selected_result = results[best_idx]
+                selected_result["mmr_score"] = float(mmr_scores[best_idx])
                 selected.append(selected_result)
 
             logger.info(
@@ -301,14 +295,38 @@ class RerankerService:
         )
         return sorted_results[:top_k] if top_k else sorted_results
 
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
+    @staticmethod
+    def _embedding_matrix(results: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        결과 임베딩을 정규화된 float32 행렬로 변환
+
+        리스트와 ndarray 임베딩을 모두 허용합니다. 임베딩이 없거나
+        차원이 다른 결과는 영벡터(유사도 0)로 처리합니다.
+        """
+        embeddings = [r.get("embedding") for r in results]
+        dim = next(
+            (len(e) for e in embeddings if e is not None and len(e) > 0), 0
+        )
+
+        matrix = np.zeros((len(results), dim), dtype=np.float32)
+        for i, embedding in enumerate(embeddings):
+            if embedding is not None and len(embedding) == dim:
+                matrix[i] = embedding
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _cosine_similarity(
+        self, vec1: Union[List[float], np.ndarray], vec2: Union[List[float], np.ndarray]
+    ) -> float:
         """코사인 유사도 계산"""
-        if not vec1 or not vec2:
+        if vec1 is None or vec2 is None or len(vec1) == 0 or len(vec2) == 0:
             return 0.0
 
         try:
-            vec1_np = np.array(vec1)
-            vec2_np = np.array(vec2)
+            vec1_np = np.asarray(vec1, dtype=np.float32)
+            vec2_np = np.asarray(vec2, dtype=np.float32)
 
             dot_product = np.dot(vec1_np, vec2_np)
             norm1 = np.linalg.norm(vec1_np)
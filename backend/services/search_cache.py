@@ -6,6 +6,7 @@
 - L2 Cache (LTM): 인기 검색 결과 (영구 저장, 빈도 기반)
 """
 
+import asyncio
 import logging
 import hashlib
 import json
@@ -14,6 +15,8 @@ from datetime import datetime
 import redis
 from redis.exceptions import RedisError
 
+from backend.services.embedding_cache import get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -84,11 +87,6 @@ class SearchCacheManager:
         """쿼리 빈도 추적 키"""
         return "search:frequency"
 
-    def _get_embedding_key(self, text: str) -> str:
-        """임베딩 캐시 키"""
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        return f"embedding:{text_hash}"
-
     async def get_cached_results(
         self,
         query: str,
@@ -263,35 +261,58 @@ class SearchCacheManager:
         except RedisError:
             pass
 
-    async def get_embedding_cache(self, text: str) -> Optional[List[float]]:
-        """임베딩 캐시 가져오기"""
-        try:
-            key = self._get_embedding_key(text)
-            cached = await self.redis.get(key)
+    async def get_embedding_cache(
+        self, text: str, model_name: Optional[str] = None
+    ) -> Optional[List[float]]:
+        """임베딩 캐시 가져오기 (공유 임베딩 캐시 사용)"""
+        cache = get_embedding_cache()
+        if cache is None:
+            return None
 
-            if cached:
-                logger.debug(f"Embedding cache hit for text: {text[:30]}...")
-                return json.loads(cached)
+        model_name = model_name or self._default_embedding_model()
+        dimension = self._embedding_dimension(model_name)
+        cached = cache.get_memory(model_name, text, dimension)
+        if cached is None:
+            # 디스크 계층 조회는 블로킹 SQLite 호출
+            cached = await asyncio.to_thread(cache.get, model_name, text, dimension)
+        if cached is not None:
+            logger.debug(f"Embedding cache hit for text: {text[:30]}...")
+            return cached.tolist()
 
-            return None
+        return None
 
-        except (RedisError, json.JSONDecodeError) as e:
-            logger.error(f"Embedding cache retrieval error: {e}")
-            return None
+    async def cache_embedding(
+        self, text: str, embedding: List[float], model_name: Optional[str] = None
+    ):
+        """임베딩 캐싱 (공유 임베딩 캐시에 영구 저장)"""
+        cache = get_embedding_cache()
+        if cache is None:
+            return
 
-    async def cache_embedding(self, text: str, embedding: List[float]):
-        """임베딩 캐싱 (영구 저장)"""
         try:
-            key = self._get_embedding_key(text)
-
             # 영구 저장 (임베딩은 변하지 않음)
-            await self.redis.set(key, json.dumps(embedding))
+            model_name = model_name or self._default_embedding_model()
+            cache.put(model_name, text, embedding, self._embedding_dimension(model_name))
 
             logger.debug(f"Cached embedding for text: {text[:30]}...")
 
-        except (RedisError, TypeError) as e:
+        except (TypeError, ValueError) as e:
             logger.error(f"Embedding cache storage error: {e}")
 
+    @staticmethod
+    def _default_embedding_model() -> str:
+        """임베딩 캐시 키에 사용할 기본 모델 이름"""
+        from backend.config import settings
+
+        return settings.EMBEDDING_MODEL
+
+    @staticmethod
+    def _embedding_dimension(model_name: str) -> int:
+        """임베딩 캐시 키에 사용할 모델 차원"""
+        from backend.config.llm import get_embedding_dimension
+
+        return get_embedding_dimension(model_name)
+
     async def get_popular_queries(self, top_n: int = 10) -> List[Dict[str, Any]]:
         """인기 검색어 조회"""
         try:
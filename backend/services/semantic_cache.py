@@ -12,7 +12,8 @@ from typing import Optional, Dict, List, Tuple, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from collections import defaultdict
-import numpy as np
+
+from backend.core.vector_index import FlatVectorIndex
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +82,8 @@ class SemanticCache:
 
     Features:
     - Exact match lookup (O(1))
-    - Semantic similarity search using embeddings
+    - Semantic similarity search using embeddings (in-process FlatVectorIndex
+      keyed by query hash; expired entries are masked in the search)
     - Popularity-based eviction (LRU + frequency)
     - Configurable similarity thresholds
     - Cache warming support
@@ -117,7 +119,8 @@ class SemanticCache:
 
         # Storage
         self._exact_cache: Dict[str, CacheEntry] = {}  # query_hash -> entry
-        self._semantic_cache: List[CacheEntry] = []  # All entries for similarity search
+
+        self._index = FlatVectorIndex(initial_capacity=max_size)  # query_hash -> embedding
 
         # Statistics
         self.stats = CacheStats()
@@ -225,7 +228,7 @@ class SemanticCache:
         Returns:
             (response, similarity_score, entry) or None
         """
-        if not self._semantic_cache:
+        if not len(self._index):
             return None
 
         self.stats.total_similarity_searches += 1
@@ -234,45 +237,45 @@ class SemanticCache:
         # Generate query embedding
         query_embedding = await self.embedding_service.embed_query(query)
 
-        # Calculate similarities
-        best_similarity = 0.0
-        best_entry = None
-        similarities = []
-
-        for entry in self._semantic_cache:
-            if entry.is_expired():
-                continue
+        # Expired entries are masked inside the single search
+        matches = self._index.search(query_embedding, top_k=1, now=time.time())
+        if not matches:
+            return None
+        best_hash, best_similarity = matches[0]
+        best_entry = self._exact_cache.get(best_hash)
+        if best_entry is None or best_entry.is_expired():
+            return None
 
-            # Validate cached response
-            if not self._is_valid_response(entry.response):
-                continue
-
-            # Cosine similarity
-            similarity = self._cosine_similarity(query_embedding, entry.query_embedding)
-            similarities.append(similarity)
-
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_entry = entry
-
-        # Update average similarity
-        if similarities:
-            avg_sim = np.mean(similarities)
-            # Running average
-            alpha = 0.1
-            self.stats.avg_similarity_score = (
-                alpha * avg_sim + (1 - alpha) * self.stats.avg_similarity_score
-            )
+        # Running average of the best similarity per search
+        alpha = 0.1
+        self.stats.avg_similarity_score = (
+            alpha * best_similarity + (1 - alpha) * self.stats.avg_similarity_score
+        )
 
         search_time = (time.time() - start_time) * 1000
         logger.debug(f"Semantic search completed in {search_time:.1f}ms")
 
         # Check if similarity meets threshold
-        if best_entry and best_similarity >= self.similarity_threshold_medium:
+        if best_similarity >= self.similarity_threshold_medium:
             return best_entry.response, best_similarity, best_entry
 
         return None
 
+    def _index_entry(self, query_hash: str, entry: CacheEntry):
+        """Add an entry's embedding (and expiry) to the semantic index."""
+        expires_at = entry.timestamp.timestamp() + entry.ttl_seconds
+        if self._index.add(query_hash, entry.query_embedding, expires_at):
+            return
+
+        vector = FlatVectorIndex.normalize(entry.query_embedding)
+        if vector is not None and vector.shape[0] != self._index.dimension:
+            logger.warning(
+                f"Embedding dimension changed ({self._index.dimension} -> "
+                f"{vector.shape[0]}), resetting semantic index"
+            )
+            self._index = FlatVectorIndex(initial_capacity=self.max_size)
+            self._index.add(query_hash, entry.query_embedding, expires_at)
+
     def _is_valid_response(self, response: Dict[str, Any]) -> bool:
         """
         Validate if a response is suitable for caching/returning.
@@ -326,20 +329,6 @@ class SemanticCache:
 
         return True
 
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity between two vectors"""
-        vec1_np = np.array(vec1)
-        vec2_np = np.array(vec2)
-
-        dot_product = np.dot(vec1_np, vec2_np)
-        norm1 = np.linalg.norm(vec1_np)
-        norm2 = np.linalg.norm(vec2_np)
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return float(dot_product / (norm1 * norm2))
-
     async def set(
         self,
         query: str,
@@ -420,9 +409,9 @@ class SemanticCache:
             ttl_seconds=ttl or self.default_ttl,
         )
 
-        # Store in both caches
+        # Store in both caches (re-adding a query replaces its indexed vector)
         self._exact_cache[query_hash] = entry
-        self._semantic_cache.append(entry)
+        self._index_entry(query_hash, entry)
 
         # Update frequency tracking
         self._query_frequency[query_hash] += 1
@@ -434,11 +423,8 @@ class SemanticCache:
     def _evict_entry(self, query_hash: str):
         """Evict a specific cache entry"""
         if query_hash in self._exact_cache:
-            entry = self._exact_cache[query_hash]
             del self._exact_cache[query_hash]
-
-            # Remove from semantic cache
-            self._semantic_cache = [e for e in self._semantic_cache if e != entry]
+            self._index.remove(query_hash)
 
             self.stats.evictions += 1
             logger.debug(f"Evicted cache entry: {query_hash}")
@@ -472,7 +458,7 @@ class SemanticCache:
     def clear(self):
         """Clear all cache entries"""
         self._exact_cache.clear()
-        self._semantic_cache.clear()
+        self._index.clear()
         self._query_frequency.clear()
         logger.info("Cache cleared")
 
@@ -531,7 +517,7 @@ class SemanticCache:
         """
         entries_with_scores = [
             (entry.query, entry.access_count, entry.popularity_score)
-            for entry in self._semantic_cache
+            for entry in self._exact_cache.values()
         ]
 
         # Sort by popularity score
@@ -531,7 +531,7 @@ class SpeculativeProcessor:
 
         try:
             # Get recent conversation history
-            history = self.stm.get_conversation_history(
+            history = await self.stm.get_conversation_history(
                 session_id=session_id, limit=max_messages
             )
 
@@ -792,15 +792,7 @@ class SpeculativeProcessor:
             return
 
         try:
-            # Add user query to STM
-            self.stm.add_message(
-                session_id=session_id,
-                role="user",
-                content=query,
-                metadata={"path": "speculative"},
-            )
-
-            # Add speculative response to STM with path marker
+            # Speculative response carries a path marker
             response_metadata = {
                 "path": "speculative",
                 "confidence_score": metadata.get("confidence_score", 0.0),
@@ -808,11 +800,13 @@ class SpeculativeProcessor:
                 "cache_hit": metadata.get("cache_hit", False),
             }
 
-            self.stm.add_message(
+            # Add user query and response to STM in one round trip
+            await self.stm.add_messages(
                 session_id=session_id,
-                role="assistant",
-                content=response,
-                metadata=response_metadata,
+                messages=[
+                    {"role": "user", "content": query, "metadata": {"path": "speculative"}},
+                    {"role": "assistant", "content": response, "metadata": response_metadata},
+                ],
             )
 
             logger.debug(f"Saved speculative results to STM for session {session_id}")
@@ -1095,8 +1089,18 @@ class SpeculativeProcessor:
             # Generate query hash for caching
             query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
             
+            # Load catalog entries of all KBs in one DB query up front
+            try:
+                from backend.services.kb_catalog import get_kb_catalog
+
+                await get_kb_catalog().get_many(kb_ids)
+            except Exception as e:
+                logger.warning(f"KB catalog preload failed: {e}")
+            
             # Use optimizer if available
             if self.kb_optimizer:
+                from backend.config import settings
+                
                 # Adaptive timeout
                 adaptive_timeout = self.kb_optimizer.calculate_adaptive_timeout(
                     kb_ids, timeout
@@ -1107,14 +1111,38 @@ class SpeculativeProcessor:
                     f"(base: {timeout:.2f}s)"
                 )
                 
-                # Search with optimization
-                all_results, metrics = await self.kb_optimizer.search_kbs_optimized(
-                    kb_ids=kb_ids,
-                    search_func=self._search_single_kb,
-                    query_hash=query_hash,
-                    query_embedding=query_embedding,
-                    top_k=top_k
-                )
+                first_k = settings.KB_SEARCH_FIRST_K
+                if 0 < first_k < len(kb_ids):
+                    # Stream KB results; answer once first_k KBs returned results
+                    all_results, metrics = [], []
+                    stream = self.kb_optimizer.search_kbs_stream(
+                        kb_ids,
+                        self._search_single_kb,
+                        query_hash,
+                        base_timeout=timeout,
+                        query_embedding=query_embedding,
+                        top_k=top_k
+                    )
+                    answered = 0
+                    try:
+                        async for _, kb_results, kb_metrics in stream:
+                            all_results.extend(kb_results)
+                            metrics.append(kb_metrics)
+                            answered += bool(kb_results)
+                            if answered >= first_k:
+                                break
+                    finally:
+                        await stream.aclose()
+                else:
+                    # Search with optimization (per-KB deadlines, partial results)
+                    all_results, metrics = await self.kb_optimizer.search_kbs_optimized(
+                        kb_ids=kb_ids,
+                        search_func=self._search_single_kb,
+                        query_hash=query_hash,
+                        base_timeout=timeout,
+                        query_embedding=query_embedding,
+                        top_k=top_k
+                    )
                 
                 # Add KB source and boost score
                 for result in all_results:
@@ -1156,7 +1184,7 @@ class SpeculativeProcessor:
             
             # Enhanced logging with detailed metrics
             kb_results_count = len(all_results)
-            cache_hit = metrics.get('cache_hit', False) if self.kb_optimizer else False
+            cache_hit = any(m.cache_hit for m in metrics) if self.kb_optimizer else False
             
             logger.info(
                 f"KB search completed: "
@@ -1197,46 +1225,20 @@ class SpeculativeProcessor:
             List of search results
         """
         try:
-            # Import here to avoid circular dependency
-            from backend.db.models.agent_builder import Knowledgebase
-            from sqlalchemy.orm import Session
-            from backend.db.database import SessionLocal
-            
-            # Get KB info
-            db: Session = SessionLocal()
-            try:
-                kb = db.query(Knowledgebase).filter(
-                    Knowledgebase.id == kb_id
-                ).first()
-                
-                if not kb:
-                    logger.warning(f"Knowledgebase {kb_id} not found")
-                    return []
-                
-                collection_name = kb.milvus_collection_name
-            finally:
-                db.close()
+            from backend.services.kb_catalog import get_kb_catalog
+
+            # Collection name, metric and index params (cached in-process)
+            catalog = get_kb_catalog()
+            entry = await catalog.get(kb_id)
+            if entry is None:
+                return []
             
-            # Search in Milvus
-            # Note: MilvusManager uses a single collection
-            # For KB-specific collections, we need to use Collection directly
+            # Search the KB's collection off the event loop
             try:
-                from pymilvus import Collection
-                
-                # Get collection
-                collection = Collection(collection_name)
-                
-                # Perform search
-                search_params = {
-                    "metric_type": "L2",
-                    "params": {"nprobe": 10}
-                }
-                
-                milvus_results = collection.search(
-                    data=[query_embedding],
-                    anns_field="embedding",
-                    param=search_params,
-                    limit=top_k,
+                milvus_results = await catalog.search(
+                    entry,
+                    [query_embedding],
+                    top_k,
                     output_fields=["document_id", "text", "document_name", "chunk_index"]
                 )
                 
@@ -1248,7 +1250,7 @@ class SpeculativeProcessor:
                             id=str(hit.id),
                             document_id=hit.entity.get('document_id', ''),
                             text=hit.entity.get('text', ''),
-                            score=1.0 - hit.distance,  # Convert L2 distance to similarity
+                            score=entry.similarity(hit.distance),
                             document_name=hit.entity.get('document_name', ''),
                             chunk_index=hit.entity.get('chunk_index', 0),
                             metadata={'kb_id': kb_id}
@@ -1258,7 +1260,11 @@ class SpeculativeProcessor:
                 return results
                 
             except Exception as milvus_error:
-                logger.error(f"Milvus search failed for collection {collection_name}: {milvus_error}")
+                logger.error(
+                    f"Milvus search failed for collection {entry.collection_name}: {milvus_error}"
+                )
+                # Stale handle or index metadata: reload on the next search
+                catalog.invalidate(kb_id)
                 # Fallback: try using MilvusManager's default search
                 # This will only work if the collection is the default one
                 try:
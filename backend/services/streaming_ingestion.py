@@ -0,0 +1,392 @@
+# Streaming Document Ingestion
+"""
+Page-by-page ingestion pipeline for large documents.
+
+Stages run concurrently and are connected by bounded queues:
+
+    extract pages -> chunk -> embed batch -> store (Milvus + BM25 callback)
+
+Only a few pages, chunk batches and vector batches are in flight at any
+time, so peak memory does not grow with document size, and the first
+chunks are searchable before the last page has been parsed.
+
+PDFs with at least ``min_pages`` pages are read page by page from the file
+(a path is never loaded into memory as a whole). Other documents are
+extracted in one step through the extraction pool and then chunked,
+embedded and stored in batches.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from backend.models.document import TextChunk
+from backend.services.document_processor import (
+    DocumentProcessingError,
+    DocumentProcessor,
+)
+
+logger = logging.getLogger(__name__)
+
+# End-of-stream marker passed through the queues
+_DONE = object()
+
+# A single chunk this many times chunk_size is emitted even without a boundary
+_MAX_CARRY_FACTOR = 4
+
+
+@dataclass
+class StreamingIngestionResult:
+    """Summary of a streamed ingestion."""
+
+    document_id: str
+    file_type: str
+    chunk_count: int
+    pages: int
+    batches: int
+    paged: bool
+    first_batch_ms: Optional[float]
+    total_ms: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class StreamingIngestionPipeline:
+    """
+    Bounded extract -> chunk -> embed -> store pipeline for one document.
+
+    Create one pipeline per document. ``chunks_stored`` only counts batches
+    confirmed by Milvus; if ``run`` fails part-way, batches still queued on
+    the batched writer may be written as well, so callers clean up by
+    document ID.
+    """
+
+    def __init__(
+        self,
+        document_processor: DocumentProcessor,
+        embedding_service,
+        milvus_manager,
+        on_batch_stored: Optional[Callable[[List[Dict[str, Any]]], Awaitable[Any]]] = None,
+        batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        min_pages: Optional[int] = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            document_processor: Processor used for extraction and chunking
+            embedding_service: Service with async embed_batch
+            milvus_manager: Manager with async insert_embeddings
+            on_batch_stored: Called with the Milvus rows of each stored batch
+                (e.g. BM25 indexing); failures are logged, not raised
+            batch_size: Chunks per embed/insert batch (default: from config)
+            queue_size: Items buffered between stages (default: from config)
+            min_pages: PDFs with fewer pages are extracted whole (default: from config)
+        """
+        from backend.config import settings
+
+        self.processor = document_processor
+        self.embedding_service = embedding_service
+        self.milvus_manager = milvus_manager
+        self.on_batch_stored = on_batch_stored
+        self.batch_size = max(1, batch_size or settings.STREAMING_INGESTION_BATCH_SIZE)
+        self.queue_size = max(1, queue_size or settings.STREAMING_INGESTION_QUEUE_SIZE)
+        self.min_pages = (
+            min_pages if min_pages is not None else settings.STREAMING_INGESTION_MIN_PAGES
+        )
+
+        self.pages = 0
+        self.characters = 0
+        self.words = 0
+        self.lines = 0
+        self.chunks_stored = 0
+        self.batches_stored = 0
+        self.paged = False
+        self.rich_metadata: Dict[str, Any] = {}
+        self._first_batch_at: Optional[float] = None
+
+    async def run(
+        self,
+        source: Union[bytes, str],
+        filename: str,
+        file_size: int,
+        row_metadata: Dict[str, Any],
+        document_id: Optional[str] = None,
+    ) -> StreamingIngestionResult:
+        """
+        Ingest one document.
+
+        Args:
+            source: File content, or path of the stored file
+            filename: Original filename (selects the file type)
+            file_size: File size in bytes
+            row_metadata: Fields added to every Milvus row (document_name,
+                file_type, upload_date, ...); document_id is set automatically
+            document_id: Document ID (default: new UUID)
+
+        Returns:
+            StreamingIngestionResult
+
+        Raises:
+            ValueError: If the file is invalid
+            DocumentProcessingError: If extraction fails or yields no text
+            RuntimeError: If embedding or storage fails
+        """
+        start = time.perf_counter()
+
+        self.processor.validate_file_size(file_size)
+        file_type = self.processor.detect_file_type(filename)
+        document_id = document_id or str(uuid.uuid4())
+        base_row = {**row_metadata, "document_id": document_id}
+
+        pages_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        chunks_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        vectors_q: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        tasks = [
+            asyncio.create_task(self._extract(source, file_type, pages_q)),
+            asyncio.create_task(self._chunk(document_id, pages_q, chunks_q)),
+            asyncio.create_task(self._embed(chunks_q, vectors_q)),
+            asyncio.create_task(self._store(base_row, vectors_q)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # One stage failed: stop the others instead of leaving them blocked
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        if self.chunks_stored == 0:
+            raise DocumentProcessingError(f"No text could be extracted from {filename}")
+
+        metadata = self.processor.extract_metadata(filename, file_size, file_type)
+        metadata.update(
+            {
+                "character_count": self.characters,
+                "word_count": self.words,
+                "line_count": self.lines,
+                "page_count": self.pages if self.paged else None,
+            }
+        )
+        metadata.update(self.rich_metadata)
+
+        total_ms = (time.perf_counter() - start) * 1000
+        first_batch_ms = (
+            (self._first_batch_at - start) * 1000 if self._first_batch_at else None
+        )
+
+        logger.info(
+            f"Streamed ingestion of {filename}: {self.chunks_stored} chunks in "
+            f"{self.batches_stored} batches from {self.pages} "
+            f"{'pages' if self.paged else 'text block(s)'} "
+            f"(first batch {first_batch_ms or 0:.0f}ms, total {total_ms:.0f}ms)"
+        )
+
+        return StreamingIngestionResult(
+            document_id=document_id,
+            file_type=file_type,
+            chunk_count=self.chunks_stored,
+            pages=self.pages,
+            batches=self.batches_stored,
+            paged=self.paged,
+            first_batch_ms=round(first_batch_ms, 2) if first_batch_ms else None,
+            total_ms=round(total_ms, 2),
+            metadata=metadata,
+        )
+
+    async def _put_text(self, text: str, pages_q: asyncio.Queue) -> None:
+        self.pages += 1
+        self.characters += len(text)
+        self.words += len(text.split())
+        self.lines += text.count("\n") + 1
+        await pages_q.put(text)
+
+    async def _extract(
+        self, source: Union[bytes, str], file_type: str, pages_q: asyncio.Queue
+    ) -> None:
+        """Stage 1: page texts (or one text block) into pages_q."""
+        if file_type == "pdf":
+            reader = await asyncio.to_thread(self.processor.open_pdf, source)
+            if len(reader.pages) >= self.min_pages:
+                self.paged = True
+                pages = self.processor.iter_pdf_pages(reader)
+                while True:
+                    # Parse one page at a time off the event loop
+                    page = await asyncio.to_thread(next, pages, None)
+                    if page is None:
+                        break
+                    await self._put_text(page, pages_q)
+                await pages_q.put(_DONE)
+                return
+
+        content = source if isinstance(source, bytes) else await asyncio.to_thread(
+            _read_file, source
+        )
+        text, self.rich_metadata = await self.processor.extract_async(content, file_type)
+        del content
+
+        if text and text.strip():
+            await self._put_text(text, pages_q)
+        await pages_q.put(_DONE)
+
+    async def _chunk(
+        self, document_id: str, pages_q: asyncio.Queue, chunks_q: asyncio.Queue
+    ) -> None:
+        """
+        Stage 2: chunk batches into chunks_q.
+
+        The last chunk of each window may continue on the next page, so it
+        is carried over and re-chunked together with the next page.
+        """
+        chunk_size = self.processor.chunk_size
+        chunk_index = 0
+        batch: List[TextChunk] = []
+
+        carry = ""
+        carry_start = 0
+        # Pages form one stream joined by blank lines; offsets refer to it
+        stream_len = 0
+
+        while True:
+            page = await pages_q.get()
+            last = page is _DONE
+
+            if last:
+                window, base = carry, carry_start
+            else:
+                separator = "\n\n" if stream_len else ""
+                if carry:
+                    window, base = carry + separator + page, carry_start
+                else:
+                    window, base = page, stream_len + len(separator)
+                stream_len += len(separator) + len(page)
+
+            pieces = (
+                await asyncio.to_thread(self.processor.split_text, window)
+                if window.strip()
+                else []
+            )
+
+            emit = pieces
+            carry = ""
+            if not last and pieces:
+                tail_start = window.rfind(pieces[-1])
+                if len(pieces) > 1 and tail_start > 0:
+                    emit = pieces[:-1]
+                    carry, carry_start = window[tail_start:], base + tail_start
+                elif len(window) < _MAX_CARRY_FACTOR * chunk_size:
+                    emit = []
+                    carry, carry_start = window, base
+
+            position = 0
+            for piece in emit:
+                found = window.find(piece, position)
+                start = found if found >= 0 else position
+                end = start + len(piece)
+                batch.append(
+                    TextChunk(
+                        chunk_id=f"{document_id}_chunk_{chunk_index}",
+                        document_id=document_id,
+                        text=piece,
+                        chunk_index=chunk_index,
+                        start_char=base + start,
+                        end_char=base + end,
+                        metadata={
+                            "chunking_strategy": self.processor.chunking_strategy,
+                            "chunk_size": len(piece),
+                        },
+                    )
+                )
+                chunk_index += 1
+                position = end
+
+                if len(batch) >= self.batch_size:
+                    await chunks_q.put(batch)
+                    batch = []
+
+            if last:
+                break
+
+        if batch:
+            await chunks_q.put(batch)
+        await chunks_q.put(_DONE)
+
+    async def _embed(self, chunks_q: asyncio.Queue, vectors_q: asyncio.Queue) -> None:
+        """Stage 3: (chunks, float32 embeddings) into vectors_q."""
+        while True:
+            batch = await chunks_q.get()
+            if batch is _DONE:
+                break
+            embeddings = await self.embedding_service.embed_batch(
+                [chunk.text for chunk in batch], batch_size=len(batch), as_numpy=True
+            )
+            await vectors_q.put((batch, embeddings))
+        await vectors_q.put(_DONE)
+
+    async def _store(self, base_row: Dict[str, Any], vectors_q: asyncio.Queue) -> None:
+        """
+        Stage 4: insert into Milvus, then hand rows to on_batch_stored.
+
+        Batches are queued on the Milvus batched writer without waiting, so
+        embedding continues while up to queue_size inserts are in flight;
+        on_batch_stored runs in batch order once a batch is durable.
+        """
+        in_flight: deque = deque()
+        try:
+            while True:
+                item = await vectors_q.get()
+                if item is _DONE:
+                    break
+                batch, embeddings = item
+
+                rows = [
+                    {
+                        **base_row,
+                        "id": chunk.chunk_id,
+                        "text": chunk.text,
+                        "chunk_index": chunk.chunk_index,
+                    }
+                    for chunk in batch
+                ]
+                future = await self.milvus_manager.submit_embeddings(
+                    embeddings=embeddings, metadata=rows
+                )
+                in_flight.append((future, rows))
+
+                while len(in_flight) > self.queue_size:
+                    await self._batch_stored(*in_flight.popleft())
+
+            while in_flight:
+                await self._batch_stored(*in_flight.popleft())
+        finally:
+            # On failure, stop waiting for outstanding inserts. Cancelling
+            # only detaches this pipeline: their rows are still written by
+            # the batched writer, so the caller deletes by document ID.
+            for future, _ in in_flight:
+                future.cancel()
+
+    async def _batch_stored(self, future: asyncio.Future, rows: List[Dict[str, Any]]) -> None:
+        """Wait until a batch is durable, then count it and run on_batch_stored."""
+        await future
+
+        self.chunks_stored += len(rows)
+        self.batches_stored += 1
+        if self._first_batch_at is None:
+            self._first_batch_at = time.perf_counter()
+
+        if self.on_batch_stored is not None:
+            try:
+                await self.on_batch_stored(rows)
+            except Exception as e:
+                logger.warning(f"Post-store hook failed for batch: {e}")
@@ -0,0 +1,149 @@
+"""
+Test script to verify the inverted-index BM25 scores like the original.
+
+The postings-based BM25 must return the same scores as the original
+implementation, which tokenized every document and scored the whole corpus
+term by term for each query.
+
+Run this to verify:
+    python backend/test_bm25_search.py
+"""
+
+import sys
+import math
+import random
+import logging
+from collections import Counter
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+QUERIES = [
+    "w1 w2 w3",
+    "w7 w7 w19",           # repeated query term
+    "w4 unknownterm",      # term not in the corpus
+    "W12 w150, w33!",      # case and punctuation
+    "nothing matches",
+]
+
+
+def _make_corpus(num_docs=300, vocabulary=200, seed=0):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocabulary)]
+    corpus = [" ".join(rng.choices(words, k=rng.randint(1, 40))) for _ in range(num_docs)]
+    doc_ids = [f"doc-{i}" for i in range(num_docs)]
+    return corpus, doc_ids
+
+
+def _reference_search(corpus, doc_ids, query, top_k, k1=1.5, b=0.75):
+    """BM25 as originally implemented: score every document for every query term."""
+    from backend.services.bm25_search import BM25
+
+    tokenize = BM25().tokenize
+    docs = [tokenize(text) for text in corpus]
+    num_docs = len(docs)
+    avg_doc_length = sum(map(len, docs)) / num_docs
+
+    doc_freqs = Counter()
+    for doc in docs:
+        doc_freqs.update(set(doc))
+    idf = {
+        term: math.log((num_docs - freq + 0.5) / (freq + 0.5) + 1.0)
+        for term, freq in doc_freqs.items()
+    }
+
+    scores = []
+    for idx, doc in enumerate(docs):
+        term_freqs = Counter(doc)
+        score = 0.0
+        for term in tokenize(query):
+            if term not in idf:
+                continue
+            tf = term_freqs.get(term, 0)
+            score += idf[term] * (tf * (k1 + 1)) / (
+                tf + k1 * (1 - b + b * (len(doc) / avg_doc_length))
+            )
+        if score > 0:
+            scores.append((doc_ids[idx], score))
+
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return scores[:top_k]
+
+
+def _assert_same_results(actual, expected):
+    assert len(actual) == len(expected), f"{len(actual)} results, expected {len(expected)}"
+    expected_scores = dict(expected)
+    for doc_id, score in actual:
+        assert doc_id in expected_scores, f"Unexpected result {doc_id}"
+        assert abs(score - expected_scores[doc_id]) < 1e-9, f"Score mismatch for {doc_id}"
+    # Same ranking up to ties
+    assert [round(s, 9) for _, s in actual] == [round(s, 9) for _, s in expected]
+
+
+def test_scores_match_reference():
+    """Test that search results and scores match the original implementation."""
+    from backend.services.bm25_search import BM25
+
+    logger.info("=" * 60)
+    logger.info("Testing BM25 score parity")
+    logger.info("=" * 60)
+
+    corpus, doc_ids = _make_corpus()
+    bm25 = BM25()
+    bm25.fit(corpus, doc_ids)
+
+    for query in QUERIES:
+        expected = _reference_search(corpus, doc_ids, query, top_k=20)
+        _assert_same_results(bm25.search(query, top_k=20), expected)
+        logger.info(f"'{query}': {len(expected)} results match")
+
+    # Single-document scoring agrees with the full search
+    query = QUERIES[0]
+    for doc_id, score in bm25.search(query, top_k=5):
+        assert abs(bm25.score(query, doc_ids.index(doc_id)) - score) < 1e-9
+
+    logger.info("✅ BM25 scores match the original implementation")
+    logger.info("=" * 60)
+
+
+def test_extend_matches_fit():
+    """Test that an index built in batches scores like one built at once."""
+    from backend.services.bm25_search import BM25
+
+    logger.info("=" * 60)
+    logger.info("Testing BM25 incremental extend")
+    logger.info("=" * 60)
+
+    corpus, doc_ids = _make_corpus(seed=1)
+    fitted = BM25()
+    fitted.fit(corpus, doc_ids)
+
+    extended = BM25()
+    for start in range(0, len(corpus), 70):
+        extended.extend(corpus[start:start + 70], doc_ids[start:start + 70])
+
+    assert extended.num_docs == fitted.num_docs
+    for query in QUERIES:
+        _assert_same_results(extended.search(query, top_k=20), fitted.search(query, top_k=20))
+
+    assert BM25().search("w1") == [], "Empty index must return no results"
+
+    logger.info("✅ Incremental index matches a full fit")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        test_scores_match_reference()
+        test_extend_matches_fit()
+
+        logger.info("\n🎉 All tests passed! BM25 scores are unchanged.")
+
+    except Exception as e:
+        logger.error(f"\n❌ Test failed with error: {e}", exc_info=True)
+        sys.exit(1)
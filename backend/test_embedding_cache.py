@@ -0,0 +1,118 @@
+"""
+Test script to verify the persistent embedding cache.
+
+Vectors are keyed by model name, dimension and normalized text, so the same
+model name at another dimension (e.g. after switching to an auto-detected
+dimension) must never get a stale vector back, and vectors must survive a
+reopen through the SQLite tier.
+
+Run this to verify:
+    python backend/test_embedding_cache.py
+"""
+
+import os
+import sys
+import logging
+import tempfile
+
+import numpy as np
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+MODEL = "test-model"
+
+
+def test_dimension_keying():
+    """Test that vectors are only returned for the dimension they were stored at."""
+    from backend.services.embedding_cache import EmbeddingCache, embedding_cache_key
+
+    logger.info("=" * 60)
+    logger.info("Testing embedding cache dimension keying")
+    logger.info("=" * 60)
+
+    assert embedding_cache_key(MODEL, "hello", 384) != embedding_cache_key(MODEL, "hello", 768)
+    assert embedding_cache_key(MODEL, "hello", 384) != embedding_cache_key("other", "hello", 384)
+    assert embedding_cache_key(MODEL, " hello\n  world ", 384) == embedding_cache_key(
+        MODEL, "hello world", 384
+    ), "Whitespace is normalized"
+
+    cache = EmbeddingCache(db_path=None)
+    cache.put(MODEL, "hello", np.ones(384), dimension=384)
+    cache.put(MODEL, "hello", np.full(768, 2.0), dimension=768)
+
+    small = cache.get(MODEL, "hello", 384)
+    large = cache.get(MODEL, "hello", 768)
+    assert small.shape == (384,) and small.dtype == np.float32 and small[0] == 1.0
+    assert large.shape == (768,) and large[0] == 2.0
+    assert cache.get(MODEL, "hello", 1024) is None
+
+    # A vector of the wrong dimension is not stored
+    cache.put(MODEL, "wrong", np.ones(10), dimension=384)
+    assert cache.get(MODEL, "wrong", 384) is None
+    assert cache.get_stats()["dimension_mismatches"] == 1
+
+    # Returned vectors are read-only views of the cached copy
+    assert not small.flags.writeable
+
+    logger.info(f"Cache stats: {cache.get_stats()}")
+    logger.info("✅ Vectors are keyed by dimension")
+    logger.info("=" * 60)
+
+
+def test_disk_round_trip():
+    """Test that vectors are served from SQLite after a reopen."""
+    from backend.services.embedding_cache import EmbeddingCache
+
+    logger.info("=" * 60)
+    logger.info("Testing embedding cache disk tier")
+    logger.info("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "embeddings.sqlite3")
+
+        cache = EmbeddingCache(db_path=db_path)
+        texts = [f"text {i}" for i in range(1200)]  # more than one SQL batch
+        vectors = np.random.default_rng(0).random((len(texts), 8), dtype=np.float32)
+        cache.put_many(MODEL, texts, vectors, dimension=8)
+        cache.close()
+        assert cache.get_stats()["pending_disk_writes"] == 0
+
+        reopened = EmbeddingCache(db_path=db_path)
+        results = reopened.get_many(MODEL, texts + ["never stored"], dimension=8)
+        assert results[-1] is None
+        assert np.array_equal(np.stack(results[:-1]), vectors)
+        assert reopened.get(MODEL, "text 0", dimension=16) is None, "Other dimension misses"
+
+        stats = reopened.get_stats()
+        logger.info(f"Reopened cache stats: {stats}")
+        assert stats["disk_hits"] == len(texts)
+        assert stats["misses"] == 2
+
+        # Second lookup is served from memory
+        reopened.get(MODEL, "text 5", dimension=8)
+        assert reopened.get_stats()["memory_hits"] == 1
+
+        reopened.clear(MODEL)
+        assert reopened.get(MODEL, "text 5", dimension=8) is None
+        reopened.close()
+
+    logger.info("✅ Vectors survive a reopen through SQLite")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        test_dimension_keying()
+        test_disk_round_trip()
+
+        logger.info("\n🎉 All tests passed! Embedding cache works correctly.")
+
+    except Exception as e:
+        logger.error(f"\n❌ Test failed with error: {e}", exc_info=True)
+        sys.exit(1)
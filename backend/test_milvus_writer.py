@@ -0,0 +1,162 @@
+"""
+Test script to verify the batched Milvus insert path.
+
+Concurrent submissions must be coalesced into one insert, each caller must
+get back the primary keys of its own rows, and a failed combined insert
+must be retried per submission so only the one with bad rows fails.
+
+Run this to verify:
+    python backend/test_milvus_writer.py
+"""
+
+import sys
+import asyncio
+import logging
+import threading
+from types import SimpleNamespace
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FakeCollection:
+    """Stand-in for a pymilvus Collection; rejects inserts containing "bad"."""
+
+    def __init__(self):
+        self.inserts = []
+        self.flushes = 0
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+    def insert(self, columns):
+        if "bad" in columns[1]:
+            raise ValueError("invalid row")
+        with self._lock:
+            self.inserts.append(len(columns[0]))
+            start = self._next_key
+            self._next_key += len(columns[0])
+        return SimpleNamespace(primary_keys=list(range(start, start + len(columns[0]))))
+
+    def flush(self):
+        self.flushes += 1
+
+
+def _rows(prefix, count):
+    return [[f"{prefix}-{i}" for i in range(count)], [f"text {prefix}" for _ in range(count)]]
+
+
+async def _run_batching():
+    from backend.services.milvus_writer import MilvusBatchWriter
+
+    collection = FakeCollection()
+    writer = MilvusBatchWriter(
+        lambda: collection, num_fields=2, max_batch_rows=100, max_delay=0.05, flush_interval=0
+    )
+
+    # Submitted together, inserted together
+    futures = [writer.submit(_rows(f"doc{i}", 3)) for i in range(5)]
+    keys = await asyncio.gather(*futures)
+    assert collection.inserts == [15], collection.inserts
+    assert keys == [list(range(i * 3, i * 3 + 3)) for i in range(5)]
+
+    # A full buffer is inserted without waiting for max_delay
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await writer.submit(_rows("big", 100))
+    assert loop.time() - start < 0.05
+    assert collection.inserts == [15, 100]
+
+    # Empty submissions resolve at once
+    assert await writer.submit([[], []]) == []
+
+    try:
+        writer.submit([["only one column"]])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Wrong column count was accepted")
+
+    return writer.get_stats()
+
+
+def test_batching():
+    """Test that concurrent submissions share one insert."""
+    logger.info("=" * 60)
+    logger.info("Testing Milvus batch writer coalescing")
+    logger.info("=" * 60)
+
+    stats = asyncio.run(_run_batching())
+    logger.info(f"Writer stats: {stats}")
+
+    assert stats["submissions"] == 6
+    assert stats["inserts"] == 2
+    assert stats["inserted_rows"] == 115
+    assert stats["max_batch_rows_seen"] == 100
+    assert stats["pending_rows"] == 0
+
+    logger.info("✅ Submissions are coalesced into batched inserts")
+    logger.info("=" * 60)
+
+
+async def _run_retry():
+    from backend.services.milvus_writer import MilvusBatchWriter
+
+    collection = FakeCollection()
+    writer = MilvusBatchWriter(
+        lambda: collection, num_fields=2, max_batch_rows=100, max_delay=0.05, flush_interval=0
+    )
+
+    good_before = writer.submit(_rows("a", 2))
+    bad = writer.submit([["b-0", "b-1"], ["fine", "bad"]])
+    good_after = writer.submit(_rows("c", 4))
+    results = await asyncio.gather(good_before, bad, good_after, return_exceptions=True)
+
+    assert results[0] == [0, 1]
+    assert isinstance(results[1], RuntimeError), results[1]
+    assert results[2] == [2, 3, 4, 5]
+    assert collection.inserts == [2, 4], "Good submissions retried on their own"
+
+    await writer.close()
+    try:
+        writer.submit(_rows("late", 1))
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("Closed writer accepted rows")
+
+    return writer.get_stats(), collection
+
+
+def test_retry_per_submission():
+    """Test that one bad submission does not fail the whole batch."""
+    logger.info("=" * 60)
+    logger.info("Testing Milvus batch writer per-submission retry")
+    logger.info("=" * 60)
+
+    stats, collection = asyncio.run(_run_retry())
+    logger.info(f"Writer stats: {stats}")
+
+    assert stats["failed_inserts"] == 2, "Combined insert and the bad retry"
+    assert stats["retried_submissions"] == 3
+    assert stats["inserted_rows"] == 6
+    assert collection.flushes == 1, "close() seals the inserted rows once"
+
+    logger.info("✅ Only the submission with bad rows failed")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        test_batching()
+        test_retry_per_submission()
+
+        logger.info("\n🎉 All tests passed! Milvus batch writer works correctly.")
+
+    except Exception as e:
+        logger.error(f"\n❌ Test failed with error: {e}", exc_info=True)
+        sys.exit(1)
@@ -0,0 +1,164 @@
+"""
+Test script to verify the segmented BM25 index.
+
+Adds go to new segments, deletes leave tombstones, and merges drop the
+tombstoned documents. Search results must match a single BM25 index built
+over the live documents.
+
+Run this to verify:
+    python backend/test_segmented_bm25.py
+"""
+
+import sys
+import random
+import logging
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+QUERIES = ["w1 w2 w3", "w7 w7 w19", "w4 unknownterm", "w150 w33"]
+
+
+def _make_corpus(num_docs=400, vocabulary=200, seed=0):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocabulary)]
+    corpus = [" ".join(rng.choices(words, k=rng.randint(1, 40))) for _ in range(num_docs)]
+    doc_ids = [f"doc-{i}" for i in range(num_docs)]
+    return corpus, doc_ids
+
+
+def _build_segments(corpus, doc_ids, batch_size=50, **kwargs):
+    from backend.services.bm25_search import SegmentedBM25
+
+    index = SegmentedBM25(**kwargs)
+    for start in range(0, len(corpus), batch_size):
+        index.add(corpus[start:start + batch_size], doc_ids[start:start + batch_size])
+    return index
+
+
+def _reference(corpus, doc_ids, exclude=()):
+    from backend.services.bm25_search import BM25
+
+    live = [(text, doc_id) for text, doc_id in zip(corpus, doc_ids) if doc_id not in exclude]
+    bm25 = BM25()
+    bm25.fit([text for text, _ in live], [doc_id for _, doc_id in live])
+    return bm25
+
+
+def _assert_same_results(actual, expected):
+    assert len(actual) == len(expected), f"{len(actual)} results, expected {len(expected)}"
+    expected_scores = dict(expected)
+    for doc_id, score in actual:
+        assert doc_id in expected_scores, f"Unexpected result {doc_id}"
+        assert abs(score - expected_scores[doc_id]) < 1e-9, f"Score mismatch for {doc_id}"
+
+
+def test_segments_match_single_index():
+    """Test that a multi-segment index scores like one BM25 over all documents."""
+    logger.info("=" * 60)
+    logger.info("Testing segmented BM25 parity")
+    logger.info("=" * 60)
+
+    corpus, doc_ids = _make_corpus()
+    index = _build_segments(corpus, doc_ids, max_segments=100)
+    reference = _reference(corpus, doc_ids)
+
+    assert len(index.segments) == 8
+    assert index.num_docs == len(corpus)
+    assert abs(index.avg_doc_length - reference.avg_doc_length) < 1e-9
+
+    for query in QUERIES:
+        _assert_same_results(index.search(query, top_k=20), reference.search(query, top_k=20))
+
+    logger.info("✅ Segmented index matches a single index")
+    logger.info("=" * 60)
+
+
+def test_tombstones_and_merge():
+    """Test deletes, replacement of re-added IDs and merging away tombstones."""
+    logger.info("=" * 60)
+    logger.info("Testing BM25 tombstones and merges")
+    logger.info("=" * 60)
+
+    corpus, doc_ids = _make_corpus(seed=1)
+    index = _build_segments(corpus, doc_ids, max_segments=100)
+
+    deleted = set(doc_ids[::7])
+    assert index.delete(list(deleted) + ["missing-doc"]) == len(deleted)
+    assert index.delete(list(deleted)) == 0, "Deleting twice must be a no-op"
+    assert index.num_docs == len(corpus) - len(deleted)
+    assert index.deleted_docs == len(deleted)
+
+    for query in QUERIES:
+        results = index.search(query, top_k=50)
+        assert not deleted & {doc_id for doc_id, _ in results}, "Tombstoned doc returned"
+
+    # Re-adding an ID tombstones the old copy
+    index.add(["w1 w1 w1 w1"], [doc_ids[1]])
+    assert index.num_docs == len(corpus) - len(deleted)
+    assert index.deleted_docs == len(deleted) + 1
+    assert index.search("w1", top_k=1)[0][0] == doc_ids[1]
+    corpus[1] = "w1 w1 w1 w1"
+
+    # Merging everything drops the tombstones, after which document
+    # frequencies no longer count deleted documents
+    assert index.merge() == 9
+    assert len(index.segments) == 1
+    assert index.deleted_docs == 0
+    assert index.num_docs == len(corpus) - len(deleted)
+
+    reference = _reference(corpus, doc_ids, exclude=deleted)
+    for query in QUERIES:
+        _assert_same_results(index.search(query, top_k=20), reference.search(query, top_k=20))
+
+    logger.info("✅ Tombstones are hidden and merged away")
+    logger.info("=" * 60)
+
+
+def test_merge_policy():
+    """Test which segments select_merge picks."""
+    logger.info("=" * 60)
+    logger.info("Testing BM25 merge selection")
+    logger.info("=" * 60)
+
+    corpus, doc_ids = _make_corpus(num_docs=100, seed=2)
+    index = _build_segments(
+        corpus, doc_ids, batch_size=10, max_segments=20, merge_factor=4, max_deleted_ratio=0.3
+    )
+    assert index.select_merge() == [], "No merge due below max_segments without tombstones"
+
+    # 40% of the third segment deleted
+    index.delete(doc_ids[20:24])
+    assert index.select_merge() == [index.segments[2]]
+
+    index.max_segments = 8
+    selected = index.select_merge()
+    assert index.segments[2] in selected
+    # The tombstoned segment is also the smallest, so it is picked once
+    assert len(selected) == 4, "merge_factor smallest segments"
+
+    merged = index.merge(selected)
+    assert merged == 4
+    assert len(index.segments) == 7
+    assert index.num_docs == 96
+
+    logger.info("✅ Merge policy selects the expected segments")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        test_segments_match_single_index()
+        test_tombstones_and_merge()
+        test_merge_policy()
+
+        logger.info("\n🎉 All tests passed! Segmented BM25 index works correctly.")
+
+    except Exception as e:
+        logger.error(f"\n❌ Test failed with error: {e}", exc_info=True)
+        sys.exit(1)
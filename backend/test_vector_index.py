@@ -0,0 +1,145 @@
+"""
+Test script to verify the in-process FlatVectorIndex used by the caches.
+
+Covers add/replace/remove by key, reuse of freed slots, growth past the
+initial capacity, top-k ordering and expiry masking.
+
+Run this to verify:
+    python backend/test_vector_index.py
+"""
+
+import sys
+import logging
+
+import numpy as np
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _unit(dimension, axis):
+    vector = np.zeros(dimension, dtype=np.float32)
+    vector[axis] = 1.0
+    return vector
+
+
+def test_add_search_remove():
+    """Test exact search, replacement and removal by key."""
+    from backend.core.vector_index import FlatVectorIndex
+
+    logger.info("=" * 60)
+    logger.info("Testing FlatVectorIndex add/search/remove")
+    logger.info("=" * 60)
+
+    index = FlatVectorIndex()
+    assert index.search([1.0, 0.0, 0.0]) == [], "Empty index must return no results"
+
+    assert index.add("x", [2.0, 0.0, 0.0])
+    assert index.add("y", [0.0, 3.0, 0.0])
+    assert index.add("xy", [1.0, 1.0, 0.0])
+    assert index.dimension == 3 and len(index) == 3
+
+    # Rejected vectors
+    assert not index.add("zero", [0.0, 0.0, 0.0])
+    assert not index.add("short", [1.0, 0.0])
+    assert "zero" not in index and "short" not in index
+
+    (key, similarity), = index.search([5.0, 0.0, 0.0])
+    assert key == "x" and abs(similarity - 1.0) < 1e-6
+
+    results = index.search([1.0, 0.2, 0.0], top_k=3)
+    assert [key for key, _ in results] == ["x", "xy", "y"]
+    assert all(a[1] >= b[1] for a, b in zip(results, results[1:]))
+    assert len(index.search([1.0, 0.0, 0.0], top_k=10)) == 3
+
+    # Replacing a key keeps one row
+    assert index.add("x", [0.0, 0.0, 1.0])
+    assert len(index) == 3
+    assert index.search([0.0, 0.0, 1.0])[0][0] == "x"
+
+    assert index.remove("x")
+    assert not index.remove("x")
+    assert "x" not in index
+    assert "x" not in [key for key, _ in index.search([0.0, 0.0, 1.0], top_k=3)]
+
+    index.clear()
+    assert len(index) == 0 and index.search([1.0, 0.0, 0.0]) == []
+
+    logger.info("✅ Add, search and remove work by key")
+    logger.info("=" * 60)
+
+
+def test_slot_reuse_and_growth():
+    """Test that freed rows are reused and the matrix doubles when full."""
+    from backend.core.vector_index import FlatVectorIndex
+
+    logger.info("=" * 60)
+    logger.info("Testing FlatVectorIndex slot reuse and growth")
+    logger.info("=" * 60)
+
+    dimension = 16
+    index = FlatVectorIndex(dimension=dimension, initial_capacity=4)
+    for i in range(4):
+        index.add(f"k{i}", _unit(dimension, i))
+    assert index._capacity == 4
+
+    index.remove("k1")
+    index.add("new", _unit(dimension, 5))
+    assert index._capacity == 4, "Freed slot must be reused before growing"
+    assert index._slots["new"] == 1
+
+    for i in range(6, 12):
+        index.add(f"k{i}", _unit(dimension, i))
+    assert index._capacity == 16, "Matrix doubles when full"
+    assert len(index) == 10
+
+    # Every key still finds its own vector after the copy
+    for key, axis in [("k0", 0), ("new", 5), ("k11", 11)]:
+        (found, similarity), = index.search(_unit(dimension, axis))
+        assert found == key and abs(similarity - 1.0) < 1e-6
+
+    logger.info("✅ Slots are reused and the index grows")
+    logger.info("=" * 60)
+
+
+def test_expiry_mask():
+    """Test that expired rows are skipped when a search passes now."""
+    from backend.core.vector_index import FlatVectorIndex
+
+    logger.info("=" * 60)
+    logger.info("Testing FlatVectorIndex expiry masking")
+    logger.info("=" * 60)
+
+    index = FlatVectorIndex()
+    index.add("expired", [1.0, 0.0], expires_at=100.0)
+    index.add("close", [1.0, 0.1], expires_at=300.0)
+    index.add("forever", [0.0, 1.0])
+
+    assert index.search([1.0, 0.0])[0][0] == "expired", "No expiry check without now"
+    assert index.search([1.0, 0.0], now=200.0)[0][0] == "close"
+    assert [key for key, _ in index.search([1.0, 0.0], top_k=3, now=500.0)] == ["forever"]
+
+    # Re-adding a key without expires_at clears its expiry
+    index.add("expired", [1.0, 0.0])
+    assert index.search([1.0, 0.0], now=500.0)[0][0] == "expired"
+
+    logger.info("✅ Expired rows are masked inside the search")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        test_add_search_remove()
+        test_slot_reuse_and_growth()
+        test_expiry_mask()
+
+        logger.info("\n🎉 All tests passed! FlatVectorIndex works correctly.")
+
+    except Exception as e:
+        logger.error(f"\n❌ Test failed with error: {e}", exc_info=True)
+        sys.exit(1)
@@ -0,0 +1,170 @@
+"""
+Test script to verify the ready-queue workflow scheduler.
+
+Independent nodes must run concurrently, joins must wait for all their
+inputs, untaken condition branches must be skipped without blocking the
+nodes after them, and long chains must not hit the recursion limit.
+
+Run this to verify:
+    python backend/test_workflow_scheduler.py
+"""
+
+import sys
+import time
+import asyncio
+import logging
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FakeWorkflow:
+    def __init__(self, workflow_id, nodes, edges):
+        self.id = workflow_id
+        self.updated_at = "2024-01-01T00:00:00"
+        self.graph_definition = {"nodes": nodes, "edges": edges}
+
+
+def _node(node_id, node_type, **data):
+    return {"id": node_id, "type": node_type, "data": data}
+
+
+def _edge(source, target, handle=None):
+    return {"source": source, "target": target, "sourceHandle": handle}
+
+
+async def _run(workflow, input_data):
+    """Run a workflow with fake nodes; returns (output, executed node IDs)."""
+    from backend.services.agent_builder.workflow_executor import WorkflowExecutor
+
+    executor = WorkflowExecutor(workflow, db=None)
+    executed = []
+
+    async def execute_node(node, nodes, edges, data):
+        executed.append(node["id"])
+        config = node["data"]
+        await asyncio.sleep(config.get("delay", 0))
+        if node["type"] == "condition":
+            return {"branch": config["branch"], "data": data}
+        return {"node": node["id"], "input": data}
+
+    executor._execute_node = execute_node
+
+    graph = workflow.graph_definition
+    output = await executor._execute_from_node(
+        graph["nodes"][0], graph["nodes"], graph["edges"], input_data
+    )
+    return output, executed
+
+
+def test_fan_out_and_join():
+    """Test that sibling nodes run concurrently and the join gets both inputs."""
+    logger.info("=" * 60)
+    logger.info("Testing scheduler fan-out and join")
+    logger.info("=" * 60)
+
+    workflow = FakeWorkflow(
+        "fan-out",
+        [
+            _node("start", "start"),
+            _node("a", "block", delay=0.2),
+            _node("b", "block", delay=0.2),
+            _node("join", "merge"),
+        ],
+        [_edge("start", "a"), _edge("start", "b"), _edge("a", "join"), _edge("b", "join")],
+    )
+
+    started = time.perf_counter()
+    output, executed = asyncio.run(_run(workflow, {"q": 1}))
+    elapsed = time.perf_counter() - started
+    logger.info(f"Executed {executed} in {elapsed:.2f}s")
+
+    assert elapsed < 0.35, "a and b must run concurrently"
+    assert executed[0] == "start" and executed[-1] == "join"
+    assert sorted(executed) == ["a", "b", "join", "start"], "Each node runs once"
+
+    assert output["node"] == "join"
+    assert set(output["input"]) == {"a", "b"}, "Join input is keyed by predecessor"
+    assert output["input"]["a"]["input"]["node"] == "start"
+
+    logger.info("✅ Independent nodes ran concurrently and joined once")
+    logger.info("=" * 60)
+
+
+def test_branch_skip():
+    """Test that the untaken branch is skipped and the join after it still runs."""
+    logger.info("=" * 60)
+    logger.info("Testing scheduler branch skipping")
+    logger.info("=" * 60)
+
+    workflow = FakeWorkflow(
+        "branch",
+        [
+            _node("start", "start"),
+            _node("check", "condition", branch="true"),
+            _node("yes", "block"),
+            _node("no", "block"),
+            _node("no-2", "block"),
+            _node("join", "merge"),
+        ],
+        [
+            _edge("start", "check"),
+            _edge("check", "yes", "true"),
+            _edge("check", "no", "false"),
+            _edge("no", "no-2"),
+            _edge("yes", "join"),
+            _edge("no-2", "join"),
+        ],
+    )
+
+    output, executed = asyncio.run(_run(workflow, {"q": 1}))
+    logger.info(f"Executed {executed}")
+
+    assert executed == ["start", "check", "yes", "join"]
+    # Single taken input: passed as is, not wrapped in a dict
+    assert output["node"] == "join"
+    assert output["input"]["node"] == "yes"
+    # The condition forwards its input to the taken branch
+    assert output["input"]["input"]["node"] == "start"
+
+    logger.info("✅ Untaken branch skipped, join after it ran")
+    logger.info("=" * 60)
+
+
+def test_long_chain_with_cycle():
+    """Test a long chain closed into a cycle: no recursion, each node once."""
+    logger.info("=" * 60)
+    logger.info("Testing scheduler on a long chain")
+    logger.info("=" * 60)
+
+    length = 3000
+    nodes = [_node("start", "start")] + [_node(f"n{i}", "block") for i in range(length)]
+    edges = [_edge("start", "n0")] + [_edge(f"n{i}", f"n{i + 1}") for i in range(length - 1)]
+    edges.append(_edge(f"n{length - 1}", "n0"))  # back edge, dropped at compile time
+
+    output, executed = asyncio.run(_run(FakeWorkflow("chain", nodes, edges), {"q": 1}))
+
+    assert len(executed) == length + 1
+    assert len(set(executed)) == length + 1, "No node runs twice"
+    assert output["node"] == f"n{length - 1}"
+
+    logger.info(f"✅ Ran a {length}-node chain without recursion")
+    logger.info("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        test_fan_out_and_join()
+        test_branch_skip()
+        test_long_chain_with_cycle()
+
+        logger.info("\n🎉 All tests passed! Workflow scheduler works correctly.")
+
+    except Exception as e:
+        logger.error(f"\n❌ Test failed with error: {e}", exc_info=True)
+        sys.exit(1)
@@ -0,0 +1,133 @@
+"""
+Embedding Memory Benchmark (large document ingestion)
+
+Measures the Python heap used to hold a document's chunk embeddings on the
+ingestion path (embed_batch -> MilvusManager.insert_embeddings column data),
+comparing the list-of-lists representation with the zero-copy float32
+ndarray returned by ``embed_batch(..., as_numpy=True)``.
+
+Chunks come from a real PDF (``--pdf``, extracted and chunked by
+DocumentProcessor) or are synthetic (``--chunks``). Vectors come from the
+configured embedding model (``--model``) or a random stand-in encoder, which
+is enough to measure memory since only the output representation differs.
+
+Usage:
+    python scripts/benchmark/benchmark_embedding_memory.py [--chunks 10000] [--dim 768]
+    python scripts/benchmark/benchmark_embedding_memory.py --pdf big.pdf --model jhgan/ko-sroberta-multitask
+"""
+
+import argparse
+import asyncio
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+
+class RandomEncoder:
+    """Stand-in for SentenceTransformer.encode returning float32 vectors."""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.rng = np.random.default_rng(0)
+
+    async def embed_batch(self, texts: List[str], as_numpy: bool = False):
+        embeddings = self.rng.standard_normal((len(texts), self.dim), dtype=np.float32)
+        return embeddings if as_numpy else embeddings.tolist()
+
+
+async def load_chunks(args) -> List[str]:
+    if not args.pdf:
+        return [f"synthetic chunk {i} " * 40 for i in range(args.chunks)]
+
+    from backend.services.document_processor import DocumentProcessor
+
+    content = Path(args.pdf).read_bytes()
+    _, chunks = await DocumentProcessor().process_document(
+        file_content=content, filename=Path(args.pdf).name, file_size=len(content)
+    )
+    return [chunk.text for chunk in chunks]
+
+
+def milvus_column(embeddings):
+    """Vector column as MilvusManager.insert_embeddings hands it to pymilvus."""
+    if isinstance(embeddings, np.ndarray):
+        return list(np.ascontiguousarray(embeddings, dtype=np.float32))
+    return embeddings
+
+
+async def measure(encoder, texts: List[str], as_numpy: bool) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    embeddings = await encoder.embed_batch(texts, as_numpy=as_numpy)
+    column = milvus_column(embeddings)
+
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del embeddings, column
+
+    return {
+        "retained_mb": retained / 1024 / 1024,
+        "peak_mb": peak / 1024 / 1024,
+        "seconds": elapsed,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pdf", help="PDF to extract and chunk (default: synthetic chunks)")
+    parser.add_argument("--chunks", type=int, default=10_000, help="Synthetic chunk count")
+    parser.add_argument("--dim", type=int, default=768, help="Stand-in encoder dimension")
+    parser.add_argument("--model", help="Embedding model to use instead of the stand-in")
+    args = parser.parse_args()
+
+    texts = await load_chunks(args)
+
+    if args.model:
+        from backend.services.embedding import EmbeddingService
+        from backend.services.embedding_cache import EmbeddingCache
+
+        # Memory-only cache with no capacity: every run encodes from scratch
+        encoder = EmbeddingService(
+            model_name=args.model,
+            embedding_cache=EmbeddingCache(db_path=None, memory_max_entries=0),
+        )
+        dim = encoder.dimension
+    else:
+        encoder = RandomEncoder(args.dim)
+        dim = args.dim
+
+    print("=" * 70)
+    print(f"Embedding memory benchmark: {len(texts)} chunks, dim={dim}")
+    print(f"Raw float32 payload: {len(texts) * dim * 4 / 1024 / 1024:.1f} MB")
+    print("=" * 70)
+    print(f"{'mode':>14} | {'retained':>10} | {'peak':>10} | {'time':>8}")
+    print("-" * 70)
+
+    results = {}
+    for label, as_numpy in (("list-of-lists", False), ("ndarray", True)):
+        result = await measure(encoder, texts, as_numpy)
+        results[label] = result
+        print(
+            f"{label:>14} | {result['retained_mb']:>8.1f}MB | "
+            f"{result['peak_mb']:>8.1f}MB | {result['seconds']:>7.2f}s"
+        )
+
+    ratio = results["list-of-lists"]["retained_mb"] / max(
+        results["ndarray"]["retained_mb"], 1e-9
+    )
+    print("-" * 70)
+    print(f"ndarray mode retains {ratio:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
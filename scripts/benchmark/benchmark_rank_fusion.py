@@ -0,0 +1,172 @@
+"""
+Rank Fusion Micro-Benchmark
+
+Compares the shared fusion engine (backend/services/rank_fusion.py)
+with the previous dict-based implementations, and measures how early the
+streaming fusion delivers its first top-k.
+
+Scenarios:
+- RRF over 2 lists (hybrid search) and 6 lists (RAG Fusion perspectives)
+- Weighted and min-max fusion
+- List lengths 20, 200, 2000
+- Streaming: retrievers with staggered latencies, time to first / final top-k
+
+Usage:
+    python scripts/benchmark/benchmark_rank_fusion.py [--repeat 200]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from backend.services.rank_fusion import (  # noqa: E402
+    FusionMethod,
+    RankFusion,
+    Retriever,
+    fuse,
+    fuse_stream,
+)
+
+
+def legacy_rrf(lists: List[List[Tuple[str, float]]], top_k: int, k: int = 60):
+    """Previous HybridSearchService.reciprocal_rank_fusion (generalized to N lists)."""
+    rrf_scores: Dict[str, float] = {}
+    for results in lists:
+        for rank, (doc_id, _) in enumerate(results, start=1):
+            rrf_scores[doc_id] = rrf_scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)[:top_k]
+
+
+def legacy_rag_fusion(lists: List[List[dict]], top_k: int, k: int = 60):
+    """Previous RAGFusion._reciprocal_rank_fusion (copies a dict per occurrence)."""
+    rrf_scores = defaultdict(float)
+    result_data = {}
+    for results in lists:
+        for rank, result in enumerate(results, start=1):
+            result_id = result.get("chunk_id") or result.get("id")
+            rrf_scores[result_id] += 1.0 / (k + rank)
+            result_data[result_id] = {
+                **result,
+                "rrf_score": rrf_scores[result_id],
+                "fusion_count": 1,
+            }
+    return sorted(result_data.values(), key=lambda x: x["rrf_score"], reverse=True)[:top_k]
+
+
+def legacy_weighted(lists: List[List[Tuple[str, float]]], top_k: int):
+    combined: Dict[str, float] = {}
+    for results in lists:
+        max_score = max(score for _, score in results)
+        for doc_id, score in results:
+            combined[doc_id] = combined.get(doc_id, 0.0) + score / max_score
+    return sorted(combined.items(), key=lambda x: x[1], reverse=True)[:top_k]
+
+
+def make_lists(num_lists: int, length: int, seed: int) -> List[List[Tuple[str, float]]]:
+    rng = random.Random(seed)
+    universe = length * 3
+    lists = []
+    for _ in range(num_lists):
+        ids = rng.sample(range(universe), length)
+        scores = sorted((rng.random() for _ in range(length)), reverse=True)
+        lists.append([(f"chunk_{i}", s) for i, s in zip(ids, scores)])
+    return lists
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def engine_rag_fusion(lists: List[List[dict]], top_k: int):
+    fusion = RankFusion()
+    for results in lists:
+        fusion.add([r["id"] for r in results], payloads=results)
+    return [
+        {**r, "rrf_score": score, "fusion_count": count}
+        for r, score, count in fusion.top_k_payloads(top_k)
+    ]
+
+
+def run_batch(repeat: int):
+    print(f"{'scenario':<30} | {'legacy':>10} | {'engine':>10} | {'speedup':>7}")
+    print("-" * 66)
+    for num_lists, label in ((2, "hybrid"), (6, "rag-fusion")):
+        for length in (20, 200, 2000):
+            lists = make_lists(num_lists, length, seed=length)
+            dict_lists = [[{"id": d, "score": s, "text": "x"} for d, s in l] for l in lists]
+            reps = max(1, repeat * 20 // length)
+
+            cases = [
+                (
+                    f"rrf {label} {num_lists}x{length}",
+                    lambda: legacy_rrf(lists, 10),
+                    lambda: fuse(lists, FusionMethod.RRF, top_k=10),
+                ),
+                (
+                    f"weighted {label} {num_lists}x{length}",
+                    lambda: legacy_weighted(lists, 10),
+                    lambda: fuse(lists, FusionMethod.WEIGHTED, top_k=10),
+                ),
+                (
+                    f"rrf dicts {label} {num_lists}x{length}",
+                    lambda: legacy_rag_fusion(dict_lists, 10),
+                    lambda: engine_rag_fusion(dict_lists, 10),
+                ),
+            ]
+            for name, legacy, engine in cases:
+                legacy_us = timed(legacy, reps)
+                engine_us = timed(engine, reps)
+                print(
+                    f"{name:<30} | {legacy_us:>8.1f}us | {engine_us:>8.1f}us | "
+                    f"{legacy_us / engine_us:>6.1f}x"
+                )
+
+
+async def run_stream():
+    latencies = {"bm25": 0.005, "vector": 0.040, "web": 0.250}
+    lists = dict(zip(latencies, make_lists(len(latencies), 50, seed=7)))
+
+    async def retriever(name: str):
+        await asyncio.sleep(latencies[name])
+        return lists[name]
+
+    start = time.perf_counter()
+    print()
+    print("Streaming fusion (retriever latencies: "
+          + ", ".join(f"{n}={l * 1000:.0f}ms" for n, l in latencies.items()) + ")")
+    async for snapshot in fuse_stream(
+        [Retriever(name, retriever(name)) for name in latencies],
+        key_fn=lambda item: item[0],
+        top_k=10,
+    ):
+        elapsed = (time.perf_counter() - start) * 1000
+        print(
+            f"  {elapsed:>7.1f}ms  after {snapshot.source:<7} "
+            f"top-k={len(snapshot.results)} final={snapshot.is_final}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print("=" * 66)
+    print("Rank fusion micro-benchmark (top_k=10)")
+    print("=" * 66)
+    run_batch(args.repeat)
+    asyncio.run(run_stream())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Rate Limiter Load Benchmark
+
+Measures the per-request overhead of RateLimiter.check_rate_limit under
+concurrent load and compares:
+
+- legacy: three INCRs (minute/hour/day), each followed by EXPIRE on a new
+  key - up to six sequential round trips
+- lua: one atomic check-and-increment script (one round trip)
+- lua + local pre-check: blocked clients are shed in-process
+
+Traffic mixes well-behaved identifiers with abusive ones that go far over
+their per-minute limit. Use --rtt-ms to add a simulated network round trip
+to every Redis command when Redis runs on the same host.
+
+Usage:
+    python scripts/benchmark/benchmark_rate_limiter.py [--redis-url redis://localhost:6380/0]
+        [--requests 20000] [--concurrency 64] [--rtt-ms 0.5]
+
+Falls back to fakeredis (with lupa for Lua) if Redis is not reachable.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from backend.core.rate_limiter import RateLimiter  # noqa: E402
+
+
+async def legacy_check(redis, identifier: str, endpoint: str, rpm: int, rph: int, rpd: int):
+    """Previous RateLimiter.check_rate_limit (without the DB lookup)."""
+    now = datetime.now()
+    counts = []
+    for window, fmt, ttl in (
+        ("minute", "%Y%m%d%H%M", 60),
+        ("hour", "%Y%m%d%H", 3600),
+        ("day", "%Y%m%d", 86400),
+    ):
+        key = f"legacy_rate_limit:{identifier}:{window}:{now.strftime(fmt)}:{endpoint}"
+        count = await redis.incr(key)
+        if count == 1:
+            await redis.expire(key, ttl)
+        counts.append(count)
+    minute_count, hour_count, day_count = counts
+    return minute_count <= rpm and hour_count <= rph and day_count <= rpd
+
+
+def add_latency(redis, rtt_ms: float) -> None:
+    """Delay every command sent to Redis by rtt_ms (simulated network)."""
+    if rtt_ms <= 0:
+        return
+    execute_command = redis.execute_command
+
+    async def delayed(*args, **kwargs):
+        await asyncio.sleep(rtt_ms / 1000.0)
+        return await execute_command(*args, **kwargs)
+
+    redis.execute_command = delayed
+
+
+async def connect(url: str):
+    from redis.asyncio import Redis
+
+    redis = Redis.from_url(url)
+    try:
+        await redis.ping()
+        return redis, url
+    except Exception as e:
+        try:
+            import fakeredis
+        except ImportError:
+            raise SystemExit(f"Redis not reachable at {url} ({e}) and fakeredis is not installed")
+        return fakeredis.FakeAsyncRedis(), "fakeredis"
+
+
+def build_traffic(total: int, users: int, abusive: int, abusive_share: float) -> List[str]:
+    """Identifier per request: abusive_share of requests come from a few clients."""
+    rng = random.Random(42)
+    normal = [f"user-{i}" for i in range(users)]
+    bad = [f"abuser-{i}" for i in range(abusive)]
+    return [
+        rng.choice(bad) if rng.random() < abusive_share else rng.choice(normal)
+        for _ in range(total)
+    ]
+
+
+async def run(name: str, check, traffic: List[str], concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    blocked = 0
+    queue = iter(traffic)
+
+    async def worker():
+        nonlocal blocked
+        for identifier in queue:
+            start = time.perf_counter()
+            allowed = await check(identifier)
+            latencies.append((time.perf_counter() - start) * 1000)
+            blocked += not allowed
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    q = statistics.quantiles(latencies, n=100)
+    return {
+        "name": name,
+        "p50": q[49],
+        "p95": q[94],
+        "p99": q[98],
+        "throughput": len(latencies) / elapsed,
+        "blocked": blocked,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--redis-url", default="redis://localhost:6380/0")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--abusive", type=int, default=5)
+    parser.add_argument("--abusive-share", type=float, default=0.5)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    redis, backend_name = await connect(args.redis_url)
+    add_latency(redis, args.rtt_ms)
+
+    rpm, rph, rpd = 60, 1000, 10000
+    endpoint = "/api/bench"
+    traffic = build_traffic(args.requests, args.users, args.abusive, args.abusive_share)
+
+    print(
+        f"Backend: {backend_name}, requests: {args.requests}, concurrency: {args.concurrency}, "
+        f"simulated RTT: {args.rtt_ms} ms, abusive share: {args.abusive_share:.0%}"
+    )
+
+    async def reset():
+        for pattern in ("rate_limit:*", "legacy_rate_limit:*"):
+            keys = [key async for key in redis.scan_iter(match=pattern)]
+            if keys:
+                await redis.delete(*keys)
+
+    results = []
+
+    await reset()
+    results.append(
+        await run(
+            "legacy (6 round trips)",
+            lambda identifier: legacy_check(redis, identifier, endpoint, rpm, rph, rpd),
+            traffic,
+            args.concurrency,
+        )
+    )
+
+    for name, precheck in (("lua", False), ("lua + local pre-check", True)):
+        await reset()
+        limiter = RateLimiter(
+            redis, rpm, rph, rpd, local_precheck=precheck, config_cache_ttl=60
+        )
+
+        async def check(identifier, limiter=limiter):
+            allowed, _, _ = await limiter.check_rate_limit(identifier, endpoint)
+            return allowed
+
+        result = await run(name, check, traffic, args.concurrency)
+        result["redis_checks"] = limiter.get_stats()["redis_checks"]
+        results.append(result)
+
+    await reset()
+
+    print(f"\n{'variant':<26}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>10}{'blocked':>9}{'redis':>8}")
+    for r in results:
+        print(
+            f"{r['name']:<26}{r['p50']:>9.3f}{r['p95']:>9.3f}{r['p99']:>9.3f}"
+            f"{r['throughput']:>10.0f}{r['blocked']:>9}{r.get('redis_checks', '-'):>8}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
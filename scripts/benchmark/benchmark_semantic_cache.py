@@ -0,0 +1,149 @@
+"""
+Semantic Cache Lookup Benchmark
+
+Compares SemanticCache lookup latency against the previous per-entry
+Python loop (cosine similarity on lists for every CacheEntry).
+
+Scenarios:
+- Cache sizes: 1k, 10k, 100k entries
+- 384-dimensional embeddings (multilingual MiniLM size)
+
+Usage:
+    python scripts/benchmark/benchmark_semantic_cache.py [--dim 384] [--queries 50]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from backend.services.semantic_cache import CacheEntry, SemanticCache  # noqa: E402
+
+
+class RandomEmbeddingService:
+    """Stand-in embedding service returning a fixed vector per call."""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.next_vector: List[float] = [0.0] * dim
+
+    async def embed_query(self, query: str) -> List[float]:
+        return self.next_vector
+
+
+def fill_cache(cache: SemanticCache, vectors: np.ndarray):
+    """Insert entries directly, bypassing response validation and embedding."""
+    response = {"response": "cached answer", "sources": [{"id": "doc"}]}
+    now = datetime.now()
+    for i, vector in enumerate(vectors):
+        entry = CacheEntry(
+            query=f"query {i}",
+            query_embedding=vector.tolist(),
+            response=response,
+            confidence=1.0,
+            timestamp=now,
+        )
+        query_hash = cache._hash_query(entry.query)
+        cache._exact_cache[query_hash] = entry
+        cache._index_entry(query_hash, entry)
+
+
+def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+    """Cosine similarity as the legacy lookup computed it."""
+    vec1_np = np.array(vec1)
+    vec2_np = np.array(vec2)
+
+    norm1 = np.linalg.norm(vec1_np)
+    norm2 = np.linalg.norm(vec2_np)
+    if norm1 == 0 or norm2 == 0:
+        return 0.0
+
+    return float(np.dot(vec1_np, vec2_np) / (norm1 * norm2))
+
+
+def legacy_lookup(cache: SemanticCache, entries: List[CacheEntry], query: List[float]):
+    """The pre-matrix implementation: one Python-level cosine per entry."""
+    best_similarity, best_entry = 0.0, None
+    for entry in entries:
+        if entry.is_expired() or not cache._is_valid_response(entry.response):
+            continue
+        similarity = cosine_similarity(query, entry.query_embedding)
+        if similarity > best_similarity:
+            best_similarity, best_entry = similarity, entry
+    return best_entry, best_similarity
+
+
+async def benchmark_size(size: int, dim: int, num_queries: int, legacy_queries: int):
+    rng = np.random.default_rng(size)
+    vectors = rng.standard_normal((size, dim)).astype(np.float32)
+
+    embedding_service = RandomEmbeddingService(dim)
+    cache = SemanticCache(embedding_service, max_size=size, similarity_threshold_medium=0.0)
+    fill_cache(cache, vectors)
+    entries = list(cache._exact_cache.values())
+
+    queries = rng.standard_normal((num_queries, dim)).astype(np.float32)
+
+    # Matrix lookup
+    times = []
+    for query in queries:
+        embedding_service.next_vector = query.tolist()
+        start = time.perf_counter()
+        await cache._semantic_search("q")
+        times.append((time.perf_counter() - start) * 1000)
+    matrix_ms = float(np.median(times))
+    matrix_p99 = float(np.percentile(times, 99))
+
+    # Legacy loop (fewer queries: it is slow at 100k)
+    times = []
+    for query in queries[:legacy_queries]:
+        query_list = query.tolist()
+        start = time.perf_counter()
+        legacy_lookup(cache, entries, query_list)
+        times.append((time.perf_counter() - start) * 1000)
+    legacy_ms = float(np.median(times))
+
+    return {
+        "size": size,
+        "matrix_median_ms": matrix_ms,
+        "matrix_p99_ms": matrix_p99,
+        "legacy_median_ms": legacy_ms,
+        "speedup": legacy_ms / matrix_ms if matrix_ms > 0 else float("inf"),
+        "matrix_mb": cache._index._vectors.nbytes / 1024 / 1024,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--legacy-queries", type=int, default=5)
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print(f"Semantic cache lookup benchmark (dim={args.dim})")
+    print("=" * 78)
+    print(
+        f"{'entries':>8} | {'matrix p50':>11} | {'matrix p99':>11} | "
+        f"{'legacy p50':>11} | {'speedup':>8} | {'matrix MB':>9}"
+    )
+    print("-" * 78)
+
+    for size in (1_000, 10_000, 100_000):
+        result = await benchmark_size(size, args.dim, args.queries, args.legacy_queries)
+        print(
+            f"{result['size']:>8} | {result['matrix_median_ms']:>9.3f}ms | "
+            f"{result['matrix_p99_ms']:>9.3f}ms | {result['legacy_median_ms']:>9.1f}ms | "
+            f"{result['speedup']:>7.0f}x | {result['matrix_mb']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())